@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..admin_user.service import AdminUserService
 from ..core.db import DatabaseConfig
+from ..core.exceptions import RateLimitException
 from ..event import EventType, log_auth_action
 from ..session.manager import SessionManager
 from ..session.schemas import SessionData
@@ -52,6 +53,7 @@ class AdminSite:
         secure_cookies: Enable secure cookie flags
         event_integration: Optional event logging integration
         session_manager: Optional session manager
+        job_runner: Optional background job runner
 
     Attributes:
         db_config: Database configuration instance
@@ -113,6 +115,7 @@ class AdminSite:
         secure_cookies: bool,
         event_integration: Optional[Any] = None,
         session_manager: Optional[SessionManager] = None,
+        job_runner: Optional[Any] = None,
     ) -> None:
         self.db_config: DatabaseConfig = database_config
         self.router: APIRouter = APIRouter()
@@ -124,6 +127,7 @@ class AdminSite:
         self.mount_path: str = mount_path
         self.theme: str = theme
         self.event_integration: Optional[Any] = event_integration
+        self.job_runner: Optional[Any] = job_runner
 
         if session_manager:
             self.session_manager = session_manager
@@ -306,6 +310,20 @@ class AdminSite:
                         },
                     )
 
+            except RateLimitException:
+                logger.warning(
+                    f"Login rejected, password hashing pool saturated: {form_data.username}"
+                )
+                return self.templates.TemplateResponse(
+                    "auth/login.html",
+                    {
+                        "request": request,
+                        "error": "Too many login attempts in progress. Please try again shortly.",
+                        "url_prefix": self.get_url_prefix(),
+                        "theme": self.theme,
+                    },
+                    status_code=429,
+                )
             except Exception as e:
                 logger.error(f"Error during login: {str(e)}", exc_info=True)
                 return self.templates.TemplateResponse(
@@ -479,6 +497,10 @@ class AdminSite:
             "model_counts": model_counts,
             "url_prefix": self.get_url_prefix(),
             "track_events": self.event_integration is not None,
+            "event_activity": (
+                getattr(self.event_integration, "rollup", None) is not None
+            ),
+            "background_jobs": self.job_runner is not None,
             "theme": self.theme,
         }
 
@@ -7,6 +7,7 @@ from datetime import datetime, timedelta, timezone
 from typing import (
     Any,
     AsyncGenerator,
+    AsyncIterator,
     Dict,
     List,
     Optional,
@@ -22,7 +23,8 @@ if sys.version_info >= (3, 10):
 else:
     from typing_extensions import TypeAlias
 
-from fastapi import APIRouter, Depends, FastAPI, Request
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordBearer
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
@@ -41,6 +43,7 @@ from ..admin_user.schemas import (
 )
 from ..admin_user.service import AdminUserService
 from ..core.db import AdminBase, DatabaseConfig
+from ..event.sink import EventSink
 from ..session import SessionManager
 from ..session.configs import MemcachedConfig, RedisConfig
 from ..session.schemas import SessionData
@@ -126,6 +129,22 @@ class CRUDAdmin:
         enforce_https: Redirect HTTP to HTTPS, default False
         https_port: HTTPS port for redirects, default 443
         track_events: Enable event logging, default False
+        buffer_events: Write events from a background batch writer instead of inside each request, default False
+        event_queue_size: Maximum buffered events before new ones are dropped, default 10000
+        event_batch_size: Buffered events written per batch insert, default 500
+        event_flush_interval_seconds: Maximum delay before buffered events are written, default 1.0
+        audit_storage: "full" to keep complete record states in each audit row, "diff" to keep field diffs with periodic snapshots, default "full"
+        audit_snapshot_interval: Versions between full snapshots when audit_storage="diff", default 10
+        audit_compression: Compress stored audit states with "zlib" or "zstd", default None
+        event_retention_days: Delete events older than this many days in a background job, default None (keep forever)
+        event_maintenance_interval_minutes: How often the retention job runs, default 60 minutes
+        event_partitioning: Create the event and audit tables range partitioned by month (PostgreSQL only), default False
+        event_rollups: Maintain hourly event counts in a rollup table and show an activity widget on the dashboard; cannot be combined with failed_login_aggregation_seconds, default False
+        failed_login_aggregation_seconds: Record repeated failed logins from one IP for one username within this many seconds as a single event with an attempt counter, default None (one event per attempt)
+        event_sink: Store events and audit records in this EventSink (e.g. a FileEventSink) instead of the admin database; cannot be combined with buffer_events, event_partitioning, event_rollups, failed_login_aggregation_seconds or audit_storage="diff", default None
+        security_alert_threshold: Keep in-memory failed login counters and raise an alert once an IP fails this many logins for one username, default None (alerts are computed from the event log on request)
+        background_jobs: Run filter-scoped bulk actions as background jobs recorded in the admin database, with a progress page under Management, default False
+        job_concurrency: Maximum number of background jobs running at once, default 2
         track_sessions_in_db: Enable session tracking in database, default False
         session_backend: Backend type ("memory", "redis", "memcached", "database")
         redis_config: Redis configuration (RedisConfig instance, dict, or None)
@@ -385,6 +404,22 @@ class CRUDAdmin:
         enforce_https: bool = False,
         https_port: int = 443,
         track_events: bool = False,
+        buffer_events: bool = False,
+        event_queue_size: int = 10000,
+        event_batch_size: int = 500,
+        event_flush_interval_seconds: float = 1.0,
+        audit_storage: str = "full",
+        audit_snapshot_interval: int = 10,
+        audit_compression: Optional[str] = None,
+        event_retention_days: Optional[int] = None,
+        event_maintenance_interval_minutes: float = 60,
+        event_partitioning: bool = False,
+        event_rollups: bool = False,
+        failed_login_aggregation_seconds: Optional[float] = None,
+        security_alert_threshold: Optional[int] = None,
+        event_sink: Optional[EventSink] = None,
+        background_jobs: bool = False,
+        job_concurrency: int = 2,
         track_sessions_in_db: bool = False,
         session_backend: str = "memory",
         redis_config: Optional[Union[RedisConfig, Dict[str, Any]]] = None,
@@ -398,6 +433,20 @@ class CRUDAdmin:
             self.mount_path = "admin"
         self.theme = theme or "dark-theme"
         self.track_events = track_events
+        if event_sink is not None and (
+            buffer_events
+            or event_partitioning
+            or event_rollups
+            or failed_login_aggregation_seconds is not None
+        ):
+            raise ValueError(
+                "event_sink cannot be combined with buffer_events, event_partitioning, "
+                "event_rollups or failed_login_aggregation_seconds"
+            )
+        if event_rollups and failed_login_aggregation_seconds is not None:
+            raise ValueError(
+                "event_rollups cannot be combined with failed_login_aggregation_seconds"
+            )
         if session_backend == "database":
             self.track_sessions_in_db = True
         else:
@@ -425,12 +474,35 @@ class CRUDAdmin:
 
         if self.track_events:
             event_log_model = cast(
-                Type[DeclarativeBase], create_admin_event_log(AdminBase)
+                Type[DeclarativeBase],
+                create_admin_event_log(AdminBase, partitioned=event_partitioning),
             )
             audit_log_model = cast(
-                Type[DeclarativeBase], create_admin_audit_log(AdminBase)
+                Type[DeclarativeBase],
+                create_admin_audit_log(
+                    AdminBase,
+                    partitioned=event_partitioning,
+                    versioned=audit_storage == "diff",
+                ),
+            )
+
+        rollup_model: Optional[Type[DeclarativeBase]] = None
+        rollup_state_model: Optional[Type[DeclarativeBase]] = None
+        if self.track_events and event_rollups:
+            from ..event.models import (
+                create_admin_event_rollup,
+                create_admin_event_rollup_state,
             )
 
+            rollup_model = create_admin_event_rollup(AdminBase)
+            rollup_state_model = create_admin_event_rollup_state(AdminBase)
+
+        job_model: Optional[Type[DeclarativeBase]] = None
+        if background_jobs:
+            from ..job import create_admin_job
+
+            job_model = create_admin_job(AdminBase)
+
         self.db_config = db_config or DatabaseConfig(
             base=AdminBase,
             session=session,
@@ -438,18 +510,61 @@ class CRUDAdmin:
             admin_db_path=admin_db_path,
             admin_event_log=event_log_model,
             admin_audit_log=audit_log_model,
+            admin_event_rollup=rollup_model,
+            admin_event_rollup_state=rollup_state_model,
+            admin_job=job_model,
         )
 
         if self.track_events:
-            from ..event import init_event_system
+            from ..event import EventRollup, SecurityAlertDetector, init_event_system
+
+            alert_detector = None
+            if security_alert_threshold is not None:
+                alert_detector = SecurityAlertDetector(
+                    threshold=security_alert_threshold
+                )
 
             self.event_service, self.event_integration = init_event_system(
-                self.db_config
+                self.db_config,
+                alert_detector=alert_detector,
+                rollup=EventRollup(self.db_config) if event_rollups else None,
+                failed_login_window_seconds=failed_login_aggregation_seconds,
+                buffered=buffer_events,
+                sink=event_sink,
+                audit_storage=audit_storage,
+                snapshot_interval=audit_snapshot_interval,
+                audit_compression=audit_compression,
+                max_queue_size=event_queue_size,
+                batch_size=event_batch_size,
+                flush_interval=event_flush_interval_seconds,
             )
         else:
             self.event_service = None
             self.event_integration = None
 
+        self.event_partitioning = event_partitioning
+        if event_partitioning and self.db_config.admin_engine.dialect.name != (
+            "postgresql"
+        ):
+            raise ValueError("event_partitioning requires a PostgreSQL admin database")
+
+        self.event_maintenance = None
+        if self.event_service and (event_retention_days or event_partitioning):
+            from ..event import EventMaintenanceJob
+
+            self.event_maintenance = EventMaintenanceJob(
+                self.event_service,
+                retention_days=event_retention_days,
+                interval_minutes=event_maintenance_interval_minutes,
+                partitioned=event_partitioning,
+            )
+
+        self.job_runner = None
+        if background_jobs:
+            from ..job import JobRunner
+
+            self.job_runner = JobRunner(self.db_config, max_concurrency=job_concurrency)
+
         self.SECRET_KEY = SECRET_KEY
 
         self.admin_user_service = AdminUserService(db_config=self.db_config)
@@ -535,7 +650,9 @@ class CRUDAdmin:
         - AdminSession for session tracking
         - AdminEventLog and AdminAuditLog if event tracking enabled
 
-        Also creates initial admin user if credentials were provided.
+        Also creates initial admin user if credentials were provided, starts
+        the event retention job if event_retention_days is set, and starts the
+        job runner if background_jobs=True, resuming unfinished jobs.
 
         Raises:
             AssertionError: If event log models are misconfigured
@@ -559,9 +676,47 @@ class CRUDAdmin:
         """
         await self.db_config.initialize_admin_db()
 
+        if self.event_maintenance:
+            if self.event_partitioning:
+                await self.event_maintenance.ensure_partitions()
+            self.event_maintenance.start()
+
+        if self.event_integration is not None and self.event_integration.rollup:
+            self.event_integration.rollup.start()
+
+        if self.job_runner is not None:
+            await self.job_runner.start()
+
         if self.initial_admin:
             await self._create_initial_admin(self.initial_admin)
 
+    async def shutdown(self) -> None:
+        """
+        Flush pending work before the application stops.
+
+        Stops the event retention and rollup jobs and drains the buffered event writer
+        when buffer_events=True so queued events are not lost, and closes the
+        event sink. Running background jobs are interrupted and resume on the
+        next start. Call it from the application's lifespan handler.
+
+        Example:
+            ```python
+            @asynccontextmanager
+            async def lifespan(app: FastAPI):
+                await admin.initialize()
+                yield
+                await admin.shutdown()
+            ```
+        """
+        if self.job_runner is not None:
+            await self.job_runner.stop()
+        if self.event_maintenance is not None:
+            await self.event_maintenance.stop()
+        if self.event_integration is not None:
+            if self.event_integration.rollup is not None:
+                await self.event_integration.rollup.stop()
+            await self.event_integration.close()
+
     def setup_event_routes(self) -> None:
         """
         Set up routes for event log management.
@@ -569,6 +724,9 @@ class CRUDAdmin:
         Creates endpoints:
         - GET /management/events - Event log page
         - GET /management/events/content - Event log data
+        - GET /management/events/{event_id}/details - Details of one event
+        - GET /management/events/export - Streaming NDJSON or CSV export
+        - GET /management/events/activity - Dashboard activity widget (event_rollups=True)
 
         Notes:
             - Only created if track_events=True
@@ -591,6 +749,30 @@ class CRUDAdmin:
                 dependencies=[Depends(self.admin_authentication.get_current_user())],
                 response_model=None,
             )
+            self.router.add_api_route(
+                "/management/events/export",
+                self.event_log_export(),
+                methods=["GET"],
+                include_in_schema=False,
+                dependencies=[Depends(self.admin_authentication.get_current_user())],
+                response_model=None,
+            )
+            self.router.add_api_route(
+                "/management/events/activity",
+                self.event_activity(),
+                methods=["GET"],
+                include_in_schema=False,
+                dependencies=[Depends(self.admin_authentication.get_current_user())],
+                response_model=None,
+            )
+            self.router.add_api_route(
+                "/management/events/{event_id}/details",
+                self.event_log_details(),
+                methods=["GET"],
+                include_in_schema=False,
+                dependencies=[Depends(self.admin_authentication.get_current_user())],
+                response_model=None,
+            )
 
     def event_log_page(
         self,
@@ -643,7 +825,7 @@ class CRUDAdmin:
 
         Returns:
             FastAPI route handler that provides filtered event data
-            with user and audit details
+            with usernames
 
         Notes:
             - Supports filtering by:
@@ -651,11 +833,15 @@ class CRUDAdmin:
             - Status
             - Username
             - Date range
-            - Returns enriched events with:
-            - Username
-            - Resource details
-            - Audit trail data
-            - Includes pagination metadata
+            - Returns events with the acting user's username, joined in the
+              same query
+            - Event details and audit data are loaded per event by the
+              details endpoint when a row is expanded
+            - Paginates with (timestamp, id) cursors passed as after/before;
+              page is only used for display
+            - Includes pagination metadata; the total is counted on the
+              first page only, up to EventService.EVENT_COUNT_LIMIT, and
+              passed along by the cursor links
 
         Examples:
             Filter events:
@@ -663,6 +849,9 @@ class CRUDAdmin:
 
             Filter by date:
             GET /management/events/content?start_date=2024-01-01&end_date=2024-01-31
+
+            Next page (cursor from the previous response):
+            GET /management/events/content?page=2&after=<next_cursor>
         """
 
         admin_db_db_dependency = cast(
@@ -674,12 +863,14 @@ class CRUDAdmin:
             admin_db: AsyncSession = Depends(admin_db_db_dependency),
             page: int = 1,
             limit: int = 10,
+            after: Optional[str] = None,
+            before: Optional[str] = None,
+            total: Optional[int] = None,
+            total_capped: bool = False,
         ) -> RouteResponse:
             try:
-                if not self.db_config.AdminEventLog:
-                    raise ValueError("AdminEventLog is not configured")
-
-                crud_events: FastCRUD = FastCRUD(self.db_config.AdminEventLog)
+                if not self.event_service:
+                    raise ValueError("Event tracking is not configured")
 
                 event_type = cast(Optional[str], request.query_params.get("event_type"))
                 status = cast(Optional[str], request.query_params.get("status"))
@@ -687,73 +878,38 @@ class CRUDAdmin:
                 start_date = cast(Optional[str], request.query_params.get("start_date"))
                 end_date = cast(Optional[str], request.query_params.get("end_date"))
 
-                filter_criteria: Dict[str, Any] = {}
-                if event_type:
-                    filter_criteria["event_type"] = event_type
-                if status:
-                    filter_criteria["status"] = status
-
-                if username:
-                    user = await self.db_config.crud_users.get(
-                        db=admin_db, username=username
-                    )
-                    if user and isinstance(user, dict):
-                        filter_criteria["user_id"] = user.get("id")
-
+                start = None
                 if start_date:
                     start = datetime.strptime(start_date, "%Y-%m-%d").replace(
                         tzinfo=UTC
                     )
-                    filter_criteria["timestamp__gte"] = start
 
+                end = None
                 if end_date:
                     end = (
                         datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
                     ).replace(tzinfo=UTC)
-                    filter_criteria["timestamp__lt"] = end
 
-                events = await crud_events.get_multi(
+                navigating = bool(after or before)
+                events = await self.event_service.get_event_page(
                     db=admin_db,
-                    offset=(page - 1) * limit,
                     limit=limit,
-                    sort_columns=["timestamp"],
-                    sort_orders=["desc"],
-                    **filter_criteria,
+                    after=after or None,
+                    before=before or None,
+                    event_type=event_type,
+                    status=status,
+                    username=username,
+                    start_time=start,
+                    end_time=end,
+                    with_total=not navigating or total is None,
                 )
+                enriched_events = events["data"]
 
-                enriched_events = []
-                if isinstance(events["data"], list):
-                    for event in events["data"]:
-                        if isinstance(event, dict):
-                            event_data = dict(event)
-                            user = await self.db_config.crud_users.get(
-                                db=admin_db, id=event.get("user_id")
-                            )
-                            if isinstance(user, dict):
-                                event_data["username"] = user.get("username", "Unknown")
-
-                            if event.get("resource_type") and event.get("resource_id"):
-                                if not self.db_config.AdminAuditLog:
-                                    raise ValueError("AdminAuditLog is not configured")
-
-                                crud_audits: FastCRUD = FastCRUD(
-                                    self.db_config.AdminAuditLog
-                                )
-                                audit = await crud_audits.get(
-                                    db=admin_db, event_id=event.get("id")
-                                )
-                                if audit and isinstance(audit, dict):
-                                    event_data["details"] = {
-                                        "resource_details": {
-                                            "model": event.get("resource_type"),
-                                            "id": event.get("resource_id"),
-                                            "changes": audit.get("new_state"),
-                                        }
-                                    }
-
-                            enriched_events.append(event_data)
-
-                total_items = events.get("total_count", 0)
+                total_items = events.get("total_count")
+                if total_items is None:
+                    total_items = total or 0
+                else:
+                    total_capped = events.get("total_capped", False)
                 assert isinstance(total_items, int), (
                     f"'total_count' should be int, got {type(total_items)}"
                 )
@@ -767,6 +923,10 @@ class CRUDAdmin:
                         "events": enriched_events,
                         "page": page,
                         "total_pages": total_pages,
+                        "total_items": total_items,
+                        "total_capped": total_capped,
+                        "next_cursor": events["next_cursor"],
+                        "prev_cursor": events["prev_cursor"],
                         "url_prefix": self.get_url_prefix(),
                         "start_date": start_date,
                         "end_date": end_date,
@@ -791,6 +951,346 @@ class CRUDAdmin:
 
         return event_log_content_inner
 
+    def event_log_export(self) -> EndpointFunction:
+        """
+        Create endpoint that streams the event log as NDJSON or CSV.
+
+        Returns:
+            FastAPI route handler that returns a StreamingResponse
+
+        Notes:
+            - Accepts the same filters as the event log page
+            - include_audit=true adds each event's audit row
+            - Rows are read in keyset chunks from a dedicated session, so
+              memory use does not grow with the export size
+            - Every row has a cursor; pass the last one received as after
+              to resume an interrupted export
+
+        Examples:
+            Export failed logins as NDJSON:
+            GET /management/events/export?event_type=login&status=failure
+
+            Export January with audit rows as CSV:
+            GET /management/events/export?format=csv&include_audit=true&start_date=2024-01-01&end_date=2024-01-31
+        """
+
+        async def event_log_export_inner(
+            request: Request,
+            format: str = "ndjson",
+            include_audit: bool = False,
+            after: Optional[str] = None,
+            chunk_size: int = 1000,
+        ) -> RouteResponse:
+            from ..event.export import EXPORT_FORMATS, get_encoder
+            from ..event.service import decode_event_cursor
+
+            if not self.event_service:
+                raise HTTPException(
+                    status_code=404, detail="Event tracking is not configured"
+                )
+            if format not in EXPORT_FORMATS:
+                raise HTTPException(
+                    status_code=400, detail=f"Unsupported export format: {format}"
+                )
+
+            try:
+                if after:
+                    decode_event_cursor(after)
+                filters = self._event_filter_params(request)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e)) from e
+
+            event_service = self.event_service
+            encoder = get_encoder(format, include_audit=include_audit)
+
+            async def stream() -> AsyncIterator[str]:
+                async with AsyncSession(
+                    self.db_config.admin_engine, expire_on_commit=False
+                ) as db:
+                    rows = event_service.iter_events(
+                        db,
+                        include_audit=include_audit,
+                        after=after or None,
+                        chunk_size=max(1, min(chunk_size, 10000)),
+                        **filters,
+                    )
+                    async for line in encoder(rows):
+                        yield line
+
+            timestamp = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
+            return StreamingResponse(
+                stream(),
+                media_type=EXPORT_FORMATS[format],
+                headers={
+                    "Content-Disposition": (
+                        f'attachment; filename="events_{timestamp}.{format}"'
+                    )
+                },
+            )
+
+        return cast(EndpointFunction, event_log_export_inner)
+
+    def _event_filter_params(self, request: Request) -> dict[str, Any]:
+        """
+        Read the event log filters from the query string.
+
+        Raises:
+            ValueError: If a date or enum value is invalid
+        """
+        from ..event.models import EventStatus, EventType
+
+        params = request.query_params
+        event_type = params.get("event_type") or None
+        status = params.get("status") or None
+        if event_type:
+            EventType(event_type)
+        if status:
+            EventStatus(status)
+
+        start_date = params.get("start_date")
+        end_date = params.get("end_date")
+        start = None
+        if start_date:
+            start = datetime.strptime(start_date, "%Y-%m-%d").replace(tzinfo=UTC)
+        end = None
+        if end_date:
+            end = (datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)).replace(
+                tzinfo=UTC
+            )
+
+        return {
+            "event_type": event_type,
+            "status": status,
+            "username": params.get("username") or None,
+            "start_time": start,
+            "end_time": end,
+        }
+
+    def event_activity(self) -> EndpointFunction:
+        """
+        Create endpoint that renders the dashboard activity widget.
+
+        Counts come from the event rollup table, so rendering cost depends on
+        the number of hours shown, not on the size of the event log.
+
+        Returns:
+            FastAPI route handler that renders the activity partial
+        """
+
+        admin_db_db_dependency = cast(
+            Callable[..., AsyncSession], self.db_config.get_admin_db
+        )
+
+        async def event_activity_inner(
+            request: Request,
+            admin_db: AsyncSession = Depends(admin_db_db_dependency),
+            hours: int = 24,
+        ) -> RouteResponse:
+            rollup = self.event_integration.rollup if self.event_integration else None
+            hours = max(1, min(hours, 24 * 31))
+            context: dict[str, Any] = {"request": request, "hours": hours}
+
+            if rollup is not None:
+                try:
+                    start = rollup.bucket_for(
+                        datetime.now(UTC) - timedelta(hours=hours - 1)
+                    )
+                    buckets: dict[datetime, dict[str, int]] = {}
+                    for row in await rollup.get_activity(admin_db, start):
+                        counts = buckets.setdefault(row["bucket"], {})
+                        counts[row["event_type"]] = row["count"]
+
+                    totals = {bucket: sum(c.values()) for bucket, c in buckets.items()}
+                    context.update(
+                        {
+                            "buckets": sorted(buckets.items()),
+                            "totals": totals,
+                            "max_total": max(totals.values(), default=0),
+                            "total_events": sum(totals.values()),
+                            "failed_logins": await rollup.get_failed_logins(
+                                admin_db, start
+                            ),
+                            "last_fold": rollup.last_fold,
+                        }
+                    )
+                except Exception as e:
+                    logger.error(f"Error loading event activity: {str(e)}")
+
+            return self.templates.TemplateResponse(
+                "admin/management/event_activity.html", context
+            )
+
+        return event_activity_inner
+
+    def event_log_details(self) -> EndpointFunction:
+        """
+        Create endpoint that renders the details of a single event.
+
+        The event log page only loads an event's details JSON (and its audit
+        row) when the event is expanded.
+
+        Returns:
+            FastAPI route handler that renders the event details partial
+        """
+
+        admin_db_db_dependency = cast(
+            Callable[..., AsyncSession], self.db_config.get_admin_db
+        )
+
+        async def event_log_details_inner(
+            request: Request,
+            event_id: int,
+            admin_db: AsyncSession = Depends(admin_db_db_dependency),
+        ) -> RouteResponse:
+            details = None
+            try:
+                if not self.event_service:
+                    raise ValueError("Event tracking is not configured")
+                details = await self.event_service.get_event_details(
+                    db=admin_db, event_id=event_id
+                )
+            except Exception as e:
+                logger.error(f"Error retrieving event details: {str(e)}")
+
+            return self.templates.TemplateResponse(
+                "admin/management/event_details.html",
+                {"request": request, "event": {"details": details}},
+            )
+
+        return cast(EndpointFunction, event_log_details_inner)
+
+    def setup_job_routes(self) -> None:
+        """
+        Set up routes for background job management.
+
+        Creates endpoints:
+        - GET /management/jobs - Job list page
+        - GET /management/jobs/content - Job progress, polled by the page while jobs run
+        - POST /management/jobs/{job_id}/cancel - Cancel a pending or running job
+
+        Notes:
+            - Only created if background_jobs=True
+            - Routes require authentication
+        """
+        self.router.add_api_route(
+            "/management/jobs",
+            self.job_list_page(),
+            methods=["GET"],
+            include_in_schema=False,
+            dependencies=[Depends(self.admin_authentication.get_current_user())],
+            response_model=None,
+        )
+        self.router.add_api_route(
+            "/management/jobs/content",
+            self.job_list_content(),
+            methods=["GET"],
+            include_in_schema=False,
+            dependencies=[Depends(self.admin_authentication.get_current_user())],
+            response_model=None,
+        )
+        self.router.add_api_route(
+            "/management/jobs/{job_id}/cancel",
+            self.job_cancel(),
+            methods=["POST"],
+            include_in_schema=False,
+            dependencies=[Depends(self.admin_authentication.get_current_user())],
+            response_model=None,
+        )
+
+    def job_list_page(self) -> EndpointFunction:
+        """
+        Create endpoint for the background job page.
+
+        Returns:
+            FastAPI route handler that renders the job list template
+        """
+
+        admin_db_db_dependency = cast(
+            Callable[..., AsyncSession], self.db_config.get_admin_db
+        )
+        app_db_dependency = cast(Callable[..., AsyncSession], self.db_config.session)
+
+        async def job_list_page_inner(
+            request: Request,
+            admin_db: AsyncSession = Depends(admin_db_db_dependency),
+            app_db: AsyncSession = Depends(app_db_dependency),
+        ) -> RouteResponse:
+            context = await self.admin_site.get_base_context(
+                admin_db=admin_db, app_db=app_db
+            )
+            context.update({"request": request, "include_sidebar_and_header": True})
+
+            return self.templates.TemplateResponse(
+                "admin/management/jobs.html", context
+            )
+
+        return job_list_page_inner
+
+    def job_list_content(self) -> Callable[..., Awaitable[RouteResponse]]:
+        """
+        Create endpoint that renders the progress of recent jobs.
+
+        The partial keeps polling itself every two seconds while any job is
+        pending or running, and stops once all are finished.
+
+        Returns:
+            FastAPI route handler that renders the job list partial
+        """
+
+        async def job_list_content_inner(
+            request: Request, limit: int = 50
+        ) -> RouteResponse:
+            from ..job import JobStatus
+
+            jobs: list[dict[str, Any]] = []
+            try:
+                if self.job_runner is not None:
+                    jobs = await self.job_runner.get_jobs(limit=max(1, min(limit, 500)))
+            except Exception as e:
+                logger.error(f"Error retrieving jobs: {str(e)}")
+
+            active = {
+                JobStatus.PENDING.value,
+                JobStatus.RUNNING.value,
+                JobStatus.CANCELLING.value,
+            }
+            return self.templates.TemplateResponse(
+                "admin/management/jobs_content.html",
+                {
+                    "request": request,
+                    "jobs": jobs,
+                    "active_statuses": active,
+                    "has_active": any(job["status"] in active for job in jobs),
+                    "url_prefix": self.get_url_prefix(),
+                },
+            )
+
+        return job_list_content_inner
+
+    def job_cancel(self) -> Callable[..., Awaitable[RouteResponse]]:
+        """
+        Create endpoint that cancels a job.
+
+        Returns:
+            FastAPI route handler that requests cancellation and re-renders
+            the job list partial
+
+        Raises:
+            HTTPException: 404 if the job does not exist
+        """
+        job_list_content = self.job_list_content()
+
+        async def job_cancel_inner(request: Request, job_id: int) -> RouteResponse:
+            if self.job_runner is None or (
+                await self.job_runner.get_job(job_id) is None
+            ):
+                raise HTTPException(status_code=404, detail="Job not found")
+
+            await self.job_runner.cancel(job_id)
+            return await job_list_content(request)
+
+        return job_cancel_inner
+
     def setup(
         self,
     ) -> None:
@@ -800,7 +1300,7 @@ class CRUDAdmin:
         Configures:
         - Authentication routes and middleware
         - Model CRUD views
-        - Management views (health check, events)
+        - Management views (health check, events, background jobs)
         - Static files
 
         Notes:
@@ -818,6 +1318,7 @@ class CRUDAdmin:
             secure_cookies=self.secure_cookies,
             event_integration=self.event_integration if self.track_events else None,
             session_manager=self.session_manager,
+            job_runner=self.job_runner,
         )
 
         self.admin_site.setup_routes()
@@ -868,23 +1369,10 @@ class CRUDAdmin:
             response_model=None,
         )
 
-        if self.track_events:
-            self.router.add_api_route(
-                "/management/events",
-                self.event_log_page(),
-                methods=["GET"],
-                include_in_schema=False,
-                dependencies=[Depends(get_user_dependency)],
-                response_model=None,
-            )
-            self.router.add_api_route(
-                "/management/events/content",
-                self.event_log_content(),
-                methods=["GET"],
-                include_in_schema=False,
-                dependencies=[Depends(get_user_dependency)],
-                response_model=None,
-            )
+        self.setup_event_routes()
+
+        if self.job_runner is not None:
+            self.setup_job_routes()
 
         self.router.include_router(router=self.admin_site.router)
 
@@ -899,6 +1387,9 @@ class CRUDAdmin:
         include_in_models: bool = True,
         allowed_actions: Optional[set[str]] = None,
         password_transformer: Optional[Any] = None,
+        delete_chunk_size: int = 500,
+        import_batch_size: int = 1000,
+        list_display: Optional[List[str]] = None,
     ) -> None:
         """
         Add CRUD view for a database model.
@@ -921,6 +1412,11 @@ class CRUDAdmin:
                 - **"delete"**: Allow deleting records
                 Defaults to all actions if None
             password_transformer: PasswordTransformer instance for handling password field transformation
+            delete_chunk_size: Maximum ids deleted per statement in bulk deletes
+            import_batch_size: Rows written per transaction in file imports and /crud/bulk requests
+            list_display: Columns shown on the list page, in order. Text and JSON
+                columns are shown as truncated previews and LargeBinary columns as
+                their size
 
         Raises:
             ValueError: If schemas don't match model structure
@@ -1151,6 +1647,11 @@ class CRUDAdmin:
             allowed_actions=allowed_actions,
             event_integration=self.event_integration,
             password_transformer=password_transformer,
+            delete_chunk_size=delete_chunk_size,
+            import_batch_size=import_batch_size,
+            list_display=list_display,
+            secret_key=self.SECRET_KEY,
+            job_runner=self.job_runner,
         )
 
         if self.track_events and self.event_integration:
@@ -1288,7 +1789,7 @@ class CRUDAdmin:
                         logger.error(msg)
                         raise ValueError(msg)
 
-                    hashed_password = self.admin_user_service.get_password_hash(
+                    hashed_password = await self.admin_user_service.hash_password(
                         create_data.password
                     )
                     internal_data = AdminUserCreateInternal(
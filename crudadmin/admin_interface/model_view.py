@@ -1,12 +1,34 @@
+import asyncio
+import codecs
+import csv
 import datetime
-from collections.abc import AsyncGenerator, Callable, Coroutine
+import hashlib
+import hmac
+import itertools
+import json
+import logging
+import os
+import secrets
+import tempfile
+import time
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Iterator,
+)
+from contextlib import asynccontextmanager
 from datetime import datetime as dt
 from typing import (
+    IO,
     Any,
     Dict,
     List,
+    Literal,
     Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -14,21 +36,90 @@ from typing import (
 )
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request, UploadFile
-from fastapi.responses import JSONResponse, RedirectResponse, Response
+from fastapi import APIRouter, Depends, File, Request, UploadFile
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.templating import Jinja2Templates
 from fastcrud import EndpointCreator, FastCRUD
 from pydantic import BaseModel, ValidationError
-from sqlalchemy import inspect
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 
+from ..core.auth import convert_user_to_dict, get_password_hash_pool
 from ..core.db import DatabaseConfig
 from ..event import EventType, log_admin_action
-from .helper import _get_form_fields_from_schema
+from ..event.export import EXPORT_FORMATS, csv_table_lines, ndjson_lines
+from ..job import JobChunk, JobRunner
+from .view_descriptor import (
+    LIST_PREVIEW_LENGTH,
+    InternalSchema,
+    compile_view_descriptor,
+)
+
+logger = logging.getLogger(__name__)
 
 EndpointCallable = Callable[..., Coroutine[Any, Any, Response]]
 
+IMPORT_EXTENSIONS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+
+def _read_import_rows(
+    file: IO[bytes], import_format: str
+) -> Iterator[Tuple[int, Any, Optional[str]]]:
+    """
+    Read an uploaded file one row at a time.
+
+    Yields:
+        (line number, row, error) tuples; error is set when the line could
+        not be parsed, and row then holds the raw line
+    """
+    lines = codecs.iterdecode(file, "utf-8-sig")
+    if import_format == "csv":
+        reader = csv.DictReader(lines)
+        for row in reader:
+            if None in row:
+                yield reader.line_num, row.pop(None), "Too many values in row"
+                continue
+            yield (
+                reader.line_num,
+                {key: value for key, value in row.items() if value not in ("", None)},
+                None,
+            )
+        return
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield line_number, line.rstrip("\n"), f"Invalid JSON: {str(e)}"
+            continue
+        if not isinstance(row, dict):
+            yield line_number, row, "Each line must be a JSON object"
+            continue
+        yield line_number, row, None
+
+
+def _validation_errors(error: ValidationError) -> List[Dict[str, Any]]:
+    """Location and message of each error in a pydantic ValidationError."""
+    return [{"loc": list(err["loc"]), "msg": err["msg"]} for err in error.errors()]
+
+
+def _database_error(error: SQLAlchemyError) -> str:
+    """Message of the DBAPI error behind a SQLAlchemy error."""
+    return str(getattr(error, "orig", None) or error)
+
+
 ModelType = TypeVar("ModelType", bound=DeclarativeBase)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
@@ -43,6 +134,18 @@ class BulkDeleteRequest(BaseModel):
     ids: List[Union[int, str]]
 
 
+class BulkActionRequest(BaseModel):
+    """Request model for bulk actions on the records matching a list filter."""
+
+    action: Literal["delete", "update"]
+    field: Optional[str] = None
+    value: Any = None
+    search_column: Optional[str] = None
+    search_value: str = ""
+    all_records: bool = False
+    confirmation_token: Optional[str] = None
+
+
 class PasswordTransformer:
     """
     Configuration for transforming password fields in forms.
@@ -157,6 +260,11 @@ class ModelView:
         admin_site: Reference to parent AdminSite instance
         event_integration: Optional event logging integration
         password_transformer: Optional password transformer for AdminUser model
+        delete_chunk_size: Maximum ids per DELETE statement in bulk deletes
+        import_batch_size: Rows written per transaction in file imports and /crud/bulk requests
+        list_display: Columns shown on the list page, in order; defaults to the select_schema fields
+        secret_key: Key signing bulk action confirmation tokens; random per process if None
+        job_runner: Run confirmed filter-scoped bulk actions as chunked background jobs instead of in the request; selected-row deletes and imports still run in the request
 
     Raises:
         ValueError: If schemas don't match model structure
@@ -352,6 +460,10 @@ class ModelView:
         ```
     """
 
+    BULK_ACTION_TOKEN_TTL = 300
+    MAX_IMPORT_REPORTS = 20
+    MAX_BULK_ITEMS = 10000
+
     def __init__(
         self,
         database_config: DatabaseConfig,
@@ -367,7 +479,17 @@ class ModelView:
         admin_site: Optional[Any] = None,
         event_integration: Optional[Any] = None,
         password_transformer: Optional[PasswordTransformer] = None,
+        delete_chunk_size: int = 500,
+        import_batch_size: int = 1000,
+        list_display: Optional[List[str]] = None,
+        secret_key: Optional[str] = None,
+        job_runner: Optional[JobRunner] = None,
     ) -> None:
+        if delete_chunk_size < 1:
+            raise ValueError("delete_chunk_size must be positive")
+        if import_batch_size < 1:
+            raise ValueError("import_batch_size must be positive")
+
         self.db_config = database_config
         self.templates = templates
         self.model = model
@@ -378,6 +500,13 @@ class ModelView:
         self.allowed_actions = allowed_actions
         self.event_integration = event_integration
         self.password_transformer = password_transformer
+        self.delete_chunk_size = delete_chunk_size
+        self.import_batch_size = import_batch_size
+        self._import_reports: Dict[str, str] = {}
+        self.secret_key = secret_key or os.urandom(32).hex()
+        self.job_runner = job_runner
+        if job_runner is not None and allowed_actions & {"delete", "update"}:
+            job_runner.register(self._bulk_action_job_kind, self._bulk_action_job)
 
         get_session: Callable[[], AsyncGenerator[AsyncSession, None]]
         if self._model_is_admin_model(model):
@@ -409,6 +538,15 @@ class ModelView:
             )
 
         self.crud: FastCRUD[Any, Any, Any, Any, Any, Any] = FastCRUD(self.model)
+        self.descriptor = compile_view_descriptor(
+            model=self.model,
+            create_schema=self.create_schema,
+            update_schema=self.update_schema,
+            select_schema=self.select_schema,
+            deleted_at_column=self.crud.deleted_at_column,
+            is_deleted_column=self.crud.is_deleted_column,
+            list_display=list_display,
+        )
 
         self.endpoints_template = EndpointCreator(
             session=self.session,
@@ -419,6 +557,7 @@ class ModelView:
             delete_schema=self.delete_schema,
         )
         self.endpoints_template.add_routes_to_router()
+        self.setup_bulk_crud_routes()
         self.router.include_router(self.endpoints_template.router, prefix="/crud")
 
         self.setup_routes()
@@ -441,32 +580,223 @@ class ModelView:
         """Convert the ID value to the appropriate type based on the model's primary key type."""
         if id_value is None:
             return None
+        return cast(Union[int, str, float], self.descriptor.pk_converter(id_value))
 
-        primary_key_info = self.db_config.get_primary_key_info(self.model)
-        if not primary_key_info:
-            return id_value
+    def _search_filter_criteria(
+        self, search_column: Optional[str], search_value: str
+    ) -> Dict[str, Any]:
+        """
+        Turn the list page search into FastCRUD filter criteria.
 
-        pk_type = primary_key_info.get("type")
+        Values that do not parse as the column's type give no filter.
+        """
+        if search_column and search_value:
+            converter = self.descriptor.search_converters.get(search_column)
+            if converter is not None:
+                criterion = converter(search_value)
+                if criterion is not None:
+                    return {criterion[0]: criterion[1]}
+        return {}
+
+    def _bulk_action_conditions(self, body: BulkActionRequest) -> List[Any]:
+        """
+        SQL conditions of the records a bulk action applies to.
 
-        if pk_type is int:
-            return int(id_value) if isinstance(id_value, str) else id_value
-        elif pk_type is str:
-            return str(id_value)
-        elif pk_type is float:
-            return float(id_value) if isinstance(id_value, str) else id_value
-        elif pk_type is UUID:
-            return str(id_value)
-        else:
-            return str(id_value)
+        Raises:
+            ValueError: If the search gives no filter, or if there is no
+                search and all_records is not set
+        """
+        conditions = self._filter_conditions(
+            self._search_filter_criteria(body.search_column, body.search_value)
+        )
+        if conditions:
+            return conditions
+        if body.search_value:
+            raise ValueError(
+                f"Search {body.search_value!r} on column {body.search_column!r} "
+                "does not give a filter"
+            )
+        if not body.all_records:
+            raise ValueError("Set all_records to apply the action to every record")
+        return conditions
+
+    def _filter_conditions(self, filter_criteria: Dict[str, Any]) -> List[Any]:
+        """SQL conditions equivalent to criteria from _search_filter_criteria."""
+        conditions = []
+        for key, value in filter_criteria.items():
+            name, _, operator = key.partition("__")
+            column = self.model.__table__.columns[name]
+            conditions.append(
+                column.ilike(value) if operator == "ilike" else column == value
+            )
+        return conditions
+
+    def _supports_returning(self, db: AsyncSession, statement: str) -> bool:
+        """Whether the session's dialect supports RETURNING for "update", "delete" or "insert_executemany"."""
+        dialect = db.get_bind().dialect
+        return bool(getattr(dialect, f"{statement}_returning", False))
+
+    def _row_columns(self) -> List[Any]:
+        """Columns read for audit states; limited to select_schema fields when set."""
+        return list(self.descriptor.row_columns)
+
+    async def _read_row_for_update(
+        self, db: AsyncSession, pk_value: Any
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read one row, locking it where the dialect supports it.
+
+        Only the select_schema fields are read when it is set, as for every
+        other read of the view, so columns it leaves out (unreadable types,
+        large or sensitive values) never reach the audit log. The lock keeps
+        the captured state consistent with the update that follows in the
+        same transaction.
+        """
+        pk_column = self.descriptor.pk_column
+        stmt = (
+            select(*self._row_columns()).where(pk_column == pk_value).with_for_update()
+        )
+        row = (await db.execute(stmt)).mappings().first()
+        return dict(row) if row is not None else None
+
+    def _update_values(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply FastCRUD.update's rules: automatic updated_at, no unknown columns.
+
+        Raises:
+            ValueError: If values has keys that are not columns of the model
+        """
+        if getattr(self.model, self.crud.updated_at_column, None) is not None:
+            values[self.crud.updated_at_column] = dt.now(datetime.timezone.utc)
+
+        extra_fields = set(values) - self.descriptor.column_set
+        if extra_fields:
+            raise ValueError(f"Extra fields provided: {extra_fields}")
+        return values
+
+    async def _update_row(
+        self,
+        db: AsyncSession,
+        pk_value: Any,
+        data: Union[BaseModel, Dict[str, Any]],
+        previous_state: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Update one row and return its new column values.
+
+        Applies the same rules as FastCRUD.update (only set fields, automatic
+        updated_at, no unknown columns) in a single UPDATE. The new state
+        holds the same columns as previous_state: it comes from RETURNING
+        where supported; otherwise it is the previous state merged with the
+        written values of those columns.
+
+        Raises:
+            ValueError: If data has fields that are not columns of the model
+        """
+        values = self._update_values(
+            dict(data)
+            if isinstance(data, dict)
+            else data.model_dump(exclude_unset=True)
+        )
+
+        pk_column = self.descriptor.pk_column
+        stmt = update(self.model).where(pk_column == pk_value).values(values)
+
+        if self._supports_returning(db, "update"):
+            result = await db.execute(stmt.returning(*self._row_columns()))
+            return dict(result.mappings().one())
+
+        await db.execute(stmt)
+        return {
+            **previous_state,
+            **{key: value for key, value in values.items() if key in previous_state},
+        }
+
+    def _soft_delete_values(self) -> Dict[str, Any]:
+        """Values marking a row deleted, if the model has is_deleted/deleted_at columns."""
+        values: Dict[str, Any] = {}
+        if self.descriptor.deleted_at_column:
+            values[self.descriptor.deleted_at_column] = dt.now(datetime.timezone.utc)
+        if self.descriptor.is_deleted_column:
+            values[self.descriptor.is_deleted_column] = True
+        return values
+
+    def _delete_statement(
+        self, conditions: List[Any], soft_delete_values: Dict[str, Any]
+    ) -> Any:
+        """DELETE the matching rows, or soft delete them with an UPDATE as FastCRUD.delete does."""
+        if soft_delete_values:
+            return update(self.model).where(*conditions).values(soft_delete_values)
+        return delete(self.model).where(*conditions)
+
+    async def _delete_rows(
+        self, db: AsyncSession, pk_values: List[Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Delete rows by primary key and return their column values.
+
+        Ids are deleted delete_chunk_size at a time, each chunk as one
+        DELETE ... WHERE pk IN (...) RETURNING statement, which keeps bind
+        parameter counts and lock times bounded. Models with is_deleted or
+        deleted_at columns are soft deleted with an UPDATE instead, as in
+        FastCRUD.delete. Without RETURNING support each chunk is selected
+        before it is deleted.
+        """
+        pk_column = self.descriptor.pk_column
+        columns = self._row_columns()
+        soft_delete_values = self._soft_delete_values()
+
+        returning = self._supports_returning(
+            db, "update" if soft_delete_values else "delete"
+        )
+        deleted: List[Dict[str, Any]] = []
+        for start in range(0, len(pk_values), self.delete_chunk_size):
+            condition = pk_column.in_(pk_values[start : start + self.delete_chunk_size])
+            stmt = self._delete_statement([condition], soft_delete_values)
+            if returning:
+                result = await db.execute(stmt.returning(*columns))
+            else:
+                result = await db.execute(select(*columns).where(condition))
+            deleted.extend(dict(row) for row in result.mappings())
+            if not returning:
+                await db.execute(stmt)
+        return deleted
+
+    def setup_bulk_crud_routes(self) -> None:
+        """
+        Add the JSON bulk endpoints next to the FastCRUD routes under /crud.
+
+        They are registered before the FastCRUD router so that /crud/bulk is
+        not matched as /crud/{id}.
+        """
+        if "create" in self.allowed_actions:
+            self.router.add_api_route(
+                "/crud/bulk",
+                self.bulk_create_endpoint(),
+                methods=["POST"],
+                include_in_schema=False,
+                response_model=None,
+            )
+        if "update" in self.allowed_actions:
+            self.router.add_api_route(
+                "/crud/bulk",
+                self.bulk_update_endpoint(),
+                methods=["PATCH"],
+                include_in_schema=False,
+                response_model=None,
+            )
 
     def setup_routes(self) -> None:
         """
         Configure FastAPI routes based on allowed actions.
 
         Sets up the following routes if allowed:
-        - Create: /form_create (POST), /create_page (GET)
-        - View: / (GET), /get_model_list (GET)
+        - Create: /form_create (POST), /create_page (GET), /import (POST),
+          /import/report/{report_id} (GET)
+        - View: / (GET), /get_model_list (GET), /export (GET),
+          /cell/{id}/{column} (GET)
         - Delete: /bulk-delete (DELETE)
+        - Delete or update: /bulk-action (POST), filter-scoped bulk actions
         - Update: /update/{id} (GET), /form_update/{id} (POST)
 
         Routes are configured based on the allowed_actions set provided during initialization.
@@ -497,6 +827,20 @@ class ModelView:
                 include_in_schema=False,
                 response_model=None,
             )
+            self.router.add_api_route(
+                "/import",
+                self.import_endpoint(),
+                methods=["POST"],
+                include_in_schema=False,
+                response_model=None,
+            )
+            self.router.add_api_route(
+                "/import/report/{report_id}",
+                self.import_report_endpoint(),
+                methods=["GET"],
+                include_in_schema=False,
+                response_model=None,
+            )
 
         if "view" in self.allowed_actions:
             self.router.add_api_route(
@@ -515,6 +859,20 @@ class ModelView:
                 include_in_schema=False,
                 response_model=None,
             )
+            self.router.add_api_route(
+                "/export",
+                self.export_endpoint(),
+                methods=["GET"],
+                include_in_schema=False,
+                response_model=None,
+            )
+            self.router.add_api_route(
+                "/cell/{id}/{column}",
+                self.list_cell_endpoint(),
+                methods=["GET"],
+                include_in_schema=False,
+                response_model=None,
+            )
 
         if "delete" in self.allowed_actions:
             self.router.add_api_route(
@@ -525,6 +883,15 @@ class ModelView:
                 response_model=None,
             )
 
+        if self.allowed_actions & {"delete", "update"}:
+            self.router.add_api_route(
+                "/bulk-action",
+                self.bulk_action_endpoint(),
+                methods=["POST"],
+                include_in_schema=False,
+                response_model=None,
+            )
+
         if "update" in self.allowed_actions:
             self.router.add_api_route(
                 "/update/{id}",
@@ -584,7 +951,7 @@ class ModelView:
             """Handle POST form submission to create a model record."""
             assert self.admin_site is not None
 
-            form_fields = _get_form_fields_from_schema(self.create_schema)
+            form_fields = self.descriptor.create_form.build()
             error_message: Optional[str] = None
             field_errors: Dict[str, str] = {}
             field_values: Dict[str, Any] = {}
@@ -611,10 +978,10 @@ class ModelView:
                         if self.password_transformer is not None:
                             item_data = self.create_schema(**form_data)
 
-                            transformed_data = (
-                                self.password_transformer.transform_create_data(
-                                    form_data, item_data
-                                )
+                            transformed_data = await get_password_hash_pool().run(
+                                self.password_transformer.transform_create_data,
+                                form_data,
+                                item_data,
                             )
 
                             for (
@@ -646,9 +1013,9 @@ class ModelView:
                                         db=db, object=generic_internal_data
                                     )
                                 else:
-                                    dynamic_internal_data = type(
-                                        "InternalSchema", (BaseModel,), {}
-                                    )(**transformed_data)
+                                    dynamic_internal_data = InternalSchema(
+                                        **transformed_data
+                                    )
                                     result = await self.crud.create(
                                         db=db, object=dynamic_internal_data
                                     )
@@ -710,8 +1077,11 @@ class ModelView:
 
         Features:
             - Handles multiple record deletion in one request
+            - Deletes in chunks of delete_chunk_size ids, one
+              DELETE ... RETURNING per chunk, feeding the returned rows to the
+              audit trail
             - Supports different primary key types (int, str, float)
-            - Validates IDs before deletion
+            - Validates IDs before deletion; ids that do not exist are ignored
             - Handles pagination after deletion
             - Event logging integration
             - Transaction management
@@ -739,7 +1109,7 @@ class ModelView:
                 - 400: Database error during deletion
         """
 
-        @log_admin_action(EventType.DELETE, model=self.model)
+        @log_admin_action(EventType.DELETE, model=self.model, captures_state=True)
         async def bulk_delete_endpoint_inner(
             request: Request,
             db: AsyncSession = Depends(self.session),
@@ -760,6 +1130,7 @@ class ModelView:
                 rows_per_page = int(rows_str)
 
                 ids = body.get("ids", [])
+                request.state.audit_requested_ids = ids
                 if not ids:
                     return JSONResponse(
                         status_code=400,
@@ -768,22 +1139,10 @@ class ModelView:
                         },
                     )
 
-                inspector = inspect(self.model)
-                primary_key = inspector.primary_key[0]
-                pk_name = primary_key.name
-                pk_type = primary_key.type.python_type
-
                 valid_ids: List[Union[int, str, float]] = []
                 for id_value in ids:
                     try:
-                        if pk_type is int:
-                            valid_ids.append(int(id_value))
-                        elif pk_type is str:
-                            valid_ids.append(str(id_value))
-                        elif pk_type is float:
-                            valid_ids.append(float(id_value))
-                        else:
-                            valid_ids.append(id_value)
+                        valid_ids.append(self._convert_id_to_pk_type(id_value))
                     except (ValueError, TypeError):
                         return JSONResponse(
                             status_code=422,
@@ -792,27 +1151,10 @@ class ModelView:
                             },
                         )
 
-                filter_criteria: Dict[str, List[Union[int, str, float]]] = {
-                    f"{pk_name}__in": valid_ids
-                }
-                records_to_delete = await self.crud.get_multi(
-                    db=db,
-                    limit=len(valid_ids),
-                    schema_to_select=self.select_schema,
-                    **cast(Any, filter_criteria),
-                )
-
-                request.state.deleted_records = records_to_delete.get("data", [])
-
                 try:
-                    for id_value in valid_ids:
-                        await self.crud.delete(
-                            db=db,
-                            db_row=None,
-                            commit=False,
-                            allow_multiple=False,
-                            **{pk_name: id_value},
-                        )
+                    request.state.deleted_records = await self._delete_rows(
+                        db, valid_ids
+                    )
                     await db.commit()
                 except Exception as e:
                     await db.rollback()
@@ -824,29 +1166,25 @@ class ModelView:
                     )
 
                 total_count = await self.crud.count(db=db)
-                max_page = (total_count + rows_per_page - 1) // rows_per_page
-                adjusted_page = min(page, max(1, max_page))
-
-                items_result = await self.crud.get_multi(
-                    db=db,
-                    offset=(adjusted_page - 1) * rows_per_page,
-                    limit=rows_per_page,
-                    schema_to_select=self.select_schema,
-                )
+                max_page = max(1, (total_count + rows_per_page - 1) // rows_per_page)
+                adjusted_page = min(max(1, page), max_page)
 
                 items: Dict[str, Any] = {
-                    "data": items_result.get("data", []),
-                    "total_count": items_result.get("total_count", 0),
+                    "data": await self._list_page(
+                        db, {}, (adjusted_page - 1) * rows_per_page, rows_per_page
+                    ),
+                    "total_count": total_count,
                 }
 
-                table_columns = [column.key for column in self.model.__table__.columns]
-                primary_key_info = self.db_config.get_primary_key_info(self.model)
+                table_columns = [column.key for column in self.descriptor.list_columns]
+                primary_key_info = self.descriptor.pk_info
 
                 context: Dict[str, Any] = {
                     "request": request,
                     "model_items": items["data"],
                     "model_name": self.model_key,
                     "table_columns": table_columns,
+                    "deferred_columns": self.descriptor.deferred_columns,
                     "total_items": items["total_count"],
                     "current_page": adjusted_page,
                     "rows_per_page": rows_per_page,
@@ -872,6 +1210,353 @@ class ModelView:
 
         return cast(EndpointCallable, bulk_delete_endpoint_inner)
 
+    def bulk_action_endpoint(self) -> EndpointCallable:
+        """
+        Create endpoint for bulk actions on every record matching the list filter.
+
+        Instead of a list of ids, the request carries the list page search
+        (column and value), and the action runs as one set-based statement.
+        A search that gives no filter is rejected, and a request without a
+        search must set all_records to act on the whole table.
+        A request without a confirmation token is a dry run that only counts
+        the matching records and returns a token. The token is an HMAC over
+        the user, action and filter and the confirmed count, and is valid for
+        BULK_ACTION_TOKEN_TTL seconds. Sending it back runs the action. If the
+        number of affected records differs from the confirmed count, the
+        transaction is rolled back.
+
+        Returns:
+            FastAPI route handler for filter-scoped bulk actions
+
+        Example:
+            ```python
+            body = {
+                "action": "update",
+                "field": "is_active",
+                "value": False,
+                "search_column": "email",
+                "search_value": "example.com",
+            }
+            preview = (await client.post("/bulk-action", json=body)).json()
+            # {"action": "update", "count": 1234, "confirmation_token": "..."}
+            body["confirmation_token"] = preview["confirmation_token"]
+            await client.post("/bulk-action", json=body)
+            # {"action": "update", "count": 1234}
+            ```
+
+        Response Formats:
+            **Errors:**
+                - 403: Action not allowed for this model
+                - 400: Invalid or expired confirmation token, bad field,
+                  search without a filter, or no search without all_records
+                - 409: Matching records changed since the dry run
+                - 422: Invalid request body or value
+        """
+
+        async def bulk_action_endpoint_inner(
+            request: Request,
+            db: AsyncSession = Depends(self.session),
+            admin_db: AsyncSession = Depends(self.db_config.get_admin_db),
+            current_user: dict = Depends(
+                cast(Any, self.admin_site).admin_authentication.get_current_user()
+            ),
+        ) -> Response:
+            """Count, or with a confirmation token run, a filter-scoped bulk action."""
+            try:
+                body = BulkActionRequest.model_validate(await request.json())
+            except (ValidationError, ValueError) as e:
+                return JSONResponse(
+                    status_code=422, content={"detail": [{"message": str(e)}]}
+                )
+
+            if body.action not in self.allowed_actions:
+                return JSONResponse(
+                    status_code=403,
+                    content={
+                        "detail": [{"message": f"Bulk {body.action} is not allowed"}]
+                    },
+                )
+
+            try:
+                values: Dict[str, Any] = {}
+                if body.action == "update":
+                    values = self._bulk_update_values(body.field, body.value)
+            except ValidationError as e:
+                return JSONResponse(
+                    status_code=422, content={"detail": [{"message": str(e)}]}
+                )
+            except ValueError as e:
+                return JSONResponse(
+                    status_code=400, content={"detail": [{"message": str(e)}]}
+                )
+
+            try:
+                conditions = self._bulk_action_conditions(body)
+            except ValueError as e:
+                return JSONResponse(
+                    status_code=400, content={"detail": [{"message": str(e)}]}
+                )
+
+            user = convert_user_to_dict(current_user)
+            user_id = user.get("id") if user else None
+
+            if body.confirmation_token is None:
+                count = (
+                    await db.execute(
+                        select(func.count()).select_from(self.model).where(*conditions)
+                    )
+                ).scalar_one()
+                return JSONResponse(
+                    content={
+                        "action": body.action,
+                        "count": count,
+                        "confirmation_token": self._bulk_action_token(
+                            user_id, body, count
+                        ),
+                    }
+                )
+
+            try:
+                confirmed_count = self._check_bulk_action_token(user_id, body)
+            except ValueError as e:
+                return JSONResponse(
+                    status_code=400, content={"detail": [{"message": str(e)}]}
+                )
+
+            job_id = None
+            if self.job_runner is not None:
+                job_id = await self.job_runner.submit(
+                    self._bulk_action_job_kind,
+                    body.model_dump(exclude={"confirmation_token"}),
+                    user_id=user_id,
+                    total=confirmed_count,
+                )
+            else:
+                stmt = (
+                    self._delete_statement(conditions, self._soft_delete_values())
+                    if body.action == "delete"
+                    else update(self.model).where(*conditions).values(values)
+                )
+                try:
+                    result = cast(
+                        CursorResult,
+                        await db.execute(
+                            stmt.execution_options(synchronize_session=False)
+                        ),
+                    )
+                    if result.rowcount != confirmed_count:
+                        await db.rollback()
+                        return JSONResponse(
+                            status_code=409,
+                            content={
+                                "detail": [
+                                    {
+                                        "message": f"{result.rowcount} records match "
+                                        f"instead of the confirmed {confirmed_count}; "
+                                        "run the dry run again"
+                                    }
+                                ]
+                            },
+                        )
+                    await db.commit()
+                except Exception as e:
+                    await db.rollback()
+                    return JSONResponse(
+                        status_code=400,
+                        content={
+                            "detail": [
+                                {"message": f"Error during bulk action: {str(e)}"}
+                            ]
+                        },
+                    )
+
+            if self.event_integration and user_id is not None:
+                try:
+                    await self.event_integration.log_model_event(
+                        db=admin_db,
+                        event_type=EventType.DELETE
+                        if body.action == "delete"
+                        else EventType.UPDATE,
+                        model=self.model,
+                        user_id=user_id,
+                        session_id=request.cookies.get("session_id", "unknown"),
+                        request=request,
+                        details={
+                            "bulk_action": {
+                                "action": body.action,
+                                "values": {body.field: body.value}
+                                if body.action == "update"
+                                else {},
+                                "search_column": body.search_column,
+                                "search_value": body.search_value,
+                                "records_count": confirmed_count,
+                                "job_id": job_id,
+                            }
+                        },
+                    )
+                except Exception as e:
+                    logger.error(f"Error logging bulk action: {str(e)}")
+
+            if job_id is not None:
+                return JSONResponse(
+                    status_code=202,
+                    content={
+                        "action": body.action,
+                        "count": confirmed_count,
+                        "job_id": job_id,
+                    },
+                )
+            return JSONResponse(
+                content={"action": body.action, "count": confirmed_count}
+            )
+
+        return cast(EndpointCallable, bulk_action_endpoint_inner)
+
+    @property
+    def _bulk_action_job_kind(self) -> str:
+        return f"bulk_action:{self.model_key}"
+
+    @asynccontextmanager
+    async def _session_scope(self) -> AsyncIterator[AsyncSession]:
+        """Open a session from the session dependency outside of a request."""
+        if self._model_is_admin_model(self.model):
+            async with AsyncSession(
+                self.db_config.admin_engine, expire_on_commit=False
+            ) as db:
+                yield db
+            return
+
+        sessions = self.session()
+        try:
+            yield await sessions.__anext__()
+        finally:
+            await sessions.aclose()
+
+    async def _bulk_action_job(self, params: Dict[str, Any], cursor: Any) -> JobChunk:
+        """
+        Run one chunk of a bulk action job.
+
+        Selects the next delete_chunk_size primary keys matching the filter
+        after the cursor, applies the action to them and commits, so each
+        chunk holds locks only briefly and an interrupted job resumes after
+        the last committed key.
+        """
+        body = BulkActionRequest.model_validate(params)
+        pk_column = self.descriptor.pk_column
+        conditions = self._bulk_action_conditions(body)
+        if cursor is not None:
+            if self.descriptor.pk_info and self.descriptor.pk_info["type"] is UUID:
+                cursor = UUID(cursor)
+            conditions.append(pk_column > cursor)
+
+        async with self._session_scope() as db:
+            pk_values = (
+                (
+                    await db.execute(
+                        select(pk_column)
+                        .where(*conditions)
+                        .order_by(pk_column)
+                        .limit(self.delete_chunk_size)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            if not pk_values:
+                return JobChunk(processed=0, cursor=cursor, done=True)
+
+            stmt = (
+                self._delete_statement(
+                    [pk_column.in_(pk_values)], self._soft_delete_values()
+                )
+                if body.action == "delete"
+                else update(self.model)
+                .where(pk_column.in_(pk_values))
+                .values(self._bulk_update_values(body.field, body.value))
+            )
+            await db.execute(stmt.execution_options(synchronize_session=False))
+            await db.commit()
+
+        last = pk_values[-1]
+        return JobChunk(
+            processed=len(pk_values),
+            cursor=last if isinstance(last, (int, float, str)) else str(last),
+            done=len(pk_values) < self.delete_chunk_size,
+        )
+
+    def _bulk_update_values(self, field: Optional[str], value: Any) -> Dict[str, Any]:
+        """
+        Validate a bulk update of one field through the update schema.
+
+        Raises:
+            ValueError: If the field is not an updatable column
+            ValidationError: If the value is invalid for the field
+        """
+        if (
+            not field
+            or field not in self.update_schema.model_fields
+            or field not in self.descriptor.column_set
+            or field in self.descriptor.pk_names
+        ):
+            raise ValueError(f"Field {field!r} cannot be bulk updated")
+
+        validated = self.update_schema.model_validate({field: value})
+        return self._update_values({field: getattr(validated, field)})
+
+    def _bulk_action_signature(
+        self, user_id: Any, body: BulkActionRequest, count: int, expires: int
+    ) -> str:
+        message = json.dumps(
+            [
+                self.model_key,
+                user_id,
+                body.action,
+                body.field,
+                body.value,
+                body.search_column,
+                body.search_value,
+                body.all_records,
+                count,
+                expires,
+            ],
+            default=str,
+            separators=(",", ":"),
+        )
+        return hmac.new(
+            self.secret_key.encode(), message.encode(), hashlib.sha256
+        ).hexdigest()
+
+    def _bulk_action_token(
+        self, user_id: Any, body: BulkActionRequest, count: int
+    ) -> str:
+        """Sign the action, filter and matching count for the confirmation step."""
+        expires = int(time.time()) + self.BULK_ACTION_TOKEN_TTL
+        signature = self._bulk_action_signature(user_id, body, count, expires)
+        return f"{expires}.{count}.{signature}"
+
+    def _check_bulk_action_token(self, user_id: Any, body: BulkActionRequest) -> int:
+        """
+        Verify a confirmation token against the request.
+
+        Returns:
+            The record count confirmed in the dry run
+
+        Raises:
+            ValueError: If the token is malformed, expired or for another request
+        """
+        try:
+            expires_str, count_str, signature = str(body.confirmation_token).split(".")
+            expires, count = int(expires_str), int(count_str)
+        except ValueError:
+            raise ValueError("Malformed confirmation token") from None
+
+        expected = self._bulk_action_signature(user_id, body, count, expires)
+        if not hmac.compare_digest(signature, expected):
+            raise ValueError("Confirmation token does not match this bulk action")
+        if expires < time.time():
+            raise ValueError("Confirmation token has expired; run the dry run again")
+        return count
+
     def get_model_admin_page(
         self, template: str = "admin/model/list.html"
     ) -> EndpointCallable:
@@ -932,36 +1617,10 @@ class ModelView:
             sort_column = request.query_params.get("sort_by")
             sort_order = request.query_params.get("sort_order", "asc")
 
-            sort_columns = (
-                [sort_column] if sort_column and sort_column != "None" else None
-            )
-            sort_orders = [sort_order] if sort_order and sort_order != "None" else None
-
             search_column = request.query_params.get("column-to-search")
             search_value = request.query_params.get("search-input", "").strip()
 
-            filter_criteria: Dict[str, Any] = {}
-            if search_column and search_value:
-                column = self.model.__table__.columns.get(search_column)
-                if column is not None:
-                    python_type = column.type.python_type
-                    try:
-                        if python_type is int:
-                            filter_criteria[search_column] = int(search_value)
-                        elif python_type is float:
-                            filter_criteria[search_column] = float(search_value)
-                        elif python_type is bool:
-                            lower_search = search_value.lower()
-                            if lower_search in ("true", "yes", "1", "t", "y"):
-                                filter_criteria[search_column] = True
-                            elif lower_search in ("false", "no", "0", "f", "n"):
-                                filter_criteria[search_column] = False
-                        elif python_type is str:
-                            filter_criteria[f"{search_column}__ilike"] = (
-                                f"%{search_value}%"
-                            )
-                    except (ValueError, TypeError):
-                        pass
+            filter_criteria = self._search_filter_criteria(search_column, search_value)
 
             try:
                 total_items = await self.crud.count(db=db, **cast(Any, filter_criteria))
@@ -969,19 +1628,16 @@ class ModelView:
                 page = min(page, max_page)
                 offset = (page - 1) * rows_per_page
 
-                items_result = await self.crud.get_multi(
-                    db=db,
-                    offset=offset,
-                    limit=rows_per_page,
-                    sort_columns=sort_columns,
-                    sort_orders=sort_orders,
-                    schema_to_select=self.select_schema,
-                    **cast(Any, filter_criteria),
-                )
-
                 items: Dict[str, Any] = {
-                    "data": items_result.get("data", []),
-                    "total_count": items_result.get("total_count", 0),
+                    "data": await self._list_page(
+                        db,
+                        filter_criteria,
+                        offset,
+                        rows_per_page,
+                        sort_by=sort_column,
+                        sort_order=sort_order,
+                    ),
+                    "total_count": total_items,
                 }
 
             except Exception:
@@ -989,14 +1645,16 @@ class ModelView:
                 total_items = 0
                 page = 1
 
-            table_columns = [column.key for column in self.model.__table__.columns]
-            primary_key_info = self.db_config.get_primary_key_info(self.model)
+            table_columns = [column.key for column in self.descriptor.list_columns]
+            primary_key_info = self.descriptor.pk_info
 
             context: Dict[str, Any] = {
                 "request": request,
                 "model_items": items["data"],
                 "model_name": self.model_key,
                 "table_columns": table_columns,
+                "search_columns": self.descriptor.column_names,
+                "deferred_columns": self.descriptor.deferred_columns,
                 "total_items": items["total_count"],
                 "current_page": page,
                 "rows_per_page": rows_per_page,
@@ -1024,6 +1682,809 @@ class ModelView:
 
         return cast(EndpointCallable, get_model_admin_page_inner)
 
+    def export_endpoint(self) -> EndpointCallable:
+        """
+        Create endpoint that streams the list results as CSV or NDJSON.
+
+        Takes the same search and sort parameters as the list page and
+        streams every matching row, projected to the select_schema columns
+        when one is set. Rows are read through a server-side cursor in
+        batches of chunk_size from a dedicated session, so memory use does
+        not grow with the table size and the first rows are sent before the
+        query has finished.
+
+        Returns:
+            FastAPI route handler that returns a StreamingResponse
+
+        Example:
+            ```python
+            # All active users, newest first, as CSV
+            response = await client.get(
+                "/export?format=csv&sort_by=created_at&sort_order=desc"
+                "&column-to-search=is_active&search-input=true"
+            )
+            ```
+
+        Response Formats:
+            **Errors:**
+                - 400: Unsupported export format
+        """
+
+        async def export_endpoint_inner(
+            request: Request, format: str = "csv", chunk_size: int = 1000
+        ) -> Response:
+            """Stream all rows matching the list page filters."""
+            if format not in EXPORT_FORMATS:
+                return JSONResponse(
+                    status_code=400,
+                    content={
+                        "detail": [{"message": f"Unsupported export format: {format}"}]
+                    },
+                )
+
+            params = request.query_params
+            stmt = self._export_statement(
+                search_column=params.get("column-to-search"),
+                search_value=params.get("search-input", "").strip(),
+                sort_by=params.get("sort_by"),
+                sort_order=params.get("sort_order", "asc"),
+            ).execution_options(yield_per=max(1, min(chunk_size, 10000)))
+            columns = [column.key for column in self._row_columns()]
+
+            async def rows(result: Any) -> AsyncIterator[Dict[str, Any]]:
+                async for row in result.mappings():
+                    yield dict(row)
+
+            async def stream() -> AsyncIterator[str]:
+                async with self._session_scope() as db:
+                    result = await db.stream(stmt)
+                    lines = (
+                        ndjson_lines(rows(result))
+                        if format == "ndjson"
+                        else csv_table_lines(rows(result), columns)
+                    )
+                    async for line in lines:
+                        yield line
+
+            timestamp = dt.now(datetime.timezone.utc).strftime("%Y%m%d%H%M%S")
+            return StreamingResponse(
+                stream(),
+                media_type=EXPORT_FORMATS[format],
+                headers={
+                    "Content-Disposition": (
+                        f'attachment; filename="{self.model_key}_{timestamp}.{format}"'
+                    )
+                },
+            )
+
+        return cast(EndpointCallable, export_endpoint_inner)
+
+    def _export_statement(
+        self,
+        search_column: Optional[str],
+        search_value: str,
+        sort_by: Optional[str],
+        sort_order: str,
+    ) -> Any:
+        """Select the list page rows for export, ordered with the primary key last."""
+        conditions = self._filter_conditions(
+            self._search_filter_criteria(search_column, search_value)
+        )
+        return (
+            select(*self._row_columns())
+            .where(*conditions)
+            .order_by(*self._order_by(sort_by, sort_order))
+        )
+
+    def _order_by(self, sort_by: Optional[str], sort_order: str) -> List[Any]:
+        """Order by the sort column, if it exists, then by the primary key."""
+        order_by: List[Any] = []
+        sort_column = (
+            self.model.__table__.columns.get(sort_by)
+            if sort_by and sort_by != "None"
+            else None
+        )
+        if sort_column is not None:
+            order_by.append(
+                sort_column.desc() if sort_order == "desc" else sort_column.asc()
+            )
+        order_by.append(self.descriptor.pk_column)
+        return order_by
+
+    async def _list_page(
+        self,
+        db: AsyncSession,
+        filter_criteria: Dict[str, Any],
+        offset: int,
+        limit: int,
+        sort_by: Optional[str] = None,
+        sort_order: str = "asc",
+    ) -> List[Dict[str, Any]]:
+        """
+        Read one page of the list view.
+
+        Only the list columns are selected. Text and JSON list columns are
+        truncated to LIST_PREVIEW_LENGTH characters in the query and
+        LargeBinary ones are read as their size, so large values are never
+        loaded for a page. Those cells become {"preview", "truncated"}
+        dictionaries; the full value is served by the cell endpoint.
+        """
+        stmt = (
+            select(*self.descriptor.list_select)
+            .where(*self._filter_conditions(filter_criteria))
+            .order_by(*self._order_by(sort_by, sort_order))
+            .offset(offset)
+            .limit(limit)
+        )
+        rows = [dict(row) for row in (await db.execute(stmt)).mappings()]
+
+        for row in rows:
+            for key, kind in self.descriptor.deferred_columns.items():
+                value = row[key]
+                if value is None:
+                    row[key] = {"preview": None, "truncated": False}
+                elif kind == "binary":
+                    row[key] = {"preview": f"<{value} bytes>", "truncated": False}
+                else:
+                    row[key] = {
+                        "preview": value[:LIST_PREVIEW_LENGTH],
+                        "truncated": len(value) > LIST_PREVIEW_LENGTH,
+                    }
+        return rows
+
+    def list_cell_endpoint(self) -> EndpointCallable:
+        """
+        Create endpoint that returns the full value of a truncated list cell.
+
+        The list page shows long Text and JSON values as previews with a
+        button that loads the rest through this endpoint with HTMX.
+
+        Returns:
+            FastAPI route handler rendering the full cell value
+        """
+
+        async def list_cell_endpoint_inner(
+            request: Request, id: str, column: str
+        ) -> Response:
+            """Render the full value of one Text or JSON list cell."""
+            if self.descriptor.deferred_columns.get(column) != "text":
+                return JSONResponse(
+                    status_code=404,
+                    content={"detail": [{"message": f"No preview column {column!r}"}]},
+                )
+
+            try:
+                pk_value = self._convert_id_to_pk_type(id)
+            except (ValueError, TypeError):
+                return JSONResponse(
+                    status_code=422,
+                    content={"detail": [{"message": f"Invalid id {id!r}"}]},
+                )
+
+            async with self._session_scope() as db:
+                row = (
+                    await db.execute(
+                        select(self.model.__table__.columns[column]).where(
+                            self.descriptor.pk_column == pk_value
+                        )
+                    )
+                ).first()
+            if row is None:
+                return JSONResponse(
+                    status_code=404,
+                    content={"detail": [{"message": f"Item with id {id} not found"}]},
+                )
+
+            value = row[0]
+            if value is not None and not isinstance(value, str):
+                value = json.dumps(value, default=str)
+            return self.templates.TemplateResponse(
+                "admin/model/components/list_cell.html",
+                {"request": request, "value": value},
+            )
+
+        return cast(EndpointCallable, list_cell_endpoint_inner)
+
+    def import_endpoint(self) -> EndpointCallable:
+        """
+        Create endpoint that imports records from an uploaded CSV or NDJSON file.
+
+        The upload is parsed in a worker thread, import_batch_size rows at a
+        time, and each row is validated against create_schema. Valid rows are inserted import_batch_size at a time,
+        each batch as one executemany INSERT in its own transaction. If a
+        batch fails in the database (e.g. a unique constraint), that batch is
+        retried row by row so only the offending rows are rejected. Rejected
+        rows are written with their errors, also from a worker thread, to an
+        NDJSON report that can be downloaded from /import/report/{report_id}.
+
+        Returns:
+            FastAPI route handler for file imports
+
+        Example:
+            ```python
+            with open("users.csv", "rb") as f:
+                response = await client.post("/import", files={"file": f})
+            # {"imported": 99998, "rejected": 2, "report_id": "...",
+            #  "report_url": "/admin/User/import/report/..."}
+            ```
+
+        Notes:
+            - The format comes from the format parameter or the file extension
+              (.csv, or .ndjson/.jsonl for NDJSON)
+            - Empty CSV cells are treated as missing, so schema defaults apply
+            - Password fields are hashed through the view's PasswordTransformer
+
+        Response Formats:
+            **Errors:**
+                - 400: Missing file or unsupported format
+        """
+
+        async def import_endpoint_inner(
+            request: Request,
+            file: Optional[UploadFile] = File(None),
+            format: Optional[str] = None,
+            db: AsyncSession = Depends(self.session),
+            admin_db: AsyncSession = Depends(self.db_config.get_admin_db),
+            current_user: dict = Depends(
+                cast(Any, self.admin_site).admin_authentication.get_current_user()
+            ),
+        ) -> Response:
+            """Validate and insert the rows of an uploaded file in batches."""
+            if file is None:
+                return JSONResponse(
+                    status_code=400,
+                    content={"detail": [{"message": "No file uploaded"}]},
+                )
+
+            import_format = format or IMPORT_EXTENSIONS.get(
+                os.path.splitext(file.filename or "")[1].lower()
+            )
+            if import_format not in ("csv", "ndjson"):
+                return JSONResponse(
+                    status_code=400,
+                    content={
+                        "detail": [
+                            {
+                                "message": "Unsupported import format; "
+                                "use .csv, .ndjson or .jsonl"
+                            }
+                        ]
+                    },
+                )
+
+            report_fd, report_path = tempfile.mkstemp(
+                prefix=f"{self.model_key}_import_", suffix=".ndjson"
+            )
+            imported = rejected = 0
+            with os.fdopen(report_fd, "w", encoding="utf-8") as report:
+                report_lines: List[str] = []
+
+                def reject(line: int, row: Any, errors: List[Dict[str, Any]]) -> None:
+                    nonlocal rejected
+                    rejected += 1
+                    report_lines.append(
+                        json.dumps(
+                            {"line": line, "row": row, "errors": errors}, default=str
+                        )
+                        + "\n"
+                    )
+
+                async def write_report() -> None:
+                    if report_lines:
+                        await asyncio.to_thread(report.writelines, list(report_lines))
+                        report_lines.clear()
+
+                rows = _read_import_rows(file.file, import_format)
+                batch: List[Tuple[int, Dict[str, Any], Dict[str, Any]]] = []
+                while True:
+                    page = await asyncio.to_thread(
+                        list, itertools.islice(rows, self.import_batch_size)
+                    )
+                    if not page:
+                        break
+                    for line, row, error in page:
+                        if error is not None:
+                            reject(line, row, [{"msg": error}])
+                            continue
+                        try:
+                            values = await self._create_values(row)
+                        except ValidationError as e:
+                            reject(line, row, _validation_errors(e))
+                            continue
+                        except ValueError as e:
+                            reject(line, row, [{"msg": str(e)}])
+                            continue
+
+                        batch.append((line, row, values))
+                        if len(batch) >= self.import_batch_size:
+                            imported += len(await self._insert_batch(db, batch, reject))
+                            batch = []
+                    await write_report()
+                if batch:
+                    imported += len(await self._insert_batch(db, batch, reject))
+                await write_report()
+
+            report_id = None
+            if rejected:
+                report_id = self._store_import_report(report_path)
+            else:
+                os.remove(report_path)
+
+            user = convert_user_to_dict(current_user)
+            if self.event_integration and user and user.get("id") is not None:
+                try:
+                    await self.event_integration.log_model_event(
+                        db=admin_db,
+                        event_type=EventType.CREATE,
+                        model=self.model,
+                        user_id=user["id"],
+                        session_id=request.cookies.get("session_id", "unknown"),
+                        request=request,
+                        details={
+                            "import": {
+                                "filename": file.filename,
+                                "format": import_format,
+                                "imported": imported,
+                                "rejected": rejected,
+                            }
+                        },
+                    )
+                except Exception as e:
+                    logger.error(f"Error logging import: {str(e)}")
+
+            return JSONResponse(
+                content={
+                    "imported": imported,
+                    "rejected": rejected,
+                    "report_id": report_id,
+                    "report_url": (
+                        f"{self.get_url_prefix()}/{self.model_key}"
+                        f"/import/report/{report_id}"
+                        if report_id
+                        else None
+                    ),
+                }
+            )
+
+        return cast(EndpointCallable, import_endpoint_inner)
+
+    def import_report_endpoint(self) -> EndpointCallable:
+        """
+        Create endpoint that downloads the rejected rows of an import.
+
+        Returns:
+            FastAPI route handler that returns the NDJSON report file
+        """
+
+        async def import_report_endpoint_inner(report_id: str) -> Response:
+            """Return the rejected-row report of a previous import."""
+            report_path = self._import_reports.get(report_id)
+            if report_path is None or not os.path.exists(report_path):
+                return JSONResponse(
+                    status_code=404,
+                    content={"detail": [{"message": "Import report not found"}]},
+                )
+            return FileResponse(
+                report_path,
+                media_type="application/x-ndjson",
+                filename=f"{self.model_key}_import_errors.ndjson",
+            )
+
+        return cast(EndpointCallable, import_report_endpoint_inner)
+
+    async def _create_values(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate one imported or bulk-created row and return the values to insert.
+
+        Raises:
+            ValidationError: If the row does not match create_schema
+            ValueError: If the row has fields that are not model columns
+        """
+        item = self.create_schema.model_validate(row)
+        values = item.model_dump()
+        if self.password_transformer is not None:
+            values = await get_password_hash_pool().run(
+                self.password_transformer.transform_create_data, values, item
+            )
+            for required_field in self.password_transformer.required_fields:
+                if not values.get(required_field):
+                    raise ValueError(
+                        f"{self.model.__name__} requires a {required_field}."
+                    )
+
+        extra_fields = set(values) - self.descriptor.column_set
+        if extra_fields:
+            raise ValueError(f"Extra fields provided: {extra_fields}")
+        return values
+
+    async def _insert_batch(
+        self,
+        db: AsyncSession,
+        batch: List[Tuple[int, Any, Dict[str, Any]]],
+        reject: Callable[[int, Any, List[Dict[str, Any]]], None],
+        return_keys: bool = False,
+    ) -> Dict[int, Any]:
+        """
+        Insert a batch of validated rows in one transaction.
+
+        Rows are grouped by their set of keys so each group is a single
+        executemany. If the batch fails, it is retried one row per
+        transaction and the failing rows are passed to reject.
+
+        Args:
+            db: Session of the model's database
+            batch: (position, raw row, values to insert) tuples
+            reject: Called with the position, raw row and errors of failed rows
+            return_keys: Read back the new primary keys where the dialect
+                supports RETURNING for executemany
+
+        Returns:
+            Primary key of each inserted row by position, or None when not read
+        """
+        pk_column = self.descriptor.pk_column
+        stmt: Any = insert(self.model)
+        if return_keys and self._supports_returning(db, "insert_executemany"):
+            stmt = stmt.returning(pk_column, sort_by_parameter_order=True)
+        else:
+            return_keys = False
+
+        async def execute(rows: List[Tuple[int, Dict[str, Any]]]) -> Dict[int, Any]:
+            result = await db.execute(stmt, [values for _, values in rows])
+            keys = list(result.scalars()) if return_keys else [None] * len(rows)
+            return {position: key for (position, _), key in zip(rows, keys)}
+
+        groups: Dict[Tuple[str, ...], List[Tuple[int, Dict[str, Any]]]] = {}
+        for position, _, values in batch:
+            groups.setdefault(tuple(sorted(values)), []).append((position, values))
+
+        inserted: Dict[int, Any] = {}
+        try:
+            for rows in groups.values():
+                inserted.update(await execute(rows))
+            await db.commit()
+            return inserted
+        except SQLAlchemyError:
+            await db.rollback()
+
+        inserted = {}
+        for position, row, values in batch:
+            try:
+                keys = await execute([(position, values)])
+                await db.commit()
+                inserted.update(keys)
+            except SQLAlchemyError as e:
+                await db.rollback()
+                reject(position, row, [{"msg": _database_error(e)}])
+        return inserted
+
+    async def _update_batch(
+        self,
+        db: AsyncSession,
+        batch: List[Tuple[int, Any, Dict[str, Any]]],
+        reject: Callable[[int, Any, List[Dict[str, Any]]], None],
+    ) -> List[int]:
+        """
+        Update a batch of rows by primary key in one transaction.
+
+        Works like _insert_batch: one executemany UPDATE per set of keys,
+        retried one row per transaction if the batch fails.
+
+        Returns:
+            Positions of the updated rows
+        """
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for _, _, values in batch:
+            groups.setdefault(tuple(sorted(values)), []).append(values)
+
+        try:
+            for rows in groups.values():
+                await db.execute(update(self.model), rows)
+            await db.commit()
+            return [position for position, _, _ in batch]
+        except SQLAlchemyError:
+            await db.rollback()
+
+        updated = []
+        for position, row, values in batch:
+            try:
+                await db.execute(update(self.model), [values])
+                await db.commit()
+                updated.append(position)
+            except SQLAlchemyError as e:
+                await db.rollback()
+                reject(position, row, [{"msg": _database_error(e)}])
+        return updated
+
+    async def _read_bulk_items(self, request: Request) -> Union[List[Any], Response]:
+        """Parse a bulk request body, or return the error response."""
+        try:
+            items = await request.json()
+        except ValueError:
+            items = None
+        if not isinstance(items, list):
+            return JSONResponse(
+                status_code=400,
+                content={"detail": [{"message": "Request body must be a JSON array"}]},
+            )
+        if len(items) > self.MAX_BULK_ITEMS:
+            return JSONResponse(
+                status_code=413,
+                content={
+                    "detail": [
+                        {"message": f"At most {self.MAX_BULK_ITEMS} items per request"}
+                    ]
+                },
+            )
+        return items
+
+    async def _bulk_item_update_values(
+        self, item: Dict[str, Any], pk_key: str
+    ) -> Dict[str, Any]:
+        """
+        Validate the fields of one bulk update item and return the values to write.
+
+        Raises:
+            ValidationError: If the fields do not match update_schema
+            ValueError: If no fields are set or a field is not a model column
+        """
+        fields = {key: value for key, value in item.items() if key != pk_key}
+        data = self.update_schema.model_validate(fields)
+        values = data.model_dump(exclude_unset=True)
+        if self.password_transformer is not None:
+            values = await get_password_hash_pool().run(
+                self.password_transformer.transform_update_data, values, data
+            )
+            values.pop("updated_at", None)
+        if not values:
+            raise ValueError("No fields to update")
+        return self._update_values(values)
+
+    async def _bulk_response(
+        self,
+        request: Request,
+        admin_db: AsyncSession,
+        current_user: Any,
+        event_type: EventType,
+        status: str,
+        results: List[Dict[str, Any]],
+    ) -> Response:
+        """Log one event for a bulk request and return its per-item results."""
+        succeeded = sum(1 for result in results if result["status"] == status)
+        summary = {status: succeeded, "failed": len(results) - succeeded}
+
+        user = convert_user_to_dict(current_user)
+        if self.event_integration and user and user.get("id") is not None and results:
+            try:
+                await self.event_integration.log_model_event(
+                    db=admin_db,
+                    event_type=event_type,
+                    model=self.model,
+                    user_id=user["id"],
+                    session_id=request.cookies.get("session_id", "unknown"),
+                    request=request,
+                    details={
+                        "bulk": {
+                            **summary,
+                            "ids": [
+                                result["id"]
+                                for result in results
+                                if result["status"] == status
+                            ],
+                        }
+                    },
+                )
+            except Exception as e:
+                logger.error(f"Error logging bulk {status}: {str(e)}")
+
+        return JSONResponse(content=jsonable_encoder({**summary, "results": results}))
+
+    def _store_import_report(self, report_path: str) -> str:
+        """Register a report file for download, removing the oldest beyond the limit."""
+        report_id = secrets.token_urlsafe(16)
+        self._import_reports[report_id] = report_path
+        while len(self._import_reports) > self.MAX_IMPORT_REPORTS:
+            oldest = next(iter(self._import_reports))
+            old_path = self._import_reports.pop(oldest)
+            if os.path.exists(old_path):
+                os.remove(old_path)
+        return report_id
+
+    def bulk_create_endpoint(self) -> EndpointCallable:
+        """
+        Create endpoint that creates many records from a JSON array.
+
+        Every item is validated against create_schema first. Valid items are
+        then inserted import_batch_size at a time, each chunk as one
+        executemany INSERT in its own transaction. A chunk the database
+        rejects is retried item by item, so one conflicting item does not
+        fail the others.
+
+        Returns:
+            FastAPI route handler for bulk creates
+
+        Example:
+            ```python
+            response = await client.post(
+                "/admin/User/crud/bulk",
+                json=[{"username": "a", "email": "a@example.com"}, {"username": "b"}],
+            )
+            # {"created": 1, "failed": 1, "results": [
+            #     {"index": 0, "status": "created", "id": 42},
+            #     {"index": 1, "status": "error", "errors": [...]}]}
+            ```
+
+        Notes:
+            - id is the new primary key where the database can return it
+              from a batched insert, and null otherwise
+
+        Response Formats:
+            **Errors:**
+                - 400: Body is not a JSON array
+                - 413: More than MAX_BULK_ITEMS items
+        """
+
+        async def bulk_create_endpoint_inner(
+            request: Request,
+            db: AsyncSession = Depends(self.session),
+            admin_db: AsyncSession = Depends(self.db_config.get_admin_db),
+            current_user: dict = Depends(
+                cast(Any, self.admin_site).admin_authentication.get_current_user()
+            ),
+        ) -> Response:
+            """Validate and insert an array of create payloads."""
+            items = await self._read_bulk_items(request)
+            if isinstance(items, Response):
+                return items
+
+            results: Dict[int, Dict[str, Any]] = {}
+
+            def reject(index: int, item: Any, errors: List[Dict[str, Any]]) -> None:
+                results[index] = {"index": index, "status": "error", "errors": errors}
+
+            valid: List[Tuple[int, Any, Dict[str, Any]]] = []
+            for index, item in enumerate(items):
+                try:
+                    if not isinstance(item, dict):
+                        raise ValueError("Each item must be a JSON object")
+                    valid.append((index, item, await self._create_values(item)))
+                except ValidationError as e:
+                    reject(index, item, _validation_errors(e))
+                except ValueError as e:
+                    reject(index, item, [{"msg": str(e)}])
+
+            for start in range(0, len(valid), self.import_batch_size):
+                inserted = await self._insert_batch(
+                    db,
+                    valid[start : start + self.import_batch_size],
+                    reject,
+                    return_keys=True,
+                )
+                for index, pk_value in inserted.items():
+                    results[index] = {
+                        "index": index,
+                        "status": "created",
+                        "id": pk_value,
+                    }
+
+            return await self._bulk_response(
+                request,
+                admin_db,
+                current_user,
+                EventType.CREATE,
+                "created",
+                [results[index] for index in range(len(items))],
+            )
+
+        return cast(EndpointCallable, bulk_create_endpoint_inner)
+
+    def bulk_update_endpoint(self) -> EndpointCallable:
+        """
+        Create endpoint that partially updates many records from a JSON array.
+
+        Each item holds the primary key and the fields to change, which are
+        validated against update_schema. Valid items are written
+        import_batch_size at a time, each chunk as one executemany UPDATE by
+        primary key in its own transaction. Items whose record does not
+        exist are reported as not_found. A chunk the database rejects is
+        retried item by item.
+
+        Returns:
+            FastAPI route handler for bulk updates
+
+        Example:
+            ```python
+            response = await client.patch(
+                "/admin/User/crud/bulk",
+                json=[{"id": 1, "is_active": False}, {"id": 2, "email": "b@example.com"}],
+            )
+            # {"updated": 2, "failed": 0, "results": [
+            #     {"index": 0, "status": "updated", "id": 1},
+            #     {"index": 1, "status": "updated", "id": 2}]}
+            ```
+
+        Response Formats:
+            **Errors:**
+                - 400: Body is not a JSON array
+                - 413: More than MAX_BULK_ITEMS items
+        """
+
+        async def bulk_update_endpoint_inner(
+            request: Request,
+            db: AsyncSession = Depends(self.session),
+            admin_db: AsyncSession = Depends(self.db_config.get_admin_db),
+            current_user: dict = Depends(
+                cast(Any, self.admin_site).admin_authentication.get_current_user()
+            ),
+        ) -> Response:
+            """Validate and apply an array of partial updates."""
+            items = await self._read_bulk_items(request)
+            if isinstance(items, Response):
+                return items
+
+            pk_column = self.descriptor.pk_column
+            pk_key = str(pk_column.key)
+            results: Dict[int, Dict[str, Any]] = {}
+
+            def reject(index: int, item: Any, errors: List[Dict[str, Any]]) -> None:
+                results[index] = {"index": index, "status": "error", "errors": errors}
+
+            valid: List[Tuple[int, Any, Dict[str, Any]]] = []
+            seen: Set[Any] = set()
+            for index, item in enumerate(items):
+                try:
+                    if not isinstance(item, dict) or item.get(pk_key) is None:
+                        raise ValueError(
+                            f"Each item must be a JSON object with {pk_key!r}"
+                        )
+                    pk_value = self._convert_id_to_pk_type(item[pk_key])
+                    if pk_value in seen:
+                        raise ValueError(f"Duplicate {pk_key!r} in request")
+                    values = await self._bulk_item_update_values(item, pk_key)
+                    seen.add(pk_value)
+                    valid.append((index, item, {pk_key: pk_value, **values}))
+                except ValidationError as e:
+                    reject(index, item, _validation_errors(e))
+                except (ValueError, TypeError) as e:
+                    reject(index, item, [{"msg": str(e)}])
+
+            for start in range(0, len(valid), self.import_batch_size):
+                chunk = valid[start : start + self.import_batch_size]
+                result = await db.execute(
+                    select(pk_column).where(
+                        pk_column.in_([values[pk_key] for _, _, values in chunk])
+                    )
+                )
+                existing = {str(pk_value) for pk_value in result.scalars()}
+                found = []
+                for index, item, values in chunk:
+                    if str(values[pk_key]) in existing:
+                        found.append((index, item, values))
+                    else:
+                        results[index] = {
+                            "index": index,
+                            "status": "not_found",
+                            "id": values[pk_key],
+                        }
+
+                pk_values = {index: values[pk_key] for index, _, values in found}
+                for index in await self._update_batch(db, found, reject):
+                    results[index] = {
+                        "index": index,
+                        "status": "updated",
+                        "id": pk_values[index],
+                    }
+
+            return await self._bulk_response(
+                request,
+                admin_db,
+                current_user,
+                EventType.UPDATE,
+                "updated",
+                [results[index] for index in range(len(items))],
+            )
+
+        return cast(EndpointCallable, bulk_update_endpoint_inner)
+
     def get_model_create_page(
         self, template: str = "admin/model/create.html"
     ) -> EndpointCallable:
@@ -1045,7 +2506,7 @@ class ModelView:
 
         async def model_create_page(request: Request) -> Response:
             """Show a blank form for creating a new record."""
-            form_fields = _get_form_fields_from_schema(self.create_schema)
+            form_fields = self.descriptor.create_form.build()
             return self.templates.TemplateResponse(
                 template,
                 {
@@ -1091,7 +2552,7 @@ class ModelView:
                     status_code=404, content={"message": f"Item with id {id} not found"}
                 )
 
-            form_fields = _get_form_fields_from_schema(self.update_schema)
+            form_fields = self.descriptor.update_form.build()
             for field in form_fields:
                 field_name = field["name"]
                 if field_name in item:
@@ -1119,12 +2580,14 @@ class ModelView:
 
         Notes:
             - Uses @log_admin_action decorator for event tracking
+            - Reads the row once (locked where supported) and updates it with
+              UPDATE ... RETURNING, handing both states to the event log
             - Only updates provided fields
             - Handles password hashing for AdminUser model
             - Supports automatic updated_at timestamp
         """
 
-        @log_admin_action(EventType.UPDATE, model=self.model)
+        @log_admin_action(EventType.UPDATE, model=self.model, captures_state=True)
         async def form_update_endpoint_inner(
             request: Request,
             db: AsyncSession = Depends(self.session),
@@ -1145,15 +2608,13 @@ class ModelView:
 
             converted_id = self._convert_id_to_pk_type(id)
 
-            item = await self.crud.get(
-                db=db, id=converted_id, schema_to_select=self.select_schema
-            )
+            item = await self._read_row_for_update(db, converted_id)
             if not item:
                 return JSONResponse(
                     status_code=404, content={"message": f"Item with id {id} not found"}
                 )
 
-            form_fields = _get_form_fields_from_schema(self.update_schema)
+            form_fields = self.descriptor.update_form.build()
             error_message: Optional[str] = None
             field_errors: Dict[str, str] = {}
             field_values: Dict[str, Any] = {}
@@ -1191,10 +2652,10 @@ class ModelView:
                         if self.password_transformer is not None:
                             update_schema_instance = self.update_schema(**update_data)
 
-                            transformed_data = (
-                                self.password_transformer.transform_update_data(
-                                    update_data, update_schema_instance
-                                )
+                            transformed_data = await get_password_hash_pool().run(
+                                self.password_transformer.transform_update_data,
+                                update_data,
+                                update_schema_instance,
                             )
 
                             if self.model.__name__ == "AdminUser":
@@ -1203,37 +2664,36 @@ class ModelView:
                                 admin_update_schema: AdminUserUpdateInternal = (
                                     AdminUserUpdateInternal(**transformed_data)
                                 )
-                                await self.crud.update(
-                                    db=db, id=converted_id, object=admin_update_schema
+                                new_state = await self._update_row(
+                                    db, converted_id, admin_update_schema, item
                                 )
                             else:
                                 if self.update_internal_schema:
                                     generic_update_schema = self.update_internal_schema(
                                         **transformed_data
                                     )
-                                    await self.crud.update(
-                                        db=db,
-                                        id=converted_id,
-                                        object=generic_update_schema,
+                                    new_state = await self._update_row(
+                                        db, converted_id, generic_update_schema, item
                                     )
                                 else:
-                                    dynamic_update_schema = type(
-                                        "InternalSchema", (BaseModel,), {}
-                                    )(**transformed_data)
-                                    await self.crud.update(
-                                        db=db,
-                                        id=converted_id,
-                                        object=dynamic_update_schema,
+                                    dynamic_update_schema = InternalSchema(
+                                        **transformed_data
+                                    )
+                                    new_state = await self._update_row(
+                                        db, converted_id, dynamic_update_schema, item
                                     )
 
                             await db.commit()
                         else:
                             update_schema_instance = self.update_schema(**update_data)
-                            await self.crud.update(
-                                db=db, id=converted_id, object=update_schema_instance
+                            new_state = await self._update_row(
+                                db, converted_id, update_schema_instance, item
                             )
                             await db.commit()
 
+                        request.state.audit_previous_state = item
+                        request.state.audit_new_state = new_state
+
                         model_list_url = (
                             f"{self.get_url_prefix()}/{self.model.__name__}/"
                         )
@@ -1324,17 +2784,11 @@ class ModelView:
             if search_column and search_value:
                 filter_criteria[f"{search_column}__ilike"] = f"%{search_value}%"
 
-            items_result = await self.crud.get_multi(
-                db=db,
-                offset=offset,
-                limit=limit,
-                schema_to_select=self.select_schema,
-                **cast(Any, filter_criteria),
-            )
-
             items: Dict[str, Any] = {
-                "data": items_result.get("data", []),
-                "total_count": items_result.get("total_count", 0),
+                "data": await self._list_page(db, filter_criteria, offset, limit),
+                "total_count": await self.crud.count(
+                    db=db, **cast(Any, filter_criteria)
+                ),
             }
 
             total_items = items["total_count"]
@@ -1345,6 +2799,13 @@ class ModelView:
                 {
                     "request": request,
                     "model_items": items["data"],
+                    "model_name": self.model_key,
+                    "table_columns": [
+                        column.key for column in self.descriptor.list_columns
+                    ],
+                    "deferred_columns": self.descriptor.deferred_columns,
+                    "primary_key_info": self.descriptor.pk_info,
+                    "url_prefix": self.get_url_prefix(),
                     "current_page": page,
                     "rows_per_page": limit,
                     "total_items": total_items,
@@ -0,0 +1,279 @@
+from collections.abc import Callable, Mapping, Sequence
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
+
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import JSON, LargeBinary, Text, func, inspect
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.types import TypeDecorator
+
+from .helper import FormField, _get_form_fields_from_schema
+
+SearchConverter = Callable[[str], Optional[Tuple[str, Any]]]
+
+TRUE_VALUES = frozenset(("true", "yes", "1", "t", "y"))
+FALSE_VALUES = frozenset(("false", "no", "0", "f", "n"))
+
+LIST_PREVIEW_LENGTH = 200
+
+
+class InternalSchema(BaseModel):
+    """Pass-through schema for password-transformed data without an internal schema."""
+
+    model_config = ConfigDict(extra="allow")
+
+
+class FormSpec(NamedTuple):
+    """Form fields of a schema, with the default factories to run per render."""
+
+    fields: Tuple[FormField, ...]
+    default_factories: Mapping[str, Callable[..., Any]]
+
+    def build(self) -> List[FormField]:
+        """Fresh copies of the fields, safe to fill with values for one request."""
+        fields = [dict(field) for field in self.fields]
+        if self.default_factories:
+            for field in fields:
+                factory = self.default_factories.get(field["name"])
+                if factory is not None:
+                    field["default"] = factory()
+        return fields
+
+
+class ViewDescriptor(NamedTuple):
+    """
+    Metadata of a ModelView, computed once when the view is added.
+
+    Holds what request handlers would otherwise derive from the model and
+    schemas on every call: the primary key and its converter, the column
+    names, per-column search converters, the list page query and the form
+    fields.
+
+    deferred_columns maps the large list columns to how they are previewed:
+    "text" for Text and JSON columns, which are truncated in the query, and
+    "binary" for LargeBinary columns, of which only the size is read.
+    """
+
+    pk_column: Any
+    pk_info: Optional[Mapping[str, Any]]
+    pk_converter: Callable[[Any], Any]
+    pk_names: FrozenSet[str]
+    columns: Tuple[Any, ...]
+    column_names: Tuple[str, ...]
+    column_set: FrozenSet[str]
+    row_columns: Tuple[Any, ...]
+    search_converters: Mapping[str, SearchConverter]
+    list_columns: Tuple[Any, ...]
+    list_select: Tuple[Any, ...]
+    deferred_columns: Mapping[str, str]
+    deleted_at_column: Optional[str]
+    is_deleted_column: Optional[str]
+    create_form: FormSpec
+    update_form: FormSpec
+
+
+def _python_type(column: Any) -> Optional[type]:
+    """Python type of a column, or None for types that do not declare one."""
+    try:
+        return cast(type, column.type.python_type)
+    except NotImplementedError:
+        return None
+
+
+def _pk_converter(pk_type: Optional[type]) -> Callable[[Any], Any]:
+    """
+    Converter from a path or JSON id to the primary key's Python type.
+
+    Ids of other types, such as UUIDs, are passed on as strings.
+    """
+    if pk_type is int:
+        return lambda value: int(value) if isinstance(value, str) else value
+    if pk_type is float:
+        return lambda value: float(value) if isinstance(value, str) else value
+    if pk_type is None:
+        return lambda value: value
+    return str
+
+
+def _search_converter(
+    name: str, python_type: Optional[type]
+) -> Optional[SearchConverter]:
+    """
+    Converter from a list page search value to a FastCRUD filter.
+
+    The converter returns None when the value does not parse as the column's
+    type, so the search gives no filter.
+    """
+    if python_type is int or python_type is float:
+        cast_value = python_type
+
+        def numeric(value: str) -> Optional[Tuple[str, Any]]:
+            try:
+                return name, cast_value(value)
+            except (ValueError, TypeError):
+                return None
+
+        return numeric
+    if python_type is bool:
+
+        def boolean(value: str) -> Optional[Tuple[str, Any]]:
+            lower_value = value.lower()
+            if lower_value in TRUE_VALUES:
+                return name, True
+            if lower_value in FALSE_VALUES:
+                return name, False
+            return None
+
+        return boolean
+    if python_type is str:
+        key = f"{name}__ilike"
+        return lambda value: (key, f"%{value}%")
+    return None
+
+
+def _deferred_kind(column: Any) -> Optional[str]:
+    """How a list column is previewed, or None if it is read in full."""
+    column_type = column.type
+    if isinstance(column_type, TypeDecorator):
+        column_type = column_type.impl_instance
+    if isinstance(column_type, LargeBinary):
+        return "binary"
+    if isinstance(column_type, (Text, JSON)):
+        return "text"
+    return None
+
+
+def _list_expression(column: Any, kind: Optional[str]) -> Any:
+    """Select expression of a list column: the column, or a preview of it."""
+    if kind == "binary":
+        return func.length(column).label(column.key)
+    if kind == "text":
+        value = column if isinstance(column.type, Text) else column.cast(Text)
+        return func.substr(value, 1, LIST_PREVIEW_LENGTH + 1, type_=Text).label(
+            column.key
+        )
+    return column
+
+
+def _form_spec(schema: Type[BaseModel]) -> FormSpec:
+    """Compile the form fields of a schema, keeping default factories for each render."""
+    factories: Dict[str, Callable[..., Any]] = {
+        name: field_info.default_factory
+        for name, field_info in schema.model_fields.items()
+        if callable(field_info.default_factory)
+    }
+    return FormSpec(
+        fields=tuple(_get_form_fields_from_schema(schema)),
+        default_factories=MappingProxyType(factories),
+    )
+
+
+def compile_view_descriptor(
+    model: Type[DeclarativeBase],
+    create_schema: Type[BaseModel],
+    update_schema: Type[BaseModel],
+    select_schema: Optional[Type[BaseModel]],
+    deleted_at_column: str,
+    is_deleted_column: str,
+    list_display: Optional[Sequence[str]] = None,
+) -> ViewDescriptor:
+    """
+    Compile the metadata of a model view.
+
+    Args:
+        model: SQLAlchemy model of the view
+        create_schema: Schema of the create form
+        update_schema: Schema of the update form
+        select_schema: Optional schema limiting the columns read for rows
+        deleted_at_column: FastCRUD's soft delete timestamp column name
+        is_deleted_column: FastCRUD's soft delete flag column name
+        list_display: Columns shown on the list page, in order; defaults to
+            the row columns
+
+    Returns:
+        Immutable descriptor of the view
+
+    Raises:
+        ValueError: If list_display names a column the model does not have
+    """
+    primary_key = inspect(model).primary_key
+    pk_column = primary_key[0] if primary_key else None
+
+    pk_info: Optional[Mapping[str, Any]] = None
+    pk_type: Optional[type] = None
+    if pk_column is not None:
+        pk_type = _python_type(pk_column)
+        if pk_type is not None:
+            pk_info = MappingProxyType(
+                {
+                    "name": pk_column.name,
+                    "type": pk_type,
+                    "type_name": pk_type.__name__,
+                }
+            )
+
+    columns = tuple(model.__table__.columns)
+    column_names = tuple(column.key for column in columns)
+    row_columns = columns
+    if select_schema is not None:
+        fields = select_schema.model_fields
+        row_columns = tuple(column for column in columns if column.key in fields)
+
+    list_columns = row_columns
+    if list_display is not None:
+        columns_by_name = {column.key: column for column in columns}
+        unknown = [name for name in list_display if name not in columns_by_name]
+        if unknown:
+            raise ValueError(f"list_display has unknown columns: {unknown}")
+        list_columns = tuple(columns_by_name[name] for name in list_display)
+
+    deferred_columns: Dict[str, str] = {}
+    list_select = []
+    if pk_column is not None and pk_column not in list_columns:
+        list_select.append(pk_column)
+    for column in list_columns:
+        kind = _deferred_kind(column)
+        if kind is not None and column is not pk_column:
+            deferred_columns[column.key] = kind
+        else:
+            kind = None
+        list_select.append(_list_expression(column, kind))
+
+    search_converters: Dict[str, SearchConverter] = {}
+    for column in columns:
+        converter = _search_converter(column.key, _python_type(column))
+        if converter is not None:
+            search_converters[column.key] = converter
+
+    return ViewDescriptor(
+        pk_column=pk_column,
+        pk_info=pk_info,
+        pk_converter=_pk_converter(pk_type),
+        pk_names=frozenset(column.key for column in columns if column.primary_key),
+        columns=columns,
+        column_names=column_names,
+        column_set=frozenset(column_names),
+        row_columns=row_columns,
+        search_converters=MappingProxyType(search_converters),
+        list_columns=list_columns,
+        list_select=tuple(list_select),
+        deferred_columns=MappingProxyType(deferred_columns),
+        deleted_at_column=deleted_at_column
+        if deleted_at_column in column_names
+        else None,
+        is_deleted_column=is_deleted_column
+        if is_deleted_column in column_names
+        else None,
+        create_form=_form_spec(create_schema),
+        update_form=_form_spec(update_schema),
+    )
@@ -9,6 +9,7 @@ from ..core.auth import (
     authenticate_user_by_credentials,
     convert_user_to_dict,
     get_password_hash,
+    hash_password,
     verify_password,
 )
 from ..core.db import DatabaseConfig
@@ -30,6 +31,10 @@ class AdminUserService:
         """Generate a bcrypt password hash using bcrypt."""
         return get_password_hash(password)
 
+    async def hash_password(self, password: str) -> str:
+        """Generate a bcrypt password hash off the event loop."""
+        return await hash_password(password)
+
     async def authenticate_user(
         self,
         username_or_email: str,
@@ -68,7 +73,7 @@ class AdminUserService:
                 logger.debug(f"Admin user '{username}' already exists.")
                 return None
 
-            hashed_password = self.get_password_hash(password)
+            hashed_password = await self.hash_password(password)
 
             admin_data = AdminUserCreate(
                 username=username,
@@ -1,7 +1,11 @@
 from .auth import (
+    PasswordHashPool,
     authenticate_user_by_credentials,
+    configure_password_hash_pool,
     convert_user_to_dict,
     get_password_hash,
+    get_password_hash_pool,
+    hash_password,
     verify_password,
 )
 from .db import DatabaseConfig
@@ -14,6 +18,16 @@ from .exceptions import (
     UnauthorizedException,
     UnprocessableEntityException,
 )
+from .hashers import (
+    Argon2Hasher,
+    BcryptHasher,
+    PasswordHasher,
+    ScryptHasher,
+    calibrate_hasher,
+    get_hasher,
+    register_hasher,
+    set_default_hasher,
+)
 
 __all__ = [
     "DatabaseConfig",
@@ -24,8 +38,20 @@ __all__ = [
     "UnprocessableEntityException",
     "DuplicateValueException",
     "RateLimitException",
+    "PasswordHashPool",
     "authenticate_user_by_credentials",
+    "configure_password_hash_pool",
     "convert_user_to_dict",
     "get_password_hash",
+    "get_password_hash_pool",
+    "hash_password",
     "verify_password",
+    "PasswordHasher",
+    "BcryptHasher",
+    "ScryptHasher",
+    "Argon2Hasher",
+    "calibrate_hasher",
+    "get_hasher",
+    "register_hasher",
+    "set_default_hasher",
 ]
@@ -6,28 +6,152 @@ across the crudadmin application, including password hashing, verification,
 and user authentication logic.
 """
 
+import asyncio
+import functools
 import logging
-from typing import Any, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
 
-import bcrypt
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .exceptions import RateLimitException
+from .hashers import get_hasher, identify_hasher, needs_rehash
+
 logger = logging.getLogger(__name__)
 
+R = TypeVar("R")
+
+
+class PasswordHashPool:
+    """
+    Bounded thread pool for CPU-bound password hashing and verification.
+
+    Hashing a password takes on the order of 100 ms, so running it on the event
+    loop stalls every other request on the worker. The pool runs it in a small
+    dedicated executor instead, and caps the number of queued calls so a login
+    storm is rejected fast with a 429 rather than piling up.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: int = 32):
+        """
+        Initialize the pool.
+
+        Args:
+            max_workers: Number of hashing threads (defaults to min(4, CPU count))
+            max_pending: Maximum number of running and queued calls before rejecting
+        """
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.max_pending = max_pending
+        self.pending = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="crudadmin-password-hash",
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., R], *args: Any) -> R:
+        """
+        Run a hashing function in the pool.
+
+        Args:
+            func: The function to run
+            *args: Positional arguments for the function
+
+        Returns:
+            The function result
+
+        Raises:
+            RateLimitException: If the pool already has max_pending calls in flight
+        """
+        if self.pending >= self.max_pending:
+            logger.warning(
+                f"Password hashing pool saturated ({self.pending} calls in flight)"
+            )
+            raise RateLimitException(
+                "Too many authentication requests in progress. Please try again shortly."
+            )
+
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(), functools.partial(func, *args)
+            )
+        finally:
+            self.pending -= 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the executor threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+_password_hash_pool = PasswordHashPool()
+
+
+def get_password_hash_pool() -> PasswordHashPool:
+    """Get the pool used for password hashing and verification."""
+    return _password_hash_pool
+
+
+def configure_password_hash_pool(
+    max_workers: Optional[int] = None, max_pending: int = 32
+) -> PasswordHashPool:
+    """
+    Replace the password hashing pool with a new size configuration.
+
+    Args:
+        max_workers: Number of hashing threads (defaults to min(4, CPU count))
+        max_pending: Maximum number of running and queued calls before rejecting
+
+    Returns:
+        The new pool
+    """
+    global _password_hash_pool
+
+    _password_hash_pool.shutdown(wait=False)
+    _password_hash_pool = PasswordHashPool(
+        max_workers=max_workers, max_pending=max_pending
+    )
+    return _password_hash_pool
+
+
+def _verify_with_hasher(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password with the hasher that produced the hash."""
+    hasher = identify_hasher(hashed_password) or get_hasher("bcrypt")
+    return hasher.verify(plain_password, hashed_password)
+
 
 async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
-    Verify a password against its hash using bcrypt.
+    Verify a password against its hash.
+
+    The algorithm is detected from the hash, so bcrypt, scrypt and argon2id
+    hashes all verify regardless of the current default hasher. The check runs
+    in the password hashing pool, off the event loop.
 
     Args:
         plain_password: The plaintext password to verify
-        hashed_password: The bcrypt hashed password to check against
+        hashed_password: The hashed password to check against
 
     Returns:
         True if the password matches, False otherwise
+
+    Raises:
+        RateLimitException: If the password hashing pool is saturated
     """
     try:
-        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+        return await _password_hash_pool.run(
+            _verify_with_hasher, plain_password, hashed_password
+        )
+    except RateLimitException:
+        raise
     except Exception as e:
         logger.error(f"Error verifying password: {str(e)}")
         return False
@@ -35,21 +159,39 @@ async def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     """
-    Generate a bcrypt password hash.
+    Generate a password hash with the default hasher (bcrypt unless configured).
 
     Args:
         password: The plaintext password to hash
 
     Returns:
-        The bcrypt hashed password as a string
+        The hashed password as a string
     """
     try:
-        return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+        return get_hasher().hash(password)
     except Exception as e:
         logger.error(f"Error hashing password: {str(e)}")
         raise
 
 
+async def hash_password(password: str) -> str:
+    """
+    Generate a password hash in the password hashing pool.
+
+    Async counterpart of get_password_hash for use inside request handlers.
+
+    Args:
+        password: The plaintext password to hash
+
+    Returns:
+        The hashed password as a string
+
+    Raises:
+        RateLimitException: If the password hashing pool is saturated
+    """
+    return await _password_hash_pool.run(get_password_hash, password)
+
+
 def convert_user_to_dict(user_obj: Any) -> Optional[dict]:
     """
     Helper to unify user record into a dictionary.
@@ -97,6 +239,27 @@ def convert_user_to_dict(user_obj: Any) -> Optional[dict]:
     return None
 
 
+async def _rehash_user_password(
+    db: AsyncSession, crud_users: Any, db_user: dict[str, Any], password: str
+) -> None:
+    """
+    Replace the stored hash if it uses outdated parameters or another algorithm.
+
+    Failures are logged and never fail the login.
+    """
+    try:
+        if not needs_rehash(db_user["hashed_password"]):
+            return
+        new_hash = await hash_password(password)
+        await crud_users.update(
+            db=db, object={"hashed_password": new_hash}, id=db_user["id"]
+        )
+        db_user["hashed_password"] = new_hash
+        logger.info(f"Upgraded password hash for user id {db_user['id']}")
+    except Exception as e:
+        logger.warning(f"Could not upgrade password hash: {str(e)}")
+
+
 async def authenticate_user_by_credentials(
     username_or_email: str,
     password: str,
@@ -107,7 +270,9 @@ async def authenticate_user_by_credentials(
     Authenticate a user by username or email and password.
 
     This is a shared authentication function that can be used across
-    different parts of the application.
+    different parts of the application. When the stored hash was created with
+    another algorithm or outdated cost parameters, it is replaced with a hash
+    from the current default hasher.
 
     Args:
         username_or_email: The username or email to authenticate with
@@ -117,6 +282,9 @@ async def authenticate_user_by_credentials(
 
     Returns:
         User data dictionary if authenticated, None otherwise
+
+    Raises:
+        RateLimitException: If the password hashing pool is saturated
     """
     try:
         logger.debug(f"Attempting to authenticate user: {username_or_email}")
@@ -141,9 +309,13 @@ async def authenticate_user_by_credentials(
             logger.debug("Invalid password")
             return None
 
+        await _rehash_user_password(db, crud_users, db_user, password)
+
         logger.debug("Authentication successful")
         return db_user
 
+    except RateLimitException:
+        raise
     except Exception as e:
         logger.error(f"Authentication error: {str(e)}", exc_info=True)
         return None
@@ -66,6 +66,10 @@ class DatabaseConfig:
         admin_session: Optional[Type[DeclarativeBase]] = None,
         admin_event_log: Optional[Type[DeclarativeBase]] = None,
         admin_audit_log: Optional[Type[DeclarativeBase]] = None,
+        admin_rate_limit: Optional[Type[DeclarativeBase]] = None,
+        admin_event_rollup: Optional[Type[DeclarativeBase]] = None,
+        admin_event_rollup_state: Optional[Type[DeclarativeBase]] = None,
+        admin_job: Optional[Type[DeclarativeBase]] = None,
         crud_admin_user: Optional[
             FastCRUD[
                 DeclarativeBase,
@@ -116,6 +120,12 @@ class DatabaseConfig:
 
         self.AdminEventLog: Optional[Type[DeclarativeBase]] = admin_event_log
         self.AdminAuditLog: Optional[Type[DeclarativeBase]] = admin_audit_log
+        self.AdminRateLimit: Optional[Type[DeclarativeBase]] = admin_rate_limit
+        self.AdminEventRollup: Optional[Type[DeclarativeBase]] = admin_event_rollup
+        self.AdminEventRollupState: Optional[Type[DeclarativeBase]] = (
+            admin_event_rollup_state
+        )
+        self.AdminJob: Optional[Type[DeclarativeBase]] = admin_job
 
         if crud_admin_user is None:
             CRUDUser = FastCRUD[
@@ -181,6 +191,14 @@ class DatabaseConfig:
                     tables_to_create.append(self.AdminEventLog)
                 if self.AdminAuditLog is not None:
                     tables_to_create.append(self.AdminAuditLog)
+                if self.AdminRateLimit is not None:
+                    tables_to_create.append(self.AdminRateLimit)
+                if self.AdminEventRollup is not None:
+                    tables_to_create.append(self.AdminEventRollup)
+                if self.AdminEventRollupState is not None:
+                    tables_to_create.append(self.AdminEventRollupState)
+                if self.AdminJob is not None:
+                    tables_to_create.append(self.AdminJob)
 
                 for table in tables_to_create:
                     logger.info(f"Creating table: {table.__tablename__}")
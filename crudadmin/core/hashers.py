@@ -0,0 +1,400 @@
+"""
+Pluggable password hashers.
+
+This module provides a registry of password hashing algorithms (bcrypt, scrypt
+and argon2id), a calibration utility that picks cost parameters for a target
+verification latency on the current hardware, and helpers used to detect
+hashes created with outdated parameters so they can be upgraded on login.
+"""
+
+import base64
+import hashlib
+import hmac
+import logging
+import re
+import secrets
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import bcrypt
+
+if TYPE_CHECKING:
+    import argon2
+
+logger = logging.getLogger(__name__)
+
+try:
+    import argon2
+
+    ARGON2_AVAILABLE = True
+except ImportError:
+    argon2 = None  # type: ignore
+    ARGON2_AVAILABLE = False
+
+
+class PasswordHasher(ABC):
+    """Base class for password hashing algorithms."""
+
+    name: str = ""
+
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        """Hash a password with the hasher's current parameters."""
+        pass
+
+    @abstractmethod
+    def verify(self, password: str, hashed_password: str) -> bool:
+        """Check a password against a hash produced by this algorithm."""
+        pass
+
+    @abstractmethod
+    def identify(self, hashed_password: str) -> bool:
+        """Return True if the hash was produced by this algorithm."""
+        pass
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Return True if the hash uses parameters other than the current ones."""
+        pass
+
+    @abstractmethod
+    def with_cost(self, cost: int) -> "PasswordHasher":
+        """Return a copy of the hasher using the given cost level."""
+        pass
+
+    @property
+    @abstractmethod
+    def cost(self) -> int:
+        """The hasher's current cost level."""
+        pass
+
+
+class BcryptHasher(PasswordHasher):
+    """bcrypt password hasher. The cost is the log2 number of rounds."""
+
+    name = "bcrypt"
+    _ROUNDS_RE = re.compile(r"^\$2[abxy]?\$(\d{2})\$")
+
+    def __init__(self, rounds: int = 12):
+        if not 4 <= rounds <= 31:
+            raise ValueError("bcrypt rounds must be between 4 and 31")
+        self.rounds = rounds
+
+    @property
+    def cost(self) -> int:
+        return self.rounds
+
+    def with_cost(self, cost: int) -> "BcryptHasher":
+        return BcryptHasher(rounds=cost)
+
+    def hash(self, password: str) -> str:
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(self.rounds)).decode()
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return bool(bcrypt.checkpw(password.encode(), hashed_password.encode()))
+
+    def identify(self, hashed_password: str) -> bool:
+        return bool(self._ROUNDS_RE.match(hashed_password))
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        match = self._ROUNDS_RE.match(hashed_password)
+        return match is None or int(match.group(1)) != self.rounds
+
+
+class ScryptHasher(PasswordHasher):
+    """
+    scrypt password hasher from the standard library.
+
+    Hashes are stored as ``$scrypt$ln=<log2 n>,r=<r>,p=<p>$<salt>$<hash>`` with
+    base64 encoded salt and hash. The cost is log2 of the CPU/memory cost ``n``.
+    """
+
+    name = "scrypt"
+    _PREFIX = "$scrypt$"
+
+    def __init__(
+        self, log_n: int = 15, r: int = 8, p: int = 1, salt_size: int = 16
+    ) -> None:
+        if not 10 <= log_n <= 24:
+            raise ValueError("scrypt log_n must be between 10 and 24")
+        self.log_n = log_n
+        self.r = r
+        self.p = p
+        self.salt_size = salt_size
+
+    @property
+    def cost(self) -> int:
+        return self.log_n
+
+    def with_cost(self, cost: int) -> "ScryptHasher":
+        return ScryptHasher(log_n=cost, r=self.r, p=self.p, salt_size=self.salt_size)
+
+    @staticmethod
+    def _derive(password: str, salt: bytes, log_n: int, r: int, p: int) -> bytes:
+        n = 1 << log_n
+        return hashlib.scrypt(
+            password.encode(),
+            salt=salt,
+            n=n,
+            r=r,
+            p=p,
+            maxmem=256 * n * r + 1024 * 1024,
+            dklen=32,
+        )
+
+    def hash(self, password: str) -> str:
+        salt = secrets.token_bytes(self.salt_size)
+        derived = self._derive(password, salt, self.log_n, self.r, self.p)
+        return (
+            f"{self._PREFIX}ln={self.log_n},r={self.r},p={self.p}$"
+            f"{base64.b64encode(salt).decode()}${base64.b64encode(derived).decode()}"
+        )
+
+    def _parse(
+        self, hashed_password: str
+    ) -> Optional[tuple[int, int, int, bytes, bytes]]:
+        if not hashed_password.startswith(self._PREFIX):
+            return None
+        try:
+            params, salt, derived = hashed_password[len(self._PREFIX) :].split("$")
+            values = dict(item.split("=") for item in params.split(","))
+            return (
+                int(values["ln"]),
+                int(values["r"]),
+                int(values["p"]),
+                base64.b64decode(salt),
+                base64.b64decode(derived),
+            )
+        except (ValueError, KeyError):
+            return None
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        parsed = self._parse(hashed_password)
+        if parsed is None:
+            return False
+        log_n, r, p, salt, expected = parsed
+        return hmac.compare_digest(self._derive(password, salt, log_n, r, p), expected)
+
+    def identify(self, hashed_password: str) -> bool:
+        return hashed_password.startswith(self._PREFIX)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        parsed = self._parse(hashed_password)
+        return parsed is None or parsed[:3] != (self.log_n, self.r, self.p)
+
+
+class Argon2Hasher(PasswordHasher):
+    """argon2id password hasher. The cost is the number of iterations."""
+
+    name = "argon2"
+
+    def __init__(
+        self, time_cost: int = 3, memory_cost: int = 65536, parallelism: int = 4
+    ) -> None:
+        if not ARGON2_AVAILABLE:
+            raise ImportError(
+                "The argon2-cffi package is not installed. "
+                "Please install it with 'pip install argon2-cffi' to use Argon2Hasher."
+            )
+        self.time_cost = time_cost
+        self.memory_cost = memory_cost
+        self.parallelism = parallelism
+        self._hasher = argon2.PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+            type=argon2.Type.ID,
+        )
+
+    @property
+    def cost(self) -> int:
+        return self.time_cost
+
+    def with_cost(self, cost: int) -> "Argon2Hasher":
+        return Argon2Hasher(
+            time_cost=cost,
+            memory_cost=self.memory_cost,
+            parallelism=self.parallelism,
+        )
+
+    def hash(self, password: str) -> str:
+        return str(self._hasher.hash(password))
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        try:
+            return bool(self._hasher.verify(hashed_password, password))
+        except argon2.exceptions.VerifyMismatchError:
+            return False
+
+    def identify(self, hashed_password: str) -> bool:
+        return hashed_password.startswith("$argon2id$")
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        if not self.identify(hashed_password):
+            return True
+        try:
+            return bool(self._hasher.check_needs_rehash(hashed_password))
+        except argon2.exceptions.InvalidHashError:
+            return True
+
+
+_HASHER_CLASSES: dict[str, type[PasswordHasher]] = {
+    BcryptHasher.name: BcryptHasher,
+    ScryptHasher.name: ScryptHasher,
+    Argon2Hasher.name: Argon2Hasher,
+}
+
+_hashers: dict[str, PasswordHasher] = {BcryptHasher.name: BcryptHasher()}
+_default_hasher: PasswordHasher = _hashers[BcryptHasher.name]
+
+
+def register_hasher(hasher: PasswordHasher, default: bool = False) -> None:
+    """
+    Register a hasher so hashes it produced can be verified.
+
+    Args:
+        hasher: The hasher instance
+        default: Whether new passwords should be hashed with it
+    """
+    global _default_hasher
+
+    _hashers[hasher.name] = hasher
+    if default:
+        _default_hasher = hasher
+
+
+def get_hasher(name: Optional[str] = None) -> PasswordHasher:
+    """
+    Get a registered hasher.
+
+    Args:
+        name: Hasher name ("bcrypt", "scrypt", "argon2"); the default hasher if None
+
+    Returns:
+        The hasher instance
+
+    Raises:
+        ValueError: If no hasher with that name is registered
+    """
+    if name is None:
+        return _default_hasher
+    if name not in _hashers:
+        raise ValueError(f"Unknown password hasher: {name}")
+    return _hashers[name]
+
+
+def set_default_hasher(hasher: Union[str, PasswordHasher]) -> PasswordHasher:
+    """
+    Set the hasher used for new password hashes.
+
+    Existing hashes keep verifying with the hasher that produced them and are
+    upgraded on the next successful login.
+
+    Args:
+        hasher: A hasher instance, or the name of a hasher to create with default parameters
+
+    Returns:
+        The new default hasher
+    """
+    if isinstance(hasher, str):
+        if hasher not in _HASHER_CLASSES:
+            raise ValueError(f"Unknown password hasher: {hasher}")
+        hasher = _HASHER_CLASSES[hasher]()
+
+    register_hasher(hasher, default=True)
+    return hasher
+
+
+def identify_hasher(hashed_password: str) -> Optional[PasswordHasher]:
+    """
+    Find the registered hasher that produced a hash.
+
+    Args:
+        hashed_password: The stored hash
+
+    Returns:
+        The matching hasher, or None if no registered hasher recognizes it
+    """
+    if _default_hasher.identify(hashed_password):
+        return _default_hasher
+
+    for hasher in _hashers.values():
+        if hasher.identify(hashed_password):
+            return hasher
+
+    for hasher_class in _HASHER_CLASSES.values():
+        if hasher_class.name not in _hashers:
+            try:
+                candidate = hasher_class()
+            except ImportError:
+                continue
+            if candidate.identify(hashed_password):
+                _hashers[candidate.name] = candidate
+                return candidate
+
+    return None
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash should be replaced by the default hasher.
+
+    Args:
+        hashed_password: The stored hash
+
+    Returns:
+        True if the hash uses another algorithm or outdated parameters
+    """
+    if identify_hasher(hashed_password) is not _default_hasher:
+        return True
+    return _default_hasher.needs_rehash(hashed_password)
+
+
+def calibrate_hasher(
+    name: str = "bcrypt",
+    target_ms: float = 250.0,
+    max_cost: Optional[int] = None,
+    **options: Any,
+) -> PasswordHasher:
+    """
+    Pick the lowest cost whose verification takes at least target_ms here.
+
+    Intended to run once at startup so that login CPU cost can be tuned per
+    deployment. Pass the result to set_default_hasher; stored hashes with a
+    different cost are rehashed on the next successful login.
+
+    Args:
+        name: Hasher name ("bcrypt", "scrypt", "argon2")
+        target_ms: Target verification latency in milliseconds
+        max_cost: Upper bound on the cost level to try
+        **options: Extra parameters for the hasher constructor
+
+    Returns:
+        A hasher instance configured with the calibrated cost
+    """
+    if name not in _HASHER_CLASSES:
+        raise ValueError(f"Unknown password hasher: {name}")
+
+    start_costs = {"bcrypt": 4, "scrypt": 10, "argon2": 1}
+    max_costs = {"bcrypt": 20, "scrypt": 20, "argon2": 20}
+
+    hasher = _HASHER_CLASSES[name](**options).with_cost(start_costs[name])
+    limit = max_cost if max_cost is not None else max_costs[name]
+    sample = hasher.hash("crudadmin-calibration")
+
+    while True:
+        start = time.perf_counter()
+        hasher.verify("crudadmin-calibration", sample)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        if elapsed_ms >= target_ms or hasher.cost >= limit:
+            break
+
+        hasher = hasher.with_cost(hasher.cost + 1)
+        sample = hasher.hash("crudadmin-calibration")
+
+    logger.info(
+        f"Calibrated {name} hasher to cost {hasher.cost} ({elapsed_ms:.0f} ms per verify)"
+    )
+    return hasher
@@ -0,0 +1,35 @@
+"""Database model for the rate limiter's database backend."""
+
+from typing import Type
+
+from sqlalchemy import Float, Integer, String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+def create_admin_rate_limit(base: Type[DeclarativeBase]) -> Type[DeclarativeBase]:
+    """
+    Create the rate limit counter model.
+
+    Each row holds the attempt count of one rate limit key until expires_at,
+    a Unix timestamp.
+    """
+    tablename = "admin_rate_limit"
+
+    if hasattr(base, "registry") and hasattr(base.registry, "_class_registry"):
+        existing_class = base.registry._class_registry.get("AdminRateLimit")
+        if existing_class is not None and isinstance(existing_class, type):
+            if issubclass(existing_class, base):
+                return existing_class
+
+    class AdminRateLimit(base):  # type: ignore
+        __tablename__ = tablename
+        __table_args__ = {"extend_existing": True}
+
+        key: Mapped[str] = mapped_column(String(255), primary_key=True)
+        count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+        expires_at: Mapped[float] = mapped_column(Float, nullable=False, index=True)
+
+        def __repr__(self) -> str:
+            return f"<AdminRateLimit(key={self.key}, count={self.count})>"
+
+    return AdminRateLimit
@@ -1,11 +1,23 @@
 """Simple rate limiter implementation using session storage backends."""
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 from pydantic import BaseModel
+from sqlalchemy import Table, case, delete, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from ..session.storage import AbstractSessionStorage, get_session_storage
 
+if TYPE_CHECKING:
+    from sqlalchemy.orm import DeclarativeBase
+
+    from .db import DatabaseConfig
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,8 +52,6 @@ class SimpleRateLimiter:
         Returns:
             Current count for the key after increment
         """
-        import time
-
         current_time = time.time()
 
         existing = await self.storage.get(key, RateLimitData)
@@ -82,17 +92,337 @@ class SimpleRateLimiter:
         data = await self.storage.get(key, RateLimitData)
         return data.count if data else 0
 
+    async def purge_expired(self) -> int:
+        """Reclaim expired counters.
+
+        Counters are written with a per-key TTL, so Redis and Memcached expire
+        them natively and this is a no-op there. Backends that expose
+        ``purge_expired`` (the memory backend) drop their expired keys.
+
+        Returns:
+            Number of counters removed
+        """
+        purge = getattr(self.storage, "purge_expired", None)
+        if purge is None:
+            return 0
+        return int(purge())
+
     async def close(self) -> None:
         """Close the storage connection."""
         await self.storage.close()
 
 
-def create_rate_limiter(backend: str, **backend_kwargs) -> SimpleRateLimiter:
+class DatabaseRateLimiter:
+    """Rate limiter backed by the admin database.
+
+    Counters live in the ``admin_rate_limit`` table and are updated with a single
+    atomic ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING`` statement per
+    attempt, so the limit holds across every worker sharing the admin database.
+    Supported on PostgreSQL and SQLite (3.35+).
+    """
+
+    SUPPORTED_DIALECTS = ("postgresql", "sqlite")
+
+    def __init__(
+        self,
+        db_config: "DatabaseConfig",
+        prefix: str = "rate_limit:",
+        model: Optional[type["DeclarativeBase"]] = None,
+    ):
+        """Initialize the rate limiter.
+
+        Args:
+            db_config: Database configuration providing the admin engine
+            prefix: Prefix for all rate limit keys
+            model: Optional rate limit model (created on the admin base if not provided)
+
+        Raises:
+            ValueError: If the admin database dialect is not supported
+        """
+        dialect = db_config.admin_engine.dialect.name
+        if dialect not in self.SUPPORTED_DIALECTS:
+            raise ValueError(
+                f"Database rate limiter does not support the '{dialect}' dialect. "
+                f"Supported dialects: {', '.join(self.SUPPORTED_DIALECTS)}"
+            )
+
+        if model is None:
+            model = db_config.AdminRateLimit
+        if model is None:
+            from .models import create_admin_rate_limit
+
+            model = create_admin_rate_limit(db_config.base)
+            db_config.AdminRateLimit = model
+
+        self.db_config = db_config
+        self.prefix = prefix
+        self.model = model
+        self.table: Table = model.__table__  # type: ignore[assignment]
+        self._dialect = dialect
+        self._table_ready = False
+        self._table_lock: Optional[asyncio.Lock] = None
+
+    def get_key(self, key: str) -> str:
+        """Get the full storage key for a rate limit key."""
+        return f"{self.prefix}{key}"
+
+    async def _ensure_table(self) -> None:
+        """Create the rate limit table on first use if it does not exist."""
+        if self._table_ready:
+            return
+
+        if self._table_lock is None:
+            self._table_lock = asyncio.Lock()
+
+        async with self._table_lock:
+            if self._table_ready:
+                return
+            async with self.db_config.admin_engine.begin() as conn:
+                await conn.run_sync(self.table.create, checkfirst=True)
+            self._table_ready = True
+
+    def _upsert_statement(
+        self, key: str, increment_value: int, expiry_seconds: int, now: float
+    ) -> Any:
+        """Build the atomic upsert returning the counter after increment."""
+        insert: Callable[[Table], Any] = (
+            postgresql_insert if self._dialect == "postgresql" else sqlite_insert
+        )
+        stmt = insert(self.table).values(
+            key=key, count=increment_value, expires_at=now + expiry_seconds
+        )
+        expired = self.table.c.expires_at <= now
+        return stmt.on_conflict_do_update(
+            index_elements=[self.table.c.key],
+            set_={
+                "count": case(
+                    (expired, stmt.excluded.count),
+                    else_=self.table.c.count + stmt.excluded.count,
+                ),
+                "expires_at": case(
+                    (expired, stmt.excluded.expires_at),
+                    else_=self.table.c.expires_at,
+                ),
+            },
+        ).returning(self.table.c.count)
+
+    async def increment(
+        self, key: str, increment_value: int, expiry_seconds: int
+    ) -> int:
+        """Increment the counter for a key and return current count.
+
+        Args:
+            key: The rate limit key
+            increment_value: Amount to increment (typically 1)
+            expiry_seconds: Expiry time in seconds
+
+        Returns:
+            Current count for the key after increment
+        """
+        await self._ensure_table()
+        stmt = self._upsert_statement(
+            self.get_key(key), increment_value, expiry_seconds, time.time()
+        )
+
+        async with self.db_config.admin_engine.begin() as conn:
+            result = await conn.execute(stmt)
+            return int(result.scalar_one())
+
+    async def delete(self, key: str) -> None:
+        """Delete a rate limit key.
+
+        Args:
+            key: The rate limit key to delete
+        """
+        await self._ensure_table()
+        async with self.db_config.admin_engine.begin() as conn:
+            await conn.execute(
+                delete(self.table).where(self.table.c.key == self.get_key(key))
+            )
+
+    async def get_count(self, key: str) -> int:
+        """Get current count for a key.
+
+        Args:
+            key: The rate limit key
+
+        Returns:
+            Current count (0 if key doesn't exist or has expired)
+        """
+        await self._ensure_table()
+        async with self.db_config.admin_engine.connect() as conn:
+            result = await conn.execute(
+                select(self.table.c.count).where(
+                    self.table.c.key == self.get_key(key),
+                    self.table.c.expires_at > time.time(),
+                )
+            )
+            count = result.scalar_one_or_none()
+        return int(count) if count is not None else 0
+
+    async def purge_expired(self) -> int:
+        """Delete all expired counters in one statement.
+
+        Returns:
+            Number of counters removed
+        """
+        await self._ensure_table()
+        async with self.db_config.admin_engine.begin() as conn:
+            result = await conn.execute(
+                delete(self.table).where(self.table.c.expires_at <= time.time())
+            )
+        return int(result.rowcount or 0)
+
+    async def close(self) -> None:
+        """Nothing to close; the admin engine is owned by the database config."""
+        return None
+
+
+RateLimiter = Union[SimpleRateLimiter, DatabaseRateLimiter]
+
+
+class _TokenBucket:
+    """Token bucket state for a single pre-filter key."""
+
+    __slots__ = ("tokens", "updated_at", "blocked_until")
+
+    def __init__(self, tokens: float, updated_at: float):
+        self.tokens = tokens
+        self.updated_at = updated_at
+        self.blocked_until = 0.0
+
+
+class LoginPreFilter:
+    """Per-process token bucket pre-filter for login attempts.
+
+    Sits in front of a distributed rate limiter and sheds obviously abusive
+    clients locally, without a round trip to the shared storage. The bucket
+    refills at ``capacity / window_seconds`` tokens per second, so a single
+    worker never rejects traffic the distributed limit would still allow.
+
+    The distributed counter remains the source of truth: attempts shed locally
+    are accumulated and handed back through ``pop_pending`` so they can be
+    synced to the shared storage periodically.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 5,
+        window_seconds: int = 900,
+        max_entries: int = 10000,
+        sync_interval_seconds: float = 5.0,
+    ):
+        """Initialize the pre-filter.
+
+        Args:
+            capacity: Maximum burst of attempts per key (usually the login max attempts)
+            window_seconds: Time needed to refill a fully drained bucket
+            max_entries: Maximum number of tracked keys before the least recently used is evicted
+            sync_interval_seconds: Minimum interval between syncs of shed attempts
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be positive")
+
+        self.capacity = float(capacity)
+        self.refill_rate = capacity / window_seconds
+        self.max_entries = max_entries
+        self.sync_interval_seconds = sync_interval_seconds
+
+        self._buckets: OrderedDict[str, _TokenBucket] = OrderedDict()
+        self._pending: dict[str, int] = {}
+        self._last_sync = time.monotonic()
+
+    def _get_bucket(self, key: str, now: float) -> _TokenBucket:
+        """Get the bucket for a key, refilled up to ``now``."""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = _TokenBucket(self.capacity, now)
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_entries:
+                self._buckets.popitem(last=False)
+            return bucket
+
+        self._buckets.move_to_end(key)
+        elapsed = now - bucket.updated_at
+        if elapsed > 0:
+            bucket.tokens = min(
+                self.capacity, bucket.tokens + elapsed * self.refill_rate
+            )
+            bucket.updated_at = now
+        return bucket
+
+    def allow(self, key: str) -> bool:
+        """Consume a token for a key.
+
+        Args:
+            key: The key to check (typically the client IP address)
+
+        Returns:
+            True if the attempt should be passed on to the distributed limiter,
+            False if it was shed locally
+        """
+        now = time.monotonic()
+        bucket = self._get_bucket(key, now)
+
+        if bucket.blocked_until > now or bucket.tokens < 1:
+            self._pending[key] = self._pending.get(key, 0) + 1
+            return False
+
+        bucket.tokens -= 1
+        return True
+
+    def block(self, key: str, seconds: float) -> None:
+        """Shed every attempt for a key locally for a period of time.
+
+        Used once the distributed limiter has denied a key, so further attempts
+        in the same window never reach the shared storage.
+
+        Args:
+            key: The key to block
+            seconds: How long to block the key
+        """
+        now = time.monotonic()
+        bucket = self._get_bucket(key, now)
+        bucket.blocked_until = max(bucket.blocked_until, now + seconds)
+        bucket.tokens = 0
+
+    def reset(self, key: str) -> None:
+        """Forget all local state for a key.
+
+        Args:
+            key: The key to reset
+        """
+        self._buckets.pop(key, None)
+        self._pending.pop(key, None)
+
+    def should_sync(self) -> bool:
+        """Check whether shed attempts are due to be synced."""
+        return (
+            bool(self._pending)
+            and time.monotonic() - self._last_sync >= self.sync_interval_seconds
+        )
+
+    def pop_pending(self) -> dict[str, int]:
+        """Return and clear the attempts shed since the last sync.
+
+        Returns:
+            Mapping of key to the number of attempts shed locally
+        """
+        pending = self._pending
+        self._pending = {}
+        self._last_sync = time.monotonic()
+        return pending
+
+
+def create_rate_limiter(backend: str, **backend_kwargs: Any) -> RateLimiter:
     """Create a rate limiter using the specified backend.
 
     Args:
-        backend: Backend type ("redis", "memcached", "memory")
-        **backend_kwargs: Additional backend configuration
+        backend: Backend type ("redis", "memcached", "memory", "database")
+        **backend_kwargs: Additional backend configuration. The "database" backend
+            requires ``db_config`` and only uses ``prefix`` besides it.
 
     Returns:
         Configured rate limiter instance
@@ -100,6 +430,13 @@ def create_rate_limiter(backend: str, **backend_kwargs) -> SimpleRateLimiter:
     if "prefix" not in backend_kwargs:
         backend_kwargs["prefix"] = "rate_limit:"
 
+    if backend == "database":
+        if "db_config" not in backend_kwargs:
+            raise ValueError("db_config is required for the database rate limiter")
+        return DatabaseRateLimiter(
+            db_config=backend_kwargs["db_config"], prefix=backend_kwargs["prefix"]
+        )
+
     storage: AbstractSessionStorage[RateLimitData] = get_session_storage(
         backend=backend, model_type=RateLimitData, **backend_kwargs
     )
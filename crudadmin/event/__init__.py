@@ -1,11 +1,18 @@
+from .alerts import SecurityAlertDetector
+from .audit_store import AuditStore
 from .decorators import log_admin_action, log_auth_action
+from .file_sink import FileEventSink
 from .integration import EventSystemIntegration
+from .maintenance import EventMaintenanceJob
 from .models import (
     EventStatus,
     EventType,
     create_admin_audit_log,
     create_admin_event_log,
+    create_admin_event_rollup,
+    create_admin_event_rollup_state,
 )
+from .rollup import EventRollup
 from .schemas import (
     AdminAuditLogCreate,
     AdminAuditLogRead,
@@ -13,26 +20,85 @@ from .schemas import (
     AdminEventLogRead,
 )
 from .service import EventService
+from .sink import EventSink
+from .writer import BufferedEventWriter
 
 __all__ = [
     "EventType",
     "EventStatus",
     "create_admin_event_log",
     "create_admin_audit_log",
+    "create_admin_event_rollup",
+    "create_admin_event_rollup_state",
     "AdminEventLogCreate",
     "AdminEventLogRead",
     "AdminAuditLogCreate",
     "AdminAuditLogRead",
     "EventService",
     "EventSystemIntegration",
+    "BufferedEventWriter",
+    "AuditStore",
+    "EventMaintenanceJob",
+    "SecurityAlertDetector",
+    "EventRollup",
+    "EventSink",
+    "FileEventSink",
     "log_admin_action",
     "log_auth_action",
 ]
 
 
-def init_event_system(db_config):
-    """Initialize the event system with the given database configuration."""
-    event_service = EventService(db_config)
-    event_integration = EventSystemIntegration(event_service)
+def init_event_system(
+    db_config,
+    buffered: bool = False,
+    audit_storage: str = "full",
+    snapshot_interval: int = 10,
+    audit_compression=None,
+    alert_detector=None,
+    failed_login_window_seconds=None,
+    rollup=None,
+    sink=None,
+    **writer_options,
+):
+    """
+    Initialize the event system with the given database configuration.
+
+    Args:
+        db_config: Database configuration with the event and audit log models
+        buffered: Write model and auth events through a BufferedEventWriter
+            instead of inserting and committing inside each request
+        audit_storage: "full" or "diff" audit storage (see AuditStore)
+        snapshot_interval: Versions between full snapshots in diff mode
+        audit_compression: None, "zlib" or "zstd" compression of stored states
+        alert_detector: SecurityAlertDetector fed by failed auth events
+        failed_login_window_seconds: Merge repeated failed logins from one IP
+            for one username within this many seconds into a single event
+        rollup: EventRollup maintaining activity counts for the dashboard;
+            cannot be combined with failed_login_window_seconds
+        sink: EventSink storing events and audit records instead of the
+            admin database; cannot be combined with buffered
+        **writer_options: max_queue_size, batch_size and flush_interval for the writer
+    """
+    if sink is not None and buffered:
+        raise ValueError("The buffered writer cannot be used with an event sink")
+    if rollup is not None and failed_login_window_seconds is not None:
+        raise ValueError("Rollups cannot be combined with failed login aggregation")
+
+    event_service = EventService(
+        db_config,
+        audit_storage=audit_storage,
+        snapshot_interval=snapshot_interval,
+        audit_compression=audit_compression,
+        failed_login_window_seconds=failed_login_window_seconds,
+        sink=sink,
+    )
+    writer = None
+    if buffered:
+        writer = BufferedEventWriter(
+            db_config, audit_store=event_service.audit_store, **writer_options
+        )
+    event_integration = EventSystemIntegration(
+        event_service, writer=writer, alert_detector=alert_detector, rollup=rollup
+    )
 
     return event_service, event_integration
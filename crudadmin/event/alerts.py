@@ -0,0 +1,131 @@
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from ..core.rate_limiter import RateLimiter, create_rate_limiter
+
+UTC = timezone.utc
+
+logger = logging.getLogger(__name__)
+
+
+class SecurityAlertDetector:
+    """
+    Incremental failed-login detector.
+
+    Each failed login increments a rolling counter keyed by IP address and
+    attempted username in a rate limiter backend (in-memory by default, or a
+    shared Redis/Memcached/database limiter for multi-worker deployments).
+    When a counter reaches the threshold an alert is recorded, so the current
+    alerts can be read without scanning the event log.
+
+    Counters use the rate limiter's fixed windows, so an alert fires once
+    `threshold` failures land inside one `window_seconds` window.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        threshold: int = 5,
+        window_seconds: int = 24 * 60 * 60,
+        max_alerts: int = 1000,
+    ) -> None:
+        """
+        Args:
+            rate_limiter: Counter backend; a private in-memory limiter if None
+            threshold: Failed attempts from one IP for one username that raise an alert
+            window_seconds: Counter window and how long an alert stays active
+            max_alerts: Maximum active alerts kept, oldest evicted first
+        """
+        if threshold < 1:
+            raise ValueError("threshold must be at least 1")
+
+        self.rate_limiter = rate_limiter or create_rate_limiter(
+            "memory", prefix="security_alert:"
+        )
+        self.threshold = threshold
+        self.window_seconds = window_seconds
+        self.max_alerts = max_alerts
+        self._alerts: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+
+    @staticmethod
+    def _key(ip_address: str, username: str) -> str:
+        return f"failed_login:{ip_address}:{username}"
+
+    async def record_failed_login(
+        self, ip_address: Optional[str], username: Optional[str]
+    ) -> int:
+        """
+        Count a failed login and raise or refresh an alert at the threshold.
+
+        Args:
+            ip_address: Client IP of the attempt
+            username: Username that was attempted
+
+        Returns:
+            Failed attempts for this IP and username in the current window
+        """
+        ip_address = ip_address or "unknown"
+        username = username or "unknown"
+
+        attempts = await self.rate_limiter.increment(
+            self._key(ip_address, username), 1, self.window_seconds
+        )
+        if attempts < self.threshold:
+            return attempts
+
+        now = datetime.now(UTC)
+        alert_key = (ip_address, username)
+        existing = self._alerts.pop(alert_key, None)
+        self._alerts[alert_key] = {
+            "attempts": attempts,
+            "first_seen": existing["first_seen"] if existing else now,
+            "last_seen": now,
+            "expires_at": time.monotonic() + self.window_seconds,
+        }
+        while len(self._alerts) > self.max_alerts:
+            self._alerts.popitem(last=False)
+
+        if attempts == self.threshold:
+            logger.warning(
+                f"Security alert: {attempts} failed logins for '{username}' "
+                f"from {ip_address}"
+            )
+        return attempts
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        expired = [
+            key for key, alert in self._alerts.items() if alert["expires_at"] <= now
+        ]
+        for key in expired:
+            del self._alerts[key]
+
+    def get_alerts(self) -> list[dict[str, Any]]:
+        """
+        Return the active alerts, most recent first.
+
+        Alerts have the same shape as `EventService.get_security_alerts`.
+        """
+        self._prune()
+        return [
+            {
+                "type": "multiple_failed_logins",
+                "severity": "high",
+                "details": {
+                    "ip_address": ip_address,
+                    "username": username,
+                    "attempts": alert["attempts"],
+                    "first_seen": alert["first_seen"],
+                    "last_seen": alert["last_seen"],
+                },
+            }
+            for (ip_address, username), alert in reversed(self._alerts.items())
+        ]
+
+    async def reset(self, ip_address: str, username: str) -> None:
+        """Clear the counter and alert for an IP and username."""
+        await self.rate_limiter.delete(self._key(ip_address, username))
+        self._alerts.pop((ip_address, username), None)
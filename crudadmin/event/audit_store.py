@@ -0,0 +1,479 @@
+"""
+Compact audit log storage.
+
+In "full" mode (the default) every audit row keeps the complete previous and
+new state of the record. In "diff" mode a row only keeps the field level diff
+in `changes`; the complete state is stored as a snapshot on the first version
+of a record and on every `snapshot_interval`-th version after that, so any
+version can be rebuilt from the nearest snapshot and the diffs that follow it.
+Stored states can additionally be compressed with zlib or zstd.
+"""
+
+import base64
+import json
+import logging
+import zlib
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
+
+from sqlalchemy import ColumnElement, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+if TYPE_CHECKING:
+    import zstandard
+
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+VERSION_KEY = "audit_version"
+SNAPSHOT_KEY = "audit_snapshot"
+COMPRESSED_KEY = "_compressed"
+
+Executor = Union[AsyncSession, AsyncConnection]
+R = TypeVar("R")
+
+
+class AuditStore:
+    """Encodes audit rows for storage and rebuilds record versions from them."""
+
+    MODES = ("full", "diff")
+    COMPRESSIONS = (None, "zlib", "zstd")
+    VERSION_ATTEMPTS = 5
+
+    def __init__(
+        self,
+        audit_model: Any,
+        mode: str = "full",
+        snapshot_interval: int = 10,
+        compression: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            audit_model: The AdminAuditLog model
+            mode: "full" to store complete states, "diff" to store field diffs
+                with periodic snapshots
+            snapshot_interval: In diff mode, store a full snapshot every this many versions
+            compression: None, "zlib" or "zstd" to compress stored states
+
+        Raises:
+            ValueError: If the mode or compression is unknown
+            ImportError: If zstd compression is requested without zstandard installed
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown audit storage mode: {mode}")
+        if compression not in self.COMPRESSIONS:
+            raise ValueError(f"Unknown audit compression: {compression}")
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be at least 1")
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise ImportError(
+                "The zstandard package is not installed. "
+                "Please install it with 'pip install zstandard' to use zstd compression."
+            )
+
+        self.audit_model = audit_model
+        self.mode = mode
+        self.snapshot_interval = snapshot_interval
+        self.compression = compression
+
+    @property
+    def is_diff(self) -> bool:
+        return self.mode == "diff"
+
+    def encode_state(self, state: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+        """Compress a state dict into a JSON-compatible wrapper if configured."""
+        if state is None or self.compression is None:
+            return state
+
+        raw = json.dumps(state, separators=(",", ":")).encode()
+        if self.compression == "zstd":
+            data = zstandard.ZstdCompressor().compress(raw)
+        else:
+            data = zlib.compress(raw)
+        return {
+            COMPRESSED_KEY: self.compression,
+            "data": base64.b64encode(data).decode(),
+        }
+
+    @staticmethod
+    def decode_state(stored: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+        """Reverse encode_state; uncompressed states are returned unchanged."""
+        if not isinstance(stored, dict) or COMPRESSED_KEY not in stored:
+            return stored
+
+        data = base64.b64decode(stored["data"])
+        if stored[COMPRESSED_KEY] == "zstd":
+            if not ZSTD_AVAILABLE:
+                raise ImportError(
+                    "The zstandard package is needed to read zstd compressed audit logs."
+                )
+            raw = zstandard.ZstdDecompressor().decompress(data)
+        else:
+            raw = zlib.decompress(data)
+        return dict(json.loads(raw))
+
+    @staticmethod
+    def slim_details(details: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+        """
+        Drop full record states from event details.
+
+        The audit row already holds the diff (and snapshots), so the copies of
+        the previous and new state nested in `resource_details.changes` are
+        removed. The summary fields are kept.
+        """
+        if not details or not isinstance(details.get("resource_details"), dict):
+            return details
+
+        resource_details = dict(details["resource_details"])
+        changes = resource_details.get("changes")
+        if isinstance(changes, dict) and "action" in changes:
+            resource_details["changes"] = {
+                k: v
+                for k, v in changes.items()
+                if k not in ("previous_state", "new_state")
+            }
+        elif isinstance(changes, dict):
+            resource_details.pop("changes")
+        return {**details, "resource_details": resource_details}
+
+    @property
+    def is_versioned(self) -> bool:
+        """Whether the audit model has the version column."""
+        return "version" in self.audit_model.__table__.c
+
+    async def _lock_resource(
+        self, executor: Executor, resource_type: str, resource_id: str
+    ) -> None:
+        """
+        Serialize version assignment for a record on partitioned tables.
+
+        A partitioned PostgreSQL table cannot have the unique version index,
+        so writers take a transaction-level advisory lock per record instead.
+        """
+        table = self.audit_model.__table__
+        dialect = (
+            executor.get_bind().dialect
+            if isinstance(executor, AsyncSession)
+            else executor.dialect
+        )
+        if dialect.name != "postgresql" or not table.dialect_options["postgresql"].get(
+            "partition_by"
+        ):
+            return
+        key = f"{table.name}:{resource_type}:{resource_id}"
+        await executor.execute(
+            select(func.pg_advisory_xact_lock(func.hashtextextended(key, 0)))
+        )
+
+    async def _latest_versions(
+        self, executor: Executor, resources: set[tuple[str, str]]
+    ) -> dict[tuple[str, str], int]:
+        model = self.audit_model
+        versions = {}
+        for resource_type, resource_id in sorted(resources):
+            if self.is_versioned:
+                await self._lock_resource(executor, resource_type, resource_id)
+                latest_version = (
+                    await executor.execute(
+                        select(func.max(model.version)).where(
+                            model.resource_type == resource_type,
+                            model.resource_id == resource_id,
+                        )
+                    )
+                ).scalar_one()
+                if latest_version is not None:
+                    versions[(resource_type, resource_id)] = int(latest_version)
+                    continue
+
+            latest = (
+                await executor.execute(
+                    select(model.audit_metadata)
+                    .where(
+                        model.resource_type == resource_type,
+                        model.resource_id == resource_id,
+                    )
+                    .order_by(model.timestamp.desc(), model.id.desc())
+                    .limit(1)
+                )
+            ).scalar_one_or_none()
+
+            if latest is None:
+                versions[(resource_type, resource_id)] = 0
+            elif isinstance(latest, dict) and VERSION_KEY in latest:
+                versions[(resource_type, resource_id)] = int(latest[VERSION_KEY])
+            else:
+                versions[(resource_type, resource_id)] = (
+                    await executor.execute(
+                        select(func.count()).where(
+                            model.resource_type == resource_type,
+                            model.resource_id == resource_id,
+                        )
+                    )
+                ).scalar_one()
+        return versions
+
+    async def prepare(
+        self, executor: Executor, records: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        Turn audit records built with full states into their stored form.
+
+        In diff mode this assigns each record the next version of its
+        resource, keeps the full new state only for snapshot versions and
+        drops the previous state. Records are updated in place and returned.
+
+        Args:
+            executor: Session or connection used to look up current versions
+            records: Audit column values, in the order they will be inserted
+        """
+        if not self.is_diff:
+            for record in records:
+                record["previous_state"] = self.encode_state(
+                    record.get("previous_state")
+                )
+                record["new_state"] = self.encode_state(record.get("new_state"))
+            return records
+
+        versions = await self._latest_versions(
+            executor,
+            {(record["resource_type"], record["resource_id"]) for record in records},
+        )
+
+        for record in records:
+            key = (record["resource_type"], record["resource_id"])
+            versions[key] += 1
+            version = versions[key]
+
+            snapshot = record["action"] == "create" or (
+                record["action"] != "delete"
+                and (version == 1 or version % self.snapshot_interval == 0)
+            )
+
+            if record["action"] != "delete":
+                record["new_state"] = (
+                    self.encode_state(record.get("new_state")) if snapshot else None
+                )
+            else:
+                record["new_state"] = self.encode_state(record.get("new_state"))
+            record["previous_state"] = None
+            record["audit_metadata"] = {
+                **(self.slim_details(record.get("audit_metadata")) or {}),
+                VERSION_KEY: version,
+                SNAPSHOT_KEY: snapshot,
+            }
+            if self.is_versioned:
+                record["version"] = version
+        return records
+
+    async def write(
+        self,
+        executor: Executor,
+        records: list[dict[str, Any]],
+        insert_rows: Callable[[list[dict[str, Any]]], Awaitable[R]],
+    ) -> R:
+        """
+        Prepare audit records and insert them with insert_rows.
+
+        In diff mode with a versioned audit model, the insert runs in a
+        savepoint. If a concurrent writer took one of the versions first, the
+        unique version index rejects the insert and the records are prepared
+        again from the now current versions, up to VERSION_ATTEMPTS times.
+
+        Args:
+            executor: Session or connection of the insert
+            records: Audit column values built with full states; left unchanged
+            insert_rows: Inserts the prepared records and returns its result
+
+        Returns:
+            The result of insert_rows
+
+        Raises:
+            IntegrityError: If the versions still conflict after the last attempt
+        """
+        if not (self.is_diff and self.is_versioned):
+            return await insert_rows(
+                await self.prepare(executor, [dict(record) for record in records])
+            )
+
+        attempt = 1
+        while True:
+            prepared = await self.prepare(
+                executor, [dict(record) for record in records]
+            )
+            try:
+                async with executor.begin_nested():
+                    return await insert_rows(prepared)
+            except IntegrityError:
+                if attempt >= self.VERSION_ATTEMPTS:
+                    raise
+                attempt += 1
+                logger.debug("Audit version conflict, retrying with new versions")
+
+    async def get_version(
+        self,
+        db: Executor,
+        resource_type: str,
+        resource_id: str,
+        version: Optional[int] = None,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Rebuild the state of a record as of a given version.
+
+        Reads audit rows newest first down to the nearest snapshot at or
+        before the requested version, then applies the diffs after it.
+
+        Args:
+            db: Database session
+            resource_type: Model name of the record
+            resource_id: Primary key of the record
+            version: Version to rebuild; the latest if None
+
+        Returns:
+            The record state, or None if the version does not exist or the
+            record was deleted at that version
+        """
+        model = self.audit_model
+        stmt = (
+            select(
+                model.action,
+                model.new_state,
+                model.changes,
+                model.audit_metadata,
+            )
+            .where(
+                model.resource_type == resource_type, model.resource_id == resource_id
+            )
+            .order_by(model.timestamp.desc(), model.id.desc())
+        )
+
+        pending: list[Any] = []
+        base: Optional[dict[str, Any]] = None
+        found = False
+        result = await db.stream(stmt)
+        try:
+            async for row in result:
+                meta = (
+                    row.audit_metadata if isinstance(row.audit_metadata, dict) else {}
+                )
+                row_version = meta.get(VERSION_KEY)
+                if version is not None and row_version is not None:
+                    if row_version > version:
+                        continue
+                    if not found and row_version != version:
+                        return None
+                found = True
+
+                if row.action == "delete":
+                    if not pending:
+                        return None
+                    base = {}
+                    break
+
+                is_snapshot = meta.get(SNAPSHOT_KEY, row_version is None)
+                if is_snapshot and row.new_state is not None:
+                    base = self.decode_state(row.new_state)
+                    break
+                pending.append(row.changes or {})
+        finally:
+            await result.close()
+
+        if not found or base is None:
+            return None
+
+        state = dict(base)
+        for changes in reversed(pending):
+            for field, change in changes.items():
+                state[field] = change.get("new") if isinstance(change, dict) else change
+        return state
+
+    async def keep_snapshots(
+        self, executor: Executor, doomed: ColumnElement[bool]
+    ) -> int:
+        """
+        Make the audit rows that outlive a deletion independent of the deleted ones.
+
+        In diff mode a version is rebuilt from the nearest earlier snapshot.
+        Before the audit rows matching doomed are deleted, the oldest remaining
+        row of each affected record is rewritten as a snapshot of its full
+        state, unless it already is one or is a delete, so the later versions
+        can still be rebuilt.
+
+        Args:
+            executor: Session or connection of the deletion
+            doomed: Condition selecting the audit rows about to be deleted
+
+        Returns:
+            Number of rows rewritten as snapshots
+        """
+        if not self.is_diff:
+            return 0
+
+        model = self.audit_model
+        resources = (
+            await executor.execute(
+                select(model.resource_type, model.resource_id).where(doomed).distinct()
+            )
+        ).all()
+
+        rewritten = 0
+        for resource_type, resource_id in resources:
+            survivor = (
+                await executor.execute(
+                    select(
+                        model.id,
+                        model.action,
+                        model.new_state,
+                        model.audit_metadata,
+                    )
+                    .where(
+                        model.resource_type == resource_type,
+                        model.resource_id == resource_id,
+                        ~doomed,
+                    )
+                    .order_by(model.timestamp, model.id)
+                    .limit(1)
+                )
+            ).one_or_none()
+            if survivor is None or survivor.action == "delete":
+                continue
+
+            meta = (
+                survivor.audit_metadata
+                if isinstance(survivor.audit_metadata, dict)
+                else {}
+            )
+            version = meta.get(VERSION_KEY)
+            if version is None or (
+                meta.get(SNAPSHOT_KEY) and survivor.new_state is not None
+            ):
+                continue
+
+            state = await self.get_version(
+                executor, resource_type, resource_id, version
+            )
+            if state is None:
+                logger.warning(
+                    f"Cannot rebuild version {version} of {resource_type} "
+                    f"{resource_id}; its audit history loses its snapshot"
+                )
+                continue
+
+            await executor.execute(
+                update(model)
+                .where(model.id == survivor.id)
+                .values(
+                    new_state=self.encode_state(state),
+                    audit_metadata={**meta, SNAPSHOT_KEY: True},
+                )
+                .execution_options(synchronize_session=False)
+            )
+            rewritten += 1
+        return rewritten
@@ -60,8 +60,23 @@ def convert_user_to_dict(user: Any) -> Dict[str, Any]:
 
 
 def log_admin_action(
-    event_type: EventType, model: Optional[Type[DeclarativeBase]] = None
+    event_type: EventType,
+    model: Optional[Type[DeclarativeBase]] = None,
+    captures_state: bool = False,
 ):
+    """
+    Log a model event for an admin endpoint.
+
+    Args:
+        event_type: Type of event to log
+        model: Model the endpoint writes to
+        captures_state: The endpoint stores the states it read and wrote on
+            request.state (audit_previous_state and audit_new_state for
+            updates, audit_requested_ids for deletes), so the decorator does
+            not read the row before and after the call or re-parse the body.
+            An update that stored no state changed nothing and is not logged.
+    """
+
     def decorator(func: Callable):
         @functools.wraps(func)
         async def wrapper(
@@ -78,7 +93,10 @@ def log_admin_action(
             previous_state = None
             crud: Optional[FastCRUD] = None
 
-            if event_type in [EventType.UPDATE, EventType.DELETE]:
+            if not captures_state and event_type in [
+                EventType.UPDATE,
+                EventType.DELETE,
+            ]:
                 try:
                     if model is not None:
                         crud = FastCRUD(model)
@@ -113,7 +131,16 @@ def log_admin_action(
                     new_state = None
                     resource_id = kwargs.get("id")
 
-                    if event_type == EventType.UPDATE:
+                    if event_type == EventType.UPDATE and captures_state:
+                        previous_state = getattr(
+                            request.state, "audit_previous_state", None
+                        )
+                        new_state = getattr(request.state, "audit_new_state", None)
+                        if new_state is None:
+                            return result
+                        new_state = get_model_changes(new_state)
+
+                    elif event_type == EventType.UPDATE:
                         try:
                             if model is not None:
                                 crud = FastCRUD(model)
@@ -147,8 +174,11 @@ def log_admin_action(
 
                     if event_type == EventType.DELETE:
                         try:
-                            body = await request.json()
-                            ids = body.get("ids", [])
+                            if captures_state:
+                                ids = getattr(request.state, "audit_requested_ids", [])
+                            else:
+                                body = await request.json()
+                                ids = body.get("ids", [])
                             logger.info(f"Delete request received for ids: {ids}")
 
                             deleted_records = []
@@ -179,9 +209,10 @@ def log_admin_action(
                         except Exception as e:
                             logger.error(f"Error in bulk delete process: {str(e)}")
 
-                    elif event_type == EventType.UPDATE:
+                    change_summary = new_state
+                    if event_type == EventType.UPDATE:
                         changes = compare_states(previous_state, new_state)
-                        new_state = {
+                        change_summary = {
                             "action": "update",
                             "updated_at": datetime.now(UTC).isoformat(),
                             "previous_state": previous_state,
@@ -198,9 +229,7 @@ def log_admin_action(
                         "resource_details": {
                             "model": model.__name__ if model else None,
                             "id": resource_id,
-                            "changes": new_state
-                            if event_type in [EventType.UPDATE, EventType.DELETE]
-                            else new_state,
+                            "changes": change_summary,
                         },
                         "request_details": {
                             "method": request.method,
@@ -0,0 +1,128 @@
+"""
+Serialization of exported rows as NDJSON or CSV.
+
+The encoders consume rows (from `EventService.iter_events` or a model export)
+one at a time and yield one encoded line per row, so an export of any size is
+written with constant memory.
+"""
+
+import csv
+import io
+import json
+from enum import Enum
+from typing import Any, AsyncIterator, Callable
+
+from .service import CustomJSONEncoder
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+CSV_COLUMNS = [
+    "id",
+    "timestamp",
+    "event_type",
+    "status",
+    "user_id",
+    "username",
+    "session_id",
+    "ip_address",
+    "user_agent",
+    "resource_type",
+    "resource_id",
+    "details",
+    "cursor",
+]
+
+AUDIT_CSV_COLUMNS = [
+    "audit_action",
+    "audit_changes",
+    "audit_previous_state",
+    "audit_new_state",
+]
+
+_json_encoder = CustomJSONEncoder()
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, cls=CustomJSONEncoder, separators=(",", ":"))
+
+
+async def ndjson_lines(rows: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+    """Encode each row as one JSON object per line."""
+    async for row in rows:
+        yield _dumps(row) + "\n"
+
+
+async def csv_table_lines(
+    rows: AsyncIterator[dict[str, Any]], columns: list[str]
+) -> AsyncIterator[str]:
+    """
+    Encode rows as CSV with a header line of the given columns.
+
+    Nested values are written as JSON strings.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def line(values: list[Any]) -> str:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(values)
+        return buffer.getvalue()
+
+    yield line(columns)
+
+    async for row in rows:
+        yield line([_format_csv_value(row.get(column)) for column in columns])
+
+
+async def csv_lines(
+    rows: AsyncIterator[dict[str, Any]], include_audit: bool = False
+) -> AsyncIterator[str]:
+    """
+    Encode event rows as CSV with a header line.
+
+    Nested values (details and the audit fields) are written as JSON strings.
+    """
+    columns = CSV_COLUMNS + (AUDIT_CSV_COLUMNS if include_audit else [])
+
+    async def flattened() -> AsyncIterator[dict[str, Any]]:
+        async for row in rows:
+            audit = row.get("audit") or {}
+            yield {
+                column: audit.get(column[len("audit_") :])
+                if column.startswith("audit_")
+                else row.get(column)
+                for column in columns
+            }
+
+    async for line in csv_table_lines(flattened(), columns):
+        yield line
+
+
+def _format_csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return _dumps(value)
+    if isinstance(value, Enum) or not isinstance(value, (str, int, float)):
+        return _json_encoder.default(value)
+    return value
+
+
+def get_encoder(
+    export_format: str, include_audit: bool = False
+) -> Callable[[AsyncIterator[dict[str, Any]]], AsyncIterator[str]]:
+    """
+    Return the line encoder for an export format.
+
+    Raises:
+        ValueError: If the format is not "ndjson" or "csv"
+    """
+    if export_format == "ndjson":
+        return ndjson_lines
+    if export_format == "csv":
+        return lambda rows: csv_lines(rows, include_audit=include_audit)
+    raise ValueError(f"Unsupported export format: {export_format}")
@@ -0,0 +1,617 @@
+"""
+Append-only segment file storage for events and audit records.
+
+Each log (events, audits) is a directory of segment files. A segment holds
+length-prefixed compact JSON records (4-byte big-endian length, then the
+payload) and is sealed once it reaches `segment_max_bytes`, after which a new
+segment is started. Segments are named after the id of their first record.
+
+Next to each segment, a sparse `.idx` file stores (timestamp, id, offset) for
+every `index_interval`-th record and for the last record of a sealed
+segment. Time-range and id lookups binary-search these entries and read only
+the blocks of records between two entries, so reads never scan whole
+segments. Retention removes whole segments.
+
+Record timestamps are kept non-decreasing within a log: a record appended
+with an earlier timestamp than its predecessor (concurrent requests) is
+stamped with the predecessor's timestamp.
+
+Several processes may share a log on POSIX systems. Appends and retention
+hold an exclusive lock on the log's `.lock` file, which also stores the last
+id and the first segment's id. A process that finds these changed by another
+one reloads the segments it has not seen before appending or reading. Without
+fcntl (Windows), a log must be used by a single process.
+"""
+
+import asyncio
+import bisect
+import json
+import logging
+import os
+import struct
+from array import array
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+from .schemas import EventStatus, EventType
+from .service import CustomJSONEncoder
+from .sink import EventSink
+
+UTC = timezone.utc
+
+logger = logging.getLogger(__name__)
+
+RECORD_HEADER = struct.Struct(">I")
+INDEX_ENTRY = struct.Struct(">dqq")
+HEAD = struct.Struct(">qq")
+
+SEGMENT_SUFFIX = ".log"
+INDEX_SUFFIX = ".idx"
+LOCK_NAME = ".lock"
+
+
+def _to_epoch(moment: datetime) -> float:
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return moment.timestamp()
+
+
+class _Segment:
+    """In-memory metadata and sparse index of one segment file."""
+
+    def __init__(self, directory: str, first_id: int) -> None:
+        self.first_id = first_id
+        self.path = os.path.join(directory, f"{first_id:020d}{SEGMENT_SUFFIX}")
+        self.index_path = os.path.join(directory, f"{first_id:020d}{INDEX_SUFFIX}")
+        self.last_id = first_id - 1
+        self.last_offset = 0
+        self.size = 0
+        self.min_ts = 0.0
+        self.max_ts = 0.0
+        self.sealed = False
+        self.entry_ts = array("d")
+        self.entry_ids = array("q")
+        self.entry_offsets = array("q")
+
+    @property
+    def count(self) -> int:
+        return self.last_id - self.first_id + 1
+
+    def add_entry(self, ts: float, record_id: int, offset: int) -> None:
+        self.entry_ts.append(ts)
+        self.entry_ids.append(record_id)
+        self.entry_offsets.append(offset)
+
+    def blocks(self, size: int) -> list[tuple[int, int]]:
+        """
+        Byte ranges of the blocks starting at each index entry, up to size.
+
+        The first record of a segment is always indexed, so the blocks cover
+        the whole segment.
+        """
+        offsets = [offset for offset in self.entry_offsets if offset < size]
+        return list(zip(offsets, offsets[1:] + [size]))
+
+
+class SegmentLog:
+    """One append-only log of JSON records with sequential integer ids."""
+
+    def __init__(
+        self,
+        directory: str,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        index_interval: int = 256,
+        fsync: bool = False,
+    ) -> None:
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.index_interval = index_interval
+        self.fsync = fsync
+
+        self.segments: list[_Segment] = []
+        self._segment_first_ids: list[int] = []
+        self._last_ts = 0.0
+        self._file: Any = None
+        self._index_file: Any = None
+        self._lock = asyncio.Lock()
+        self._lock_fd: Optional[int] = None
+        self._opened = False
+
+    @property
+    def last_id(self) -> int:
+        return self.segments[-1].last_id if self.segments else 0
+
+    @property
+    def count(self) -> int:
+        return sum(segment.count for segment in self.segments)
+
+    @property
+    def _head(self) -> tuple[int, int]:
+        """Last id and first segment id, as stored in the lock file."""
+        return self.last_id, self.segments[0].first_id if self.segments else 0
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the log's file lock, shared with other processes."""
+        if fcntl is None:
+            yield
+            return
+        if self._lock_fd is None:
+            self._lock_fd = os.open(
+                os.path.join(self.directory, LOCK_NAME), os.O_RDWR | os.O_CREAT, 0o644
+            )
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _write_head(self) -> None:
+        if self._lock_fd is not None:
+            os.pwrite(self._lock_fd, HEAD.pack(*self._head), 0)
+
+    def _refresh(self) -> None:
+        """
+        Reload the segments changed by other processes. Requires the file lock.
+
+        Sealed segments never change, so only the ones removed by retention
+        are dropped, and the active segment and any newer ones are reloaded.
+        """
+        if self._lock_fd is None:
+            return
+        data = os.pread(self._lock_fd, HEAD.size, 0)
+        if len(data) < HEAD.size or HEAD.unpack(data) == self._head:
+            return
+
+        first_ids = self._list_first_ids()
+        existing = set(first_ids)
+        self._close_files()
+        self.segments = [
+            segment for segment in self.segments[:-1] if segment.first_id in existing
+        ]
+        known = {segment.first_id for segment in self.segments}
+        self._load_segments(
+            [first_id for first_id in first_ids if first_id not in known]
+        )
+
+    def _list_first_ids(self) -> list[int]:
+        return sorted(
+            int(name[: -len(SEGMENT_SUFFIX)])
+            for name in os.listdir(self.directory)
+            if name.endswith(SEGMENT_SUFFIX)
+        )
+
+    def open(self) -> None:
+        """Load segment indexes and recover the tail of the active segment."""
+        if self._opened:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        with self._locked():
+            self._load_segments(self._list_first_ids())
+            self._write_head()
+        self._opened = True
+
+    async def reload(self) -> None:
+        """Open the log and pick up the records appended by other processes."""
+        async with self._lock:
+            self.open()
+            await asyncio.to_thread(self._reload)
+
+    def _reload(self) -> None:
+        with self._locked():
+            self._refresh()
+
+    def _load_segments(self, first_ids: list[int]) -> None:
+        """Load the given segments, in order, after the ones already loaded."""
+        for position, first_id in enumerate(first_ids):
+            segment = _Segment(self.directory, first_id)
+            segment.size = os.path.getsize(segment.path)
+            self._load_index(segment)
+            if position + 1 == len(first_ids):
+                self._recover_tail(segment)
+            elif segment.entry_ids and segment.entry_ids[-1] == (
+                first_ids[position + 1] - 1
+            ):
+                segment.sealed = True
+                segment.last_id = segment.entry_ids[-1]
+                segment.last_offset = segment.entry_offsets[-1]
+                segment.max_ts = segment.entry_ts[-1]
+            else:
+                # Sealing was interrupted before the last record was indexed.
+                self._recover_tail(segment)
+                self._seal(segment)
+            self.segments.append(segment)
+
+        self._segment_first_ids = [segment.first_id for segment in self.segments]
+        if self.segments:
+            self._last_ts = self.segments[-1].max_ts
+
+    def _load_index(self, segment: _Segment) -> None:
+        if not os.path.exists(segment.index_path):
+            return
+        with open(segment.index_path, "rb") as f:
+            data = f.read()
+        usable = len(data) - len(data) % INDEX_ENTRY.size
+        for ts, record_id, offset in INDEX_ENTRY.iter_unpack(data[:usable]):
+            if offset >= segment.size:
+                break
+            segment.add_entry(ts, record_id, offset)
+        if len(segment.entry_ts):
+            segment.min_ts = segment.entry_ts[0]
+
+    def _recover_tail(self, segment: _Segment) -> None:
+        """
+        Scan the records after the last index entry of the active segment.
+
+        Restores index entries lost in a crash and truncates a torn write.
+        """
+        offset = segment.entry_offsets[-1] if len(segment.entry_offsets) else 0
+        with open(segment.path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+
+        valid_end = offset
+        position = 0
+        while position + RECORD_HEADER.size <= len(data):
+            (length,) = RECORD_HEADER.unpack_from(data, position)
+            end = position + RECORD_HEADER.size + length
+            if end > len(data):
+                break
+            try:
+                record = json.loads(data[position + RECORD_HEADER.size : end])
+            except ValueError:
+                break
+
+            record_id = int(record["id"])
+            ts = _to_epoch(datetime.fromisoformat(record["timestamp"]))
+            record_offset = offset + position
+            indexed = len(segment.entry_ids) and segment.entry_ids[-1] >= record_id
+            if (record_id - segment.first_id) % self.index_interval == 0 and not (
+                indexed
+            ):
+                self._write_index_entry(segment, ts, record_id, record_offset)
+            if record_id == segment.first_id:
+                segment.min_ts = ts
+            segment.max_ts = ts
+            segment.last_id = record_id
+            segment.last_offset = record_offset
+            position = end
+            valid_end = offset + position
+
+        self._close_files()
+        if valid_end < segment.size:
+            logger.warning(
+                f"Truncating {segment.size - valid_end} bytes of incomplete "
+                f"records at the end of {segment.path}"
+            )
+            with open(segment.path, "r+b") as f:
+                f.truncate(valid_end)
+        segment.size = valid_end
+
+    def _close_files(self) -> None:
+        for handle in (self._file, self._index_file):
+            if handle is not None:
+                handle.close()
+        self._file = None
+        self._index_file = None
+
+    def close(self) -> None:
+        """Close the files of the active segment and the lock file."""
+        self._close_files()
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    def _start_segment(self, first_id: int) -> _Segment:
+        if self.segments:
+            self._seal(self.segments[-1])
+        segment = _Segment(self.directory, first_id)
+        self.segments.append(segment)
+        self._segment_first_ids.append(first_id)
+        return segment
+
+    def _seal(self, segment: _Segment) -> None:
+        """Index the last record of a segment so its bounds survive a restart."""
+        if segment.count > 0 and segment.entry_ids[-1] != segment.last_id:
+            self._write_index_entry(
+                segment, segment.max_ts, segment.last_id, segment.last_offset
+            )
+        segment.sealed = True
+        self._close_files()
+
+    def _write_index_entry(
+        self, segment: _Segment, ts: float, record_id: int, offset: int
+    ) -> None:
+        if self._index_file is None:
+            self._index_file = open(segment.index_path, "ab")
+        self._index_file.write(INDEX_ENTRY.pack(ts, record_id, offset))
+        self._index_file.flush()
+        segment.add_entry(ts, record_id, offset)
+
+    def _write(self, record: dict[str, Any], ts: float) -> None:
+        payload = json.dumps(
+            record, cls=CustomJSONEncoder, separators=(",", ":")
+        ).encode()
+        size = RECORD_HEADER.size + len(payload)
+
+        segment = self.segments[-1] if self.segments else None
+        if segment is None or (
+            segment.count > 0 and segment.size + size > self.segment_max_bytes
+        ):
+            segment = self._start_segment(record["id"])
+
+        if self._file is None:
+            self._file = open(segment.path, "ab")
+        offset = segment.size
+        self._file.write(RECORD_HEADER.pack(len(payload)) + payload)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+        position = record["id"] - segment.first_id
+        if position % self.index_interval == 0:
+            self._write_index_entry(segment, ts, record["id"], offset)
+        if position == 0:
+            segment.min_ts = ts
+        segment.max_ts = ts
+        segment.last_id = record["id"]
+        segment.last_offset = offset
+        segment.size = offset + size
+
+    async def append(self, record: dict[str, Any]) -> dict[str, Any]:
+        """
+        Append a record, assigning its id.
+
+        Returns:
+            The stored record, with "id" and a non-decreasing "timestamp"
+        """
+        async with self._lock:
+            self.open()
+            return await asyncio.to_thread(self._append, record)
+
+    def _append(self, record: dict[str, Any]) -> dict[str, Any]:
+        with self._locked():
+            self._refresh()
+            timestamp = record.get("timestamp") or datetime.now(UTC)
+            ts = _to_epoch(timestamp)
+            if ts < self._last_ts:
+                ts = self._last_ts
+                timestamp = datetime.fromtimestamp(ts, UTC)
+
+            stored = {**record, "id": self.last_id + 1, "timestamp": timestamp}
+            self._write(stored, ts)
+            self._last_ts = ts
+            self._write_head()
+            return stored
+
+    @staticmethod
+    def _read_block(path: str, start: int, end: int) -> list[dict[str, Any]]:
+        with open(path, "rb") as f:
+            f.seek(start)
+            data = f.read(end - start)
+
+        records = []
+        position = 0
+        while position + RECORD_HEADER.size <= len(data):
+            (length,) = RECORD_HEADER.unpack_from(data, position)
+            body_start = position + RECORD_HEADER.size
+            if body_start + length > len(data):
+                break
+            records.append(json.loads(data[body_start : body_start + length]))
+            position = body_start + length
+        return records
+
+    async def scan(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        reverse: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over the records with start <= timestamp < end.
+
+        Only the index blocks that can hold matching timestamps are read, one
+        block at a time.
+
+        Args:
+            start: Earliest timestamp to include
+            end: Timestamp to stop before
+            reverse: Newest first instead of oldest first
+        """
+        await self.reload()
+        start_ts = _to_epoch(start) if start else None
+        end_ts = _to_epoch(end) if end else None
+
+        segments = [
+            segment
+            for segment in list(self.segments)
+            if segment.count > 0
+            and (start_ts is None or segment.max_ts >= start_ts)
+            and (end_ts is None or segment.min_ts < end_ts)
+        ]
+        if reverse:
+            segments.reverse()
+
+        for segment in segments:
+            blocks = segment.blocks(segment.size)
+            first, last = 0, len(blocks)
+            if start_ts is not None:
+                first = max(0, bisect.bisect_left(segment.entry_ts, start_ts) - 1)
+            if end_ts is not None:
+                last = min(last, bisect.bisect_left(segment.entry_ts, end_ts))
+            selected = blocks[first:last]
+            if reverse:
+                selected.reverse()
+
+            for block_start, block_end in selected:
+                records = await asyncio.to_thread(
+                    self._read_block, segment.path, block_start, block_end
+                )
+                if reverse:
+                    records.reverse()
+                for record in records:
+                    ts = _to_epoch(datetime.fromisoformat(record["timestamp"]))
+                    if start_ts is not None and ts < start_ts:
+                        if reverse:
+                            return
+                        continue
+                    if end_ts is not None and ts >= end_ts:
+                        if reverse:
+                            continue
+                        return
+                    yield record
+
+    async def get(self, record_id: int) -> Optional[dict[str, Any]]:
+        """Read one record by id."""
+        await self.reload()
+        position = bisect.bisect_right(self._segment_first_ids, record_id) - 1
+        if position < 0:
+            return None
+        segment = self.segments[position]
+        if record_id > segment.last_id:
+            return None
+
+        blocks = segment.blocks(segment.size)
+        block = bisect.bisect_right(segment.entry_ids, record_id) - 1
+        block_start, block_end = blocks[block]
+        for record in await asyncio.to_thread(
+            self._read_block, segment.path, block_start, block_end
+        ):
+            if record["id"] == record_id:
+                return record
+        return None
+
+    async def delete_before(self, cutoff: datetime) -> int:
+        """
+        Delete the sealed segments whose newest record is older than cutoff.
+
+        Returns:
+            Number of records deleted
+        """
+        async with self._lock:
+            self.open()
+            return await asyncio.to_thread(self._delete_before, _to_epoch(cutoff))
+
+    def _delete_before(self, cutoff_ts: float) -> int:
+        with self._locked():
+            self._refresh()
+            deleted = 0
+            while (
+                len(self.segments) > 1
+                and self.segments[0].sealed
+                and self.segments[0].max_ts < cutoff_ts
+            ):
+                segment = self.segments.pop(0)
+                self._segment_first_ids.pop(0)
+                for path in (segment.path, segment.index_path):
+                    if os.path.exists(path):
+                        os.remove(path)
+                deleted += segment.count
+                logger.info(f"Removed event segment {segment.path}")
+            self._write_head()
+            return deleted
+
+
+class FileEventSink(EventSink):
+    """
+    Event sink storing events and audit records in append-only segment files.
+
+    Writing an event is a single append to a local file, so logging puts no
+    load on the admin database. Reads use the sparse offset index for time
+    ranges and ids; filters other than time are applied while scanning.
+    Worker processes on one host can share the directory on POSIX systems;
+    it should be on a local filesystem, where file locks are reliable.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        index_interval: int = 256,
+        fsync: bool = False,
+    ) -> None:
+        """
+        Args:
+            directory: Directory holding the "events" and "audits" logs
+            segment_max_bytes: Size at which a segment is sealed and a new one started
+            index_interval: Records between sparse index entries
+            fsync: fsync every append; safer on power loss, much slower
+        """
+        if segment_max_bytes < 1 or index_interval < 1:
+            raise ValueError("segment_max_bytes and index_interval must be positive")
+
+        options: dict[str, Any] = {
+            "segment_max_bytes": segment_max_bytes,
+            "index_interval": index_interval,
+            "fsync": fsync,
+        }
+        self.directory = directory
+        self.events = SegmentLog(os.path.join(directory, "events"), **options)
+        self.audits = SegmentLog(os.path.join(directory, "audits"), **options)
+
+    @staticmethod
+    def _decode_event(record: dict[str, Any]) -> dict[str, Any]:
+        return {
+            **record,
+            "timestamp": datetime.fromisoformat(record["timestamp"]),
+            "event_type": EventType(record["event_type"]),
+            "status": EventStatus(record["status"]),
+        }
+
+    @staticmethod
+    def _decode_audit(record: dict[str, Any]) -> dict[str, Any]:
+        return {**record, "timestamp": datetime.fromisoformat(record["timestamp"])}
+
+    async def append_event(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Store an event record and return it with its id."""
+        return await self.events.append(record)
+
+    async def append_audit(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Store an audit record and return it with its id."""
+        return await self.audits.append(record)
+
+    async def iter_events(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        reverse: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over events with start <= timestamp < end."""
+        async for record in self.events.scan(start, end, reverse=reverse):
+            yield self._decode_event(record)
+
+    async def iter_audits(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        reverse: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over audit records with start <= timestamp < end."""
+        async for record in self.audits.scan(start, end, reverse=reverse):
+            yield self._decode_audit(record)
+
+    async def get_event(self, event_id: int) -> Optional[dict[str, Any]]:
+        """Read one event by id."""
+        record = await self.events.get(event_id)
+        return self._decode_event(record) if record is not None else None
+
+    async def count_events(self) -> int:
+        """Number of stored events."""
+        await self.events.reload()
+        return self.events.count
+
+    async def delete_before(self, cutoff: datetime) -> int:
+        """Delete whole segments older than cutoff; returns events deleted."""
+        await self.audits.delete_before(cutoff)
+        return await self.events.delete_before(cutoff)
+
+    async def close(self) -> None:
+        """Close the open segment files."""
+        self.events.close()
+        self.audits.close()
@@ -5,15 +5,36 @@ from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 
+from .alerts import SecurityAlertDetector
+from .audit_store import AuditStore
 from .models import EventStatus, EventType
+from .rollup import EventRollup
 from .service import EventService
+from .writer import BufferedEventWriter
 
 logger = logging.getLogger(__name__)
 
 
 class EventSystemIntegration:
-    def __init__(self, event_service: EventService):
+    def __init__(
+        self,
+        event_service: EventService,
+        writer: Optional[BufferedEventWriter] = None,
+        alert_detector: Optional[SecurityAlertDetector] = None,
+        rollup: Optional[EventRollup] = None,
+    ):
         self.event_service = event_service
+        self.writer = writer
+        self.alert_detector = alert_detector
+        self.rollup = rollup
+
+    async def close(self) -> None:
+        """Drain the buffered writer and close the event sink, if configured."""
+        if self.writer is not None:
+            await self.writer.close()
+        sink = getattr(self.event_service, "sink", None)
+        if sink is not None:
+            await sink.close()
 
     async def log_model_event(
         self,
@@ -28,6 +49,41 @@ class EventSystemIntegration:
         new_state: Optional[Dict[str, Any]] = None,
         details: Optional[Dict[str, Any]] = None,
     ):
+        audit_store: Optional[AuditStore] = getattr(
+            self.event_service, "audit_store", None
+        )
+        if audit_store is not None and audit_store.is_diff:
+            details = AuditStore.slim_details(details)
+
+        if self.writer is not None:
+            audit = None
+            if (
+                event_type in [EventType.CREATE, EventType.UPDATE, EventType.DELETE]
+                and resource_id
+            ):
+                audit = self.event_service.build_audit_record(
+                    resource_type=model.__name__,
+                    resource_id=str(resource_id),
+                    action=event_type.value,
+                    previous_state=previous_state,
+                    new_state=new_state,
+                    metadata=details,
+                )
+            self.writer.enqueue(
+                self.event_service.build_event_record(
+                    event_type=event_type,
+                    status=EventStatus.SUCCESS,
+                    user_id=user_id,
+                    session_id=session_id,
+                    request=request,
+                    resource_type=model.__name__,
+                    resource_id=str(resource_id) if resource_id else None,
+                    details=details,
+                ),
+                audit,
+            )
+            return None
+
         try:
             event = await self.event_service.log_event(
                 db=db,
@@ -79,6 +135,30 @@ class EventSystemIntegration:
         try:
             status = EventStatus.SUCCESS if success else EventStatus.FAILURE
 
+            if (
+                self.alert_detector is not None
+                and event_type in (EventType.LOGIN, EventType.FAILED_LOGIN)
+                and (not success or event_type == EventType.FAILED_LOGIN)
+            ):
+                await self._record_failed_login(request, details)
+
+            # Aggregated failures update an existing row, which the
+            # insert-only writer cannot do.
+            if self.writer is not None and not self.event_service.aggregates(
+                event_type, status
+            ):
+                self.writer.enqueue(
+                    self.event_service.build_event_record(
+                        event_type=event_type,
+                        status=status,
+                        user_id=user_id,
+                        session_id=session_id,
+                        request=request,
+                        details=details,
+                    )
+                )
+                return
+
             await self.event_service.log_event(
                 db=db,
                 event_type=event_type,
@@ -92,6 +172,22 @@ class EventSystemIntegration:
         except Exception as e:
             logger.error(f"Error logging auth event: {str(e)}", exc_info=True)
 
+    async def _record_failed_login(
+        self, request: Request, details: Optional[Dict[str, Any]]
+    ) -> None:
+        assert self.alert_detector is not None
+        details = details or {}
+        auth_details = details.get("auth_details")
+        username = (
+            auth_details.get("username") if isinstance(auth_details, dict) else None
+        ) or details.get("username")
+        ip_address = request.client.host if request.client else "unknown"
+
+        try:
+            await self.alert_detector.record_failed_login(ip_address, username)
+        except Exception as e:
+            logger.error(f"Error updating security alert counters: {str(e)}")
+
     async def log_security_event(
         self,
         db: AsyncSession,
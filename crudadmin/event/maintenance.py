@@ -0,0 +1,157 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .partitioning import (
+    drop_expired_partitions,
+    ensure_month_partitions,
+    month_start,
+)
+from .service import EventService
+
+UTC = timezone.utc
+
+logger = logging.getLogger(__name__)
+
+
+class EventMaintenanceJob:
+    """
+    Periodic retention job for the event and audit logs.
+
+    Each run deletes expired events and their audit rows in bounded batches.
+    With `partitioned=True` (PostgreSQL tables created as range partitioned),
+    it also creates upcoming month partitions and drops or detaches the
+    partitions whose month is entirely past the retention period, so most of
+    the expired data is removed without row-level deletes.
+    """
+
+    def __init__(
+        self,
+        event_service: EventService,
+        retention_days: Optional[int] = 90,
+        interval_minutes: float = 60,
+        batch_size: int = 1000,
+        pause_seconds: float = 0.1,
+        partitioned: bool = False,
+        months_ahead: int = 2,
+        detach_partitions: bool = False,
+    ) -> None:
+        """
+        Args:
+            event_service: Event service bound to the admin database
+            retention_days: Age in days after which events are removed; None
+                only maintains partitions
+            interval_minutes: Time between runs when started with start()
+            batch_size: Maximum events deleted per transaction
+            pause_seconds: Delay between delete batches
+            partitioned: Manage monthly partitions of the event and audit tables
+            months_ahead: Number of future month partitions to keep created
+            detach_partitions: Detach expired partitions instead of dropping them
+        """
+        if retention_days is not None and retention_days < 1:
+            raise ValueError("retention_days must be at least 1")
+
+        self.event_service = event_service
+        self.db_config = event_service.db_config
+        self.retention_days = retention_days
+        self.interval = timedelta(minutes=interval_minutes)
+        self.batch_size = batch_size
+        self.pause_seconds = pause_seconds
+        self.partitioned = partitioned
+        self.months_ahead = months_ahead
+        self.detach_partitions = detach_partitions
+
+        self.last_run: Optional[datetime] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def _table_names(self) -> list[str]:
+        return [
+            self.db_config.AdminEventLog.__tablename__,
+            self.db_config.AdminAuditLog.__tablename__,
+        ]
+
+    async def ensure_partitions(self) -> list[str]:
+        """Create the current and upcoming month partitions of both tables."""
+        created: list[str] = []
+        async with self.db_config.admin_engine.begin() as conn:
+            for table_name in self._table_names:
+                created.extend(
+                    await ensure_month_partitions(
+                        conn, table_name, months_ahead=self.months_ahead
+                    )
+                )
+        return created
+
+    async def run_once(self) -> dict[str, Any]:
+        """
+        Run one retention pass.
+
+        Returns:
+            Dictionary with the partitions removed and the number of events
+            deleted row by row
+        """
+        removed: list[str] = []
+        deleted = 0
+
+        if self.partitioned:
+            await self.ensure_partitions()
+
+        if self.retention_days is not None:
+            cutoff = datetime.now(UTC) - timedelta(days=self.retention_days)
+
+            if self.partitioned:
+                async with self.db_config.admin_engine.begin() as conn:
+                    audit_model: Any = self.db_config.AdminAuditLog
+                    await self.event_service.audit_store.keep_snapshots(
+                        conn, audit_model.timestamp < month_start(cutoff)
+                    )
+                    for table_name in self._table_names:
+                        removed.extend(
+                            await drop_expired_partitions(
+                                conn,
+                                table_name,
+                                cutoff,
+                                detach_only=self.detach_partitions,
+                            )
+                        )
+
+            async with AsyncSession(
+                self.db_config.admin_engine, expire_on_commit=False
+            ) as db:
+                deleted = await self.event_service.cleanup_old_logs(
+                    db,
+                    retention_days=self.retention_days,
+                    batch_size=self.batch_size,
+                    pause_seconds=self.pause_seconds,
+                )
+
+        self.last_run = datetime.now(UTC)
+        return {"events_deleted": deleted, "partitions_removed": removed}
+
+    def start(self) -> None:
+        """Start running the job every interval in a background task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task, waiting for a run in progress to be cancelled."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Event maintenance failed: {str(e)}", exc_info=True)
+            await asyncio.sleep(self.interval.total_seconds())
@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from typing import Any, Optional, cast
 
-from sqlalchemy import JSON, DateTime, String
+from sqlalchemy import JSON, DateTime, Index, Integer, String, UniqueConstraint
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -10,8 +10,27 @@ from .schemas import EventStatus, EventType
 UTC = timezone.utc
 
 
-def create_admin_event_log(base: type[DeclarativeBase]) -> type[DeclarativeBase]:
+def _table_options(partitioned: bool) -> dict[str, Any]:
+    options: dict[str, Any] = {"extend_existing": True}
+    if partitioned:
+        options["postgresql_partition_by"] = "RANGE (timestamp)"
+    return options
+
+
+def create_admin_event_log(
+    base: type[DeclarativeBase], partitioned: bool = False
+) -> type[DeclarativeBase]:
+    """
+    Create the event log model.
+
+    Args:
+        base: Declarative base of the admin database
+        partitioned: Declare the table as range partitioned by timestamp
+            (PostgreSQL only). The primary key becomes (id, timestamp); see
+            crudadmin.event.partitioning for managing the monthly partitions.
+    """
     tablename = "admin_event_log"
+    table_options = _table_options(partitioned)
 
     if hasattr(base, "registry") and hasattr(base.registry, "_class_registry"):
         existing_class = base.registry._class_registry.get("AdminEventLog")
@@ -21,19 +40,26 @@ def create_admin_event_log(base: type[DeclarativeBase]) -> type[DeclarativeBase]
 
     class AdminEventLog(base):  # type: ignore
         __tablename__ = tablename
-        __table_args__ = {"extend_existing": True}
+        __table_args__ = (
+            Index(f"ix_{tablename}_timestamp_id", "timestamp", "id"),
+            Index(f"ix_{tablename}_event_type_timestamp", "event_type", "timestamp"),
+            Index(f"ix_{tablename}_status_timestamp", "status", "timestamp"),
+            Index(f"ix_{tablename}_user_id_timestamp", "user_id", "timestamp", "id"),
+            table_options,
+        )
 
         id: Mapped[int] = mapped_column(
             "id",
             autoincrement=True,
             nullable=False,
-            unique=True,
+            unique=not partitioned,
             primary_key=True,
         )
         timestamp: Mapped[datetime] = mapped_column(
             DateTime(timezone=True),
             default=lambda: datetime.now(UTC),
             nullable=False,
+            primary_key=partitioned,
         )
         event_type: Mapped[EventType] = mapped_column(
             SQLEnum(EventType), nullable=False
@@ -57,8 +83,33 @@ def create_admin_event_log(base: type[DeclarativeBase]) -> type[DeclarativeBase]
     return AdminEventLog
 
 
-def create_admin_audit_log(base: type[DeclarativeBase]) -> type[DeclarativeBase]:
+def create_admin_audit_log(
+    base: type[DeclarativeBase], partitioned: bool = False, versioned: bool = False
+) -> type[DeclarativeBase]:
+    """
+    Create the audit log model.
+
+    Args:
+        base: Declarative base of the admin database
+        partitioned: Declare the table as range partitioned by timestamp
+            (PostgreSQL only). The primary key becomes (id, timestamp); see
+            crudadmin.event.partitioning for managing the monthly partitions.
+        versioned: Add the version column used by diff audit storage, unique
+            per record unless the table is partitioned
+    """
     tablename = "admin_audit_log"
+    table_options = _table_options(partitioned)
+    version_indexes = []
+    if versioned:
+        version_indexes.append(
+            Index(
+                f"ix_{tablename}_resource_version",
+                "resource_type",
+                "resource_id",
+                "version",
+                unique=not partitioned,
+            )
+        )
 
     if hasattr(base, "registry") and hasattr(base.registry, "_class_registry"):
         existing_class = base.registry._class_registry.get("AdminAuditLog")
@@ -68,13 +119,22 @@ def create_admin_audit_log(base: type[DeclarativeBase]) -> type[DeclarativeBase]
 
     class AdminAuditLog(base):  # type: ignore
         __tablename__ = tablename
-        __table_args__ = {"extend_existing": True}
+        __table_args__ = (
+            Index(
+                f"ix_{tablename}_resource_timestamp",
+                "resource_type",
+                "resource_id",
+                "timestamp",
+            ),
+            *version_indexes,
+            table_options,
+        )
 
         id: Mapped[int] = mapped_column(
             "id",
             autoincrement=True,
             nullable=False,
-            unique=True,
+            unique=not partitioned,
             primary_key=True,
         )
         event_id: Mapped[int] = mapped_column(index=True)
@@ -82,6 +142,7 @@ def create_admin_audit_log(base: type[DeclarativeBase]) -> type[DeclarativeBase]
             DateTime(timezone=True),
             default=lambda: datetime.now(UTC),
             nullable=False,
+            primary_key=partitioned,
         )
         resource_type: Mapped[str] = mapped_column(String(128))
         resource_id: Mapped[str] = mapped_column(String(128))
@@ -96,8 +157,82 @@ def create_admin_audit_log(base: type[DeclarativeBase]) -> type[DeclarativeBase]
         audit_metadata: Mapped[dict[str, Any]] = mapped_column(
             JSON, default=dict, nullable=False
         )
+        if versioned:
+            version: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
         def __repr__(self):
             return f"<AdminAuditLog(id={self.id}, resource_type={self.resource_type}, resource_id={self.resource_id})>"
 
     return AdminAuditLog
+
+
+def create_admin_event_rollup(base: type[DeclarativeBase]) -> type[DeclarativeBase]:
+    """
+    Create the event rollup model.
+
+    Each row holds the number of events in one time bucket for one
+    (event_type, status, resource_type) combination. Rows are maintained
+    incrementally by crudadmin.event.rollup.EventRollup.
+    """
+    tablename = "admin_event_rollup"
+
+    if hasattr(base, "registry") and hasattr(base.registry, "_class_registry"):
+        existing_class = base.registry._class_registry.get("AdminEventRollup")
+        if existing_class is not None and isinstance(existing_class, type):
+            if issubclass(existing_class, base):
+                return cast(type[DeclarativeBase], existing_class)
+
+    class AdminEventRollup(base):  # type: ignore
+        __tablename__ = tablename
+        __table_args__ = (
+            UniqueConstraint(
+                "bucket",
+                "event_type",
+                "status",
+                "resource_type",
+                name=f"uq_{tablename}_key",
+            ),
+            {"extend_existing": True},
+        )
+
+        id: Mapped[int] = mapped_column(
+            "id", autoincrement=True, nullable=False, unique=True, primary_key=True
+        )
+        bucket: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+        event_type: Mapped[str] = mapped_column(String(32))
+        status: Mapped[str] = mapped_column(String(32))
+        resource_type: Mapped[str] = mapped_column(String(128), default="")
+        count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+        def __repr__(self):
+            return f"<AdminEventRollup(bucket={self.bucket}, event_type={self.event_type}, count={self.count})>"
+
+    return AdminEventRollup
+
+
+def create_admin_event_rollup_state(
+    base: type[DeclarativeBase],
+) -> type[DeclarativeBase]:
+    """Create the model holding the id of the last event folded into the rollup."""
+    tablename = "admin_event_rollup_state"
+
+    if hasattr(base, "registry") and hasattr(base.registry, "_class_registry"):
+        existing_class = base.registry._class_registry.get("AdminEventRollupState")
+        if existing_class is not None and isinstance(existing_class, type):
+            if issubclass(existing_class, base):
+                return cast(type[DeclarativeBase], existing_class)
+
+    class AdminEventRollupState(base):  # type: ignore
+        __tablename__ = tablename
+        __table_args__ = {"extend_existing": True}
+
+        name: Mapped[str] = mapped_column(String(64), primary_key=True)
+        last_event_id: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+        updated_at: Mapped[Optional[datetime]] = mapped_column(
+            DateTime(timezone=True), nullable=True
+        )
+
+        def __repr__(self):
+            return f"<AdminEventRollupState(name={self.name}, last_event_id={self.last_event_id})>"
+
+    return AdminEventRollupState
@@ -0,0 +1,166 @@
+"""
+Monthly range partitioning of the event and audit log tables on PostgreSQL.
+
+When the tables are created with `partitioned=True`, rows are routed to one
+partition per calendar month named `<table>_pYYYYMM`, plus a default partition
+for rows outside every month partition. Expiring a month is then a
+`DROP TABLE` (or `DETACH PARTITION`) instead of a large DELETE.
+"""
+
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+UTC = timezone.utc
+
+logger = logging.getLogger(__name__)
+
+
+def month_start(moment: datetime) -> datetime:
+    """Return the first instant of the month containing moment, in UTC."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    moment = moment.astimezone(UTC)
+    return datetime(moment.year, moment.month, 1, tzinfo=UTC)
+
+
+def add_months(start: datetime, months: int) -> datetime:
+    """Move a month start forward (or backward) by a number of months."""
+    index = start.year * 12 + start.month - 1 + months
+    return start.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(table_name: str, month: datetime) -> str:
+    """Name of the partition holding the given month."""
+    return f"{table_name}_p{month.year:04d}{month.month:02d}"
+
+
+def _check_postgresql(conn: AsyncConnection) -> None:
+    if conn.dialect.name != "postgresql":
+        raise ValueError(
+            f"Partition management requires PostgreSQL, not '{conn.dialect.name}'"
+        )
+
+
+async def list_month_partitions(
+    conn: AsyncConnection, table_name: str
+) -> list[tuple[str, datetime]]:
+    """
+    List the month partitions of a partitioned table.
+
+    Only partitions following the `<table>_pYYYYMM` naming scheme are returned.
+
+    Returns:
+        (partition name, month start) pairs sorted by month
+    """
+    _check_postgresql(conn)
+
+    result = await conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON pg_inherits.inhparent = parent.oid "
+            "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+            "WHERE parent.relname = :table_name"
+        ),
+        {"table_name": table_name},
+    )
+
+    pattern = re.compile(rf"^{re.escape(table_name)}_p(\d{{4}})(\d{{2}})$")
+    partitions = []
+    for (name,) in result:
+        match = pattern.match(name)
+        if match:
+            month = datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=UTC)
+            partitions.append((name, month))
+
+    return sorted(partitions, key=lambda item: item[1])
+
+
+async def ensure_month_partitions(
+    conn: AsyncConnection,
+    table_name: str,
+    months_ahead: int = 2,
+    now: Optional[datetime] = None,
+) -> list[str]:
+    """
+    Create the partitions for the current month and the next months_ahead months.
+
+    Also creates the table's default partition if it does not exist.
+
+    Returns:
+        Names of the partitions that were created
+    """
+    _check_postgresql(conn)
+    quote = conn.dialect.identifier_preparer.quote
+
+    existing = {name for name, _ in await list_month_partitions(conn, table_name)}
+    await conn.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {quote(table_name + '_default')} "
+            f"PARTITION OF {quote(table_name)} DEFAULT"
+        )
+    )
+
+    created = []
+    current = month_start(now or datetime.now(UTC))
+    for offset in range(months_ahead + 1):
+        start = add_months(current, offset)
+        name = partition_name(table_name, start)
+        if name in existing:
+            continue
+
+        end = add_months(start, 1)
+        await conn.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {quote(name)} "
+                f"PARTITION OF {quote(table_name)} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        )
+        created.append(name)
+        logger.info(f"Created partition {name}")
+
+    return created
+
+
+async def drop_expired_partitions(
+    conn: AsyncConnection,
+    table_name: str,
+    cutoff: datetime,
+    detach_only: bool = False,
+) -> list[str]:
+    """
+    Remove the month partitions whose whole month is older than cutoff.
+
+    Args:
+        conn: Connection to the PostgreSQL admin database
+        table_name: The partitioned parent table
+        cutoff: Partitions ending at or before this time are removed
+        detach_only: Detach the partitions (keeping them as standalone tables
+            for archiving) instead of dropping them
+
+    Returns:
+        Names of the partitions that were dropped or detached
+    """
+    _check_postgresql(conn)
+    quote = conn.dialect.identifier_preparer.quote
+
+    removed = []
+    for name, month in await list_month_partitions(conn, table_name):
+        if add_months(month, 1) > cutoff:
+            continue
+
+        if detach_only:
+            await conn.execute(
+                text(f"ALTER TABLE {quote(table_name)} DETACH PARTITION {quote(name)}")
+            )
+        else:
+            await conn.execute(text(f"DROP TABLE {quote(name)}"))
+        removed.append(name)
+        logger.info(f"{'Detached' if detach_only else 'Dropped'} partition {name}")
+
+    return removed
@@ -0,0 +1,361 @@
+"""
+Incrementally maintained event counts for activity charts.
+
+`EventRollup.fold` reads the events added since its last run, counts them per
+time bucket, event type, status and resource type, and adds the counts to the
+rollup table. Activity queries then read the small rollup table instead of
+scanning the event log, so their cost depends on the time range shown rather
+than on the number of events.
+"""
+
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from .models import create_admin_event_rollup, create_admin_event_rollup_state
+from .schemas import EventStatus, EventType
+
+UTC = timezone.utc
+
+logger = logging.getLogger(__name__)
+
+STATE_NAME = "events"
+GROUP_COLUMNS = ("event_type", "status", "resource_type")
+
+
+def _value(value: Any) -> str:
+    if value is None:
+        return ""
+    return str(value.value if hasattr(value, "value") else value)
+
+
+class _FoldConflict(Exception):
+    """Raised to roll back a chunk when another fold moved the progress marker."""
+
+
+class EventRollup:
+    """
+    Folds new event log rows into per-bucket counts.
+
+    Progress is tracked by the id of the last folded event. Each fold only
+    takes events older than `lag_seconds` and stops at the first younger one,
+    so an event is not skipped as long as its transaction commits within
+    that lag. The
+    progress marker is advanced with a compare-and-set, so concurrent folds
+    from several workers never count a row twice.
+
+    Counts are per stored event: failed logins merged by
+    `failed_login_window_seconds` count once.
+    """
+
+    def __init__(
+        self,
+        db_config: Any,
+        bucket_seconds: int = 3600,
+        chunk_size: int = 5000,
+        lag_seconds: float = 5.0,
+        interval_seconds: float = 60.0,
+    ) -> None:
+        """
+        Args:
+            db_config: Database configuration with the event log and rollup models
+            bucket_seconds: Width of a time bucket; keep it fixed once data is folded
+            chunk_size: Events folded per transaction
+            lag_seconds: Only fold events at least this old
+            interval_seconds: Time between folds when started with start()
+        """
+        if bucket_seconds < 1 or chunk_size < 1:
+            raise ValueError("bucket_seconds and chunk_size must be positive")
+
+        if db_config.AdminEventRollup is None:
+            db_config.AdminEventRollup = create_admin_event_rollup(db_config.base)
+        if db_config.AdminEventRollupState is None:
+            db_config.AdminEventRollupState = create_admin_event_rollup_state(
+                db_config.base
+            )
+
+        self.db_config = db_config
+        self.event_model: Any = db_config.AdminEventLog
+        self.rollup_model: Any = db_config.AdminEventRollup
+        self.state_model: Any = db_config.AdminEventRollupState
+        self.bucket_seconds = bucket_seconds
+        self.chunk_size = chunk_size
+        self.lag_seconds = lag_seconds
+        self.interval_seconds = interval_seconds
+
+        self.last_fold: Optional[datetime] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._tables_ready = False
+
+    async def _ensure_tables(self) -> None:
+        """Create the rollup tables on first use if they do not exist."""
+        if self._tables_ready:
+            return
+        async with self.db_config.admin_engine.begin() as conn:
+            for model in (self.rollup_model, self.state_model):
+                await conn.run_sync(model.__table__.create, checkfirst=True)
+        self._tables_ready = True
+
+    def bucket_for(self, moment: datetime) -> datetime:
+        """Return the start of the bucket containing moment, in UTC."""
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=UTC)
+        seconds = int(moment.timestamp())
+        return datetime.fromtimestamp(seconds - seconds % self.bucket_seconds, UTC)
+
+    async def _read_state(self, conn: AsyncConnection) -> int:
+        last_event_id = (
+            await conn.execute(
+                select(self.state_model.last_event_id).where(
+                    self.state_model.name == STATE_NAME
+                )
+            )
+        ).scalar_one_or_none()
+        if last_event_id is None:
+            await conn.execute(
+                insert(self.state_model).values(name=STATE_NAME, last_event_id=0)
+            )
+            return 0
+        return int(last_event_id)
+
+    async def _add_counts(
+        self, conn: AsyncConnection, counts: Counter[tuple[datetime, str, str, str]]
+    ) -> None:
+        model = self.rollup_model
+        for (bucket, event_type, status, resource_type), count in counts.items():
+            result = await conn.execute(
+                update(model)
+                .where(
+                    model.bucket == bucket,
+                    model.event_type == event_type,
+                    model.status == status,
+                    model.resource_type == resource_type,
+                )
+                .values(count=model.count + count)
+            )
+            if result.rowcount == 0:
+                await conn.execute(
+                    insert(model).values(
+                        bucket=bucket,
+                        event_type=event_type,
+                        status=status,
+                        resource_type=resource_type,
+                        count=count,
+                    )
+                )
+
+    async def _fold_chunk(self, cutoff: datetime) -> int:
+        try:
+            return await self._try_fold_chunk(cutoff)
+        except _FoldConflict:
+            logger.info("Event rollup advanced by another worker, skipping chunk")
+            return 0
+
+    async def _try_fold_chunk(self, cutoff: datetime) -> int:
+        event_model = self.event_model
+
+        async with self.db_config.admin_engine.begin() as conn:
+            last_event_id = await self._read_state(conn)
+            rows = (
+                await conn.execute(
+                    select(
+                        event_model.id,
+                        event_model.timestamp,
+                        event_model.event_type,
+                        event_model.status,
+                        event_model.resource_type,
+                    )
+                    .where(event_model.id > last_event_id)
+                    .order_by(event_model.id)
+                    .limit(self.chunk_size)
+                )
+            ).all()
+
+            counts: Counter[tuple[datetime, str, str, str]] = Counter()
+            new_last_id = last_event_id
+            for row in rows:
+                timestamp = row.timestamp
+                if timestamp.tzinfo is None:
+                    timestamp = timestamp.replace(tzinfo=UTC)
+                if timestamp >= cutoff:
+                    break
+                counts[
+                    (
+                        self.bucket_for(timestamp),
+                        _value(row.event_type),
+                        _value(row.status),
+                        _value(row.resource_type),
+                    )
+                ] += 1
+                new_last_id = row.id
+
+            if new_last_id == last_event_id:
+                return 0
+
+            await self._add_counts(conn, counts)
+            advanced = await conn.execute(
+                update(self.state_model)
+                .where(
+                    self.state_model.name == STATE_NAME,
+                    self.state_model.last_event_id == last_event_id,
+                )
+                .values(last_event_id=new_last_id, updated_at=datetime.now(UTC))
+            )
+            if advanced.rowcount != 1:
+                raise _FoldConflict()
+
+            return sum(counts.values())
+
+    async def fold(self, max_chunks: Optional[int] = None) -> int:
+        """
+        Fold the events added since the last fold into the rollup table.
+
+        Args:
+            max_chunks: Stop after this many chunks; None folds until caught up
+
+        Returns:
+            Number of events folded
+        """
+        await self._ensure_tables()
+        cutoff = datetime.now(UTC) - timedelta(seconds=self.lag_seconds)
+        folded = 0
+        chunks = 0
+        while max_chunks is None or chunks < max_chunks:
+            count = await self._fold_chunk(cutoff)
+            if count == 0:
+                break
+            folded += count
+            chunks += 1
+
+        self.last_fold = datetime.now(UTC)
+        return folded
+
+    async def get_activity(
+        self,
+        db: Any,
+        start: datetime,
+        end: Optional[datetime] = None,
+        group_by: Optional[str] = "event_type",
+        event_type: Optional[str] = None,
+        status: Optional[str] = None,
+        resource_type: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Get event counts per bucket from the rollup table.
+
+        Args:
+            db: Session or connection to the admin database
+            start: First bucket to include
+            end: Only include buckets before this time
+            group_by: "event_type", "status", "resource_type" or None for one
+                total per bucket
+            event_type: Only count events of this type
+            status: Only count events with this status
+            resource_type: Only count events on this model
+
+        Returns:
+            Dicts with "bucket", "count" and the group_by value, ordered by bucket
+        """
+        if group_by is not None and group_by not in GROUP_COLUMNS:
+            raise ValueError(f"Cannot group event activity by {group_by}")
+
+        model = self.rollup_model
+        columns = [model.bucket]
+        if group_by is not None:
+            columns.append(getattr(model, group_by))
+
+        stmt = (
+            select(*columns, func.sum(model.count).label("count"))
+            .where(*self._filters(start, end, event_type, status, resource_type))
+            .group_by(*columns)
+            .order_by(model.bucket)
+        )
+        result = await db.execute(stmt)
+        activity = []
+        for row in result.mappings():
+            item = dict(row)
+            bucket = item["bucket"]
+            if bucket.tzinfo is None:
+                item["bucket"] = bucket.replace(tzinfo=UTC)
+            item["count"] = int(item["count"])
+            activity.append(item)
+        return activity
+
+    async def get_total(
+        self,
+        db: Any,
+        start: datetime,
+        end: Optional[datetime] = None,
+        event_type: Optional[str] = None,
+        status: Optional[str] = None,
+        resource_type: Optional[str] = None,
+    ) -> int:
+        """Get the number of events in a time range from the rollup table."""
+        model = self.rollup_model
+        stmt = select(func.coalesce(func.sum(model.count), 0)).where(
+            *self._filters(start, end, event_type, status, resource_type)
+        )
+        return int((await db.execute(stmt)).scalar_one())
+
+    async def get_failed_logins(
+        self, db: Any, start: datetime, end: Optional[datetime] = None
+    ) -> int:
+        """Get the number of failed login events in a time range."""
+        return await self.get_total(
+            db,
+            start,
+            end,
+            event_type=EventType.LOGIN.value,
+            status=EventStatus.FAILURE.value,
+        ) + await self.get_total(
+            db, start, end, event_type=EventType.FAILED_LOGIN.value
+        )
+
+    def _filters(
+        self,
+        start: datetime,
+        end: Optional[datetime],
+        event_type: Optional[str],
+        status: Optional[str],
+        resource_type: Optional[str],
+    ) -> list[Any]:
+        model = self.rollup_model
+        conditions = [model.bucket >= self.bucket_for(start)]
+        if end is not None:
+            conditions.append(model.bucket < end)
+        if event_type:
+            conditions.append(model.event_type == event_type)
+        if status:
+            conditions.append(model.status == status)
+        if resource_type:
+            conditions.append(model.resource_type == resource_type)
+        return conditions
+
+    def start(self) -> None:
+        """Fold new events every interval in a background task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.fold()
+            except Exception as e:
+                logger.error(f"Event rollup failed: {str(e)}", exc_info=True)
+            await asyncio.sleep(self.interval_seconds)
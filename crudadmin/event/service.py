@@ -1,15 +1,19 @@
+import asyncio
+import base64
 import json
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Optional, cast
+from typing import Any, AsyncIterator, Optional, cast
 from uuid import UUID
 
 from fastapi import Request
 from fastcrud import FastCRUD
+from sqlalchemy import Select, and_, delete, exists, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .audit_store import AuditStore
 from .schemas import (
     AdminAuditLogCreate,
     AdminAuditLogRead,
@@ -18,6 +22,7 @@ from .schemas import (
     EventStatus,
     EventType,
 )
+from .sink import EventSink, EventSinkReader
 
 UTC = timezone.utc
 
@@ -25,8 +30,8 @@ logger = logging.getLogger(__name__)
 
 
 class CustomJSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, datetime):
+    def default(self, obj: Any) -> Any:
+        if isinstance(obj, (datetime, date, time)):
             return obj.isoformat()
         if isinstance(obj, Decimal):
             return str(obj)
@@ -37,17 +42,149 @@ class CustomJSONEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def encode_event_cursor(timestamp: datetime, event_id: int) -> str:
+    """Encode an event's (timestamp, id) position as an opaque pagination cursor."""
+    raw = f"{timestamp.isoformat()}|{event_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_event_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_event_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, event_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(timestamp), int(event_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor}") from e
+
+
 class EventService:
-    def __init__(self, db_config):
+    EVENT_COUNT_LIMIT = 10000
+
+    def __init__(
+        self,
+        db_config,
+        audit_storage: str = "full",
+        snapshot_interval: int = 10,
+        audit_compression: Optional[str] = None,
+        failed_login_window_seconds: Optional[float] = None,
+        sink: Optional[EventSink] = None,
+    ):
+        """
+        Args:
+            db_config: Database configuration with the event and audit log models
+            audit_storage: "full" to store complete record states in every audit
+                row, "diff" to store field diffs with periodic snapshots
+            snapshot_interval: In diff mode, store a full snapshot every this many versions
+            audit_compression: None, "zlib" or "zstd" to compress stored states
+            failed_login_window_seconds: If set, a failed login from the same IP
+                for the same username within this many seconds of the previous
+                one updates that event's attempt counter instead of adding a row
+            sink: Store events and audit records in this sink instead of the
+                admin database; the database is then only used for usernames
+
+        Raises:
+            ValueError: If a sink is combined with diff audit storage
+        """
+        if sink is not None and audit_storage == "diff":
+            raise ValueError("Diff audit storage requires the admin database")
+
         self.db_config = db_config
-        self.crud_events = FastCRUD(db_config.AdminEventLog)
-        self.crud_audits = FastCRUD(db_config.AdminAuditLog)
+        self.failed_login_window_seconds = failed_login_window_seconds
+        self.crud_events: FastCRUD[Any, Any, Any, Any, Any, Any] = FastCRUD(
+            db_config.AdminEventLog
+        )
+        self.crud_audits: FastCRUD[Any, Any, Any, Any, Any, Any] = FastCRUD(
+            db_config.AdminAuditLog
+        )
         self.json_encoder = CustomJSONEncoder()
+        self.audit_store = AuditStore(
+            db_config.AdminAuditLog,
+            mode=audit_storage,
+            snapshot_interval=snapshot_interval,
+            compression=audit_compression,
+        )
+        self.sink = sink
+        self.sink_reader = (
+            EventSinkReader(sink, db_config, self.audit_store) if sink else None
+        )
 
     def _serialize_dict(self, data: Optional[dict]) -> dict:
         if not data:
             return {}
-        return cast(dict, json.loads(self.json_encoder.encode(data)))
+        return cast(dict, self._to_json_safe(data))
+
+    def _to_json_safe(self, value: Any) -> Any:
+        """Convert a value to JSON-compatible types without an encode/decode round-trip."""
+        if value is None or isinstance(value, (str, bool, int, float)):
+            if isinstance(value, Enum):
+                return value.value
+            return value
+        if isinstance(value, dict):
+            return {
+                (k if isinstance(k, str) else str(self._to_json_safe(k))): (
+                    self._to_json_safe(v)
+                )
+                for k, v in value.items()
+            }
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return [self._to_json_safe(v) for v in value]
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        return self._to_json_safe(self.json_encoder.default(value))
+
+    def build_event_record(
+        self,
+        event_type: EventType,
+        status: EventStatus,
+        user_id: int,
+        session_id: str,
+        request: Request,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        details: Optional[dict] = None,
+    ) -> dict[str, Any]:
+        """Build the column values of an event log row for a buffered insert."""
+        return {
+            "timestamp": datetime.now(UTC),
+            "event_type": event_type,
+            "status": status,
+            "user_id": user_id,
+            "session_id": session_id,
+            "ip_address": request.client.host if request.client else "unknown",
+            "user_agent": request.headers.get("user-agent", ""),
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "details": self._serialize_dict(details),
+        }
+
+    def build_audit_record(
+        self,
+        resource_type: str,
+        resource_id: str,
+        action: str,
+        previous_state: Optional[dict] = None,
+        new_state: Optional[dict] = None,
+        metadata: Optional[dict] = None,
+    ) -> dict[str, Any]:
+        """Build the column values of an audit log row; event_id is set on flush."""
+        return {
+            "timestamp": datetime.now(UTC),
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "action": action,
+            "previous_state": self._serialize_dict(previous_state),
+            "new_state": self._serialize_dict(new_state),
+            "changes": self._serialize_dict(
+                self._compute_changes(previous_state, new_state)
+            ),
+            "audit_metadata": self._serialize_dict(metadata),
+        }
 
     async def log_event(
         self,
@@ -62,8 +199,29 @@ class EventService:
         details: Optional[dict] = None,
     ) -> AdminEventLogRead:
         try:
+            if self.sink is not None:
+                record = self.build_event_record(
+                    event_type=event_type,
+                    status=status,
+                    user_id=user_id,
+                    session_id=session_id,
+                    request=request,
+                    resource_type=resource_type,
+                    resource_id=resource_id,
+                    details=details,
+                )
+                return AdminEventLogRead(**await self.sink.append_event(record))
+
             ip_address = request.client.host if request.client else "unknown"
 
+            if self.aggregates(event_type, status):
+                aggregated = await self._aggregate_failed_login(
+                    db, event_type, ip_address, details
+                )
+                if aggregated is not None:
+                    await db.commit()
+                    return aggregated
+
             event_data = AdminEventLogCreate(
                 event_type=event_type,
                 status=status,
@@ -94,6 +252,76 @@ class EventService:
             logger.error(f"Error logging event: {str(e)}", exc_info=True)
             raise
 
+    def aggregates(self, event_type: EventType, status: EventStatus) -> bool:
+        """Whether an event of this type and status is merged into a counter row."""
+        return (
+            self.sink is None
+            and self.failed_login_window_seconds is not None
+            and (
+                event_type == EventType.FAILED_LOGIN
+                or (event_type == EventType.LOGIN and status == EventStatus.FAILURE)
+            )
+        )
+
+    async def _aggregate_failed_login(
+        self,
+        db: AsyncSession,
+        event_type: EventType,
+        ip_address: str,
+        details: Optional[dict],
+    ) -> Optional[AdminEventLogRead]:
+        """
+        Count a failed login on the latest matching event inside the window.
+
+        The event keeps `first_seen`, `last_seen` and `attempts` in its details
+        and its timestamp moves to the latest attempt, so the window slides
+        while failures keep arriving.
+
+        Returns:
+            The updated event, or None if a new event should be inserted
+        """
+        assert self.failed_login_window_seconds is not None
+        event_model: Any = self.db_config.AdminEventLog
+        now = datetime.now(UTC)
+        cutoff = now - timedelta(seconds=self.failed_login_window_seconds)
+
+        auth_details = (details or {}).get("auth_details")
+        username = (
+            auth_details.get("username") if isinstance(auth_details, dict) else None
+        ) or (details or {}).get("username")
+
+        stmt = (
+            select(event_model)
+            .where(
+                event_model.event_type == event_type,
+                event_model.status == EventStatus.FAILURE,
+                event_model.ip_address == ip_address,
+                event_model.timestamp >= cutoff,
+                self.username_expression() == (username or "unknown"),
+            )
+            .order_by(event_model.timestamp.desc(), event_model.id.desc())
+            .limit(1)
+            .with_for_update()
+        )
+        event = (await db.execute(stmt)).scalar_one_or_none()
+        if event is None:
+            return None
+
+        current = dict(event.details or {})
+        timestamp = event.timestamp
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=UTC)
+        event.details = {
+            **current,
+            "attempts": int(current.get("attempts", 1)) + 1,
+            "first_seen": current.get("first_seen", timestamp.isoformat()),
+            "last_seen": now.isoformat(),
+        }
+        event.timestamp = now
+        await db.flush()
+
+        return AdminEventLogRead.model_validate(event)
+
     async def create_audit_log(
         self,
         db: AsyncSession,
@@ -106,6 +334,33 @@ class EventService:
         metadata: Optional[dict] = None,
     ) -> AdminAuditLogRead:
         try:
+            if self.sink is not None:
+                return await self._append_audit_log(
+                    event_id=event_id,
+                    record=self.build_audit_record(
+                        resource_type=resource_type,
+                        resource_id=resource_id,
+                        action=action,
+                        previous_state=previous_state,
+                        new_state=new_state,
+                        metadata=metadata,
+                    ),
+                )
+
+            if self.audit_store.is_diff or self.audit_store.compression:
+                return await self._create_compact_audit_log(
+                    db,
+                    event_id=event_id,
+                    record=self.build_audit_record(
+                        resource_type=resource_type,
+                        resource_id=resource_id,
+                        action=action,
+                        previous_state=previous_state,
+                        new_state=new_state,
+                        metadata=metadata,
+                    ),
+                )
+
             audit_data = AdminAuditLogCreate(
                 event_id=event_id,
                 resource_type=resource_type,
@@ -134,6 +389,48 @@ class EventService:
             logger.error(f"Error creating audit log: {str(e)}", exc_info=True)
             raise
 
+    async def _create_compact_audit_log(
+        self, db: AsyncSession, event_id: int, record: dict[str, Any]
+    ) -> AdminAuditLogRead:
+        """Store an audit record in the configured diff or compressed form."""
+        record["event_id"] = event_id
+
+        async def insert(records: list[dict[str, Any]]) -> Any:
+            audit = self.db_config.AdminAuditLog(**records[0])
+            db.add(audit)
+            await db.flush()
+            return audit
+
+        audit = await self.audit_store.write(db, [record], insert)
+
+        return AdminAuditLogRead(
+            id=audit.id,
+            timestamp=audit.timestamp,
+            event_id=audit.event_id,
+            resource_type=audit.resource_type,
+            resource_id=audit.resource_id,
+            action=audit.action,
+            previous_state=audit.previous_state,
+            new_state=audit.new_state,
+            changes=audit.changes,
+            metadata=audit.audit_metadata,
+        )
+
+    async def _append_audit_log(
+        self, event_id: int, record: dict[str, Any]
+    ) -> AdminAuditLogRead:
+        """Store an audit record in the event sink, compressed if configured."""
+        assert self.sink is not None
+        record["event_id"] = event_id
+        for key in ("previous_state", "new_state"):
+            record[key] = self.audit_store.encode_state(record[key])
+
+        stored = await self.sink.append_audit(record)
+        return AdminAuditLogRead(
+            **{k: v for k, v in stored.items() if k != "audit_metadata"},
+            metadata=stored["audit_metadata"],
+        )
+
     def _compute_changes(
         self,
         previous_state: Optional[dict],
@@ -156,6 +453,71 @@ class EventService:
 
         return changes
 
+    async def _keyset_page(
+        self,
+        db: AsyncSession,
+        stmt: Select,
+        model: Any,
+        limit: int,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> tuple[list[dict[str, Any]], Optional[str], Optional[str]]:
+        """
+        Run a newest-first query one page at a time using (timestamp, id) cursors.
+
+        Rows are ordered by timestamp and id descending, so the (timestamp, id)
+        composite index serves both the order and the cursor condition at any
+        depth, unlike OFFSET.
+
+        Args:
+            db: Database session
+            stmt: Select with filters applied that includes the timestamp and id columns
+            model: The model whose timestamp and id columns drive the cursor
+            limit: Page size
+            after: Cursor of the last row of the previous page, to fetch older rows
+            before: Cursor of the first row of the next page, to fetch newer rows
+
+        Returns:
+            The rows, the cursor for the next (older) page and the cursor for
+            the previous (newer) page; a cursor is None when there is no such page
+        """
+        ts, row_id = model.timestamp, model.id
+
+        if before:
+            cursor_ts, cursor_id = decode_event_cursor(before)
+            newer = stmt.where(
+                or_(ts > cursor_ts, and_(ts == cursor_ts, row_id > cursor_id))
+            ).order_by(ts.asc(), row_id.asc())
+            rows = (await db.execute(newer.limit(limit + 1))).mappings().all()
+            if len(rows) > limit:
+                page = [dict(row) for row in reversed(rows[:limit])]
+                return (
+                    page,
+                    encode_event_cursor(page[-1]["timestamp"], page[-1]["id"]),
+                    encode_event_cursor(page[0]["timestamp"], page[0]["id"]),
+                )
+            after = None
+
+        ordered = stmt.order_by(ts.desc(), row_id.desc())
+        if after:
+            cursor_ts, cursor_id = decode_event_cursor(after)
+            ordered = ordered.where(
+                or_(ts < cursor_ts, and_(ts == cursor_ts, row_id < cursor_id))
+            )
+
+        rows = (await db.execute(ordered.limit(limit + 1))).mappings().all()
+        page = [dict(row) for row in rows[:limit]]
+
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_event_cursor(page[-1]["timestamp"], page[-1]["id"])
+
+        prev_cursor = None
+        if after and page:
+            prev_cursor = encode_event_cursor(page[0]["timestamp"], page[0]["id"])
+
+        return page, next_cursor, prev_cursor
+
     async def get_user_activity(
         self,
         db: AsyncSession,
@@ -164,25 +526,378 @@ class EventService:
         end_time: Optional[datetime] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> dict:
-        """Get user activity logs."""
-        filters: dict = {"user_id": user_id}
+        """
+        Get user activity logs, newest first.
+
+        Pages are fetched with keyset pagination: pass the returned
+        "next_cursor" as cursor to get the following page. A non-zero offset
+        falls back to OFFSET pagination, which gets slower the deeper the page.
+
+        Returns:
+            Dictionary with "data" and "next_cursor" (or "data" and
+            "total_count" when offset is used)
+        """
+        if self.sink_reader is not None:
+            return await self.sink_reader.get_user_activity(
+                db, user_id, start_time, end_time, limit, offset, cursor
+            )
+
+        if offset:
+            filters: dict = {"user_id": user_id}
+
+            if start_time:
+                filters["timestamp__gte"] = start_time
+            if end_time:
+                filters["timestamp__lte"] = end_time
 
+            result = await self.crud_events.get_multi(
+                db,
+                offset=offset,
+                limit=limit,
+                sort_columns=["timestamp"],
+                sort_orders=["desc"],
+                **filters,
+            )
+
+            return cast(dict, result)
+
+        event_model: Any = self.db_config.AdminEventLog
+
+        stmt = select(*event_model.__table__.columns).where(
+            event_model.user_id == user_id
+        )
         if start_time:
-            filters["timestamp__gte"] = start_time
+            stmt = stmt.where(event_model.timestamp >= start_time)
         if end_time:
-            filters["timestamp__lte"] = end_time
+            stmt = stmt.where(event_model.timestamp <= end_time)
 
-        result = await self.crud_events.get_multi(
-            db,
-            offset=offset,
-            limit=limit,
-            sort_columns=["timestamp"],
-            sort_orders=["desc"],
-            **filters,
+        data, next_cursor, _ = await self._keyset_page(
+            db, stmt, event_model, limit, after=cursor
         )
+        return {"data": data, "next_cursor": next_cursor}
 
-        return cast(dict, result)
+    def _event_filters(
+        self,
+        event_type: Optional[str] = None,
+        status: Optional[str] = None,
+        username: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> list[Any]:
+        """Build the event log page filters; username needs the AdminUser join."""
+        event_model: Any = self.db_config.AdminEventLog
+        user_model: Any = self.db_config.AdminUser
+
+        conditions = []
+        if event_type:
+            conditions.append(event_model.event_type == EventType(event_type))
+        if status:
+            conditions.append(event_model.status == EventStatus(status))
+        if username:
+            conditions.append(user_model.username == username)
+        if start_time:
+            conditions.append(event_model.timestamp >= start_time)
+        if end_time:
+            conditions.append(event_model.timestamp < end_time)
+        return conditions
+
+    async def get_event_page(
+        self,
+        db: AsyncSession,
+        limit: int = 10,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        event_type: Optional[str] = None,
+        status: Optional[str] = None,
+        username: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        with_total: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Get a page of events for the event log, with the acting user's username.
+
+        Usernames are joined in the same query, and the details JSON is left out
+        so the page cost does not depend on payload size; use get_event_details
+        to load it for a single event. Pages are fetched with (timestamp, id)
+        cursors rather than OFFSET.
+
+        The total is counted only when with_total is set, and stops at
+        EVENT_COUNT_LIMIT matching events, so a page never scans the whole log.
+
+        Args:
+            db: Database session
+            limit: Page size
+            after: "next_cursor" of the current page, to move to older events
+            before: "prev_cursor" of the current page, to move to newer events
+            event_type: Only include events of this type
+            status: Only include events with this status
+            username: Only include events by this admin user
+            start_time: Only include events at or after this time
+            end_time: Only include events before this time
+            with_total: Whether to count the matching events
+
+        Returns:
+            Dictionary with "data" (list of event dicts), "total_count" (None
+            without with_total), "total_capped" (whether the count stopped at
+            EVENT_COUNT_LIMIT), "next_cursor" and "prev_cursor"
+        """
+        if self.sink_reader is not None:
+            return await self.sink_reader.get_event_page(
+                db,
+                limit,
+                after,
+                before,
+                event_type,
+                status,
+                username,
+                start_time,
+                end_time,
+                with_total=with_total,
+                count_limit=self.EVENT_COUNT_LIMIT,
+            )
+
+        event_model: Any = self.db_config.AdminEventLog
+        user_model: Any = self.db_config.AdminUser
+
+        conditions = self._event_filters(
+            event_type, status, username, start_time, end_time
+        )
+
+        stmt = (
+            select(
+                event_model.id,
+                event_model.timestamp,
+                event_model.event_type,
+                event_model.status,
+                event_model.user_id,
+                event_model.session_id,
+                event_model.ip_address,
+                event_model.resource_type,
+                event_model.resource_id,
+                func.coalesce(user_model.username, "Unknown").label("username"),
+            )
+            .outerjoin(user_model, user_model.id == event_model.user_id)
+            .where(*conditions)
+        )
+        data, next_cursor, prev_cursor = await self._keyset_page(
+            db, stmt, event_model, limit, after=after, before=before
+        )
+
+        total_count = None
+        total_capped = False
+        if with_total:
+            matching = select(event_model.id)
+            if username:
+                matching = matching.join(
+                    user_model, user_model.id == event_model.user_id
+                )
+            matching = matching.where(*conditions).limit(self.EVENT_COUNT_LIMIT + 1)
+            total_count = (
+                await db.execute(select(func.count()).select_from(matching.subquery()))
+            ).scalar_one()
+            total_capped = total_count > self.EVENT_COUNT_LIMIT
+            total_count = min(total_count, self.EVENT_COUNT_LIMIT)
+
+        return {
+            "data": data,
+            "total_count": total_count,
+            "total_capped": total_capped,
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
+        }
+
+    async def iter_events(
+        self,
+        db: AsyncSession,
+        include_audit: bool = False,
+        after: Optional[str] = None,
+        chunk_size: int = 1000,
+        event_type: Optional[str] = None,
+        status: Optional[str] = None,
+        username: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over all matching events, oldest first, for export.
+
+        Events are read in chunks of chunk_size, each chunk continuing after
+        the (timestamp, id) of the previous one, so memory use stays constant
+        and no transaction is held open for the whole export. Every row carries
+        a "cursor"; pass the cursor of the last row received as after to
+        resume an interrupted export.
+
+        Args:
+            db: Database session
+            include_audit: Add the audit row of each event (action, changes and
+                states) under "audit"
+            after: Only include events after this cursor
+            chunk_size: Rows fetched per query
+            event_type: Only include events of this type
+            status: Only include events with this status
+            username: Only include events by this admin user
+            start_time: Only include events at or after this time
+            end_time: Only include events before this time
+
+        Yields:
+            Event dicts with the acting user's username and a resume cursor
+        """
+        if self.sink_reader is not None:
+            async for event in self.sink_reader.iter_events(
+                db,
+                include_audit,
+                after,
+                event_type,
+                status,
+                username,
+                start_time,
+                end_time,
+            ):
+                yield event
+            return
+
+        event_model: Any = self.db_config.AdminEventLog
+        user_model: Any = self.db_config.AdminUser
+        audit_model: Any = self.db_config.AdminAuditLog
+        ts, row_id = event_model.timestamp, event_model.id
+
+        columns = [
+            *event_model.__table__.columns,
+            func.coalesce(user_model.username, "Unknown").label("username"),
+        ]
+        if include_audit:
+            columns += [
+                audit_model.action.label("audit_action"),
+                audit_model.changes.label("audit_changes"),
+                audit_model.previous_state.label("audit_previous_state"),
+                audit_model.new_state.label("audit_new_state"),
+            ]
+
+        stmt = (
+            select(*columns)
+            .outerjoin(user_model, user_model.id == event_model.user_id)
+            .where(
+                *self._event_filters(event_type, status, username, start_time, end_time)
+            )
+            .order_by(ts.asc(), row_id.asc())
+            .limit(chunk_size)
+        )
+        if include_audit:
+            stmt = stmt.outerjoin(audit_model, audit_model.event_id == event_model.id)
+
+        cursor = decode_event_cursor(after) if after else None
+        while True:
+            chunk = stmt
+            if cursor is not None:
+                cursor_ts, cursor_id = cursor
+                chunk = stmt.where(
+                    or_(ts > cursor_ts, and_(ts == cursor_ts, row_id > cursor_id))
+                )
+            rows = (await db.execute(chunk)).mappings().all()
+
+            for row in rows:
+                event = {k: v for k, v in row.items() if not k.startswith("audit_")}
+                if include_audit:
+                    event["audit"] = (
+                        {
+                            "action": row["audit_action"],
+                            "changes": row["audit_changes"],
+                            "previous_state": self.audit_store.decode_state(
+                                row["audit_previous_state"]
+                            ),
+                            "new_state": self.audit_store.decode_state(
+                                row["audit_new_state"]
+                            ),
+                        }
+                        if row["audit_action"] is not None
+                        else None
+                    )
+                event["cursor"] = encode_event_cursor(event["timestamp"], event["id"])
+                yield event
+
+            if len(rows) < chunk_size:
+                return
+            cursor = (rows[-1]["timestamp"], rows[-1]["id"])
+
+    async def get_event_details(
+        self, db: AsyncSession, event_id: int
+    ) -> Optional[dict[str, Any]]:
+        """
+        Get the details of one event for display.
+
+        For events with an audit row, the resource details are built from the
+        audit's new state; otherwise the event's own details are returned.
+
+        Returns:
+            The details dict, or None if the event does not exist
+        """
+        if self.sink_reader is not None:
+            return await self.sink_reader.get_event_details(db, event_id)
+
+        event_model: Any = self.db_config.AdminEventLog
+        audit_model: Any = self.db_config.AdminAuditLog
+
+        stmt = (
+            select(
+                event_model.resource_type,
+                event_model.resource_id,
+                event_model.details,
+                audit_model.id.label("audit_id"),
+                audit_model.new_state,
+                audit_model.changes,
+            )
+            .outerjoin(audit_model, audit_model.event_id == event_model.id)
+            .where(event_model.id == event_id)
+            .limit(1)
+        )
+        row = (await db.execute(stmt)).mappings().first()
+        if row is None:
+            return None
+
+        if row["resource_type"] and row["resource_id"] and row["audit_id"]:
+            new_state = self.audit_store.decode_state(row["new_state"])
+            return {
+                "resource_details": {
+                    "model": row["resource_type"],
+                    "id": row["resource_id"],
+                    "changes": new_state if new_state is not None else row["changes"],
+                }
+            }
+        return cast(dict[str, Any], row["details"] or {})
+
+    async def get_resource_version(
+        self,
+        db: AsyncSession,
+        resource_type: str,
+        resource_id: str,
+        version: Optional[int] = None,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Rebuild a record's state as of an audit version.
+
+        Works with both storage modes; in diff mode the state is rebuilt from
+        the nearest snapshot and the diffs after it.
+
+        Args:
+            db: Database session
+            resource_type: Model name of the record
+            resource_id: Primary key of the record
+            version: Version number (see audit_version in audit_metadata); the latest if None
+
+        Returns:
+            The record state, or None if unknown or deleted at that version
+        """
+        if self.sink_reader is not None:
+            return await self.sink_reader.get_resource_version(
+                resource_type, resource_id, version
+            )
+
+        return await self.audit_store.get_version(
+            db, resource_type, resource_id, version=version
+        )
 
     async def get_resource_history(
         self,
@@ -193,6 +908,11 @@ class EventService:
         offset: int = 0,
     ) -> dict:
         """Get audit history for a specific resource."""
+        if self.sink_reader is not None:
+            return await self.sink_reader.get_resource_history(
+                resource_type, resource_id, limit, offset
+            )
+
         result = await self.crud_audits.get_multi(
             db,
             offset=offset,
@@ -205,60 +925,192 @@ class EventService:
 
         return cast(dict[str, Any], result)
 
+    def failed_login_filter(self) -> Any:
+        """SQL condition matching failed login events."""
+        event_model: Any = self.db_config.AdminEventLog
+        return or_(
+            event_model.event_type == EventType.FAILED_LOGIN,
+            and_(
+                event_model.event_type == EventType.LOGIN,
+                event_model.status == EventStatus.FAILURE,
+            ),
+        )
+
+    def username_expression(self) -> Any:
+        """SQL expression extracting the attempted username from event details."""
+        event_model: Any = self.db_config.AdminEventLog
+        return func.coalesce(
+            event_model.details[("auth_details", "username")].as_string(),
+            event_model.details["username"].as_string(),
+            "unknown",
+        )
+
     async def get_security_alerts(
-        self, db: AsyncSession, lookback_hours: int = 24
+        self, db: AsyncSession, lookback_hours: int = 24, threshold: int = 5
     ) -> list[dict[str, Any]]:
-        """Get security alerts based on event patterns."""
-        alerts: list[dict[str, Any]] = []
+        """
+        Get security alerts based on event patterns.
+
+        Failed logins in the lookback window are grouped by IP address and
+        attempted username in the database, so only the groups that reach the
+        threshold are returned to Python. Aggregated events count with their
+        `attempts`.
+
+        Args:
+            db: Database session
+            lookback_hours: How far back to look for failed logins
+            threshold: Minimum failed attempts from one IP for one username
+
+        Returns:
+            One alert dict per (IP address, username) pair at or above the threshold
+        """
+        if self.sink_reader is not None:
+            return await self.sink_reader.get_security_alerts(lookback_hours, threshold)
+
+        event_model: Any = self.db_config.AdminEventLog
         lookback_time = datetime.now(UTC) - timedelta(hours=lookback_hours)
+        username = self.username_expression().label("username")
+        attempt_count = func.sum(
+            func.coalesce(event_model.details["attempts"].as_integer(), 1)
+        )
+        attempts = attempt_count.label("attempts")
 
-        failed_logins = await self.crud_events.get_multi(
-            db,
-            event_type=EventType.FAILED_LOGIN,
-            status=EventStatus.FAILURE,
-            timestamp__gte=lookback_time,
+        stmt = (
+            select(event_model.ip_address, username, attempts)
+            .where(event_model.timestamp >= lookback_time, self.failed_login_filter())
+            .group_by(event_model.ip_address, username)
+            .having(attempt_count >= threshold)
+            .order_by(attempts.desc())
         )
+        rows = (await db.execute(stmt)).all()
 
-        failed_login_patterns: dict[tuple, int] = {}
+        return [
+            {
+                "type": "multiple_failed_logins",
+                "severity": "high",
+                "details": {
+                    "ip_address": row.ip_address,
+                    "username": row.username,
+                    "attempts": row.attempts,
+                },
+            }
+            for row in rows
+        ]
 
-        for login in failed_logins.get("data", []):
-            key = (
-                login.get("ip_address", "unknown"),
-                login.get("details", {}).get("username", "unknown"),
-            )
-            failed_login_patterns[key] = failed_login_patterns.get(key, 0) + 1
-
-        for (ip, username), count in failed_login_patterns.items():
-            if count >= 5:
-                alerts.append(
-                    {
-                        "type": "multiple_failed_logins",
-                        "severity": "high",
-                        "details": {
-                            "ip_address": ip,
-                            "username": username,
-                            "attempts": count,
-                        },
-                    }
-                )
+    async def cleanup_old_logs(
+        self,
+        db: AsyncSession,
+        retention_days: int = 90,
+        batch_size: int = 1000,
+        pause_seconds: float = 0.0,
+    ) -> int:
+        """
+        Delete events older than the retention period, together with their audit rows.
 
-        return alerts
+        Rows are removed in batches of batch_size events, each committed
+        separately, so no single statement holds locks on a large range or
+        produces a large burst of WAL. Audit rows are deleted by the id of
+        their event; audit rows older than the cutoff whose event no longer
+        exists are removed afterwards. With diff audit storage, the oldest
+        remaining audit row of each affected record is first rewritten as a
+        snapshot, so its later versions can still be rebuilt.
+
+        Args:
+            db: Database session
+            retention_days: Age in days after which events are deleted
+            batch_size: Maximum events deleted per transaction
+            pause_seconds: Delay between batches to leave room for other writers
+
+        Returns:
+            Number of events deleted; with an event sink, whole segments
+            are removed instead of batches of rows
+        """
+        event_model: Any = self.db_config.AdminEventLog
+        audit_model: Any = self.db_config.AdminAuditLog
+        cutoff = datetime.now(UTC) - timedelta(days=retention_days)
+        if self.sink is not None:
+            return await self.sink.delete_before(cutoff)
+
+        deleted = 0
 
-    async def cleanup_old_logs(
-        self, db: AsyncSession, retention_days: int = 90
-    ) -> None:
-        """Clean up old logs based on retention policy."""
         try:
-            cutoff_date = datetime.now(UTC) - timedelta(days=retention_days)
+            while True:
+                event_ids = (
+                    (
+                        await db.execute(
+                            select(event_model.id)
+                            .where(event_model.timestamp < cutoff)
+                            .order_by(event_model.timestamp)
+                            .limit(batch_size)
+                        )
+                    )
+                    .scalars()
+                    .all()
+                )
+                if not event_ids:
+                    break
 
-            await self.crud_events.delete(
-                db, allow_multiple=True, timestamp__lt=cutoff_date
-            )
+                await self.audit_store.keep_snapshots(
+                    db, audit_model.event_id.in_(event_ids)
+                )
+                await db.execute(
+                    delete(audit_model)
+                    .where(audit_model.event_id.in_(event_ids))
+                    .execution_options(synchronize_session=False)
+                )
+                await db.execute(
+                    delete(event_model)
+                    .where(event_model.id.in_(event_ids))
+                    .execution_options(synchronize_session=False)
+                )
+                await db.commit()
+                deleted += len(event_ids)
 
-            await self.crud_audits.delete(
-                db, allow_multiple=True, timestamp__lt=cutoff_date
-            )
+                if len(event_ids) < batch_size:
+                    break
+                if pause_seconds:
+                    await asyncio.sleep(pause_seconds)
+
+            while True:
+                orphan_ids = (
+                    (
+                        await db.execute(
+                            select(audit_model.id)
+                            .where(
+                                audit_model.timestamp < cutoff,
+                                ~exists().where(event_model.id == audit_model.event_id),
+                            )
+                            .limit(batch_size)
+                        )
+                    )
+                    .scalars()
+                    .all()
+                )
+                if not orphan_ids:
+                    break
+
+                await self.audit_store.keep_snapshots(
+                    db, audit_model.id.in_(orphan_ids)
+                )
+                await db.execute(
+                    delete(audit_model)
+                    .where(audit_model.id.in_(orphan_ids))
+                    .execution_options(synchronize_session=False)
+                )
+                await db.commit()
+
+                if len(orphan_ids) < batch_size:
+                    break
+                if pause_seconds:
+                    await asyncio.sleep(pause_seconds)
+
+            if deleted:
+                logger.info(
+                    f"Deleted {deleted} events older than {retention_days} days"
+                )
+            return deleted
 
         except Exception as e:
             logger.error(f"Error cleaning up old logs: {str(e)}", exc_info=True)
+            await db.rollback()
             raise
@@ -0,0 +1,504 @@
+"""
+Pluggable storage for events and audit records.
+
+By default EventService stores events and audit records in the admin
+database. Passing an `EventSink` moves that storage elsewhere; EventService
+then writes through the sink and answers the events page, export, history and
+alert queries with `EventSinkReader`, which works on any sink by scanning its
+time-ordered iterators. The admin database is still used to resolve
+usernames.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .schemas import EventStatus, EventType
+
+if TYPE_CHECKING:
+    from .audit_store import AuditStore
+
+UTC = timezone.utc
+
+EventFilter = Callable[[dict[str, Any]], bool]
+
+
+class EventSink(ABC):
+    """Append-only storage backend for events and audit records."""
+
+    @abstractmethod
+    async def append_event(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Store an event record and return it with its assigned id."""
+
+    @abstractmethod
+    async def append_audit(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Store an audit record and return it with its assigned id."""
+
+    @abstractmethod
+    def iter_events(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        reverse: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over events with start <= timestamp < end, in time order."""
+
+    @abstractmethod
+    def iter_audits(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        reverse: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over audit records with start <= timestamp < end, in time order."""
+
+    @abstractmethod
+    async def get_event(self, event_id: int) -> Optional[dict[str, Any]]:
+        """Read one event by id."""
+
+    @abstractmethod
+    async def count_events(self) -> int:
+        """Number of stored events."""
+
+    @abstractmethod
+    async def delete_before(self, cutoff: datetime) -> int:
+        """Delete events (and audits) older than cutoff; returns events deleted."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release open resources."""
+
+
+def _aware(moment: datetime) -> datetime:
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=UTC)
+
+
+def _key(event: dict[str, Any]) -> tuple[datetime, int]:
+    return _aware(event["timestamp"]), event["id"]
+
+
+class EventSinkReader:
+    """Answers EventService queries from an EventSink."""
+
+    AUDIT_LOOKUP_WINDOW = timedelta(minutes=5)
+    PAGE_COLUMNS = (
+        "id",
+        "timestamp",
+        "event_type",
+        "status",
+        "user_id",
+        "session_id",
+        "ip_address",
+        "resource_type",
+        "resource_id",
+    )
+
+    def __init__(
+        self, sink: EventSink, db_config: Any, audit_store: "AuditStore"
+    ) -> None:
+        self.sink = sink
+        self.db_config = db_config
+        self.audit_store = audit_store
+
+    async def _usernames(
+        self, db: AsyncSession, user_ids: set[int], cache: dict[int, str]
+    ) -> dict[int, str]:
+        missing = {user_id for user_id in user_ids if user_id not in cache}
+        if missing:
+            user_model: Any = self.db_config.AdminUser
+            result = await db.execute(
+                select(user_model.id, user_model.username).where(
+                    user_model.id.in_(missing)
+                )
+            )
+            cache.update({row.id: row.username for row in result})
+            for user_id in missing:
+                cache.setdefault(user_id, "Unknown")
+        return cache
+
+    async def _filter(
+        self,
+        db: AsyncSession,
+        event_type: Optional[str] = None,
+        status: Optional[str] = None,
+        username: Optional[str] = None,
+        user_id: Optional[int] = None,
+    ) -> Optional[EventFilter]:
+        """Build an event predicate; None if the username does not exist."""
+        if username:
+            user_model: Any = self.db_config.AdminUser
+            user_id = (
+                await db.execute(
+                    select(user_model.id).where(user_model.username == username)
+                )
+            ).scalar_one_or_none()
+            if user_id is None:
+                return None
+
+        wanted_type = EventType(event_type) if event_type else None
+        wanted_status = EventStatus(status) if status else None
+
+        def matches(event: dict[str, Any]) -> bool:
+            return (
+                (wanted_type is None or event["event_type"] == wanted_type)
+                and (wanted_status is None or event["status"] == wanted_status)
+                and (user_id is None or event["user_id"] == user_id)
+            )
+
+        return matches
+
+    async def keyset_page(
+        self,
+        matches: EventFilter,
+        limit: int,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> tuple[list[dict[str, Any]], Optional[str], Optional[str]]:
+        """Newest-first page of matching events with the same cursors as the database path."""
+        from .service import decode_event_cursor, encode_event_cursor
+
+        if before:
+            cursor = decode_event_cursor(before)
+            cursor = (_aware(cursor[0]), cursor[1])
+            start = max(start_time, cursor[0]) if start_time else cursor[0]
+            newer: list[dict[str, Any]] = []
+            async for event in self.sink.iter_events(start=start, end=end_time):
+                if _key(event) > cursor and matches(event):
+                    newer.append(event)
+                    if len(newer) > limit:
+                        break
+            if len(newer) > limit:
+                page = list(reversed(newer[:limit]))
+                return (
+                    page,
+                    encode_event_cursor(*_key(page[-1])),
+                    encode_event_cursor(*_key(page[0])),
+                )
+            after = None
+
+        end = end_time
+        after_cursor = None
+        if after:
+            cursor_ts, cursor_id = decode_event_cursor(after)
+            after_cursor = (_aware(cursor_ts), cursor_id)
+            bound = after_cursor[0] + timedelta(microseconds=1)
+            end = min(end, bound) if end else bound
+
+        rows: list[dict[str, Any]] = []
+        async for event in self.sink.iter_events(
+            start=start_time, end=end, reverse=True
+        ):
+            if after_cursor is not None and _key(event) >= after_cursor:
+                continue
+            if matches(event):
+                rows.append(event)
+                if len(rows) > limit:
+                    break
+
+        page = rows[:limit]
+        next_cursor = (
+            encode_event_cursor(*_key(page[-1])) if len(rows) > limit else None
+        )
+        prev_cursor = (
+            encode_event_cursor(*_key(page[0])) if after_cursor and page else None
+        )
+        return page, next_cursor, prev_cursor
+
+    async def get_event_page(
+        self,
+        db: AsyncSession,
+        limit: int = 10,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        event_type: Optional[str] = None,
+        status: Optional[str] = None,
+        username: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        with_total: bool = True,
+        count_limit: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """
+        Events page from the sink.
+
+        The total count is read from the sink when there are no filters;
+        otherwise it requires a scan of the filtered time range, which stops
+        once count_limit events matched.
+        """
+        empty: dict[str, Any] = {
+            "data": [],
+            "total_count": 0 if with_total else None,
+            "total_capped": False,
+            "next_cursor": None,
+            "prev_cursor": None,
+        }
+        matches = await self._filter(db, event_type, status, username)
+        if matches is None:
+            return empty
+
+        events, next_cursor, prev_cursor = await self.keyset_page(
+            matches, limit, after, before, start_time, end_time
+        )
+        usernames = await self._usernames(
+            db, {event["user_id"] for event in events}, {}
+        )
+        data = [
+            {
+                **{column: event.get(column) for column in self.PAGE_COLUMNS},
+                "username": usernames[event["user_id"]],
+            }
+            for event in events
+        ]
+
+        total_count: Optional[int] = None
+        if with_total and any((event_type, status, username, start_time, end_time)):
+            total_count = 0
+            async for event in self.sink.iter_events(start=start_time, end=end_time):
+                total_count += matches(event)
+                if count_limit is not None and total_count > count_limit:
+                    break
+        elif with_total:
+            total_count = await self.sink.count_events()
+
+        total_capped = False
+        if total_count is not None and count_limit is not None:
+            total_capped = total_count > count_limit
+            total_count = min(total_count, count_limit)
+
+        return {
+            "data": data,
+            "total_count": total_count,
+            "total_capped": total_capped,
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
+        }
+
+    async def get_user_activity(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """User activity from the sink, newest first."""
+        matches = await self._filter(db, user_id=user_id)
+        assert matches is not None
+        end = end_time + timedelta(microseconds=1) if end_time else None
+
+        if offset:
+            data: list[dict[str, Any]] = []
+            total_count = 0
+            async for event in self.sink.iter_events(
+                start=start_time, end=end, reverse=True
+            ):
+                if matches(event):
+                    if offset <= total_count < offset + limit:
+                        data.append(event)
+                    total_count += 1
+            return {"data": data, "total_count": total_count}
+
+        data, next_cursor, _ = await self.keyset_page(
+            matches, limit, after=cursor, start_time=start_time, end_time=end
+        )
+        return {"data": data, "next_cursor": next_cursor}
+
+    async def _find_audit(self, event: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """The audit record of an event, written right after it."""
+        start = _aware(event["timestamp"])
+        async for audit in self.sink.iter_audits(
+            start=start, end=start + self.AUDIT_LOOKUP_WINDOW
+        ):
+            if audit.get("event_id") == event["id"]:
+                return audit
+        return None
+
+    def _audit_fields(
+        self, audit: Optional[dict[str, Any]]
+    ) -> Optional[dict[str, Any]]:
+        if audit is None:
+            return None
+        return {
+            "action": audit.get("action"),
+            "changes": audit.get("changes"),
+            "previous_state": self.audit_store.decode_state(
+                audit.get("previous_state")
+            ),
+            "new_state": self.audit_store.decode_state(audit.get("new_state")),
+        }
+
+    async def get_event_details(
+        self, db: AsyncSession, event_id: int
+    ) -> Optional[dict[str, Any]]:
+        """Details of one event, built like the database path."""
+        event = await self.sink.get_event(event_id)
+        if event is None:
+            return None
+
+        if event.get("resource_type") and event.get("resource_id"):
+            audit = await self._find_audit(event)
+            if audit is not None:
+                new_state = self.audit_store.decode_state(audit.get("new_state"))
+                return {
+                    "resource_details": {
+                        "model": event["resource_type"],
+                        "id": event["resource_id"],
+                        "changes": new_state
+                        if new_state is not None
+                        else audit.get("changes"),
+                    }
+                }
+        return dict(event.get("details") or {})
+
+    async def iter_events(
+        self,
+        db: AsyncSession,
+        include_audit: bool = False,
+        after: Optional[str] = None,
+        event_type: Optional[str] = None,
+        status: Optional[str] = None,
+        username: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Matching events oldest first, for export.
+
+        Audit records are merged from the audit log read alongside the
+        events, keeping only the audits within AUDIT_LOOKUP_WINDOW of the
+        current event in memory.
+        """
+        from .service import decode_event_cursor, encode_event_cursor
+
+        matches = await self._filter(db, event_type, status, username)
+        if matches is None:
+            return
+
+        cursor = None
+        start = start_time
+        if after:
+            cursor_ts, cursor_id = decode_event_cursor(after)
+            cursor = (_aware(cursor_ts), cursor_id)
+            start = max(start, cursor[0]) if start else cursor[0]
+
+        audits = self.sink.iter_audits(start=start) if include_audit else None
+        pending: dict[int, dict[str, Any]] = {}
+        next_audit: Optional[dict[str, Any]] = None
+        usernames: dict[int, str] = {}
+
+        async for event in self.sink.iter_events(start=start, end=end_time):
+            if cursor is not None and _key(event) <= cursor:
+                continue
+            if not matches(event):
+                continue
+
+            await self._usernames(db, {event["user_id"]}, usernames)
+            row = {**event, "username": usernames[event["user_id"]]}
+
+            if audits is not None:
+                horizon = _aware(event["timestamp"]) + self.AUDIT_LOOKUP_WINDOW
+                while True:
+                    if next_audit is None:
+                        try:
+                            next_audit = await audits.__anext__()
+                        except StopAsyncIteration:
+                            break
+                    if _aware(next_audit["timestamp"]) > horizon:
+                        break
+                    pending[next_audit.get("event_id", 0)] = next_audit
+                    next_audit = None
+
+                row["audit"] = self._audit_fields(pending.pop(event["id"], None))
+                oldest = _aware(event["timestamp"]) - self.AUDIT_LOOKUP_WINDOW
+                for event_id in [
+                    k for k, v in pending.items() if _aware(v["timestamp"]) < oldest
+                ]:
+                    del pending[event_id]
+
+            row["cursor"] = encode_event_cursor(*_key(event))
+            yield row
+
+    async def get_resource_history(
+        self,
+        resource_type: str,
+        resource_id: str,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """Audit records of one resource, newest first; scans the audit log."""
+        data: list[dict[str, Any]] = []
+        total_count = 0
+        async for audit in self.sink.iter_audits(reverse=True):
+            if (
+                audit.get("resource_type") == resource_type
+                and audit.get("resource_id") == resource_id
+            ):
+                if offset <= total_count < offset + limit:
+                    data.append(audit)
+                total_count += 1
+        return {"data": data, "total_count": total_count}
+
+    async def get_resource_version(
+        self, resource_type: str, resource_id: str, version: Optional[int] = None
+    ) -> Optional[dict[str, Any]]:
+        """State of a resource after its version-th audit record (1-based)."""
+        found: Optional[dict[str, Any]] = None
+        current = 0
+        async for audit in self.sink.iter_audits():
+            if (
+                audit.get("resource_type") == resource_type
+                and audit.get("resource_id") == resource_id
+            ):
+                current += 1
+                found = audit
+                if version is not None and current == version:
+                    break
+
+        if found is None or (version is not None and current != version):
+            return None
+        if found.get("action") == "delete":
+            return None
+        return self.audit_store.decode_state(found.get("new_state"))
+
+    async def get_security_alerts(
+        self, lookback_hours: int = 24, threshold: int = 5
+    ) -> list[dict[str, Any]]:
+        """Failed login alerts computed from a scan of the lookback window."""
+        start = datetime.now(UTC) - timedelta(hours=lookback_hours)
+        attempts: dict[tuple[str, str], int] = {}
+        async for event in self.sink.iter_events(start=start):
+            failed = event["event_type"] == EventType.FAILED_LOGIN or (
+                event["event_type"] == EventType.LOGIN
+                and event["status"] == EventStatus.FAILURE
+            )
+            if not failed:
+                continue
+            details = event.get("details") or {}
+            auth_details = details.get("auth_details")
+            username = (
+                auth_details.get("username") if isinstance(auth_details, dict) else None
+            ) or details.get("username")
+            key = (event["ip_address"], username or "unknown")
+            attempts[key] = attempts.get(key, 0) + int(details.get("attempts", 1))
+
+        alerts = [
+            {
+                "type": "multiple_failed_logins",
+                "severity": "high",
+                "details": {
+                    "ip_address": ip_address,
+                    "username": username,
+                    "attempts": count,
+                },
+            }
+            for (ip_address, username), count in attempts.items()
+            if count >= threshold
+        ]
+        return sorted(alerts, key=lambda a: a["details"]["attempts"], reverse=True)
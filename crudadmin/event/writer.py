@@ -0,0 +1,249 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Optional
+
+from sqlalchemy import insert
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedEventWriter:
+    """
+    Batches event and audit log rows and writes them in the background.
+
+    Request handlers call `enqueue`, which only appends to a bounded in-memory
+    queue and returns immediately. A background task flushes the queue when it
+    reaches `batch_size` rows or every `flush_interval` seconds, inserting all
+    queued events with a single executemany and then their audit rows with a
+    second one, in one transaction. When the queue is full new records are
+    dropped and counted rather than blocking the request.
+
+    A batch that fails is retried on the following flushes. After
+    `max_attempts` failures its rows are written one at a time, and the rows
+    that still fail are dropped and counted as `failed`, so a row that can
+    never be written does not hold back the rest of the queue.
+
+    Call `close` on shutdown to drain the queue.
+    """
+
+    def __init__(
+        self,
+        db_config: Any,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        audit_store: Optional[Any] = None,
+        max_attempts: int = 3,
+    ) -> None:
+        """
+        Args:
+            db_config: Database configuration with the AdminEventLog and AdminAuditLog models
+            max_queue_size: Maximum number of queued events before new ones are dropped
+            batch_size: Queue depth that triggers an immediate flush, and rows per flush
+            flush_interval: Maximum seconds a queued event waits before being written
+            audit_store: AuditStore that converts audit rows to their stored form
+            max_attempts: Failed writes of a batch before its rows are written
+                one at a time
+        """
+        if max_queue_size < 1 or batch_size < 1 or max_attempts < 1:
+            raise ValueError(
+                "max_queue_size, batch_size and max_attempts must be positive"
+            )
+
+        self.db_config = db_config
+        self.event_table = db_config.AdminEventLog.__table__
+        self.audit_table = db_config.AdminAuditLog.__table__
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.audit_store = audit_store
+        self.max_attempts = max_attempts
+
+        self._queue: deque[tuple[dict[str, Any], Optional[dict[str, Any]]]] = deque()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._closed = False
+        self._attempts = 0
+
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.flushes = 0
+        self.write_errors = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events waiting to be written."""
+        return len(self._queue)
+
+    def stats(self) -> dict[str, int]:
+        """Return the writer's counters."""
+        return {
+            "queue_depth": self.queue_depth,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "flushes": self.flushes,
+            "write_errors": self.write_errors,
+        }
+
+    def enqueue(
+        self, event: dict[str, Any], audit: Optional[dict[str, Any]] = None
+    ) -> bool:
+        """
+        Queue an event row and its optional audit row for writing.
+
+        Args:
+            event: Event log column values
+            audit: Audit log column values; event_id is filled in on flush
+
+        Returns:
+            True if the event was queued, False if it was dropped
+        """
+        if self._closed or len(self._queue) >= self.max_queue_size:
+            self.dropped += 1
+            logger.warning(
+                f"Event queue full ({self.max_queue_size}), dropping event "
+                f"({self.dropped} dropped so far)"
+            )
+            return False
+
+        self._queue.append((event, audit))
+        self._ensure_started()
+
+        if self._wakeup is not None and len(self._queue) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def _ensure_started(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            while self._queue and not self._closed:
+                if not await self.flush():
+                    break
+
+    async def flush(self) -> bool:
+        """
+        Write up to `batch_size` queued events and their audit rows.
+
+        On failure the batch is put back at the front of the queue so it is
+        retried on the next flush. The flush that reaches `max_attempts`
+        writes the batch one row at a time instead and drops the rows that
+        still fail.
+
+        Returns:
+            True if the batch was written (or the queue was empty), False if
+            it was put back to retry
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            batch = [
+                self._queue.popleft()
+                for _ in range(min(self.batch_size, len(self._queue)))
+            ]
+            if not batch:
+                return True
+
+            try:
+                await self._write_batch(batch)
+            except Exception as e:
+                self.write_errors += 1
+                self._attempts += 1
+                logger.error(
+                    f"Error writing {len(batch)} buffered events "
+                    f"(attempt {self._attempts} of {self.max_attempts}): {str(e)}",
+                    exc_info=True,
+                )
+                if self._attempts < self.max_attempts:
+                    self._queue.extendleft(reversed(batch))
+                    return False
+                await self._write_rows(batch)
+            else:
+                self.written += len(batch)
+
+            self._attempts = 0
+            self.flushes += 1
+            return True
+
+    async def _write_rows(
+        self, batch: list[tuple[dict[str, Any], Optional[dict[str, Any]]]]
+    ) -> None:
+        """Write a batch that keeps failing one row at a time, dropping bad rows."""
+        for item in batch:
+            try:
+                await self._write_batch([item])
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Dropping buffered event that cannot be written: {e}")
+            else:
+                self.written += 1
+
+    async def _write_batch(
+        self, batch: list[tuple[dict[str, Any], Optional[dict[str, Any]]]]
+    ) -> None:
+        events = [event for event, _ in batch]
+
+        async with self.db_config.admin_engine.begin() as conn:
+            if conn.dialect.insert_executemany_returning_sort_by_parameter_order:
+                result = await conn.execute(
+                    insert(self.event_table).returning(
+                        self.event_table.c.id, sort_by_parameter_order=True
+                    ),
+                    events,
+                )
+                event_ids = list(result.scalars())
+            else:
+                event_ids = []
+                for event in events:
+                    result = await conn.execute(insert(self.event_table), event)
+                    event_ids.append(result.inserted_primary_key[0])
+
+            audits = [
+                {**audit, "event_id": event_id}
+                for (_, audit), event_id in zip(batch, event_ids)
+                if audit is not None
+            ]
+            if audits and self.audit_store is not None:
+                await self.audit_store.write(
+                    conn,
+                    audits,
+                    lambda rows: conn.execute(insert(self.audit_table), rows),
+                )
+            elif audits:
+                await conn.execute(insert(self.audit_table), audits)
+
+    async def close(self) -> None:
+        """Stop the background task and write every queued event."""
+        self._closed = True
+
+        if self._task is not None:
+            if self._wakeup is not None:
+                self._wakeup.set()
+            await self._task
+            self._task = None
+
+        while self._queue:
+            await self.flush()
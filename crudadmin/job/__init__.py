@@ -0,0 +1,10 @@
+from .models import JobStatus, create_admin_job
+from .runner import JobChunk, JobHandler, JobRunner
+
+__all__ = [
+    "JobStatus",
+    "create_admin_job",
+    "JobChunk",
+    "JobHandler",
+    "JobRunner",
+]
@@ -0,0 +1,78 @@
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Optional
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+UTC = timezone.utc
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    CANCELLING = "cancelling"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+def create_admin_job(base: type[DeclarativeBase]) -> type[DeclarativeBase]:
+    """
+    Create the background job model.
+
+    Each row is one job run by crudadmin.job.JobRunner. The cursor column
+    holds the handler's position after the last committed chunk, so a job
+    interrupted by a restart resumes where it stopped. The owner and
+    heartbeat_at columns are the lease of the runner executing the job.
+    """
+    tablename = "admin_job"
+
+    if hasattr(base, "registry") and hasattr(base.registry, "_class_registry"):
+        existing_class = base.registry._class_registry.get("AdminJob")
+        if existing_class is not None and isinstance(existing_class, type):
+            if issubclass(existing_class, base):
+                return existing_class
+
+    class AdminJob(base):  # type: ignore
+        __tablename__ = tablename
+        __table_args__ = (
+            Index(f"ix_{tablename}_status_created_at", "status", "created_at"),
+            {"extend_existing": True},
+        )
+
+        id: Mapped[int] = mapped_column(
+            "id", autoincrement=True, nullable=False, unique=True, primary_key=True
+        )
+        kind: Mapped[str] = mapped_column(String(128), nullable=False)
+        status: Mapped[str] = mapped_column(
+            String(16), default=JobStatus.PENDING.value, nullable=False
+        )
+        user_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+        params: Mapped[dict[str, Any]] = mapped_column(
+            JSON, default=dict, nullable=False
+        )
+        cursor: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
+        total: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+        processed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+        error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+        created_at: Mapped[datetime] = mapped_column(
+            DateTime(timezone=True),
+            default=lambda: datetime.now(UTC),
+            nullable=False,
+        )
+        started_at: Mapped[Optional[datetime]] = mapped_column(
+            DateTime(timezone=True), nullable=True
+        )
+        finished_at: Mapped[Optional[datetime]] = mapped_column(
+            DateTime(timezone=True), nullable=True
+        )
+        owner: Mapped[Optional[str]] = mapped_column(String(128), nullable=True)
+        heartbeat_at: Mapped[Optional[datetime]] = mapped_column(
+            DateTime(timezone=True), nullable=True
+        )
+
+        def __repr__(self) -> str:
+            return f"<AdminJob(id={self.id}, kind={self.kind}, status={self.status})>"
+
+    return AdminJob
@@ -0,0 +1,446 @@
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any, NamedTuple, Optional
+
+from sqlalchemy import func, literal, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.db import DatabaseConfig
+from .models import JobStatus
+
+UTC = timezone.utc
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = (
+    JobStatus.PENDING.value,
+    JobStatus.RUNNING.value,
+    JobStatus.CANCELLING.value,
+)
+
+
+class JobChunk(NamedTuple):
+    """Result of one call to a job handler."""
+
+    processed: int
+    cursor: Any
+    done: bool
+
+
+JobHandler = Callable[[dict[str, Any], Any], Awaitable[JobChunk]]
+
+
+class JobRunner:
+    """
+    In-process runner for long admin operations.
+
+    A job is a row in the admin_job table and a handler registered for its
+    kind. The handler is called repeatedly with the job params and the cursor
+    it returned last time (None on the first call), processes one chunk in its
+    own transaction and returns a JobChunk. After each chunk the runner
+    commits the progress and the new cursor, then checks whether the job was
+    cancelled. At most max_concurrency jobs run at once; the others wait.
+
+    A runner claims a job with one conditional UPDATE that sets itself as
+    the job's owner, and keeps the lease by refreshing heartbeat_at while the
+    job runs. Several processes can share the admin_job table: a job is only
+    claimed while it has no owner or its owner's heartbeat is older than
+    lease_seconds. Jobs left without a live owner, for example by a process
+    that stopped, are picked up by start() and then every lease_seconds, and
+    resume from their last cursor, so handlers must be able to continue from
+    a cursor written by another process.
+    """
+
+    def __init__(
+        self,
+        db_config: DatabaseConfig,
+        max_concurrency: int = 2,
+        lease_seconds: float = 60,
+    ) -> None:
+        """
+        Args:
+            db_config: Database configuration with the AdminJob model set
+            max_concurrency: Maximum number of jobs running at the same time
+            lease_seconds: Time without a heartbeat after which another
+                runner may take over a job
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds must be positive")
+        if db_config.AdminJob is None:
+            raise ValueError("db_config has no AdminJob model")
+
+        self.db_config = db_config
+        self.job_model: Any = db_config.AdminJob
+        self.max_concurrency = max_concurrency
+        self.lease_seconds = lease_seconds
+        self.handlers: dict[str, JobHandler] = {}
+        self.owner = f"{socket.gethostname()[:64]}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: dict[int, asyncio.Task[None]] = {}
+        self._sweeper: Optional[asyncio.Task[None]] = None
+        self._started = False
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        """Register the handler that runs jobs of the given kind."""
+        self.handlers[kind] = handler
+
+    async def submit(
+        self,
+        kind: str,
+        params: dict[str, Any],
+        user_id: Optional[int] = None,
+        total: Optional[int] = None,
+    ) -> int:
+        """
+        Create a job and schedule it.
+
+        Args:
+            kind: Registered handler name
+            params: JSON-serializable arguments passed to every handler call
+            user_id: Admin user who started the job
+            total: Expected number of items, shown as progress
+
+        Returns:
+            Id of the new job
+
+        Raises:
+            ValueError: If no handler is registered for kind
+        """
+        if kind not in self.handlers:
+            raise ValueError(f"No job handler registered for {kind!r}")
+
+        async with self._session() as db:
+            job = self.job_model(
+                kind=kind,
+                status=JobStatus.PENDING.value,
+                user_id=user_id,
+                params=params,
+                total=total,
+                processed=0,
+            )
+            db.add(job)
+            await db.commit()
+            job_id = int(job.id)
+
+        if self._started:
+            self._schedule(job_id)
+        return job_id
+
+    async def cancel(self, job_id: int) -> bool:
+        """
+        Request cancellation of a job.
+
+        A pending job is cancelled immediately; a running job stops after the
+        chunk in progress.
+
+        Returns:
+            False if the job does not exist or has already finished
+        """
+        job_model = self.job_model
+        async with self._session() as db:
+            status = (
+                await db.execute(select(job_model.status).where(job_model.id == job_id))
+            ).scalar_one_or_none()
+            if status == JobStatus.PENDING.value:
+                values = {
+                    "status": JobStatus.CANCELLED.value,
+                    "finished_at": datetime.now(UTC),
+                }
+            elif status == JobStatus.RUNNING.value:
+                values = {"status": JobStatus.CANCELLING.value}
+            else:
+                return status == JobStatus.CANCELLING.value
+
+            result = await db.execute(
+                update(job_model)
+                .where(job_model.id == job_id, job_model.status == status)
+                .values(**values)
+            )
+            await db.commit()
+            return bool(getattr(result, "rowcount", 0))
+
+    async def get_job(self, job_id: int) -> Optional[dict[str, Any]]:
+        """Get one job as a dictionary."""
+        async with self._session() as db:
+            job = await db.get(self.job_model, job_id)
+            return self._to_dict(job) if job is not None else None
+
+    async def get_jobs(self, limit: int = 50) -> list[dict[str, Any]]:
+        """Get the most recent jobs, newest first."""
+        job_model = self.job_model
+        async with self._session() as db:
+            result = await db.execute(
+                select(job_model).order_by(job_model.id.desc()).limit(limit)
+            )
+            return [self._to_dict(job) for job in result.scalars()]
+
+    async def start(self) -> None:
+        """
+        Start running jobs, resuming those left without a live owner.
+
+        Jobs whose cancellation was requested before their owner stopped are
+        marked cancelled, and jobs with no registered handler are marked
+        failed. Afterwards, jobs whose lease expires are taken over every
+        lease_seconds.
+        """
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._started = True
+        await self._resume_expired()
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep())
+
+    async def stop(self) -> None:
+        """
+        Stop running jobs.
+
+        Interrupted jobs keep their status and last committed cursor, and
+        their lease is released so the next start() of any runner resumes
+        them.
+        """
+        self._started = False
+        tasks = list(self._tasks.values())
+        if self._sweeper is not None:
+            tasks.append(self._sweeper)
+            self._sweeper = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+        job_model = self.job_model
+        async with self._session() as db:
+            await db.execute(
+                update(job_model)
+                .where(
+                    job_model.owner == self.owner,
+                    job_model.status.in_(ACTIVE_STATUSES),
+                )
+                .values(owner=None, heartbeat_at=None)
+            )
+            await db.commit()
+
+    def _claimable(self, now: datetime) -> Any:
+        """Condition on jobs without an owner or whose lease has expired."""
+        job_model = self.job_model
+        return or_(
+            job_model.owner.is_(None),
+            job_model.heartbeat_at.is_(None),
+            job_model.heartbeat_at < now - timedelta(seconds=self.lease_seconds),
+        )
+
+    async def _resume_expired(self) -> None:
+        """Schedule the active jobs whose lease is free or has expired."""
+        job_model = self.job_model
+        now = datetime.now(UTC)
+        finished = {"finished_at": now, "owner": None, "heartbeat_at": None}
+        async with self._session() as db:
+            await db.execute(
+                update(job_model)
+                .where(
+                    job_model.status == JobStatus.CANCELLING.value,
+                    self._claimable(now),
+                )
+                .values(status=JobStatus.CANCELLED.value, **finished)
+            )
+            await db.execute(
+                update(job_model)
+                .where(
+                    job_model.status.in_(ACTIVE_STATUSES),
+                    job_model.kind.not_in(list(self.handlers)),
+                    self._claimable(now),
+                )
+                .values(
+                    status=JobStatus.FAILED.value,
+                    error=literal("No job handler registered for '")
+                    + job_model.kind
+                    + literal("'"),
+                    **finished,
+                )
+            )
+            resume = (
+                (
+                    await db.execute(
+                        select(job_model.id)
+                        .where(
+                            job_model.status.in_(ACTIVE_STATUSES),
+                            self._claimable(now),
+                        )
+                        .order_by(job_model.id)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            await db.commit()
+
+        for job_id in resume:
+            if job_id not in self._tasks:
+                logger.info(f"Resuming job {job_id}")
+                self._schedule(job_id)
+
+    async def _sweep(self) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds)
+            try:
+                await self._resume_expired()
+            except Exception as e:
+                logger.error(f"Error resuming expired jobs: {str(e)}")
+
+    def _session(self) -> AsyncSession:
+        return AsyncSession(self.db_config.admin_engine, expire_on_commit=False)
+
+    def _schedule(self, job_id: int) -> None:
+        if job_id in self._tasks:
+            return
+        task = asyncio.create_task(self._execute(job_id))
+        self._tasks[job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job_id, None))
+
+    async def _claim(self, job_id: int) -> Optional[Any]:
+        """
+        Take the lease of a job, marking it running.
+
+        Returns:
+            The claimed job, or None if it finished, is cancelled or is
+            owned by another live runner
+        """
+        job_model = self.job_model
+        now = datetime.now(UTC)
+        async with self._session() as db:
+            result = await db.execute(
+                update(job_model)
+                .where(
+                    job_model.id == job_id,
+                    job_model.status.in_(
+                        (JobStatus.PENDING.value, JobStatus.RUNNING.value)
+                    ),
+                    self._claimable(now),
+                )
+                .values(
+                    status=JobStatus.RUNNING.value,
+                    owner=self.owner,
+                    heartbeat_at=now,
+                    started_at=func.coalesce(job_model.started_at, now),
+                )
+            )
+            if not getattr(result, "rowcount", 0):
+                await db.execute(
+                    update(job_model)
+                    .where(
+                        job_model.id == job_id,
+                        job_model.status == JobStatus.CANCELLING.value,
+                        self._claimable(now),
+                    )
+                    .values(status=JobStatus.CANCELLED.value, finished_at=now)
+                )
+                await db.commit()
+                return None
+            await db.commit()
+            return await db.get(job_model, job_id)
+
+    async def _heartbeat(self, job_id: int) -> None:
+        """Refresh the lease of a running job until cancelled."""
+        job_model = self.job_model
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                async with self._session() as db:
+                    await db.execute(
+                        update(job_model)
+                        .where(job_model.id == job_id, job_model.owner == self.owner)
+                        .values(heartbeat_at=datetime.now(UTC))
+                    )
+                    await db.commit()
+            except Exception as e:
+                logger.error(f"Error refreshing the lease of job {job_id}: {str(e)}")
+
+    async def _execute(self, job_id: int) -> None:
+        assert self._semaphore is not None
+        job_model = self.job_model
+
+        async with self._semaphore:
+            job = await self._claim(job_id)
+            if job is None:
+                return
+            handler = self.handlers.get(job.kind)
+            if handler is None:
+                async with self._session() as db:
+                    await self._finish(
+                        db,
+                        job_id,
+                        JobStatus.FAILED,
+                        error=f"No job handler registered for {job.kind!r}",
+                    )
+                return
+            params: dict[str, Any] = dict(job.params)
+            cursor = job.cursor
+            owned = job_model.id == job_id, job_model.owner == self.owner
+
+            heartbeat = asyncio.create_task(self._heartbeat(job_id))
+            try:
+                while True:
+                    chunk = await handler(dict(params), cursor)
+                    cursor = chunk.cursor
+                    async with self._session() as db:
+                        result = await db.execute(
+                            update(job_model)
+                            .where(*owned)
+                            .values(
+                                processed=job_model.processed + chunk.processed,
+                                cursor=cursor,
+                                heartbeat_at=datetime.now(UTC),
+                            )
+                        )
+                        if not getattr(result, "rowcount", 0):
+                            await db.rollback()
+                            logger.warning(
+                                f"Job {job_id} was taken over by another runner"
+                            )
+                            return
+                        if chunk.done:
+                            await self._finish(db, job_id, JobStatus.COMPLETED)
+                            return
+
+                        status = (
+                            await db.execute(
+                                select(job_model.status).where(job_model.id == job_id)
+                            )
+                        ).scalar_one()
+                        if status == JobStatus.CANCELLING.value:
+                            await self._finish(db, job_id, JobStatus.CANCELLED)
+                            return
+                        await db.commit()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job {job_id} failed: {str(e)}", exc_info=True)
+                async with self._session() as db:
+                    await self._finish(db, job_id, JobStatus.FAILED, error=str(e))
+            finally:
+                heartbeat.cancel()
+
+    async def _finish(
+        self,
+        db: AsyncSession,
+        job_id: int,
+        status: JobStatus,
+        error: Optional[str] = None,
+    ) -> None:
+        await db.execute(
+            update(self.job_model)
+            .where(self.job_model.id == job_id, self.job_model.owner == self.owner)
+            .values(status=status.value, error=error, finished_at=datetime.now(UTC))
+        )
+        await db.commit()
+
+    @staticmethod
+    def _to_dict(job: Any) -> dict[str, Any]:
+        return {column.key: getattr(job, column.key) for column in job.__table__.c}
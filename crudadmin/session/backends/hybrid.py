@@ -10,7 +10,7 @@ maintains a persistent record for monitoring and analytics.
 """
 
 import logging
-from typing import Optional, TypeVar, cast
+from typing import Any, Optional, TypeVar, cast
 
 from pydantic import BaseModel
 
@@ -110,6 +110,28 @@ class HybridSessionStorage(AbstractSessionStorage[T]):
 
         return result
 
+    async def update_fields(
+        self, session_id: str, model_class: type[T], fields: dict[str, Any]
+    ) -> bool:
+        """Set some fields of a session in both Redis and Database.
+
+        Args:
+            session_id: The session ID
+            model_class: The Pydantic model class of the session data
+            fields: Field values to set
+
+        Returns:
+            True if the session was updated in Redis, False if it didn't exist
+        """
+        result = await self.redis_storage.update_fields(session_id, model_class, fields)
+
+        try:
+            await self.database_storage.update_fields(session_id, model_class, fields)
+        except Exception as e:
+            logger.warning(f"Failed to update session audit trail in database: {e}")
+
+        return result
+
     async def delete(self, session_id: str) -> bool:
         """Delete session from Redis and mark as inactive in Database.
 
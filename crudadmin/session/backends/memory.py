@@ -1,3 +1,4 @@
+import heapq
 import json
 import logging
 import re
@@ -31,6 +32,47 @@ class MemorySessionStorage(AbstractSessionStorage[T]):
         super().__init__(prefix=prefix, expiration=expiration)
         self.data: dict[str, bytes] = {}
         self.expiry: dict[str, datetime] = {}
+        self._expiry_heap: list[tuple[datetime, str]] = []
+
+    def _set_expiry(self, key: str, seconds: int) -> None:
+        """Set the expiry of a key and record it in the expiry heap.
+
+        Superseded heap entries are skipped lazily when popped, and the heap is
+        rebuilt from ``self.expiry`` once stale entries outnumber live ones.
+
+        Args:
+            key: The storage key
+            seconds: Seconds until the key expires
+        """
+        expires_at = datetime.now(UTC) + timedelta(seconds=seconds)
+        self.expiry[key] = expires_at
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+
+        if len(self._expiry_heap) > 2 * len(self.expiry) + 64:
+            self._expiry_heap = [(when, k) for k, when in self.expiry.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def purge_expired(self) -> int:
+        """Remove all expired keys.
+
+        Pops entries off the expiry heap until the earliest one is still live,
+        so the cost is proportional to the number of expired keys rather than
+        the total number of keys.
+
+        Returns:
+            Number of keys removed
+        """
+        now = datetime.now(UTC)
+        removed = 0
+
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            expires_at, key = heapq.heappop(self._expiry_heap)
+            if self.expiry.get(key) == expires_at:
+                self.data.pop(key, None)
+                del self.expiry[key]
+                removed += 1
+
+        return removed
 
     async def create(
         self,
@@ -60,8 +102,9 @@ class MemorySessionStorage(AbstractSessionStorage[T]):
             json_data.encode("utf-8") if isinstance(json_data, str) else json_data
         )
 
+        self.purge_expired()
         self.data[key] = value_bytes
-        self.expiry[key] = datetime.now(UTC) + timedelta(seconds=exp)
+        self._set_expiry(key, exp)
 
         logger.debug(f"Created session {session_id} with expiration {exp}s")
         return session_id
@@ -129,7 +172,7 @@ class MemorySessionStorage(AbstractSessionStorage[T]):
 
         if reset_expiration:
             exp = expiration if expiration is not None else self.expiration
-            self.expiry[key] = datetime.now(UTC) + timedelta(seconds=exp)
+            self._set_expiry(key, exp)
 
         return True
 
@@ -165,7 +208,7 @@ class MemorySessionStorage(AbstractSessionStorage[T]):
         exp = expiration if expiration is not None else self.expiration
 
         if key in self.data and not self._check_expiry(key):
-            self.expiry[key] = datetime.now(UTC) + timedelta(seconds=exp)
+            self._set_expiry(key, exp)
             return True
         return False
 
@@ -227,6 +270,7 @@ class MemorySessionStorage(AbstractSessionStorage[T]):
         """Clear all data."""
         self.data.clear()
         self.expiry.clear()
+        self._expiry_heap.clear()
 
     async def delete_pattern(self, pattern: str) -> int:
         """Delete all keys matching a pattern.
@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import TYPE_CHECKING, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 from pydantic import BaseModel
 
@@ -8,25 +8,28 @@ from ..storage import AbstractSessionStorage
 
 if TYPE_CHECKING:
     from redis.asyncio import Redis
-    from redis.exceptions import RedisError
+    from redis.exceptions import RedisError, WatchError
 
 T = TypeVar("T", bound=BaseModel)
 logger = logging.getLogger(__name__)
 
 try:
     from redis.asyncio import Redis
-    from redis.exceptions import RedisError
+    from redis.exceptions import RedisError, WatchError
 
     REDIS_AVAILABLE = True
 except ImportError:
     Redis = None  # type: ignore
     RedisError = None  # type: ignore
+    WatchError = None  # type: ignore
     REDIS_AVAILABLE = False
 
 
 class RedisSessionStorage(AbstractSessionStorage[T]):
     """Redis implementation of session storage."""
 
+    UPDATE_FIELDS_ATTEMPTS = 3
+
     def __init__(
         self,
         prefix: str = "session:",
@@ -224,6 +227,59 @@ class RedisSessionStorage(AbstractSessionStorage[T]):
             logger.error(f"Error updating session: {e}")
             raise
 
+    async def update_fields(
+        self, session_id: str, model_class: type[T], fields: dict[str, Any]
+    ) -> bool:
+        """Set some fields of a session in one optimistic Redis transaction.
+
+        The session key is watched while it is read and merged, and the write
+        is retried if another request changed the session in between. After
+        UPDATE_FIELDS_ATTEMPTS conflicts the update is given up.
+
+        Args:
+            session_id: The session ID
+            model_class: The Pydantic model class of the session data
+            fields: Field values to set
+
+        Returns:
+            True if the session was updated, False if it didn't exist or kept
+            changing
+
+        Raises:
+            RedisError: If there is an error with Redis
+        """
+        key = self.get_key(session_id)
+
+        try:
+            async with self.client.pipeline() as pipeline:
+                for _ in range(self.UPDATE_FIELDS_ATTEMPTS):
+                    try:
+                        await pipeline.watch(key)
+                        raw = await pipeline.get(key)
+                        if raw is None:
+                            return False
+                        data = model_class.model_validate(json.loads(raw))
+                        pipeline.multi()  # type: ignore[no-untyped-call]
+                        pipeline.set(
+                            key,
+                            data.model_copy(update=fields).model_dump_json(),
+                            keepttl=True,
+                        )
+                        await pipeline.execute()
+                        return True
+                    except WatchError:
+                        continue
+
+            logger.warning(
+                f"Gave up updating fields of session {session_id} after "
+                f"{self.UPDATE_FIELDS_ATTEMPTS} conflicting writes"
+            )
+            return False
+
+        except self.RedisError as e:
+            logger.error(f"Error updating session fields: {e}")
+            raise
+
     async def delete(self, session_id: str) -> bool:
         """Delete a session from Redis.
 
@@ -1,11 +1,13 @@
+import asyncio
 import logging
 import secrets
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any, Literal, Optional
 
 from fastapi import Request, Response
 
-from ..core.rate_limiter import SimpleRateLimiter
+from ..core.rate_limiter import LoginPreFilter, RateLimiter
 from .schemas import CSRFToken, SessionCreate, SessionData, UserAgentInfo
 from .storage import AbstractSessionStorage, get_session_storage
 from .user_agents_types import parse
@@ -87,9 +89,12 @@ class SessionManager:
         session_timeout_minutes: int = 30,
         cleanup_interval_minutes: int = 15,
         csrf_token_bytes: int = 32,
-        rate_limiter: Optional[SimpleRateLimiter] = None,
+        rate_limiter: Optional[RateLimiter] = None,
         login_max_attempts: int = 5,
         login_window_minutes: int = 15,
+        login_prefilter: Optional[LoginPreFilter] = None,
+        user_agent_cache_size: int = 1024,
+        defer_user_agent_parsing: bool = False,
         session_backend: str = "memory",
         **backend_kwargs: Any,
     ):
@@ -104,6 +109,11 @@ class SessionManager:
             rate_limiter: Optional rate limiter implementation for login attempts
             login_max_attempts: Maximum failed login attempts before rate limiting
             login_window_minutes: Time window for tracking failed login attempts
+            login_prefilter: Optional per-process pre-filter that sheds abusive IPs
+                before they reach the rate limiter storage
+            user_agent_cache_size: Maximum number of parsed User-Agent strings to cache
+            defer_user_agent_parsing: Parse uncached User-Agent strings in a background
+                task after the session is created instead of on the login path
             session_backend: Backend type if creating storage automatically
             **backend_kwargs: Additional arguments for backend creation
         """
@@ -115,6 +125,11 @@ class SessionManager:
         self.rate_limiter = rate_limiter
         self.login_max_attempts = login_max_attempts
         self.login_window = timedelta(minutes=login_window_minutes)
+        self.login_prefilter = login_prefilter
+        self.user_agent_cache_size = user_agent_cache_size
+        self.defer_user_agent_parsing = defer_user_agent_parsing
+        self._user_agent_cache: OrderedDict[str, UserAgentInfo] = OrderedDict()
+        self._background_tasks: set[asyncio.Task[None]] = set()
 
         if session_storage is None:
             storage_settings = {
@@ -140,12 +155,42 @@ class SessionManager:
     def parse_user_agent(self, user_agent_string: str) -> UserAgentInfo:
         """Parse User-Agent string into structured information.
 
+        Results are kept in a bounded LRU cache keyed by the raw header, since
+        most logins come from a handful of browser strings.
+
         Args:
             user_agent_string: Raw User-Agent header
 
         Returns:
             Structured UserAgentInfo
         """
+        cached = self._get_cached_user_agent(user_agent_string)
+        if cached is not None:
+            return cached
+
+        info = self._parse_user_agent_uncached(user_agent_string)
+        self._cache_user_agent(user_agent_string, info)
+        return info.model_copy()
+
+    def _get_cached_user_agent(self, user_agent_string: str) -> Optional[UserAgentInfo]:
+        """Get a copy of a cached parse result, if any."""
+        cached = self._user_agent_cache.get(user_agent_string)
+        if cached is None:
+            return None
+        self._user_agent_cache.move_to_end(user_agent_string)
+        return cached.model_copy()
+
+    def _cache_user_agent(self, user_agent_string: str, info: UserAgentInfo) -> None:
+        """Store a parse result, evicting the least recently used entry."""
+        if self.user_agent_cache_size <= 0:
+            return
+        self._user_agent_cache[user_agent_string] = info
+        self._user_agent_cache.move_to_end(user_agent_string)
+        if len(self._user_agent_cache) > self.user_agent_cache_size:
+            self._user_agent_cache.popitem(last=False)
+
+    def _parse_user_agent_uncached(self, user_agent_string: str) -> UserAgentInfo:
+        """Run the User-Agent parser."""
         ua_parser = parse(user_agent_string)
         return UserAgentInfo(
             browser=ua_parser.browser.family,
@@ -184,7 +229,13 @@ class SessionManager:
                 logger.error("Request client is None. Cannot retrieve IP address.")
                 raise ValueError("Invalid request client.")
 
-            device_info = self.parse_user_agent(user_agent).model_dump()
+            parse_deferred = False
+            if self.defer_user_agent_parsing:
+                cached_info = self._get_cached_user_agent(user_agent)
+                parse_deferred = cached_info is None
+                device_info = cached_info.model_dump() if cached_info else {}
+            else:
+                device_info = self.parse_user_agent(user_agent).model_dump()
 
             ip_address = (
                 request.headers.get("x-forwarded-for", client.host)
@@ -207,6 +258,13 @@ class SessionManager:
             session_id = await self.storage.create(session_data)
             csrf_token = await self._generate_csrf_token(user_id, session_id)
 
+            if parse_deferred:
+                task = asyncio.create_task(
+                    self._complete_device_info(session_id, user_agent)
+                )
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+
             logger.info(f"Session {session_id} created successfully")
             return session_id, csrf_token
 
@@ -214,6 +272,26 @@ class SessionManager:
             logger.error(f"Error creating session: {str(e)}", exc_info=True)
             raise
 
+    async def _complete_device_info(self, session_id: str, user_agent: str) -> None:
+        """Parse a User-Agent in a worker thread and patch it into a session.
+
+        Used when defer_user_agent_parsing is enabled, so the parse happens after
+        the login response instead of on the login path.
+
+        Args:
+            session_id: The session to update
+            user_agent: Raw User-Agent header
+        """
+        try:
+            info = await asyncio.to_thread(self._parse_user_agent_uncached, user_agent)
+            self._cache_user_agent(user_agent, info)
+
+            await self.storage.update_fields(
+                session_id, SessionData, {"device_info": info.model_dump()}
+            )
+        except Exception as e:
+            logger.warning(f"Error updating device info for session {session_id}: {e}")
+
     async def validate_session(
         self, session_id: str, update_activity: bool = True
     ) -> Optional[SessionData]:
@@ -647,8 +725,14 @@ class SessionManager:
         try:
             ip_key = f"login:ip:{ip_address}"
             username_key = f"login:user:{username}"
+            expiry_seconds = int(self.login_window.total_seconds())
+
+            if self.login_prefilter is not None:
+                await self._sync_login_prefilter(expiry_seconds)
 
             if success:
+                if self.login_prefilter is not None:
+                    self.login_prefilter.reset(ip_address)
                 try:
                     await self.rate_limiter.delete(ip_key)
                     await self.rate_limiter.delete(username_key)
@@ -659,8 +743,15 @@ class SessionManager:
                     )
                     return True, None
 
+            if self.login_prefilter is not None and not self.login_prefilter.allow(
+                ip_address
+            ):
+                logger.warning(
+                    f"Login attempt shed by local pre-filter: {ip_address}, username: {username}"
+                )
+                return False, 0
+
             try:
-                expiry_seconds = int(self.login_window.total_seconds())
                 ip_count = await self.rate_limiter.increment(ip_key, 1, expiry_seconds)
                 username_count = await self.rate_limiter.increment(
                     username_key, 1, expiry_seconds
@@ -678,6 +769,11 @@ class SessionManager:
                 logger.warning(
                     f"Rate limit exceeded for login: {ip_address}, username: {username}, attempts: {attempt_count}"
                 )
+                if (
+                    self.login_prefilter is not None
+                    and ip_count > self.login_max_attempts
+                ):
+                    self.login_prefilter.block(ip_address, expiry_seconds)
 
             return is_allowed, remaining
 
@@ -685,18 +781,43 @@ class SessionManager:
             logger.error(f"Unexpected error in login rate limiting: {e}", exc_info=True)
             return True, None
 
+    async def _sync_login_prefilter(self, expiry_seconds: int) -> None:
+        """Push attempts shed by the local pre-filter to the rate limiter.
+
+        The distributed counter stays the source of truth, so attempts rejected
+        locally are added to the shared IP counters once per sync interval.
+
+        Args:
+            expiry_seconds: Expiry for the rate limit keys
+        """
+        if (
+            self.login_prefilter is None
+            or self.rate_limiter is None
+            or not self.login_prefilter.should_sync()
+        ):
+            return
+
+        for ip_address, count in self.login_prefilter.pop_pending().items():
+            try:
+                await self.rate_limiter.increment(
+                    f"login:ip:{ip_address}", count, expiry_seconds
+                )
+            except Exception as e:
+                logger.warning(f"Error syncing login pre-filter counts: {e}")
+
     async def cleanup_rate_limits(self) -> None:
         """Clean up expired rate limit records.
 
-        This should be called periodically along with session cleanup.
+        Rate limit counters carry their own TTL and expire individually, so
+        this never scans or deletes by pattern; it only lets backends without
+        native expiry reclaim keys whose TTL has passed.
         """
         if not self.rate_limiter:
             return
 
         try:
-            if hasattr(self.rate_limiter, "delete_pattern"):
-                await self.rate_limiter.delete_pattern("login:*")
-            else:
-                logger.debug("Rate limiter does not support pattern-based cleanup")
+            if hasattr(self.rate_limiter, "purge_expired"):
+                removed = await self.rate_limiter.purge_expired()
+                logger.debug(f"Purged {removed} expired rate limit records")
         except Exception as e:
             logger.error(f"Error cleaning up rate limit records: {e}", exc_info=True)
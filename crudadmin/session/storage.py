@@ -98,6 +98,31 @@ class AbstractSessionStorage(Generic[T], ABC):
         """
         pass
 
+    async def update_fields(
+        self, session_id: str, model_class: Type[T], fields: dict[str, Any]
+    ) -> bool:
+        """Set some fields of a session, keeping its other fields and expiration.
+
+        Unlike update, which writes back a whole session read earlier, the
+        stored session is re-read right before the write, so fields changed by
+        concurrent requests (such as last_activity) are not overwritten.
+        Backends that can change fields atomically override this.
+
+        Args:
+            session_id: The session ID
+            model_class: The Pydantic model class of the session data
+            fields: Field values to set
+
+        Returns:
+            True if the session was updated, False if it didn't exist
+        """
+        data = await self.get(session_id, model_class)
+        if data is None:
+            return False
+        return await self.update(
+            session_id, data.model_copy(update=fields), reset_expiration=False
+        )
+
     @abstractmethod
     async def delete(self, session_id: str) -> bool:
         """Delete a session.
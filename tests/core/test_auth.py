@@ -1,4 +1,8 @@
+import asyncio
 import logging
+import os
+import threading
+import time
 from unittest.mock import AsyncMock, patch
 
 import bcrypt
@@ -6,11 +10,14 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from crudadmin.core.auth import (
+    PasswordHashPool,
     authenticate_user_by_credentials,
     convert_user_to_dict,
     get_password_hash,
+    hash_password,
     verify_password,
 )
+from crudadmin.core.exceptions import RateLimitException
 
 
 class TestVerifyPassword:
@@ -320,6 +327,138 @@ class TestConvertUserToDict:
         assert result is None
 
 
+class TestPasswordHashPool:
+    """Test cases for the bounded password hashing pool."""
+
+    @pytest.mark.asyncio
+    async def test_hash_password_roundtrip(self):
+        """Test hashing and verifying through the pool."""
+        hashed = await hash_password("pool_password")
+
+        assert await verify_password("pool_password", hashed) is True
+        assert await verify_password("wrong_password", hashed) is False
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_saturated(self):
+        """Test that calls beyond max_pending are rejected with a 429."""
+        pool = PasswordHashPool(max_workers=1, max_pending=1)
+        release = threading.Event()
+
+        try:
+            blocked = asyncio.ensure_future(pool.run(release.wait, 5))
+            await asyncio.sleep(0.05)
+
+            with pytest.raises(RateLimitException) as exc_info:
+                await pool.run(lambda: None)
+            assert exc_info.value.status_code == 429
+
+            release.set()
+            assert await blocked is True
+            assert pool.pending == 0
+        finally:
+            release.set()
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency_off_the_event_loop(self):
+        """Test that hashing runs on at most max_workers threads, off the loop."""
+        pool = PasswordHashPool(max_workers=2, max_pending=8)
+        release = threading.Event()
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def hash_work():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            release.wait(5)
+            with lock:
+                active -= 1
+
+        try:
+            calls = [asyncio.ensure_future(pool.run(hash_work)) for _ in range(6)]
+            await asyncio.sleep(0.05)
+
+            assert not any(call.done() for call in calls)
+            assert pool.pending == 6
+
+            release.set()
+            await asyncio.gather(*calls)
+            assert peak <= 2
+            assert pool.pending == 0
+        finally:
+            release.set()
+            pool.shutdown()
+
+    @pytest.mark.benchmark
+    @pytest.mark.skipif(
+        not os.environ.get("CRUDADMIN_BENCHMARK"),
+        reason="benchmark; set CRUDADMIN_BENCHMARK=1 to run",
+    )
+    @pytest.mark.asyncio
+    async def test_benchmark_unrelated_latency_during_login_storm(self):
+        """Benchmark: p99 latency of unrelated requests while 16 logins verify."""
+        hashed = bcrypt.hashpw(b"storm_password", bcrypt.gensalt()).decode()
+
+        async def p99_lag(storm):
+            lags = []
+            done = False
+
+            async def unrelated_request():
+                while not done:
+                    start = time.perf_counter()
+                    await asyncio.sleep(0.005)
+                    lags.append(time.perf_counter() - start - 0.005)
+
+            ticker = asyncio.ensure_future(unrelated_request())
+            await asyncio.sleep(0)
+            await storm()
+            done = True
+            await ticker
+            lags.sort()
+            return lags[max(0, int(len(lags) * 0.99) - 1)]
+
+        async def on_the_loop():
+            for _ in range(16):
+                bcrypt.checkpw(b"storm_password", hashed.encode())
+                await asyncio.sleep(0)
+
+        async def in_the_pool():
+            await asyncio.gather(
+                *[verify_password("storm_password", hashed) for _ in range(16)]
+            )
+
+        blocking = await p99_lag(on_the_loop)
+        pooled = await p99_lag(in_the_pool)
+        print(
+            f"p99 lag: {blocking * 1000:.1f} ms on the loop, {pooled * 1000:.1f} ms pooled"
+        )
+
+        assert pooled < blocking
+
+    @pytest.mark.asyncio
+    async def test_authenticate_propagates_saturation(self):
+        """Test that a saturated pool surfaces as 429 instead of bad credentials."""
+        mock_db = AsyncMock(spec=AsyncSession)
+        mock_crud_users = AsyncMock()
+        mock_crud_users.get.return_value = {
+            "id": 1,
+            "username": "testuser",
+            "hashed_password": get_password_hash("password"),
+        }
+
+        with patch(
+            "crudadmin.core.auth.verify_password",
+            side_effect=RateLimitException("saturated"),
+        ):
+            with pytest.raises(RateLimitException):
+                await authenticate_user_by_credentials(
+                    "testuser", "password", mock_db, mock_crud_users
+                )
+
+
 class TestAuthenticateUserByCredentials:
     """Test cases for authenticate_user_by_credentials function."""
 
@@ -0,0 +1,202 @@
+from unittest.mock import AsyncMock
+
+import bcrypt
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crudadmin.core import hashers
+from crudadmin.core.auth import (
+    authenticate_user_by_credentials,
+    get_password_hash,
+    verify_password,
+)
+from crudadmin.core.hashers import (
+    ARGON2_AVAILABLE,
+    Argon2Hasher,
+    BcryptHasher,
+    ScryptHasher,
+    calibrate_hasher,
+    get_hasher,
+    identify_hasher,
+    needs_rehash,
+    set_default_hasher,
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_default_hasher():
+    """Restore the hasher registry after each test."""
+    registered = dict(hashers._hashers)
+    default = hashers._default_hasher
+    yield
+    hashers._hashers.clear()
+    hashers._hashers.update(registered)
+    hashers._default_hasher = default
+
+
+class TestHashers:
+    """Test cases for the individual password hashers."""
+
+    @pytest.mark.parametrize(
+        "hasher",
+        [
+            BcryptHasher(rounds=4),
+            ScryptHasher(log_n=10),
+            pytest.param(
+                "argon2",
+                marks=pytest.mark.skipif(
+                    not ARGON2_AVAILABLE, reason="argon2-cffi not installed"
+                ),
+            ),
+        ],
+    )
+    def test_hash_and_verify(self, hasher):
+        """Test that each hasher verifies its own hashes."""
+        if hasher == "argon2":
+            hasher = Argon2Hasher(time_cost=1, memory_cost=1024, parallelism=1)
+
+        hashed = hasher.hash("s3cret!")
+
+        assert hasher.identify(hashed)
+        assert hasher.verify("s3cret!", hashed) is True
+        assert hasher.verify("wrong", hashed) is False
+        assert hasher.needs_rehash(hashed) is False
+        assert hasher.with_cost(hasher.cost + 1).needs_rehash(hashed) is True
+
+    def test_identify_hasher(self):
+        """Test that hashes are routed to the algorithm that produced them."""
+        bcrypt_hash = BcryptHasher(rounds=4).hash("password")
+        scrypt_hash = ScryptHasher(log_n=10).hash("password")
+
+        assert identify_hasher(bcrypt_hash).name == "bcrypt"
+        assert identify_hasher(scrypt_hash).name == "scrypt"
+        assert identify_hasher("not-a-hash") is None
+
+    def test_set_default_hasher(self):
+        """Test switching the default hasher by name and instance."""
+        assert get_hasher().name == "bcrypt"
+
+        set_default_hasher(ScryptHasher(log_n=10))
+        assert get_hasher().name == "scrypt"
+        assert get_password_hash("password").startswith("$scrypt$")
+
+        with pytest.raises(ValueError, match="Unknown password hasher"):
+            set_default_hasher("md5")
+
+    def test_needs_rehash_on_algorithm_or_cost_change(self):
+        """Test that hashes from other algorithms or costs need rehashing."""
+        set_default_hasher(BcryptHasher(rounds=5))
+
+        assert needs_rehash(BcryptHasher(rounds=4).hash("password")) is True
+        assert needs_rehash(BcryptHasher(rounds=5).hash("password")) is False
+        assert needs_rehash(ScryptHasher(log_n=10).hash("password")) is True
+
+    def test_calibrate_hasher(self):
+        """Test that calibration stops at the target latency or the cost limit."""
+        fast = calibrate_hasher("bcrypt", target_ms=0)
+        assert fast.cost == 4
+
+        capped = calibrate_hasher("bcrypt", target_ms=10_000, max_cost=6)
+        assert capped.cost == 6
+
+
+class TestTransparentRehash:
+    """Test cases for rehashing on successful login."""
+
+    @pytest.mark.asyncio
+    async def test_verify_password_with_non_default_algorithm(self):
+        """Test that hashes keep verifying after the default changes."""
+        scrypt_hash = ScryptHasher(log_n=10).hash("password")
+
+        set_default_hasher(BcryptHasher(rounds=4))
+        assert await verify_password("password", scrypt_hash) is True
+
+    @pytest.mark.asyncio
+    async def test_outdated_hash_is_upgraded_on_login(self):
+        """Test that a successful login replaces an outdated hash."""
+        old_hash = bcrypt.hashpw(b"password", bcrypt.gensalt(4)).decode()
+        set_default_hasher(BcryptHasher(rounds=5))
+
+        mock_db = AsyncMock(spec=AsyncSession)
+        mock_crud_users = AsyncMock()
+        mock_crud_users.get.return_value = {
+            "id": 7,
+            "username": "testuser",
+            "hashed_password": old_hash,
+        }
+
+        result = await authenticate_user_by_credentials(
+            "testuser", "password", mock_db, mock_crud_users
+        )
+
+        assert result is not None
+        mock_crud_users.update.assert_awaited_once()
+        new_hash = mock_crud_users.update.call_args.kwargs["object"]["hashed_password"]
+        assert mock_crud_users.update.call_args.kwargs["id"] == 7
+        assert new_hash.startswith("$2b$05$")
+        assert result["hashed_password"] == new_hash
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not ARGON2_AVAILABLE, reason="argon2-cffi not installed")
+    async def test_bcrypt_login_after_switching_to_argon2(self):
+        """Test that bcrypt users log in and are migrated once argon2 is the default."""
+        old_hash = bcrypt.hashpw(b"password", bcrypt.gensalt(4)).decode()
+        set_default_hasher(Argon2Hasher(time_cost=1, memory_cost=1024, parallelism=1))
+
+        mock_db = AsyncMock(spec=AsyncSession)
+        mock_crud_users = AsyncMock()
+        mock_crud_users.get.return_value = {
+            "id": 7,
+            "username": "testuser",
+            "hashed_password": old_hash,
+        }
+
+        result = await authenticate_user_by_credentials(
+            "testuser", "password", mock_db, mock_crud_users
+        )
+
+        assert result is not None
+        assert result["hashed_password"].startswith("$argon2id$")
+        assert await verify_password("password", result["hashed_password"]) is True
+
+    @pytest.mark.asyncio
+    async def test_current_hash_is_not_rewritten(self):
+        """Test that up to date hashes are left alone."""
+        set_default_hasher(BcryptHasher(rounds=4))
+
+        mock_db = AsyncMock(spec=AsyncSession)
+        mock_crud_users = AsyncMock()
+        mock_crud_users.get.return_value = {
+            "id": 7,
+            "username": "testuser",
+            "hashed_password": get_password_hash("password"),
+        }
+
+        result = await authenticate_user_by_credentials(
+            "testuser", "password", mock_db, mock_crud_users
+        )
+
+        assert result is not None
+        mock_crud_users.update.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_rehash_failure_does_not_fail_login(self):
+        """Test that a failed hash upgrade still lets the user in."""
+        old_hash = bcrypt.hashpw(b"password", bcrypt.gensalt(4)).decode()
+        set_default_hasher(BcryptHasher(rounds=5))
+
+        mock_db = AsyncMock(spec=AsyncSession)
+        mock_crud_users = AsyncMock()
+        mock_crud_users.get.return_value = {
+            "id": 7,
+            "username": "testuser",
+            "hashed_password": old_hash,
+        }
+        mock_crud_users.update.side_effect = Exception("database is read-only")
+
+        result = await authenticate_user_by_credentials(
+            "testuser", "password", mock_db, mock_crud_users
+        )
+
+        assert result is not None
+        assert result["hashed_password"] == old_hash
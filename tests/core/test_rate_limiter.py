@@ -4,6 +4,8 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from crudadmin.core.rate_limiter import (
+    DatabaseRateLimiter,
+    LoginPreFilter,
     RateLimitData,
     SimpleRateLimiter,
     create_rate_limiter,
@@ -210,6 +212,88 @@ class TestCreateRateLimiter:
             create_rate_limiter("invalid_backend")
 
 
+class TestDatabaseRateLimiter:
+    """Test the admin database backed rate limiter."""
+
+    @pytest.fixture
+    async def rate_limiter(self, db_config):
+        """Create a database rate limiter for testing."""
+        return DatabaseRateLimiter(db_config)
+
+    @pytest.mark.asyncio
+    async def test_increment(self, rate_limiter):
+        """Test that increments are counted atomically per key."""
+        assert await rate_limiter.increment("login:ip:1", 1, 60) == 1
+        assert await rate_limiter.increment("login:ip:1", 1, 60) == 2
+        assert await rate_limiter.increment("login:ip:1", 3, 60) == 5
+        assert await rate_limiter.increment("login:ip:2", 1, 60) == 1
+
+        assert await rate_limiter.get_count("login:ip:1") == 5
+
+    @pytest.mark.asyncio
+    async def test_concurrent_increments(self, tmp_path):
+        """Test that concurrent increments from separate connections are not lost."""
+        import asyncio
+
+        from sqlalchemy.orm import DeclarativeBase
+
+        from crudadmin.core.db import DatabaseConfig
+
+        class AdminBase(DeclarativeBase):
+            pass
+
+        config = DatabaseConfig(
+            base=AdminBase,
+            session=AsyncMock(),
+            admin_db_url=f"sqlite+aiosqlite:///{tmp_path / 'admin.db'}",
+        )
+        rate_limiter = DatabaseRateLimiter(config)
+
+        try:
+            results = await asyncio.gather(
+                *[rate_limiter.increment("concurrent", 1, 60) for _ in range(10)]
+            )
+
+            assert sorted(results) == list(range(1, 11))
+            assert await rate_limiter.get_count("concurrent") == 10
+        finally:
+            await config.admin_engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_expired_window_resets(self, rate_limiter):
+        """Test that an expired counter restarts from the increment."""
+        await rate_limiter.increment("key", 5, -1)
+
+        assert await rate_limiter.get_count("key") == 0
+        assert await rate_limiter.increment("key", 1, 60) == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_and_purge(self, rate_limiter):
+        """Test deleting keys and purging expired counters in bulk."""
+        await rate_limiter.increment("active", 1, 60)
+        await rate_limiter.increment("deleted", 1, 60)
+        await rate_limiter.increment("expired_1", 1, -1)
+        await rate_limiter.increment("expired_2", 1, -1)
+
+        await rate_limiter.delete("deleted")
+        assert await rate_limiter.get_count("deleted") == 0
+
+        assert await rate_limiter.purge_expired() == 2
+        assert await rate_limiter.get_count("active") == 1
+
+    @pytest.mark.asyncio
+    async def test_created_through_factory(self, db_config):
+        """Test creating the database rate limiter through the factory."""
+        rate_limiter = create_rate_limiter("database", db_config=db_config)
+
+        assert isinstance(rate_limiter, DatabaseRateLimiter)
+        assert rate_limiter.prefix == "rate_limit:"
+        assert db_config.AdminRateLimit is rate_limiter.model
+
+        with pytest.raises(ValueError, match="db_config is required"):
+            create_rate_limiter("database")
+
+
 class TestRateLimiterIntegration:
     """Integration tests for rate limiter with different backends."""
 
@@ -370,3 +454,68 @@ class TestRateLimiterPerformance:
 
         finally:
             await rate_limiter.close()
+
+
+class TestLoginPreFilter:
+    """Test the per-process login pre-filter."""
+
+    def test_allows_up_to_capacity(self):
+        """Test that a key is allowed until its bucket is drained."""
+        prefilter = LoginPreFilter(capacity=3, window_seconds=900)
+
+        assert [prefilter.allow("10.0.0.1") for _ in range(4)] == [
+            True,
+            True,
+            True,
+            False,
+        ]
+        assert prefilter.allow("10.0.0.2") is True
+
+    def test_shed_attempts_are_pending(self):
+        """Test that shed attempts are handed back for syncing."""
+        prefilter = LoginPreFilter(capacity=1, window_seconds=900)
+
+        prefilter.allow("10.0.0.1")
+        prefilter.allow("10.0.0.1")
+        prefilter.allow("10.0.0.1")
+
+        assert prefilter.pop_pending() == {"10.0.0.1": 2}
+        assert prefilter.pop_pending() == {}
+
+    def test_refill(self):
+        """Test that tokens refill over time."""
+        prefilter = LoginPreFilter(capacity=1, window_seconds=1)
+
+        assert prefilter.allow("10.0.0.1") is True
+        assert prefilter.allow("10.0.0.1") is False
+
+        time.sleep(1.1)
+        assert prefilter.allow("10.0.0.1") is True
+
+    def test_block_and_reset(self):
+        """Test blocking a key and resetting it."""
+        prefilter = LoginPreFilter(capacity=5, window_seconds=900)
+
+        prefilter.block("10.0.0.1", 60)
+        assert prefilter.allow("10.0.0.1") is False
+
+        prefilter.reset("10.0.0.1")
+        assert prefilter.allow("10.0.0.1") is True
+
+    def test_bounded_entries(self):
+        """Test that the least recently used keys are evicted."""
+        prefilter = LoginPreFilter(capacity=1, window_seconds=900, max_entries=2)
+
+        prefilter.allow("a")
+        prefilter.allow("b")
+        prefilter.allow("c")
+
+        assert len(prefilter._buckets) == 2
+        assert prefilter.allow("a") is True
+
+    def test_invalid_configuration(self):
+        """Test that invalid configuration is rejected."""
+        with pytest.raises(ValueError):
+            LoginPreFilter(capacity=0)
+        with pytest.raises(ValueError):
+            LoginPreFilter(window_seconds=0)
@@ -325,6 +325,29 @@ async def test_crud_admin_setup_event_routes(async_session):
     admin.setup_event_routes()
 
 
+@pytest.mark.asyncio
+async def test_crud_admin_setup_registers_all_event_routes(async_session):
+    """Test that setup registers every event management route."""
+    secret_key = "test-secret-key-for-testing-only-32-chars"
+    db_config = create_test_db_config(async_session, include_event_models=True)
+
+    admin = CRUDAdmin(
+        session=async_session,
+        SECRET_KEY=secret_key,
+        track_events=True,
+        db_config=db_config,
+    )
+
+    paths = {getattr(route, "path", None) for route in admin.router.routes}
+    assert {
+        "/management/events",
+        "/management/events/content",
+        "/management/events/export",
+        "/management/events/activity",
+        "/management/events/{event_id}/details",
+    } <= paths
+
+
 @pytest.mark.asyncio
 async def test_crud_admin_initialize(async_session):
     """Test CRUDAdmin initialization process."""
@@ -0,0 +1,153 @@
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy.orm import DeclarativeBase
+
+from crudadmin.admin_interface.model_view import ModelView
+from crudadmin.core.db import DatabaseConfig
+
+
+def _model_view(
+    async_session, product_model, create_schema, update_schema, select_schema=None
+):
+    class AdminBase(DeclarativeBase):
+        pass
+
+    async def get_session():
+        yield async_session
+
+    db_config = DatabaseConfig(
+        base=AdminBase,
+        session=get_session,
+        admin_db_url="sqlite+aiosqlite:///:memory:",
+    )
+    admin_site = Mock()
+    admin_site.admin_authentication.get_current_user.return_value = Mock()
+
+    return ModelView(
+        database_config=db_config,
+        templates=Mock(),
+        model=product_model,
+        allowed_actions={"view", "create", "update", "delete"},
+        create_schema=create_schema,
+        update_schema=update_schema,
+        select_schema=select_schema,
+        admin_site=admin_site,
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_row_returns_new_state(
+    async_session, product_model, product_create_schema, product_update_schema
+):
+    """Test that one read and one UPDATE ... RETURNING capture both states."""
+    async_session.add(product_model(id=1, name="Old", price=10))
+    await async_session.commit()
+    view = _model_view(
+        async_session, product_model, product_create_schema, product_update_schema
+    )
+
+    previous = await view._read_row_for_update(async_session, 1)
+    new = await view._update_row(
+        async_session, 1, product_update_schema(name="New"), previous
+    )
+    await async_session.commit()
+
+    assert previous["name"] == "Old"
+    assert new["name"] == "New"
+    assert new["price"] == 10
+    assert new["updated_at"] is not None
+    assert await view._read_row_for_update(async_session, 2) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("returning", [True, False])
+async def test_update_row_states_use_select_schema_fields(
+    async_session,
+    product_model,
+    product_create_schema,
+    product_update_schema,
+    returning,
+):
+    """Test that audit states hold only select_schema fields, with or without RETURNING."""
+
+    class ProductSelect(BaseModel):
+        id: int
+        name: str
+
+    async_session.add(product_model(id=1, name="Old", price=10))
+    await async_session.commit()
+    view = _model_view(
+        async_session,
+        product_model,
+        product_create_schema,
+        product_update_schema,
+        select_schema=ProductSelect,
+    )
+    view._supports_returning = Mock(return_value=returning)
+
+    previous = await view._read_row_for_update(async_session, 1)
+    new = await view._update_row(
+        async_session, 1, product_update_schema(name="New", price=20), previous
+    )
+    await async_session.commit()
+
+    assert previous == {"id": 1, "name": "Old"}
+    assert new == {"id": 1, "name": "New"}
+    product = await view.crud.get(async_session, id=1)
+    assert product["price"] == 20
+
+
+@pytest.mark.asyncio
+async def test_update_row_rejects_unknown_columns(
+    async_session, product_model, product_create_schema, product_update_schema
+):
+    """Test that fields that are not model columns are rejected."""
+    async_session.add(product_model(id=1, name="Old", price=10))
+    await async_session.commit()
+    view = _model_view(
+        async_session, product_model, product_create_schema, product_update_schema
+    )
+
+    with pytest.raises(ValueError):
+        await view._update_row(async_session, 1, {"colour": "red"}, {})
+
+
+@pytest.mark.asyncio
+async def test_delete_rows_in_chunks(
+    async_session, user_model, user_create_schema, user_update_schema
+):
+    """Test that bulk deletes return the deleted rows across chunks."""
+    for i in range(5):
+        async_session.add(user_model(id=i + 1, username=f"u{i}", email=f"u{i}@x.io"))
+    await async_session.commit()
+    view = _model_view(
+        async_session, user_model, user_create_schema, user_update_schema
+    )
+    view.delete_chunk_size = 2
+
+    deleted = await view._delete_rows(async_session, [1, 2, 3, 5, 99])
+    await async_session.commit()
+
+    assert sorted(row["username"] for row in deleted) == ["u0", "u1", "u2", "u4"]
+    assert await view.crud.count(async_session) == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_rows_soft_deletes(
+    async_session, product_model, product_create_schema, product_update_schema
+):
+    """Test that models with is_deleted/deleted_at are soft deleted."""
+    async_session.add(product_model(id=1, name="Old", price=10))
+    await async_session.commit()
+    view = _model_view(
+        async_session, product_model, product_create_schema, product_update_schema
+    )
+
+    deleted = await view._delete_rows(async_session, [1])
+    await async_session.commit()
+
+    assert deleted[0]["is_deleted"] is True
+    assert deleted[0]["deleted_at"] is not None
+    assert await view.crud.count(async_session, is_deleted=True) == 1
@@ -0,0 +1,307 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.orm import DeclarativeBase
+
+from crudadmin.admin_interface.auth import AdminAuthentication
+from crudadmin.admin_interface.model_view import ModelView
+from crudadmin.admin_user.schemas import AdminUserCreateInternal
+from crudadmin.core.db import DatabaseConfig
+from crudadmin.job import JobRunner, create_admin_job
+
+
+def _model_view(
+    async_session, user_model, create_schema, update_schema, job_runner=None
+):
+    class AdminBase(DeclarativeBase):
+        pass
+
+    async def get_session():
+        yield async_session
+
+    db_config = DatabaseConfig(
+        base=AdminBase,
+        session=get_session,
+        admin_db_url="sqlite+aiosqlite:///:memory:",
+    )
+    admin_site = Mock()
+    admin_site.admin_authentication.get_current_user.return_value = Mock()
+
+    return ModelView(
+        database_config=db_config,
+        templates=Mock(),
+        model=user_model,
+        allowed_actions={"view", "create", "update", "delete"},
+        create_schema=create_schema,
+        update_schema=update_schema,
+        admin_site=admin_site,
+        secret_key="test-secret",
+        job_runner=job_runner,
+    )
+
+
+async def _post(view, async_session, body, user_id=1, current_user=None):
+    request = Mock()
+    request.json = AsyncMock(return_value=body)
+    request.cookies = {}
+    response = await view.bulk_action_endpoint()(
+        request=request,
+        db=async_session,
+        admin_db=Mock(),
+        current_user=current_user or {"id": user_id},
+    )
+    return response.status_code, json.loads(response.body)
+
+
+async def _seed(async_session, user_model):
+    for i in range(5):
+        domain = "example.com" if i < 3 else "other.io"
+        async_session.add(
+            user_model(id=i + 1, username=f"u{i}", email=f"u{i}@{domain}")
+        )
+    await async_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_dry_run_then_confirm(
+    async_session, user_model, user_create_schema, user_update_schema
+):
+    """Test that a dry run counts the filter and its token runs the update."""
+    await _seed(async_session, user_model)
+    view = _model_view(
+        async_session, user_model, user_create_schema, user_update_schema
+    )
+    body = {
+        "action": "update",
+        "field": "is_active",
+        "value": False,
+        "search_column": "email",
+        "search_value": "example.com",
+    }
+
+    status, preview = await _post(view, async_session, body)
+    assert status == 200
+    assert preview["count"] == 3
+    assert await view.crud.count(async_session, is_active=False) == 0
+
+    status, result = await _post(
+        view,
+        async_session,
+        {**body, "confirmation_token": preview["confirmation_token"]},
+    )
+    assert status == 200
+    assert result == {"action": "update", "count": 3}
+    assert await view.crud.count(async_session, is_active=False) == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_rolls_back_when_count_changed(
+    async_session, user_model, user_create_schema, user_update_schema
+):
+    """Test that records matching after the dry run abort the delete."""
+    await _seed(async_session, user_model)
+    view = _model_view(
+        async_session, user_model, user_create_schema, user_update_schema
+    )
+    body = {"action": "delete", "search_column": "email", "search_value": "other.io"}
+
+    _, preview = await _post(view, async_session, body)
+    async_session.add(user_model(id=6, username="u5", email="u5@other.io"))
+    await async_session.commit()
+
+    status, _ = await _post(
+        view,
+        async_session,
+        {**body, "confirmation_token": preview["confirmation_token"]},
+    )
+    assert status == 409
+    assert await view.crud.count(async_session) == 6
+
+
+@pytest.mark.asyncio
+async def test_bulk_action_token_is_bound_to_request(
+    async_session, user_model, user_create_schema, user_update_schema
+):
+    """Test that tokens fail for another filter, another user or after expiry."""
+    await _seed(async_session, user_model)
+    view = _model_view(
+        async_session, user_model, user_create_schema, user_update_schema
+    )
+    body = {"action": "delete", "search_column": "email", "search_value": "other.io"}
+    _, preview = await _post(view, async_session, body)
+    token = preview["confirmation_token"]
+
+    status, _ = await _post(
+        view,
+        async_session,
+        {**body, "search_value": "", "confirmation_token": token},
+    )
+    assert status == 400
+    status, _ = await _post(
+        view, async_session, {**body, "confirmation_token": token}, user_id=2
+    )
+    assert status == 400
+
+    view.BULK_ACTION_TOKEN_TTL = -1
+    _, preview = await _post(view, async_session, body)
+    status, result = await _post(
+        view,
+        async_session,
+        {**body, "confirmation_token": preview["confirmation_token"]},
+    )
+    assert status == 400
+    assert "expired" in result["detail"][0]["message"]
+    assert await view.crud.count(async_session) == 5
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_rejects_non_updatable_fields(
+    async_session, user_model, user_create_schema, user_update_schema
+):
+    """Test that only update schema columns other than the key can be set."""
+    await _seed(async_session, user_model)
+    view = _model_view(
+        async_session, user_model, user_create_schema, user_update_schema
+    )
+
+    status, _ = await _post(
+        view, async_session, {"action": "update", "field": "id", "value": 9}
+    )
+    assert status == 400
+    status, _ = await _post(
+        view, async_session, {"action": "update", "field": "is_active", "value": []}
+    )
+    assert status == 422
+    status, _ = await _post(view, async_session, {"action": "archive"})
+    assert status == 422
+
+
+@pytest.mark.asyncio
+async def test_bulk_action_requires_a_filter_or_all_records(
+    async_session, user_model, user_create_schema, user_update_schema
+):
+    """Test that a search giving no filter never falls back to every record."""
+    await _seed(async_session, user_model)
+    view = _model_view(
+        async_session, user_model, user_create_schema, user_update_schema
+    )
+
+    for search in (
+        {"search_column": "id", "search_value": "seven"},
+        {"search_column": "missing", "search_value": "x"},
+        {"search_column": "id", "search_value": "seven", "all_records": True},
+        {},
+    ):
+        status, result = await _post(
+            view, async_session, {"action": "delete", **search}
+        )
+        assert status == 400
+        assert "confirmation_token" not in result
+
+    status, result = await _post(
+        view, async_session, {"action": "delete", "all_records": True}
+    )
+    assert status == 200
+    assert result["count"] == 5
+
+
+@pytest.mark.asyncio
+async def test_bulk_action_runs_as_background_job(
+    async_session, user_model, user_create_schema, user_update_schema, tmp_path
+):
+    """Test that with a job runner the confirmed action runs in chunks as a job."""
+
+    class AdminBase(DeclarativeBase):
+        pass
+
+    job_db_config = DatabaseConfig(
+        base=AdminBase,
+        session=Mock(),
+        admin_db_url=f"sqlite+aiosqlite:///{tmp_path / 'admin.db'}",
+        admin_job=create_admin_job(AdminBase),
+    )
+    await job_db_config.initialize_admin_db()
+    runner = JobRunner(job_db_config)
+
+    await _seed(async_session, user_model)
+    view = _model_view(
+        async_session,
+        user_model,
+        user_create_schema,
+        user_update_schema,
+        job_runner=runner,
+    )
+    view.delete_chunk_size = 2
+    await runner.start()
+
+    body = {"action": "delete", "search_column": "email", "search_value": "example"}
+    _, preview = await _post(view, async_session, body)
+    status, result = await _post(
+        view,
+        async_session,
+        {**body, "confirmation_token": preview["confirmation_token"]},
+    )
+    assert status == 202
+    assert result["count"] == 3
+
+    for _ in range(500):
+        job = await runner.get_job(result["job_id"])
+        if job["status"] == "completed":
+            break
+        await asyncio.sleep(0.01)
+
+    assert job["status"] == "completed"
+    assert job["processed"] == 3
+    assert job["total"] == 3
+    assert await view.crud.count(async_session) == 2
+    await runner.stop()
+    await job_db_config.admin_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_bulk_action_with_authenticated_user(
+    async_session,
+    user_model,
+    user_create_schema,
+    user_update_schema,
+    db_config,
+    admin_user_service,
+    session_manager,
+    mock_request,
+):
+    """Test the bulk action with the user model returned by the auth dependency."""
+    await _seed(async_session, user_model)
+    view = _model_view(
+        async_session, user_model, user_create_schema, user_update_schema
+    )
+    admin_user = await db_config.crud_users.create(
+        db_config.admin_session,
+        object=AdminUserCreateInternal(username="admin", hashed_password="x"),
+    )
+    session_id, _ = await session_manager.create_session(
+        request=mock_request, user_id=admin_user.id
+    )
+    authentication = AdminAuthentication(
+        database_config=db_config,
+        user_service=admin_user_service,
+        session_manager=session_manager,
+        oauth2_scheme=Mock(),
+    )
+    current_user = await authentication.get_current_user()(
+        request=mock_request, db=db_config.admin_session, session_id=session_id
+    )
+    body = {"action": "delete", "search_column": "email", "search_value": "other.io"}
+
+    _, preview = await _post(view, async_session, body, current_user=current_user)
+    status, result = await _post(
+        view,
+        async_session,
+        {**body, "confirmation_token": preview["confirmation_token"]},
+        current_user=current_user,
+    )
+
+    assert status == 200
+    assert result == {"action": "delete", "count": 2}
+    assert await view.crud.count(async_session) == 3
@@ -0,0 +1,163 @@
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import DeclarativeBase
+
+from crudadmin.admin_interface.model_view import ModelView
+from crudadmin.core.db import DatabaseConfig
+
+
+def _model_view(async_session, user_model, create_schema, update_schema, **kwargs):
+    class AdminBase(DeclarativeBase):
+        pass
+
+    async def get_session():
+        yield async_session
+
+    db_config = DatabaseConfig(
+        base=AdminBase,
+        session=get_session,
+        admin_db_url="sqlite+aiosqlite:///:memory:",
+    )
+    admin_site = Mock()
+    admin_site.admin_authentication.get_current_user.return_value = Mock()
+
+    return ModelView(
+        database_config=db_config,
+        templates=Mock(),
+        model=user_model,
+        allowed_actions={"view", "create", "update"},
+        create_schema=create_schema,
+        update_schema=update_schema,
+        admin_site=admin_site,
+        **kwargs,
+    )
+
+
+async def _call(endpoint, async_session, body):
+    request = Mock()
+    request.cookies = {}
+    request.json = AsyncMock(return_value=body)
+    response = await endpoint(
+        request=request,
+        db=async_session,
+        admin_db=Mock(),
+        current_user={"id": 1},
+    )
+    return response, json.loads(response.body)
+
+
+async def _users(async_session, user_model):
+    result = await async_session.execute(
+        select(user_model.id, user_model.username, user_model.is_active).order_by(
+            user_model.id
+        )
+    )
+    return [tuple(row) for row in result]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_returns_per_item_status(
+    async_session, user_model, user_create_schema, user_update_schema
+):
+    """Test that valid items are inserted in chunks and invalid ones reported."""
+    async_session.add(user_model(id=1, username="taken", email="taken@example.com"))
+    await async_session.commit()
+    view = _model_view(
+        async_session,
+        user_model,
+        user_create_schema,
+        user_update_schema,
+        import_batch_size=2,
+    )
+
+    _, result = await _call(
+        view.bulk_create_endpoint(),
+        async_session,
+        [
+            {"username": "a", "email": "a@example.com"},
+            {"username": "b"},
+            {"username": "taken", "email": "other@example.com"},
+            {"username": "c", "email": "c@example.com", "is_active": False},
+            "not an object",
+        ],
+    )
+
+    assert result["created"] == 2
+    assert result["failed"] == 3
+    statuses = [item["status"] for item in result["results"]]
+    assert statuses == ["created", "error", "error", "created", "error"]
+    assert [item["id"] for item in result["results"] if "id" in item] == [2, 3]
+    assert result["results"][1]["errors"][0]["loc"] == ["email"]
+    assert "UNIQUE" in result["results"][2]["errors"][0]["msg"]
+    assert await _users(async_session, user_model) == [
+        (1, "taken", True),
+        (2, "a", True),
+        (3, "c", False),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_applies_partial_updates(
+    async_session, user_model, user_create_schema, user_update_schema
+):
+    """Test that partial updates are written by primary key with per-item status."""
+    for i in range(1, 4):
+        async_session.add(user_model(id=i, username=f"u{i}", email=f"u{i}@example.com"))
+    await async_session.commit()
+    view = _model_view(
+        async_session, user_model, user_create_schema, user_update_schema
+    )
+
+    _, result = await _call(
+        view.bulk_update_endpoint(),
+        async_session,
+        [
+            {"id": 1, "is_active": False},
+            {"id": 2, "username": "renamed"},
+            {"id": 99, "is_active": False},
+            {"id": 3, "unknown": "x"},
+            {"id": 1, "username": "again"},
+            {"is_active": True},
+        ],
+    )
+
+    assert result["updated"] == 2
+    assert [item["status"] for item in result["results"]] == [
+        "updated",
+        "updated",
+        "not_found",
+        "error",
+        "error",
+        "error",
+    ]
+    assert "Duplicate" in result["results"][4]["errors"][0]["msg"]
+    async_session.expire_all()
+    assert await _users(async_session, user_model) == [
+        (1, "u1", False),
+        (2, "renamed", True),
+        (3, "u3", True),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_endpoints_validate_body_and_routes(
+    async_session, user_model, user_create_schema, user_update_schema
+):
+    """Test that non-array bodies are rejected and /crud/bulk precedes /crud/{id}."""
+    view = _model_view(
+        async_session, user_model, user_create_schema, user_update_schema
+    )
+
+    response, _ = await _call(
+        view.bulk_create_endpoint(), async_session, {"username": "a"}
+    )
+    assert response.status_code == 400
+
+    paths = [
+        (route.path, method) for route in view.router.routes for method in route.methods
+    ]
+    assert paths.index(("/crud/bulk", "PATCH")) < paths.index(("/crud/{id}", "PATCH"))
+    assert ("/crud/bulk", "POST") in paths
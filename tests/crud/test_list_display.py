@@ -0,0 +1,141 @@
+from typing import Any, Optional
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy import JSON, Column, Integer, LargeBinary, String, Text
+from sqlalchemy.orm import DeclarativeBase
+
+from crudadmin.admin_interface.model_view import ModelView
+from crudadmin.admin_interface.view_descriptor import LIST_PREVIEW_LENGTH
+from crudadmin.core.db import DatabaseConfig
+
+
+class DocumentBase(DeclarativeBase):
+    pass
+
+
+class Document(DocumentBase):
+    __tablename__ = "list_display_document"
+    id = Column(Integer, primary_key=True)
+    title = Column(String(64))
+    body = Column(Text)
+    meta = Column(JSON)
+    attachment = Column(LargeBinary)
+
+
+class DocumentCreate(BaseModel):
+    title: str
+    body: Optional[str] = None
+    meta: Optional[Any] = None
+
+
+def _model_view(async_session, **kwargs):
+    class AdminBase(DeclarativeBase):
+        pass
+
+    async def get_session():
+        yield async_session
+
+    db_config = DatabaseConfig(
+        base=AdminBase,
+        session=get_session,
+        admin_db_url="sqlite+aiosqlite:///:memory:",
+    )
+    admin_site = Mock()
+    admin_site.admin_authentication.get_current_user.return_value = Mock()
+
+    return ModelView(
+        database_config=db_config,
+        templates=Mock(),
+        model=Document,
+        allowed_actions={"view"},
+        create_schema=DocumentCreate,
+        update_schema=DocumentCreate,
+        admin_site=admin_site,
+        **kwargs,
+    )
+
+
+async def _seed(async_session):
+    await async_session.run_sync(
+        lambda session: DocumentBase.metadata.create_all(session.connection())
+    )
+    async_session.add_all(
+        [
+            Document(
+                id=1, title="short", body="hi", meta={"a": 1}, attachment=b"x" * 64
+            ),
+            Document(
+                id=2,
+                title="long",
+                body="y" * (LIST_PREVIEW_LENGTH + 50),
+                meta=None,
+                attachment=None,
+            ),
+        ]
+    )
+    await async_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_list_page_previews_large_columns(async_session):
+    """Test that Text/JSON cells are truncated and LargeBinary cells sized."""
+    await _seed(async_session)
+    view = _model_view(async_session)
+
+    rows = await view._list_page(async_session, {}, 0, 10)
+
+    assert set(view.descriptor.deferred_columns) == {"body", "meta", "attachment"}
+    assert rows[0]["title"] == "short"
+    assert rows[0]["body"] == {"preview": "hi", "truncated": False}
+    assert rows[0]["meta"] == {"preview": '{"a": 1}', "truncated": False}
+    assert rows[0]["attachment"] == {"preview": "<64 bytes>", "truncated": False}
+    assert rows[1]["body"] == {
+        "preview": "y" * LIST_PREVIEW_LENGTH,
+        "truncated": True,
+    }
+    assert rows[1]["attachment"] == {"preview": None, "truncated": False}
+
+
+@pytest.mark.asyncio
+async def test_list_display_projects_columns(async_session):
+    """Test that list_display limits and orders the columns read for the list."""
+    await _seed(async_session)
+    view = _model_view(async_session, list_display=["title", "body"])
+
+    rows = await view._list_page(
+        async_session, {"title__ilike": "%o%"}, 0, 10, sort_by="title"
+    )
+
+    assert [column.key for column in view.descriptor.list_columns] == [
+        "title",
+        "body",
+    ]
+    assert [set(row) for row in rows] == [{"id", "title", "body"}] * 2
+    assert [row["title"] for row in rows] == ["long", "short"]
+
+
+def test_list_display_rejects_unknown_columns(async_session):
+    """Test that list_display names are checked when the view is added."""
+    with pytest.raises(ValueError, match="missing"):
+        _model_view(async_session, list_display=["title", "missing"])
+
+
+@pytest.mark.asyncio
+async def test_list_cell_endpoint_returns_full_value(async_session):
+    """Test that the cell endpoint renders only Text and JSON list cells."""
+    await _seed(async_session)
+    view = _model_view(async_session)
+    endpoint = view.list_cell_endpoint()
+    request = Mock()
+
+    await endpoint(request=request, id="2", column="body")
+    template, context = view.templates.TemplateResponse.call_args.args
+    not_deferred = await endpoint(request=request, id="2", column="title")
+    missing = await endpoint(request=request, id="99", column="body")
+
+    assert template == "admin/model/components/list_cell.html"
+    assert context["value"] == "y" * (LIST_PREVIEW_LENGTH + 50)
+    assert not_deferred.status_code == 404
+    assert missing.status_code == 404
@@ -0,0 +1,127 @@
+import csv
+import io
+import json
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy.orm import DeclarativeBase
+
+from crudadmin.admin_interface.model_view import ModelView
+from crudadmin.core.db import DatabaseConfig
+
+
+class UserExportRead(BaseModel):
+    id: int
+    username: str
+
+
+def _model_view(
+    async_session, user_model, create_schema, update_schema, select_schema=None
+):
+    class AdminBase(DeclarativeBase):
+        pass
+
+    async def get_session():
+        yield async_session
+
+    db_config = DatabaseConfig(
+        base=AdminBase,
+        session=get_session,
+        admin_db_url="sqlite+aiosqlite:///:memory:",
+    )
+    admin_site = Mock()
+    admin_site.admin_authentication.get_current_user.return_value = Mock()
+
+    return ModelView(
+        database_config=db_config,
+        templates=Mock(),
+        model=user_model,
+        allowed_actions={"view"},
+        create_schema=create_schema,
+        update_schema=update_schema,
+        select_schema=select_schema,
+        admin_site=admin_site,
+    )
+
+
+async def _export(view, query_params, **kwargs):
+    request = Mock()
+    request.query_params = query_params
+    response = await view.export_endpoint()(request=request, **kwargs)
+    body = "".join([chunk async for chunk in response.body_iterator])
+    return response, body
+
+
+async def _seed(async_session, user_model):
+    for i in range(5):
+        domain = "example.com" if i % 2 else "other.io"
+        async_session.add(
+            user_model(id=i + 1, username=f"u{i}", email=f"u{i}@{domain}")
+        )
+    await async_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_export_csv_applies_search_and_sort(
+    async_session, user_model, user_create_schema, user_update_schema
+):
+    """Test that the CSV export streams the filtered rows in list order."""
+    await _seed(async_session, user_model)
+    view = _model_view(
+        async_session, user_model, user_create_schema, user_update_schema
+    )
+
+    response, body = await _export(
+        view,
+        {
+            "column-to-search": "email",
+            "search-input": "example",
+            "sort_by": "username",
+            "sort_order": "desc",
+        },
+        format="csv",
+        chunk_size=1,
+    )
+    rows = list(csv.DictReader(io.StringIO(body)))
+
+    assert response.media_type == "text/csv"
+    assert "UserModel_" in response.headers["content-disposition"]
+    assert [row["username"] for row in rows] == ["u3", "u1"]
+    assert rows[0]["is_active"] == "True"
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_uses_select_schema_columns(
+    async_session, user_model, user_create_schema, user_update_schema
+):
+    """Test that NDJSON rows are projected to the select_schema fields."""
+    await _seed(async_session, user_model)
+    view = _model_view(
+        async_session,
+        user_model,
+        user_create_schema,
+        user_update_schema,
+        select_schema=UserExportRead,
+    )
+
+    _, body = await _export(view, {}, format="ndjson", chunk_size=2)
+    rows = [json.loads(line) for line in body.splitlines()]
+
+    assert rows == [{"id": i + 1, "username": f"u{i}"} for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_export_rejects_unknown_format(
+    async_session, user_model, user_create_schema, user_update_schema
+):
+    """Test that unsupported formats are rejected before streaming."""
+    view = _model_view(
+        async_session, user_model, user_create_schema, user_update_schema
+    )
+
+    request = Mock()
+    request.query_params = {}
+    response = await view.export_endpoint()(request=request, format="xlsx")
+
+    assert response.status_code == 400
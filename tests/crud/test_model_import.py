@@ -0,0 +1,184 @@
+import io
+import json
+import threading
+from unittest.mock import Mock
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy import select
+from sqlalchemy.orm import DeclarativeBase
+
+from crudadmin.admin_interface.model_view import ModelView
+from crudadmin.core.db import DatabaseConfig
+
+
+def _model_view(async_session, user_model, create_schema, update_schema, **kwargs):
+    class AdminBase(DeclarativeBase):
+        pass
+
+    async def get_session():
+        yield async_session
+
+    db_config = DatabaseConfig(
+        base=AdminBase,
+        session=get_session,
+        admin_db_url="sqlite+aiosqlite:///:memory:",
+    )
+    admin_site = Mock()
+    admin_site.admin_authentication.get_current_user.return_value = Mock()
+
+    return ModelView(
+        database_config=db_config,
+        templates=Mock(),
+        model=user_model,
+        allowed_actions={"view", "create"},
+        create_schema=create_schema,
+        update_schema=update_schema,
+        admin_site=admin_site,
+        **kwargs,
+    )
+
+
+async def _import(view, async_session, content, filename, file=None, **kwargs):
+    upload = UploadFile(file=file or io.BytesIO(content.encode()), filename=filename)
+    request = Mock()
+    request.cookies = {}
+    response = await view.import_endpoint()(
+        request=request,
+        file=upload,
+        db=async_session,
+        admin_db=Mock(),
+        current_user={"id": 1},
+        **kwargs,
+    )
+    return response, json.loads(response.body)
+
+
+async def _usernames(async_session, user_model):
+    result = await async_session.execute(
+        select(user_model.username).order_by(user_model.id)
+    )
+    return list(result.scalars())
+
+
+@pytest.mark.asyncio
+async def test_import_csv_inserts_rows_in_batches(
+    async_session, user_model, user_create_schema, user_update_schema
+):
+    """Test that a CSV upload is validated and inserted across batches."""
+    view = _model_view(
+        async_session,
+        user_model,
+        user_create_schema,
+        user_update_schema,
+        import_batch_size=2,
+    )
+    content = "\ufeffusername,email,is_active\n" + "".join(
+        f"u{i},u{i}@example.com,{'false' if i == 3 else ''}\n" for i in range(5)
+    )
+
+    response, result = await _import(view, async_session, content, "users.csv")
+
+    assert response.status_code == 200
+    assert result == {
+        "imported": 5,
+        "rejected": 0,
+        "report_id": None,
+        "report_url": None,
+    }
+    assert await _usernames(async_session, user_model) == [f"u{i}" for i in range(5)]
+    inactive = await async_session.execute(
+        select(user_model.username).where(user_model.is_active.is_(False))
+    )
+    assert list(inactive.scalars()) == ["u3"]
+
+
+@pytest.mark.asyncio
+async def test_import_ndjson_reports_rejected_rows(
+    async_session, user_model, user_create_schema, user_update_schema
+):
+    """Test that invalid and conflicting rows are reported, not inserted."""
+    async_session.add(user_model(username="taken", email="taken@example.com"))
+    await async_session.commit()
+    view = _model_view(
+        async_session,
+        user_model,
+        user_create_schema,
+        user_update_schema,
+        import_batch_size=10,
+    )
+    lines = [
+        {"username": "a", "email": "a@example.com"},
+        {"username": "b"},
+        "not json",
+        {"username": "taken", "email": "other@example.com"},
+        {"username": "c", "email": "c@example.com", "is_active": False},
+    ]
+    content = "\n".join(
+        line if isinstance(line, str) else json.dumps(line) for line in lines
+    )
+
+    _, result = await _import(view, async_session, content, "users.ndjson")
+
+    assert result["imported"] == 2
+    assert result["rejected"] == 3
+    assert result["report_url"].endswith(f"/import/report/{result['report_id']}")
+    assert await _usernames(async_session, user_model) == ["taken", "a", "c"]
+
+    report = await view.import_report_endpoint()(report_id=result["report_id"])
+    with open(report.path, encoding="utf-8") as f:
+        rejected = [json.loads(line) for line in f]
+    assert [row["line"] for row in rejected] == [2, 3, 4]
+    assert rejected[0]["errors"][0]["loc"] == ["email"]
+    assert "Invalid JSON" in rejected[1]["errors"][0]["msg"]
+    assert "UNIQUE" in rejected[2]["errors"][0]["msg"]
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_unknown_format(
+    async_session, user_model, user_create_schema, user_update_schema
+):
+    """Test that files without a supported format are rejected up front."""
+    view = _model_view(
+        async_session, user_model, user_create_schema, user_update_schema
+    )
+
+    response, _ = await _import(view, async_session, "a,b\n", "users.xlsx")
+    missing = await view.import_report_endpoint()(report_id="unknown")
+
+    assert response.status_code == 400
+    assert missing.status_code == 404
+
+
+class _ThreadRecordingFile(io.BytesIO):
+    """In-memory upload that records the threads it is read from."""
+
+    def __init__(self, content: bytes):
+        super().__init__(content)
+        self.threads = set()
+
+    def __next__(self):
+        self.threads.add(threading.get_ident())
+        return super().__next__()
+
+
+@pytest.mark.asyncio
+async def test_import_parses_upload_off_the_event_loop(
+    async_session, user_model, user_create_schema, user_update_schema
+):
+    """Test that the upload is read in a worker thread, not the event loop thread."""
+    view = _model_view(
+        async_session,
+        user_model,
+        user_create_schema,
+        user_update_schema,
+        import_batch_size=2,
+    )
+    content = "username,email\n" + "".join(f"u{i},u{i}@example.com\n" for i in range(5))
+    upload = _ThreadRecordingFile(content.encode())
+
+    _, result = await _import(view, async_session, "", "users.csv", file=upload)
+
+    assert result["imported"] == 5
+    assert upload.threads
+    assert threading.get_ident() not in upload.threads
@@ -0,0 +1,88 @@
+from datetime import datetime
+from itertools import count
+
+import pytest
+from pydantic import BaseModel, Field
+
+from crudadmin.admin_interface.view_descriptor import (
+    InternalSchema,
+    compile_view_descriptor,
+)
+
+
+def _descriptor(model, create_schema, update_schema, select_schema=None):
+    return compile_view_descriptor(
+        model=model,
+        create_schema=create_schema,
+        update_schema=update_schema,
+        select_schema=select_schema,
+        deleted_at_column="deleted_at",
+        is_deleted_column="is_deleted",
+    )
+
+
+def test_descriptor_precomputes_model_metadata(
+    product_model, product_create_schema, product_update_schema
+):
+    """Test that primary key, columns and soft delete columns are compiled."""
+
+    class ProductSelect(BaseModel):
+        id: int
+        name: str
+
+    descriptor = _descriptor(
+        product_model, product_create_schema, product_update_schema, ProductSelect
+    )
+
+    assert descriptor.pk_column.key == "id"
+    assert dict(descriptor.pk_info) == {"name": "id", "type": int, "type_name": "int"}
+    assert descriptor.pk_converter("42") == 42
+    assert "price" in descriptor.column_set
+    assert [column.key for column in descriptor.row_columns] == ["id", "name"]
+    assert descriptor.deleted_at_column == "deleted_at"
+    assert descriptor.is_deleted_column == "is_deleted"
+    with pytest.raises(TypeError):
+        descriptor.search_converters["name"] = None
+
+
+def test_descriptor_search_converters(
+    user_model, user_create_schema, user_update_schema
+):
+    """Test that search values are coerced by the column type."""
+    converters = _descriptor(
+        user_model, user_create_schema, user_update_schema
+    ).search_converters
+
+    assert converters["id"]("7") == ("id", 7)
+    assert converters["id"]("seven") is None
+    assert converters["is_active"]("No") == ("is_active", False)
+    assert converters["is_active"]("maybe") is None
+    assert converters["email"]("example") == ("email__ilike", "%example%")
+    assert "created_at" not in converters
+
+
+def test_form_spec_builds_fresh_fields_with_factory_defaults(user_model):
+    """Test that default factories run per build and built fields are copies."""
+    calls = count()
+
+    class EventCreate(BaseModel):
+        name: str
+        sequence: int = Field(default_factory=lambda: next(calls))
+        created_at: datetime = Field(default_factory=datetime.now)
+
+    form = _descriptor(user_model, EventCreate, EventCreate).create_form
+
+    first = form.build()
+    first[0]["value"] = "changed"
+    second = form.build()
+
+    assert "value" not in second[0]
+    assert second[1]["default"] == first[1]["default"] + 1
+    assert isinstance(second[2]["default"], datetime)
+
+
+def test_internal_schema_keeps_transformed_fields():
+    """Test that the shared internal schema passes all fields through."""
+    data = InternalSchema(username="a", hashed_password="x")
+
+    assert data.model_dump() == {"username": "a", "hashed_password": "x"}
@@ -0,0 +1,96 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from crudadmin.event import SecurityAlertDetector, init_event_system
+from crudadmin.event.models import EventType
+
+
+class TestSecurityAlertDetector:
+    """Test cases for the streaming failed-login detector."""
+
+    @pytest.mark.asyncio
+    async def test_alert_raised_at_threshold(self):
+        """Test that an alert appears once the counter reaches the threshold."""
+        detector = SecurityAlertDetector(threshold=3)
+
+        assert await detector.record_failed_login("10.0.0.1", "admin") == 1
+        assert await detector.record_failed_login("10.0.0.1", "admin") == 2
+        await detector.record_failed_login("10.0.0.2", "admin")
+        assert detector.get_alerts() == []
+
+        assert await detector.record_failed_login("10.0.0.1", "admin") == 3
+        await detector.record_failed_login("10.0.0.1", "admin")
+
+        alerts = detector.get_alerts()
+        assert len(alerts) == 1
+        details = alerts[0]["details"]
+        assert alerts[0]["type"] == "multiple_failed_logins"
+        assert details["ip_address"] == "10.0.0.1"
+        assert details["username"] == "admin"
+        assert details["attempts"] == 4
+        assert details["first_seen"] <= details["last_seen"]
+
+    @pytest.mark.asyncio
+    async def test_alerts_expire_and_reset(self):
+        """Test that alerts drop out after their window and on reset."""
+        detector = SecurityAlertDetector(threshold=1, window_seconds=0)
+        await detector.record_failed_login("10.0.0.1", "admin")
+        assert detector.get_alerts() == []
+
+        detector = SecurityAlertDetector(threshold=1)
+        await detector.record_failed_login("10.0.0.1", "admin")
+        await detector.reset("10.0.0.1", "admin")
+        assert detector.get_alerts() == []
+        assert await detector.record_failed_login("10.0.0.1", "admin") == 1
+
+    @pytest.mark.asyncio
+    async def test_max_alerts_evicts_oldest(self):
+        """Test that only the most recent alerts are kept."""
+        detector = SecurityAlertDetector(threshold=1, max_alerts=2)
+        for username in ("a", "b", "c"):
+            await detector.record_failed_login("10.0.0.1", username)
+
+        assert [alert["details"]["username"] for alert in detector.get_alerts()] == [
+            "c",
+            "b",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_log_auth_event_feeds_detector(self, db_config, mock_request):
+        """Test that failed auth events update the detector."""
+        detector = SecurityAlertDetector(threshold=2)
+        _, integration = init_event_system(db_config, alert_detector=detector)
+
+        for success in (False, True, False):
+            await integration.log_auth_event(
+                db=AsyncMock(),
+                event_type=EventType.LOGIN,
+                user_id=0,
+                session_id="unknown",
+                request=mock_request,
+                success=success,
+                details={"auth_details": {"username": "admin"}},
+            )
+
+        alerts = detector.get_alerts()
+        assert len(alerts) == 1
+        assert alerts[0]["details"]["ip_address"] == "127.0.0.1"
+        assert alerts[0]["details"]["attempts"] == 2
+
+    @pytest.mark.asyncio
+    async def test_only_login_failures_feed_detector(self, db_config, mock_request):
+        """Test that failed logouts and other auth events are not counted."""
+        detector = SecurityAlertDetector(threshold=1)
+        _, integration = init_event_system(db_config, alert_detector=detector)
+
+        await integration.log_auth_event(
+            db=AsyncMock(),
+            event_type=EventType.LOGOUT,
+            user_id=1,
+            session_id="session",
+            request=mock_request,
+            success=False,
+        )
+
+        assert detector.get_alerts() == []
@@ -0,0 +1,302 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, update
+from sqlalchemy.orm import DeclarativeBase
+
+from crudadmin.core.db import DatabaseConfig
+from crudadmin.event import init_event_system
+from crudadmin.event.audit_store import ZSTD_AVAILABLE, AuditStore
+from crudadmin.event.models import (
+    EventType,
+    create_admin_audit_log,
+    create_admin_event_log,
+)
+from crudadmin.event.service import EventService
+
+
+class Product:
+    """Stand-in model class; only its name is used for events."""
+
+
+STATES = [
+    {"id": 1, "name": "Widget", "price": 10},
+    {"id": 1, "name": "Widget", "price": 12},
+    {"id": 1, "name": "Widget Pro", "price": 12},
+    {"id": 1, "name": "Widget Pro", "price": 15},
+    {"id": 1, "name": "Widget Max", "price": 20},
+]
+
+
+async def record_history(service: EventService, db) -> None:
+    previous = None
+    for i, state in enumerate(STATES):
+        await service.create_audit_log(
+            db=db,
+            event_id=i + 1,
+            resource_type="Product",
+            resource_id="1",
+            action="create" if previous is None else "update",
+            previous_state=previous,
+            new_state=state,
+            metadata={"resource_details": {"changes": {"action": "update"}}},
+        )
+        previous = state
+    await db.commit()
+
+
+@pytest_asyncio.fixture
+async def versioned_db_config(admin_async_session):
+    class AdminBase(DeclarativeBase):
+        pass
+
+    config = DatabaseConfig(
+        base=AdminBase,
+        session=admin_async_session,
+        admin_db_url="sqlite+aiosqlite:///:memory:",
+        admin_event_log=create_admin_event_log(AdminBase),
+        admin_audit_log=create_admin_audit_log(AdminBase, versioned=True),
+    )
+    await config.initialize_admin_db()
+    yield config
+    await config.admin_engine.dispose()
+
+
+class TestDiffStorage:
+    """Test cases for diff-only audit storage."""
+
+    @pytest.mark.asyncio
+    async def test_rows_store_diffs_and_periodic_snapshots(self, db_config):
+        """Test that only snapshot versions keep the full state."""
+        service = EventService(db_config, audit_storage="diff", snapshot_interval=3)
+        await record_history(service, db_config.admin_session)
+
+        rows = (
+            await db_config.admin_session.execute(
+                select(db_config.AdminAuditLog).order_by(db_config.AdminAuditLog.id)
+            )
+        ).scalars()
+
+        stored = [
+            (
+                row.audit_metadata["audit_version"],
+                row.audit_metadata["audit_snapshot"],
+                row.new_state is not None,
+                row.previous_state,
+            )
+            for row in rows
+        ]
+        assert stored == [
+            (1, True, True, None),
+            (2, False, False, None),
+            (3, True, True, None),
+            (4, False, False, None),
+            (5, False, False, None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_resource_version_rebuilds_every_version(self, db_config):
+        """Test that each historical version is rebuilt from snapshot plus diffs."""
+        service = EventService(db_config, audit_storage="diff", snapshot_interval=3)
+        await record_history(service, db_config.admin_session)
+        db = db_config.admin_session
+
+        for version, expected in enumerate(STATES, start=1):
+            assert (
+                await service.get_resource_version(db, "Product", "1", version)
+                == expected
+            )
+
+        assert await service.get_resource_version(db, "Product", "1") == STATES[-1]
+        assert await service.get_resource_version(db, "Product", "1", 9) is None
+        assert await service.get_resource_version(db, "Product", "2") is None
+
+    @pytest.mark.asyncio
+    async def test_deleted_record_has_no_latest_version(self, db_config):
+        """Test that a record deleted at its latest version rebuilds as None."""
+        service = EventService(db_config, audit_storage="diff")
+        db = db_config.admin_session
+        await record_history(service, db)
+        await service.create_audit_log(
+            db=db,
+            event_id=6,
+            resource_type="Product",
+            resource_id="1",
+            action="delete",
+            new_state={"action": "delete", "deleted_records": [STATES[-1]]},
+        )
+
+        assert await service.get_resource_version(db, "Product", "1") is None
+        assert await service.get_resource_version(db, "Product", "1", 5) == STATES[-1]
+
+    @pytest.mark.asyncio
+    async def test_buffered_writer_assigns_versions(self, db_config, mock_request):
+        """Test that the buffered writer stores audits in diff form too."""
+        service, integration = init_event_system(
+            db_config, buffered=True, audit_storage="diff", flush_interval=60
+        )
+
+        previous = None
+        for state in STATES[:3]:
+            await integration.log_model_event(
+                db=db_config.admin_session,
+                event_type=EventType.CREATE if previous is None else EventType.UPDATE,
+                model=Product,
+                user_id=1,
+                session_id="session",
+                request=mock_request,
+                resource_id="1",
+                previous_state=previous,
+                new_state=state,
+            )
+            previous = state
+        await integration.close()
+
+        rows = (
+            await db_config.admin_session.execute(
+                select(db_config.AdminAuditLog.audit_metadata).order_by(
+                    db_config.AdminAuditLog.id
+                )
+            )
+        ).scalars()
+        assert [meta["audit_version"] for meta in rows] == [1, 2, 3]
+        assert (
+            await service.get_resource_version(db_config.admin_session, "Product", "1")
+            == STATES[2]
+        )
+
+    @pytest.mark.asyncio
+    async def test_retention_keeps_surviving_versions_rebuildable(self, db_config):
+        """Test that cleanup rewrites the oldest surviving diff as a snapshot."""
+        service = EventService(db_config, audit_storage="diff", snapshot_interval=3)
+        db = db_config.admin_session
+        await record_history(service, db)
+        audit_model = db_config.AdminAuditLog
+        await db.execute(
+            update(audit_model)
+            .where(audit_model.id <= 4)
+            .values(timestamp=datetime.now(timezone.utc) - timedelta(days=30))
+        )
+        await db.commit()
+
+        await service.cleanup_old_logs(db, retention_days=7)
+
+        row = (await db.execute(select(audit_model))).scalar_one()
+        assert row.audit_metadata["audit_version"] == 5
+        assert row.audit_metadata["audit_snapshot"] is True
+        assert await service.get_resource_version(db, "Product", "1") == STATES[-1]
+
+    @pytest.mark.asyncio
+    async def test_version_conflict_retries_with_next_version(
+        self, versioned_db_config, monkeypatch
+    ):
+        """Test that a version taken by a concurrent writer is reassigned."""
+        service = EventService(
+            versioned_db_config, audit_storage="diff", snapshot_interval=3
+        )
+        db = versioned_db_config.admin_session
+        await record_history(service, db)
+        store = service.audit_store
+        latest_versions = store._latest_versions
+        stale = [{("Product", "1"): 3}]
+
+        async def stale_once(executor, resources):
+            return stale.pop() if stale else await latest_versions(executor, resources)
+
+        monkeypatch.setattr(store, "_latest_versions", stale_once)
+        new_state = {"id": 1, "name": "Widget Ultra", "price": 25}
+        await service.create_audit_log(
+            db=db,
+            event_id=6,
+            resource_type="Product",
+            resource_id="1",
+            action="update",
+            previous_state=STATES[-1],
+            new_state=new_state,
+        )
+        await db.commit()
+
+        audit_model = versioned_db_config.AdminAuditLog
+        versions = (
+            await db.execute(select(audit_model.version).order_by(audit_model.id))
+        ).scalars()
+        assert list(versions) == [1, 2, 3, 4, 5, 6]
+        assert await service.get_resource_version(db, "Product", "1") == new_state
+
+
+class TestCompression:
+    """Test cases for compressed audit states."""
+
+    @pytest.mark.parametrize(
+        "compression",
+        [
+            "zlib",
+            pytest.param(
+                "zstd",
+                marks=pytest.mark.skipif(
+                    not ZSTD_AVAILABLE, reason="zstandard not installed"
+                ),
+            ),
+        ],
+    )
+    def test_encode_decode_round_trip(self, db_config, compression):
+        """Test that compressed states decode to the original."""
+        store = AuditStore(db_config.AdminAuditLog, compression=compression)
+        state = {"description": "x" * 1000, "price": 10}
+
+        encoded = store.encode_state(state)
+
+        assert encoded["_compressed"] == compression
+        assert len(encoded["data"]) < 200
+        assert store.decode_state(encoded) == state
+        assert store.decode_state(state) == state
+
+    @pytest.mark.asyncio
+    async def test_compressed_full_mode_history(self, db_config):
+        """Test that compressed full snapshots still rebuild versions."""
+        service = EventService(db_config, audit_compression="zlib")
+        await record_history(service, db_config.admin_session)
+
+        row = (
+            await db_config.admin_session.execute(
+                select(db_config.AdminAuditLog.new_state).limit(1)
+            )
+        ).scalar_one()
+        assert row["_compressed"] == "zlib"
+        assert (
+            await service.get_resource_version(db_config.admin_session, "Product", "1")
+            == STATES[-1]
+        )
+
+    def test_invalid_options(self, db_config):
+        """Test that unknown modes and compressions are rejected."""
+        with pytest.raises(ValueError, match="storage mode"):
+            AuditStore(db_config.AdminAuditLog, mode="delta")
+        with pytest.raises(ValueError, match="compression"):
+            AuditStore(db_config.AdminAuditLog, compression="lz4")
+
+
+def test_slim_details_drops_nested_states():
+    """Test that event details keep the summary but not full states."""
+    details = {
+        "resource_details": {
+            "model": "Product",
+            "changes": {
+                "action": "update",
+                "previous_state": {"price": 1},
+                "new_state": {"price": 2},
+                "changes": {"price": {"old": 1, "new": 2}},
+            },
+        },
+        "request_details": {"method": "POST"},
+    }
+
+    slim = AuditStore.slim_details(details)
+
+    assert slim["resource_details"]["changes"] == {
+        "action": "update",
+        "changes": {"price": {"old": 1, "new": 2}},
+    }
+    assert slim["request_details"] == {"method": "POST"}
+    assert "previous_state" in details["resource_details"]["changes"]
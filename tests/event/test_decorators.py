@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import State
 
 from crudadmin.event.decorators import (
     compare_states,
@@ -335,6 +336,63 @@ class TestLogAdminActionDecorator:
             mock_event_integration.log_model_event.assert_called_once()
             mock_admin_db.commit.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_log_admin_action_update_with_captured_state(
+        self, mock_request, mock_db, mock_admin_db, mock_event_integration
+    ):
+        """Test that captured states are logged without reading the row."""
+        user = {"id": 1, "username": "testuser"}
+        updated_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        @log_admin_action(EventType.UPDATE, MockModel, captures_state=True)
+        async def test_function(request, db, admin_db, current_user, id, **kwargs):
+            request.state.audit_previous_state = {"id": id, "name": "old_item"}
+            request.state.audit_new_state = {
+                "id": id,
+                "name": "new_item",
+                "updated_at": updated_at,
+            }
+            return {"id": id}
+
+        with patch("crudadmin.event.decorators.FastCRUD") as mock_crud_class:
+            await test_function(
+                request=mock_request,
+                db=mock_db,
+                admin_db=mock_admin_db,
+                current_user=user,
+                event_integration=mock_event_integration,
+                id=123,
+            )
+            mock_crud_class.assert_not_called()
+
+        call_args = mock_event_integration.log_model_event.call_args[1]
+        assert call_args["previous_state"] == {"id": 123, "name": "old_item"}
+        assert call_args["new_state"]["updated_at"] == updated_at.isoformat()
+        changes = call_args["details"]["resource_details"]["changes"]["changes"]
+        assert set(changes) == {"name", "updated_at"}
+
+    @pytest.mark.asyncio
+    async def test_log_admin_action_update_without_write_is_not_logged(
+        self, mock_request, mock_db, mock_admin_db, mock_event_integration
+    ):
+        """Test that a capturing endpoint that wrote nothing logs no event."""
+        mock_request.state = State()
+
+        @log_admin_action(EventType.UPDATE, MockModel, captures_state=True)
+        async def test_function(request, db, admin_db, current_user, id, **kwargs):
+            return {"error": "validation failed"}
+
+        await test_function(
+            request=mock_request,
+            db=mock_db,
+            admin_db=mock_admin_db,
+            current_user={"id": 1, "username": "testuser"},
+            event_integration=mock_event_integration,
+            id=123,
+        )
+
+        mock_event_integration.log_model_event.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_log_admin_action_delete_event(
         self, mock_request, mock_db, mock_admin_db, mock_event_integration
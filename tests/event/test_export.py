@@ -0,0 +1,133 @@
+import csv
+import io
+import json
+
+import pytest
+
+from crudadmin.event.export import csv_lines, get_encoder, ndjson_lines
+from crudadmin.event.models import EventStatus, EventType
+
+
+async def _seed(db_config, event_service, mock_request, count=5):
+    db = db_config.admin_session
+    events = []
+    for i in range(count):
+        events.append(
+            await event_service.log_event(
+                db=db,
+                event_type=EventType.UPDATE if i % 2 else EventType.LOGIN,
+                status=EventStatus.SUCCESS,
+                user_id=1,
+                session_id="session",
+                request=mock_request,
+                resource_type="Product" if i % 2 else None,
+                resource_id=str(i) if i % 2 else None,
+                details={"n": i},
+            )
+        )
+    await event_service.create_audit_log(
+        db=db,
+        event_id=events[1].id,
+        resource_type="Product",
+        resource_id="1",
+        action="update",
+        previous_state={"price": 1},
+        new_state={"price": 2},
+    )
+    await db.commit()
+    return events
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+class TestIterEvents:
+    """Test cases for chunked event iteration."""
+
+    @pytest.mark.asyncio
+    async def test_iterates_oldest_first_across_chunks(
+        self, db_config, event_service, mock_request
+    ):
+        """Test that chunks continue from the previous chunk's last row."""
+        events = await _seed(db_config, event_service, mock_request)
+
+        rows = await _collect(
+            event_service.iter_events(db_config.admin_session, chunk_size=2)
+        )
+
+        assert [row["id"] for row in rows] == [event.id for event in events]
+        assert rows[0]["username"] == "Unknown"
+        assert rows[0]["details"] == {"n": 0}
+        assert "audit" not in rows[0]
+
+    @pytest.mark.asyncio
+    async def test_resume_and_filters(self, db_config, event_service, mock_request):
+        """Test resuming after a cursor and filtering like the events page."""
+        events = await _seed(db_config, event_service, mock_request)
+        db = db_config.admin_session
+
+        rows = await _collect(event_service.iter_events(db, chunk_size=2))
+        resumed = await _collect(
+            event_service.iter_events(db, after=rows[2]["cursor"], chunk_size=2)
+        )
+        assert [row["id"] for row in resumed] == [events[3].id, events[4].id]
+
+        updates = await _collect(event_service.iter_events(db, event_type="update"))
+        assert [row["id"] for row in updates] == [events[1].id, events[3].id]
+
+    @pytest.mark.asyncio
+    async def test_include_audit(self, db_config, event_service, mock_request):
+        """Test that audit rows are joined when requested."""
+        events = await _seed(db_config, event_service, mock_request)
+
+        rows = await _collect(
+            event_service.iter_events(db_config.admin_session, include_audit=True)
+        )
+        by_id = {row["id"]: row for row in rows}
+
+        assert by_id[events[1].id]["audit"] == {
+            "action": "update",
+            "changes": {"price": {"old": 1, "new": 2}},
+            "previous_state": {"price": 1},
+            "new_state": {"price": 2},
+        }
+        assert by_id[events[3].id]["audit"] is None
+
+
+class TestExportEncoders:
+    """Test cases for the NDJSON and CSV encoders."""
+
+    @pytest.mark.asyncio
+    async def test_ndjson(self, db_config, event_service, mock_request):
+        """Test that each event is one JSON line."""
+        await _seed(db_config, event_service, mock_request, count=2)
+        rows = event_service.iter_events(db_config.admin_session)
+
+        lines = await _collect(ndjson_lines(rows))
+
+        assert len(lines) == 2
+        first = json.loads(lines[0])
+        assert first["event_type"] == "login"
+        assert first["details"] == {"n": 0}
+
+    @pytest.mark.asyncio
+    async def test_csv_with_audit(self, db_config, event_service, mock_request):
+        """Test that CSV has a header and JSON encoded nested fields."""
+        events = await _seed(db_config, event_service, mock_request, count=2)
+        rows = event_service.iter_events(db_config.admin_session, include_audit=True)
+
+        text = "".join(await _collect(csv_lines(rows, include_audit=True)))
+        records = list(csv.DictReader(io.StringIO(text)))
+
+        assert [int(r["id"]) for r in records] == [e.id for e in events]
+        assert records[0]["event_type"] == "login"
+        assert records[0]["audit_action"] == ""
+        assert records[1]["audit_action"] == "update"
+        assert json.loads(records[1]["audit_new_state"]) == {"price": 2}
+        assert json.loads(records[1]["details"]) == {"n": 1}
+
+    def test_unknown_format(self):
+        """Test that unsupported formats are rejected."""
+        with pytest.raises(ValueError):
+            get_encoder("xml")
@@ -0,0 +1,285 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from crudadmin.event import init_event_system
+from crudadmin.event.file_sink import FileEventSink, SegmentLog
+from crudadmin.event.models import EventStatus, EventType
+from crudadmin.event.service import EventService
+
+UTC = timezone.utc
+
+
+def _record(n, timestamp=None):
+    return {"timestamp": timestamp or datetime.now(UTC), "n": n}
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+class TestSegmentLog:
+    """Test cases for the append-only segment log."""
+
+    @pytest.mark.asyncio
+    async def test_rotation_and_reopen(self, tmp_path):
+        """Test that segments rotate by size and are reloaded on reopen."""
+        log = SegmentLog(str(tmp_path), segment_max_bytes=300, index_interval=3)
+        for n in range(20):
+            stored = await log.append(_record(n))
+            assert stored["id"] == n + 1
+        log.close()
+
+        assert len(log.segments) > 1
+        assert all(segment.sealed for segment in log.segments[:-1])
+
+        reopened = SegmentLog(str(tmp_path), segment_max_bytes=300, index_interval=3)
+        assert reopened.count == 0
+        records = await _collect(reopened.scan())
+        assert [r["n"] for r in records] == list(range(20))
+        assert reopened.count == 20
+        assert (await reopened.get(13))["n"] == 12
+        assert await reopened.get(21) is None
+        assert (await reopened.append(_record(20)))["id"] == 21
+
+    @pytest.mark.asyncio
+    async def test_recovers_torn_write(self, tmp_path):
+        """Test that an incomplete trailing record is truncated on open."""
+        log = SegmentLog(str(tmp_path), index_interval=2)
+        for n in range(5):
+            await log.append(_record(n))
+        log.close()
+
+        segment_path = log.segments[-1].path
+        with open(segment_path, "ab") as f:
+            f.write(b"\x00\x00\x01\x00{partial")
+        os.remove(log.segments[-1].index_path)
+
+        reopened = SegmentLog(str(tmp_path), index_interval=2)
+        reopened.open()
+        assert reopened.last_id == 5
+        assert os.path.getsize(segment_path) == reopened.segments[-1].size
+        assert [r["n"] for r in await _collect(reopened.scan())] == list(range(5))
+        assert (await reopened.append(_record(5)))["id"] == 6
+
+    @pytest.mark.asyncio
+    async def test_time_range_scan(self, tmp_path):
+        """Test time-bounded scans in both directions."""
+        log = SegmentLog(str(tmp_path), segment_max_bytes=200, index_interval=2)
+        base = datetime(2024, 1, 1, tzinfo=UTC)
+        for n in range(12):
+            await log.append(_record(n, base + timedelta(minutes=n)))
+
+        start, end = base + timedelta(minutes=3), base + timedelta(minutes=9)
+        forward = await _collect(log.scan(start, end))
+        backward = await _collect(log.scan(start, end, reverse=True))
+
+        assert [r["n"] for r in forward] == list(range(3, 9))
+        assert [r["n"] for r in backward] == list(reversed(range(3, 9)))
+
+    @pytest.mark.asyncio
+    async def test_timestamps_never_decrease(self, tmp_path):
+        """Test that a late record is stamped with its predecessor's time."""
+        log = SegmentLog(str(tmp_path))
+        now = datetime.now(UTC)
+        await log.append(_record(0, now))
+        late = await log.append(_record(1, now - timedelta(seconds=5)))
+
+        assert late["timestamp"] == now
+
+    @pytest.mark.asyncio
+    async def test_delete_before_removes_sealed_segments(self, tmp_path):
+        """Test that retention drops whole old segments and keeps the active one."""
+        log = SegmentLog(str(tmp_path), segment_max_bytes=200)
+        old = datetime.now(UTC) - timedelta(days=10)
+        for n in range(10):
+            await log.append(_record(n, old))
+        await log.append(_record(10))
+        kept_before = log.segments[-1].count
+
+        deleted = await log.delete_before(datetime.now(UTC) - timedelta(days=1))
+
+        assert deleted == 11 - kept_before
+        assert log.count == kept_before
+        assert await log.get(1) is None
+        assert (await _collect(log.scan()))[-1]["n"] == 10
+
+    @pytest.mark.asyncio
+    async def test_logs_sharing_a_directory_see_each_other(self, tmp_path):
+        """Test that logs of two processes on one directory stay consistent."""
+        first = SegmentLog(str(tmp_path), segment_max_bytes=200, index_interval=2)
+        second = SegmentLog(str(tmp_path), segment_max_bytes=200, index_interval=2)
+        old = datetime.now(UTC) - timedelta(days=10)
+
+        ids = []
+        for n in range(12):
+            log = first if n % 3 else second
+            ids.append((await log.append(_record(n, old)))["id"])
+
+        assert ids == list(range(1, 13))
+        for log in (first, second):
+            assert [r["n"] for r in await _collect(log.scan())] == list(range(12))
+            assert (await log.get(12))["n"] == 11
+
+        await first.append(_record(12))
+        deleted = await second.delete_before(datetime.now(UTC) - timedelta(days=1))
+
+        assert deleted > 0
+        assert (await first.append(_record(13)))["id"] == 14
+        assert await first.get(1) is None
+        assert [r["n"] for r in await _collect(second.scan())][-2:] == [12, 13]
+
+
+class TestEventServiceWithFileSink:
+    """Test cases for EventService backed by a FileEventSink."""
+
+    @pytest.fixture
+    def sink(self, tmp_path):
+        return FileEventSink(str(tmp_path), segment_max_bytes=1024, index_interval=4)
+
+    @pytest.fixture
+    def sink_service(self, db_config, sink):
+        return EventService(db_config, sink=sink)
+
+    async def _log(self, service, db, request, event_type, status=None, **kwargs):
+        return await service.log_event(
+            db=db,
+            event_type=event_type,
+            status=status or EventStatus.SUCCESS,
+            user_id=1,
+            session_id="session",
+            request=request,
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_events_page_and_details(
+        self, db_config, sink, sink_service, mock_request
+    ):
+        """Test paging, filtering and details without touching the event table."""
+        db = db_config.admin_session
+        events = []
+        for i in range(7):
+            events.append(
+                await self._log(
+                    sink_service,
+                    db,
+                    mock_request,
+                    EventType.UPDATE if i % 2 else EventType.LOGIN,
+                    resource_type="Product" if i % 2 else None,
+                    resource_id=str(i) if i % 2 else None,
+                    details={"n": i},
+                )
+            )
+        await sink_service.create_audit_log(
+            db=db,
+            event_id=events[3].id,
+            resource_type="Product",
+            resource_id="3",
+            action="update",
+            previous_state={"price": 1},
+            new_state={"price": 2},
+        )
+
+        first = await sink_service.get_event_page(db, limit=3)
+        assert [row["id"] for row in first["data"]] == [7, 6, 5]
+        assert first["total_count"] == 7
+        assert first["data"][0]["username"] == "Unknown"
+
+        second = await sink_service.get_event_page(
+            db, limit=3, after=first["next_cursor"]
+        )
+        assert [row["id"] for row in second["data"]] == [4, 3, 2]
+        back = await sink_service.get_event_page(
+            db, limit=3, before=second["prev_cursor"]
+        )
+        assert [row["id"] for row in back["data"]] == [7, 6, 5]
+
+        updates = await sink_service.get_event_page(db, event_type="update")
+        assert [row["id"] for row in updates["data"]] == [6, 4, 2]
+        assert updates["total_count"] == 3
+        assert (await sink_service.get_event_page(db, username="nobody"))["data"] == []
+
+        assert await sink_service.get_event_details(db, events[3].id) == {
+            "resource_details": {"model": "Product", "id": "3", "changes": {"price": 2}}
+        }
+        assert await sink_service.get_event_details(db, events[0].id) == {"n": 0}
+        assert await sink_service.get_event_details(db, 99) is None
+
+        stored = await db.execute(select(func.count(db_config.AdminEventLog.id)))
+        assert stored.scalar_one() == 0
+
+    @pytest.mark.asyncio
+    async def test_history_export_and_alerts(
+        self, db_config, sink_service, mock_request
+    ):
+        """Test resource history, versions, export and alerts from the sink."""
+        db = db_config.admin_session
+        for version in range(1, 4):
+            event = await self._log(
+                sink_service,
+                db,
+                mock_request,
+                EventType.UPDATE,
+                resource_type="Product",
+                resource_id="1",
+            )
+            await sink_service.create_audit_log(
+                db=db,
+                event_id=event.id,
+                resource_type="Product",
+                resource_id="1",
+                action="update",
+                previous_state={"price": version - 1},
+                new_state={"price": version},
+            )
+        for _ in range(3):
+            await self._log(
+                sink_service,
+                db,
+                mock_request,
+                EventType.LOGIN,
+                EventStatus.FAILURE,
+                details={"username": "admin"},
+            )
+
+        history = await sink_service.get_resource_history(
+            db, "Product", "1", limit=2, offset=1
+        )
+        assert history["total_count"] == 3
+        assert [a["new_state"] for a in history["data"]] == [
+            {"price": 2},
+            {"price": 1},
+        ]
+        assert await sink_service.get_resource_version(db, "Product", "1", 2) == {
+            "price": 2
+        }
+        assert await sink_service.get_resource_version(db, "Product", "1") == {
+            "price": 3
+        }
+
+        rows = await _collect(sink_service.iter_events(db, include_audit=True))
+        assert [row["id"] for row in rows] == list(range(1, 7))
+        assert rows[1]["audit"]["new_state"] == {"price": 2}
+        assert rows[4]["audit"] is None
+        resumed = await _collect(sink_service.iter_events(db, after=rows[3]["cursor"]))
+        assert [row["id"] for row in resumed] == [5, 6]
+
+        alerts = await sink_service.get_security_alerts(db, threshold=3)
+        assert alerts[0]["details"] == {
+            "ip_address": "127.0.0.1",
+            "username": "admin",
+            "attempts": 3,
+        }
+
+    def test_rejects_database_only_options(self, db_config, sink):
+        """Test that options needing the admin database are rejected."""
+        with pytest.raises(ValueError):
+            EventService(db_config, sink=sink, audit_storage="diff")
+        with pytest.raises(ValueError):
+            init_event_system(db_config, buffered=True, sink=sink)
+        assert not EventService(
+            db_config, sink=sink, failed_login_window_seconds=60
+        ).aggregates(EventType.FAILED_LOGIN, EventStatus.FAILURE)
@@ -0,0 +1,88 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from crudadmin.event.maintenance import EventMaintenanceJob
+from crudadmin.event.models import EventStatus, EventType
+from crudadmin.event.partitioning import (
+    add_months,
+    ensure_month_partitions,
+    month_start,
+    partition_name,
+)
+
+UTC = timezone.utc
+
+
+class TestPartitionHelpers:
+    """Test cases for the month partition helpers."""
+
+    def test_month_arithmetic(self):
+        """Test month boundaries across year ends."""
+        start = month_start(datetime(2024, 12, 15, 8, 30, tzinfo=UTC))
+
+        assert start == datetime(2024, 12, 1, tzinfo=UTC)
+        assert add_months(start, 1) == datetime(2025, 1, 1, tzinfo=UTC)
+        assert add_months(start, -12) == datetime(2023, 12, 1, tzinfo=UTC)
+        assert partition_name("admin_event_log", start) == "admin_event_log_p202412"
+
+    @pytest.mark.asyncio
+    async def test_partitioning_requires_postgresql(self, db_config):
+        """Test that partition management refuses other dialects."""
+        async with db_config.admin_engine.connect() as conn:
+            with pytest.raises(ValueError, match="requires PostgreSQL"):
+                await ensure_month_partitions(conn, "admin_event_log")
+
+
+class TestEventMaintenanceJob:
+    """Test cases for the event retention job."""
+
+    @pytest.mark.asyncio
+    async def test_run_once_deletes_expired_events(self, db_config, event_service):
+        """Test that a run removes events older than the retention period."""
+        async with db_config.admin_engine.begin() as conn:
+            await conn.execute(
+                db_config.AdminEventLog.__table__.insert(),
+                [
+                    {
+                        "timestamp": datetime.now(UTC) - timedelta(days=age),
+                        "event_type": EventType.LOGIN,
+                        "status": EventStatus.SUCCESS,
+                        "user_id": 1,
+                        "session_id": "session",
+                        "ip_address": "127.0.0.1",
+                        "user_agent": "test-agent",
+                        "details": {},
+                    }
+                    for age in (1, 10, 100, 200)
+                ],
+            )
+
+        job = EventMaintenanceJob(event_service, retention_days=30, pause_seconds=0)
+        result = await job.run_once()
+
+        assert result == {"events_deleted": 2, "partitions_removed": []}
+        assert job.last_run is not None
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self, event_service):
+        """Test that the background task runs and can be stopped."""
+        job = EventMaintenanceJob(event_service, retention_days=30)
+
+        with patch.object(job, "run_once", new_callable=AsyncMock) as mock_run_once:
+            job.start()
+            for _ in range(50):
+                if mock_run_once.await_count:
+                    break
+                await asyncio.sleep(0.01)
+            await job.stop()
+
+        mock_run_once.assert_awaited()
+        assert job._task is None
+
+    def test_invalid_retention(self, event_service):
+        """Test that a retention of less than a day is rejected."""
+        with pytest.raises(ValueError):
+            EventMaintenanceJob(event_service, retention_days=0)
@@ -0,0 +1,127 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+
+from crudadmin.event import init_event_system
+from crudadmin.event.models import EventStatus, EventType
+from crudadmin.event.rollup import EventRollup
+
+UTC = timezone.utc
+
+
+async def _log(event_service, db, request, event_type, status, resource_type=None):
+    return await event_service.log_event(
+        db=db,
+        event_type=event_type,
+        status=status,
+        user_id=1,
+        session_id="session",
+        request=request,
+        resource_type=resource_type,
+        resource_id="1" if resource_type else None,
+    )
+
+
+async def _set_timestamp(db_config, event_id, timestamp):
+    model = db_config.AdminEventLog
+    async with db_config.admin_engine.begin() as conn:
+        await conn.execute(
+            update(model).where(model.id == event_id).values(timestamp=timestamp)
+        )
+
+
+class TestEventRollup:
+    """Test cases for the incrementally maintained event rollup."""
+
+    @pytest.mark.asyncio
+    async def test_fold_counts_new_events_once(
+        self, db_config, event_service, mock_request
+    ):
+        """Test that folding twice only counts each event once."""
+        rollup = EventRollup(db_config, lag_seconds=0, chunk_size=2)
+        db = db_config.admin_session
+
+        for _ in range(3):
+            await _log(
+                event_service,
+                db,
+                mock_request,
+                EventType.UPDATE,
+                EventStatus.SUCCESS,
+                "Product",
+            )
+        await _log(
+            event_service, db, mock_request, EventType.LOGIN, EventStatus.FAILURE
+        )
+
+        assert await rollup.fold() == 4
+        assert await rollup.fold() == 0
+
+        await _log(
+            event_service,
+            db,
+            mock_request,
+            EventType.UPDATE,
+            EventStatus.SUCCESS,
+            "Product",
+        )
+        assert await rollup.fold() == 1
+
+        start = datetime.now(UTC) - timedelta(hours=1)
+        activity = await rollup.get_activity(db, start, group_by="resource_type")
+        assert {row["resource_type"]: row["count"] for row in activity} == {
+            "Product": 4,
+            "": 1,
+        }
+        assert await rollup.get_total(db, start, event_type="update") == 4
+        assert await rollup.get_failed_logins(db, start) == 1
+
+    @pytest.mark.asyncio
+    async def test_buckets_and_lag(self, db_config, event_service, mock_request):
+        """Test hourly bucketing and that recent events wait for the lag."""
+        rollup = EventRollup(db_config, lag_seconds=60)
+        db = db_config.admin_session
+        now = datetime.now(UTC)
+
+        oldest = await _log(
+            event_service, db, mock_request, EventType.LOGIN, EventStatus.SUCCESS
+        )
+        recent = await _log(
+            event_service, db, mock_request, EventType.LOGIN, EventStatus.SUCCESS
+        )
+        await _log(
+            event_service, db, mock_request, EventType.LOGIN, EventStatus.SUCCESS
+        )
+        await _set_timestamp(db_config, oldest.id, now - timedelta(hours=3))
+        await _set_timestamp(db_config, recent.id, now - timedelta(hours=2))
+
+        assert await rollup.fold() == 2
+
+        activity = await rollup.get_activity(db, now - timedelta(hours=5))
+        assert [row["bucket"] for row in activity] == [
+            rollup.bucket_for(now - timedelta(hours=3)),
+            rollup.bucket_for(now - timedelta(hours=2)),
+        ]
+        assert all(row["event_type"] == "login" for row in activity)
+
+        rollup.lag_seconds = 0
+        assert await rollup.fold() == 1
+
+    @pytest.mark.asyncio
+    async def test_get_activity_rejects_unknown_group(self, db_config):
+        """Test that grouping by a non-rollup column is rejected."""
+        rollup = EventRollup(db_config)
+        with pytest.raises(ValueError):
+            await rollup.get_activity(
+                db_config.admin_session, datetime.now(UTC), group_by="user_id"
+            )
+
+    def test_rejects_failed_login_aggregation(self, db_config):
+        """Test that rollups are not combined with merged failed logins."""
+        with pytest.raises(ValueError, match="aggregation"):
+            init_event_system(
+                db_config,
+                rollup=EventRollup(db_config),
+                failed_login_window_seconds=60,
+            )
@@ -5,6 +5,7 @@ from enum import Enum
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
+from sqlalchemy import select
 
 from crudadmin.event.schemas import (
     AdminAuditLogRead,
@@ -12,7 +13,12 @@ from crudadmin.event.schemas import (
     EventStatus,
     EventType,
 )
-from crudadmin.event.service import CustomJSONEncoder, EventService
+from crudadmin.event.service import (
+    CustomJSONEncoder,
+    EventService,
+    decode_event_cursor,
+    encode_event_cursor,
+)
 
 UTC = timezone.utc
 
@@ -347,31 +353,51 @@ async def test_get_user_activity(event_service):
 
 
 @pytest.mark.asyncio
-async def test_get_user_activity_without_time_filters(event_service):
-    """Test getting user activity without time filters."""
-    user_id = 1
-
-    mock_result = {"data": [], "total_count": 0}
-
-    with patch.object(
-        event_service.crud_events, "get_multi", new_callable=AsyncMock
-    ) as mock_get_multi:
-        mock_get_multi.return_value = mock_result
-
-        result = await event_service.get_user_activity(
-            db=AsyncMock(),
-            user_id=user_id,
+async def test_get_user_activity_keyset_pagination(
+    db_config, event_service, mock_request
+):
+    """Test that user activity pages follow (timestamp, id) cursors."""
+    db = db_config.admin_session
+    same_time = datetime(2024, 1, 1, tzinfo=UTC)
+    for i in range(5):
+        db.add(
+            db_config.AdminEventLog(
+                timestamp=same_time if i < 3 else same_time + timedelta(hours=i),
+                event_type=EventType.LOGIN,
+                status=EventStatus.SUCCESS,
+                user_id=1,
+                session_id="session",
+                ip_address="127.0.0.1",
+                user_agent="test-agent",
+                details={},
+            )
         )
-
-        assert result == mock_result
-        mock_get_multi.assert_called_once_with(
-            ANY,
-            offset=0,
-            limit=50,
-            sort_columns=["timestamp"],
-            sort_orders=["desc"],
-            user_id=user_id,
+    db.add(
+        db_config.AdminEventLog(
+            timestamp=same_time,
+            event_type=EventType.LOGIN,
+            status=EventStatus.SUCCESS,
+            user_id=2,
+            session_id="session",
+            ip_address="127.0.0.1",
+            user_agent="test-agent",
+            details={},
+        )
+    )
+    await db.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        page = await event_service.get_user_activity(
+            db=db, user_id=1, limit=2, cursor=cursor
         )
+        seen.extend(event["id"] for event in page["data"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == [5, 4, 3, 2, 1]
 
 
 @pytest.mark.asyncio
@@ -416,61 +442,102 @@ async def test_get_resource_history(event_service):
 
 
 @pytest.mark.asyncio
-async def test_get_security_alerts(event_service):
-    """Test getting security alerts."""
-    lookback_hours = 12
-
-    mock_result = {
-        "data": [
-            {"id": 1, "event_type": "LOGIN", "status": "FAILURE"},
-            {"id": 2, "event_type": "UNAUTHORIZED_ACCESS", "status": "FAILURE"},
-        ],
-        "total_count": 2,
-    }
+async def test_get_security_alerts(db_config, event_service, mock_request):
+    """Test that failed logins are grouped and thresholded in SQL."""
+    db = db_config.admin_session
 
-    with patch.object(
-        event_service.crud_events, "get_multi", new_callable=AsyncMock
-    ) as mock_get_multi:
-        mock_get_multi.return_value = mock_result
-
-        result = await event_service.get_security_alerts(
-            db=AsyncMock(),
-            lookback_hours=lookback_hours,
+    async def failed_login(username, event_type=EventType.LOGIN):
+        await event_service.log_event(
+            db=db,
+            event_type=event_type,
+            status=EventStatus.FAILURE,
+            user_id=0,
+            session_id="unknown",
+            request=mock_request,
+            details={"auth_details": {"username": username}},
         )
 
-        assert isinstance(result, list)
-        mock_get_multi.assert_called_once()
-
-        # Verify the call includes time filter
-        call_args = mock_get_multi.call_args
-        assert "timestamp__gte" in call_args[1]
+    for _ in range(3):
+        await failed_login("admin")
+    await failed_login("admin", EventType.FAILED_LOGIN)
+    await failed_login("bob")
+    await event_service.log_event(
+        db=db,
+        event_type=EventType.LOGIN,
+        status=EventStatus.SUCCESS,
+        user_id=1,
+        session_id="session",
+        request=mock_request,
+        details={"auth_details": {"username": "bob"}},
+    )
+
+    alerts = await event_service.get_security_alerts(db, lookback_hours=1, threshold=2)
+
+    assert alerts == [
+        {
+            "type": "multiple_failed_logins",
+            "severity": "high",
+            "details": {"ip_address": "127.0.0.1", "username": "admin", "attempts": 4},
+        }
+    ]
+    assert await event_service.get_security_alerts(db, threshold=5) == []
 
 
 @pytest.mark.asyncio
-async def test_cleanup_old_logs(event_service):
-    """Test cleanup of old logs."""
-    retention_days = 30
-
-    with patch.object(
-        event_service.crud_events, "delete", new_callable=AsyncMock
-    ) as mock_delete_events, patch.object(
-        event_service.crud_audits, "delete", new_callable=AsyncMock
-    ) as mock_delete_audits:
-        await event_service.cleanup_old_logs(
-            db=AsyncMock(),
-            retention_days=retention_days,
+async def test_cleanup_old_logs(db_config, event_service):
+    """Test that cleanup deletes old events with their audit rows in batches."""
+    db = db_config.admin_session
+    old = datetime.now(UTC) - timedelta(days=40)
+    recent = datetime.now(UTC) - timedelta(days=5)
+
+    for i, timestamp in enumerate([old] * 5 + [recent] * 2):
+        db.add(
+            db_config.AdminEventLog(
+                id=i + 1,
+                timestamp=timestamp,
+                event_type=EventType.UPDATE,
+                status=EventStatus.SUCCESS,
+                user_id=1,
+                session_id="session",
+                ip_address="127.0.0.1",
+                user_agent="test-agent",
+                details={},
+            )
+        )
+        db.add(
+            db_config.AdminAuditLog(
+                event_id=i + 1,
+                timestamp=recent,
+                resource_type="Product",
+                resource_id=str(i),
+                action="update",
+            )
+        )
+    db.add(
+        db_config.AdminAuditLog(
+            event_id=999,
+            timestamp=old,
+            resource_type="Product",
+            resource_id="orphan",
+            action="delete",
         )
+    )
+    await db.commit()
 
-        # Verify both event and audit logs are cleaned up
-        mock_delete_events.assert_called_once()
-        mock_delete_audits.assert_called_once()
+    with patch.object(db, "commit", wraps=db.commit) as mock_commit:
+        deleted = await event_service.cleanup_old_logs(
+            db=db, retention_days=30, batch_size=2
+        )
 
-        # Verify the time filter is applied
-        events_call_args = mock_delete_events.call_args
-        audits_call_args = mock_delete_audits.call_args
+    assert deleted == 5
+    assert mock_commit.call_count == 4
 
-        assert "timestamp__lt" in events_call_args[1]
-        assert "timestamp__lt" in audits_call_args[1]
+    remaining_events = (await db.execute(select(db_config.AdminEventLog.id))).scalars()
+    assert sorted(remaining_events) == [6, 7]
+    remaining_audits = (
+        await db.execute(select(db_config.AdminAuditLog.event_id))
+    ).scalars()
+    assert sorted(remaining_audits) == [6, 7]
 
 
 @pytest.mark.asyncio
@@ -552,3 +619,228 @@ async def test_event_service_with_missing_models(db_config):
 
     with pytest.raises(AttributeError):
         EventService(db_config)
+
+
+async def _seed_event_page(db_config, event_service, mock_request):
+    db = db_config.admin_session
+    db.add(db_config.AdminUser(username="alice", hashed_password="x"))
+    await db.commit()
+
+    login = await event_service.log_event(
+        db=db,
+        event_type=EventType.LOGIN,
+        status=EventStatus.SUCCESS,
+        user_id=1,
+        session_id="session",
+        request=mock_request,
+        details={"auth_details": {"username": "alice"}},
+    )
+    update = await event_service.log_event(
+        db=db,
+        event_type=EventType.UPDATE,
+        status=EventStatus.SUCCESS,
+        user_id=99,
+        session_id="session",
+        request=mock_request,
+        resource_type="Product",
+        resource_id="7",
+        details={"request_details": {"path": "/admin/Product/update/7"}},
+    )
+    await event_service.create_audit_log(
+        db=db,
+        event_id=update.id,
+        resource_type="Product",
+        resource_id="7",
+        action="update",
+        previous_state={"price": 1},
+        new_state={"price": 2},
+    )
+    await db.commit()
+    return login, update
+
+
+@pytest.mark.asyncio
+async def test_get_event_page_joins_usernames(db_config, event_service, mock_request):
+    """Test that event pages include usernames without loading details."""
+    login, update = await _seed_event_page(db_config, event_service, mock_request)
+
+    page = await event_service.get_event_page(db_config.admin_session, limit=10)
+
+    assert page["total_count"] == 2
+    assert [event["id"] for event in page["data"]] == [update.id, login.id]
+    assert page["data"][0]["username"] == "Unknown"
+    assert page["data"][1]["username"] == "alice"
+    assert "details" not in page["data"][0]
+
+    filtered = await event_service.get_event_page(
+        db_config.admin_session, username="alice", event_type="login"
+    )
+    assert filtered["total_count"] == 1
+    assert filtered["data"][0]["id"] == login.id
+
+
+@pytest.mark.asyncio
+async def test_get_event_details(db_config, event_service, mock_request):
+    """Test loading the details of a single event on demand."""
+    login, update = await _seed_event_page(db_config, event_service, mock_request)
+
+    login_details = await event_service.get_event_details(
+        db_config.admin_session, login.id
+    )
+    assert login_details == {"auth_details": {"username": "alice"}}
+
+    update_details = await event_service.get_event_details(
+        db_config.admin_session, update.id
+    )
+    assert update_details == {
+        "resource_details": {"model": "Product", "id": "7", "changes": {"price": 2}}
+    }
+
+    assert await event_service.get_event_details(db_config.admin_session, 12345) is None
+
+
+@pytest.mark.asyncio
+async def test_get_event_page_cursors(db_config, event_service, mock_request):
+    """Test moving forward and back through event pages with cursors."""
+    for _ in range(5):
+        await event_service.log_event(
+            db=db_config.admin_session,
+            event_type=EventType.LOGIN,
+            status=EventStatus.SUCCESS,
+            user_id=1,
+            session_id="session",
+            request=mock_request,
+        )
+
+    first = await event_service.get_event_page(db_config.admin_session, limit=2)
+    assert [e["id"] for e in first["data"]] == [5, 4]
+    assert first["prev_cursor"] is None
+    assert first["total_count"] == 5
+
+    second = await event_service.get_event_page(
+        db_config.admin_session,
+        limit=2,
+        after=first["next_cursor"],
+        with_total=False,
+    )
+    assert [e["id"] for e in second["data"]] == [3, 2]
+    assert second["total_count"] is None
+
+    last = await event_service.get_event_page(
+        db_config.admin_session, limit=2, after=second["next_cursor"]
+    )
+    assert [e["id"] for e in last["data"]] == [1]
+    assert last["next_cursor"] is None
+
+    back = await event_service.get_event_page(
+        db_config.admin_session, limit=2, before=last["prev_cursor"]
+    )
+    assert [e["id"] for e in back["data"]] == [3, 2]
+
+    home = await event_service.get_event_page(
+        db_config.admin_session, limit=2, before=back["prev_cursor"]
+    )
+    assert [e["id"] for e in home["data"]] == [5, 4]
+    assert home["prev_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_event_page_caps_total(db_config, event_service, mock_request):
+    """Test that the page total stops counting at EVENT_COUNT_LIMIT."""
+    for _ in range(5):
+        await event_service.log_event(
+            db=db_config.admin_session,
+            event_type=EventType.LOGIN,
+            status=EventStatus.SUCCESS,
+            user_id=1,
+            session_id="session",
+            request=mock_request,
+        )
+    event_service.EVENT_COUNT_LIMIT = 3
+
+    capped = await event_service.get_event_page(db_config.admin_session, limit=2)
+    filtered = await event_service.get_event_page(
+        db_config.admin_session, limit=2, event_type="logout"
+    )
+
+    assert capped["total_count"] == 3
+    assert capped["total_capped"] is True
+    assert filtered["total_count"] == 0
+    assert filtered["total_capped"] is False
+
+
+def test_event_cursor_round_trip():
+    """Test encoding and decoding pagination cursors."""
+    timestamp = datetime(2024, 5, 1, 12, 30, tzinfo=UTC)
+
+    assert decode_event_cursor(encode_event_cursor(timestamp, 42)) == (timestamp, 42)
+
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        decode_event_cursor("not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_failed_logins_are_aggregated(db_config, mock_request):
+    """Test that repeated failed logins update one counter event."""
+    service = EventService(db_config, failed_login_window_seconds=60)
+    db = db_config.admin_session
+
+    async def failed_login(username):
+        return await service.log_event(
+            db=db,
+            event_type=EventType.LOGIN,
+            status=EventStatus.FAILURE,
+            user_id=0,
+            session_id="unknown",
+            request=mock_request,
+            details={"auth_details": {"username": username}},
+        )
+
+    first = await failed_login("admin")
+    for _ in range(3):
+        latest = await failed_login("admin")
+    other = await failed_login("bob")
+
+    assert latest.id == first.id
+    assert other.id != first.id
+    assert latest.details["attempts"] == 4
+    assert latest.details["auth_details"] == {"username": "admin"}
+    assert latest.details["first_seen"] <= latest.details["last_seen"]
+
+    rows = (await db.execute(select(db_config.AdminEventLog))).scalars().all()
+    assert len(rows) == 2
+
+    alerts = await service.get_security_alerts(db, threshold=4)
+    assert [alert["details"]["attempts"] for alert in alerts] == [4]
+
+
+@pytest.mark.asyncio
+async def test_failed_login_window_expires(db_config, mock_request):
+    """Test that a failure after the window starts a new event."""
+    service = EventService(db_config, failed_login_window_seconds=60)
+    db = db_config.admin_session
+
+    first = await service.log_event(
+        db=db,
+        event_type=EventType.FAILED_LOGIN,
+        status=EventStatus.FAILURE,
+        user_id=0,
+        session_id="unknown",
+        request=mock_request,
+        details={"username": "admin"},
+    )
+    row = await db.get(db_config.AdminEventLog, first.id)
+    row.timestamp = datetime.now(timezone.utc) - timedelta(minutes=5)
+    await db.commit()
+
+    second = await service.log_event(
+        db=db,
+        event_type=EventType.FAILED_LOGIN,
+        status=EventStatus.FAILURE,
+        user_id=0,
+        session_id="unknown",
+        request=mock_request,
+        details={"username": "admin"},
+    )
+    assert second.id != first.id
+    assert "attempts" not in second.details
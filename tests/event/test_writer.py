@@ -0,0 +1,265 @@
+import asyncio
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import func, select
+
+from crudadmin.event import init_event_system
+from crudadmin.event.models import EventStatus, EventType
+from crudadmin.event.writer import BufferedEventWriter
+
+UTC = timezone.utc
+
+
+class Product:
+    """Stand-in model class; only its name is used for events."""
+
+
+async def count_rows(db_config, model) -> int:
+    async with db_config.admin_engine.connect() as conn:
+        return (await conn.execute(select(func.count()).select_from(model))).scalar()
+
+
+class TestBufferedEventWriter:
+    """Test cases for the background event and audit writer."""
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_events_and_audits(
+        self, db_config, event_service, mock_request
+    ):
+        """Test that a flush inserts events and links audits to their ids."""
+        writer = BufferedEventWriter(db_config, flush_interval=60)
+
+        for i in range(3):
+            event = event_service.build_event_record(
+                event_type=EventType.UPDATE,
+                status=EventStatus.SUCCESS,
+                user_id=1,
+                session_id="session",
+                request=mock_request,
+                resource_type="Product",
+                resource_id=str(i),
+                details={"price": Decimal("9.99")},
+            )
+            audit = None
+            if i != 1:
+                audit = event_service.build_audit_record(
+                    resource_type="Product",
+                    resource_id=str(i),
+                    action="update",
+                    previous_state={"price": 1},
+                    new_state={"price": 2},
+                    metadata={"at": datetime(2024, 1, 1, tzinfo=UTC)},
+                )
+            assert writer.enqueue(event, audit) is True
+
+        assert writer.queue_depth == 3
+        assert await writer.flush() is True
+
+        assert await count_rows(db_config, db_config.AdminEventLog) == 3
+        async with db_config.admin_engine.connect() as conn:
+            events = {
+                row.resource_id: row.id
+                for row in await conn.execute(select(db_config.AdminEventLog))
+            }
+            audits = (await conn.execute(select(db_config.AdminAuditLog))).all()
+
+        assert {(a.resource_id, a.event_id) for a in audits} == {
+            ("0", events["0"]),
+            ("2", events["2"]),
+        }
+        assert audits[0].changes == {"price": {"old": 1, "new": 2}}
+        assert audits[0].audit_metadata == {"at": "2024-01-01T00:00:00+00:00"}
+        assert writer.stats() == {
+            "queue_depth": 0,
+            "written": 3,
+            "dropped": 0,
+            "failed": 0,
+            "flushes": 1,
+            "write_errors": 0,
+        }
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_events(
+        self, db_config, event_service, mock_request
+    ):
+        """Test that enqueue never blocks and counts dropped events."""
+        writer = BufferedEventWriter(db_config, max_queue_size=2, flush_interval=60)
+        event = event_service.build_event_record(
+            event_type=EventType.LOGIN,
+            status=EventStatus.FAILURE,
+            user_id=0,
+            session_id="unknown",
+            request=mock_request,
+        )
+
+        assert writer.enqueue(dict(event)) is True
+        assert writer.enqueue(dict(event)) is True
+        assert writer.enqueue(dict(event)) is False
+        assert writer.stats()["dropped"] == 1
+
+        await writer.close()
+        assert await count_rows(db_config, db_config.AdminEventLog) == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_size_triggers_background_flush(
+        self, db_config, event_service, mock_request
+    ):
+        """Test that reaching batch_size wakes the background writer."""
+        writer = BufferedEventWriter(db_config, batch_size=2, flush_interval=60)
+        event = event_service.build_event_record(
+            event_type=EventType.LOGIN,
+            status=EventStatus.SUCCESS,
+            user_id=1,
+            session_id="session",
+            request=mock_request,
+        )
+
+        writer.enqueue(dict(event))
+        writer.enqueue(dict(event))
+
+        for _ in range(100):
+            if writer.written == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        assert writer.written == 2
+        assert writer.queue_depth == 0
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_requeues_batch(self, db_config):
+        """Test that a failed batch is kept for the next flush."""
+        writer = BufferedEventWriter(db_config, flush_interval=60)
+        writer.enqueue({"event_type": EventType.LOGIN})
+
+        assert await writer.flush() is False
+        assert writer.queue_depth == 1
+        assert writer.write_errors == 1
+
+        await writer.close()
+        assert writer.queue_depth == 0
+        assert writer.failed == 1
+
+    @pytest.mark.asyncio
+    async def test_bad_row_does_not_block_the_queue(
+        self, db_config, event_service, mock_request
+    ):
+        """Test that a row that cannot be written is dropped after max_attempts."""
+        writer = BufferedEventWriter(
+            db_config, batch_size=3, flush_interval=60, max_attempts=2
+        )
+
+        def event(resource_id):
+            return event_service.build_event_record(
+                event_type=EventType.UPDATE,
+                status=EventStatus.SUCCESS,
+                user_id=1,
+                session_id="session",
+                request=mock_request,
+                resource_type="Product",
+                resource_id=resource_id,
+            )
+
+        writer.enqueue(event("1"))
+        writer.enqueue({**event("bad"), "details": {"value": object()}})
+        writer.enqueue(event("2"))
+        writer.enqueue(event("3"))
+
+        assert await writer.flush() is False
+        assert writer.queue_depth == 4
+        assert await writer.flush() is True
+        assert await writer.flush() is True
+
+        async with db_config.admin_engine.connect() as conn:
+            written = (
+                await conn.execute(select(db_config.AdminEventLog.resource_id))
+            ).scalars()
+            assert sorted(written) == ["1", "2", "3"]
+        assert writer.failed == 1
+        assert writer.written == 3
+        assert writer.queue_depth == 0
+        await writer.close()
+
+
+class TestBufferedEventIntegration:
+    """Test cases for EventSystemIntegration with a buffered writer."""
+
+    @pytest.mark.asyncio
+    async def test_log_model_event_does_not_touch_session(
+        self, db_config, mock_request
+    ):
+        """Test that buffered model events skip the request's admin session."""
+        _, integration = init_event_system(db_config, buffered=True, flush_interval=60)
+        mock_db = AsyncMock()
+
+        result = await integration.log_model_event(
+            db=mock_db,
+            event_type=EventType.CREATE,
+            model=Product,
+            user_id=1,
+            session_id="session",
+            request=mock_request,
+            resource_id="42",
+            new_state={"name": "Widget"},
+        )
+
+        assert result is None
+        mock_db.commit.assert_not_called()
+        assert integration.writer.queue_depth == 1
+
+        await integration.close()
+
+        assert await count_rows(db_config, db_config.AdminEventLog) == 1
+        assert await count_rows(db_config, db_config.AdminAuditLog) == 1
+
+    @pytest.mark.asyncio
+    async def test_log_auth_event_is_buffered(self, db_config, mock_request):
+        """Test that auth events go through the writer."""
+        _, integration = init_event_system(db_config, buffered=True, flush_interval=60)
+
+        await integration.log_auth_event(
+            db=AsyncMock(),
+            event_type=EventType.LOGIN,
+            user_id=0,
+            session_id="unknown",
+            request=mock_request,
+            success=False,
+            details={"auth_details": {"username": "admin"}},
+        )
+        await integration.close()
+
+        async with db_config.admin_engine.connect() as conn:
+            row = (await conn.execute(select(db_config.AdminEventLog))).one()
+        assert row.status == EventStatus.FAILURE
+        assert row.details == {"auth_details": {"username": "admin"}}
+
+    @pytest.mark.asyncio
+    async def test_aggregated_failed_logins_bypass_writer(
+        self, db_config, mock_request
+    ):
+        """Test that aggregated failed logins are merged in the request session."""
+        _, integration = init_event_system(
+            db_config, buffered=True, flush_interval=60, failed_login_window_seconds=60
+        )
+
+        for _ in range(3):
+            await integration.log_auth_event(
+                db=db_config.admin_session,
+                event_type=EventType.LOGIN,
+                user_id=0,
+                session_id="unknown",
+                request=mock_request,
+                success=False,
+                details={"auth_details": {"username": "admin"}},
+            )
+
+        assert integration.writer.queue_depth == 0
+        await integration.close()
+
+        async with db_config.admin_engine.connect() as conn:
+            row = (await conn.execute(select(db_config.AdminEventLog))).one()
+        assert row.details["attempts"] == 3
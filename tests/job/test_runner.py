@@ -0,0 +1,229 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.orm import DeclarativeBase
+
+from crudadmin.core.db import DatabaseConfig
+from crudadmin.job import JobChunk, JobRunner, JobStatus, create_admin_job
+
+
+@pytest_asyncio.fixture
+async def job_db_config(admin_async_session, tmp_path):
+    class AdminBase(DeclarativeBase):
+        pass
+
+    admin_base = AdminBase
+    config = DatabaseConfig(
+        base=admin_base,
+        session=admin_async_session,
+        admin_db_url=f"sqlite+aiosqlite:///{tmp_path / 'admin.db'}",
+        admin_job=create_admin_job(admin_base),
+    )
+    await config.initialize_admin_db()
+    yield config
+    await config.admin_engine.dispose()
+
+
+def _counter(items: int, chunk: int, calls: list):
+    async def handler(params, cursor):
+        calls.append(cursor)
+        start = cursor or 0
+        end = min(start + chunk, items)
+        return JobChunk(processed=end - start, cursor=end, done=end >= items)
+
+    return handler
+
+
+async def _wait(runner, job_id, timeout=5.0):
+    for _ in range(int(timeout / 0.01)):
+        job = await runner.get_job(job_id)
+        if job["status"] in ("completed", "failed", "cancelled"):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+class TestJobRunner:
+    """Test cases for the background job runner."""
+
+    @pytest.mark.asyncio
+    async def test_job_runs_in_chunks(self, job_db_config):
+        """Test that a job calls the handler with each cursor until done."""
+        calls: list = []
+        runner = JobRunner(job_db_config)
+        runner.register("count", _counter(items=5, chunk=2, calls=calls))
+        await runner.start()
+
+        job_id = await runner.submit("count", {"x": 1}, user_id=1, total=5)
+        job = await _wait(runner, job_id)
+
+        assert job["status"] == JobStatus.COMPLETED.value
+        assert job["processed"] == 5
+        assert job["cursor"] == 5
+        assert job["finished_at"] is not None
+        assert calls == [None, 2, 4]
+        await runner.stop()
+
+    @pytest.mark.asyncio
+    async def test_unknown_kind_rejected(self, job_db_config):
+        """Test that jobs can only be submitted for registered handlers."""
+        runner = JobRunner(job_db_config)
+        with pytest.raises(ValueError):
+            await runner.submit("missing", {})
+
+    @pytest.mark.asyncio
+    async def test_failure_is_recorded(self, job_db_config):
+        """Test that a handler error marks the job failed with the message."""
+
+        async def handler(params, cursor):
+            raise RuntimeError("boom")
+
+        runner = JobRunner(job_db_config)
+        runner.register("fail", handler)
+        await runner.start()
+
+        job = await _wait(runner, await runner.submit("fail", {}))
+
+        assert job["status"] == JobStatus.FAILED.value
+        assert job["error"] == "boom"
+        await runner.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_after_current_chunk(self, job_db_config):
+        """Test that cancelling a running job stops it between chunks."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def handler(params, cursor):
+            started.set()
+            await release.wait()
+            return JobChunk(processed=1, cursor=(cursor or 0) + 1, done=False)
+
+        runner = JobRunner(job_db_config)
+        runner.register("slow", handler)
+        await runner.start()
+        job_id = await runner.submit("slow", {})
+
+        await started.wait()
+        assert await runner.cancel(job_id) is True
+        release.set()
+        job = await _wait(runner, job_id)
+
+        assert job["status"] == JobStatus.CANCELLED.value
+        assert job["processed"] == 1
+        assert await runner.cancel(job_id) is False
+        await runner.stop()
+
+    @pytest.mark.asyncio
+    async def test_pending_job_cancelled_before_start(self, job_db_config):
+        """Test that a job submitted before start() can be cancelled."""
+        runner = JobRunner(job_db_config)
+        runner.register("count", _counter(items=1, chunk=1, calls=[]))
+
+        job_id = await runner.submit("count", {})
+        assert await runner.cancel(job_id) is True
+        await runner.start()
+
+        assert (await runner.get_job(job_id))["status"] == "cancelled"
+        await runner.stop()
+
+    @pytest.mark.asyncio
+    async def test_start_resumes_from_cursor(self, job_db_config):
+        """Test that a job interrupted mid-run resumes from its last cursor."""
+        calls: list = []
+        job_model = job_db_config.AdminJob
+        async with job_db_config.admin_engine.begin() as conn:
+            await conn.execute(
+                job_model.__table__.insert().values(
+                    kind="count",
+                    status=JobStatus.RUNNING.value,
+                    params={},
+                    cursor=4,
+                    processed=4,
+                )
+            )
+
+        runner = JobRunner(job_db_config)
+        runner.register("count", _counter(items=6, chunk=10, calls=calls))
+        await runner.start()
+        job = await _wait(runner, 1)
+
+        assert calls == [4]
+        assert job["processed"] == 6
+        assert job["status"] == JobStatus.COMPLETED.value
+        await runner.stop()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self, job_db_config):
+        """Test that no more than max_concurrency jobs run at once."""
+        running = 0
+        peak = 0
+
+        async def handler(params, cursor):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return JobChunk(processed=1, cursor=None, done=True)
+
+        runner = JobRunner(job_db_config, max_concurrency=2)
+        runner.register("sleep", handler)
+        await runner.start()
+
+        job_ids = [await runner.submit("sleep", {}) for _ in range(5)]
+        for job_id in job_ids:
+            await _wait(runner, job_id)
+
+        assert peak == 2
+        await runner.stop()
+
+    @pytest.mark.asyncio
+    async def test_job_is_claimed_by_one_runner(self, job_db_config):
+        """Test that runners sharing the job table never run a job twice."""
+        calls: list = []
+        runners = [JobRunner(job_db_config) for _ in range(3)]
+        for runner in runners:
+            runner.register("count", _counter(items=1, chunk=1, calls=calls))
+        job_id = await runners[0].submit("count", {})
+
+        await asyncio.gather(*(runner.start() for runner in runners))
+        job = await _wait(runners[0], job_id)
+        await asyncio.sleep(0.05)
+
+        assert calls == [None]
+        assert job["owner"] in {runner.owner for runner in runners}
+        for runner in runners:
+            await runner.stop()
+
+    @pytest.mark.asyncio
+    async def test_only_expired_leases_are_resumed(self, job_db_config):
+        """Test that a job with a live owner is left alone until its lease expires."""
+        calls: list = []
+        async with job_db_config.admin_engine.begin() as conn:
+            await conn.execute(
+                job_db_config.AdminJob.__table__.insert().values(
+                    kind="count",
+                    status=JobStatus.RUNNING.value,
+                    params={},
+                    cursor=2,
+                    processed=2,
+                    owner="other-process",
+                    heartbeat_at=datetime.now(timezone.utc),
+                )
+            )
+
+        runner = JobRunner(job_db_config, lease_seconds=0.3)
+        runner.register("count", _counter(items=3, chunk=10, calls=calls))
+        await runner.start()
+
+        assert calls == []
+        assert (await runner.get_job(1))["owner"] == "other-process"
+
+        job = await _wait(runner, 1)
+        assert calls == [2]
+        assert job["processed"] == 3
+        assert job["owner"] == runner.owner
+        await runner.stop()
@@ -9,6 +9,8 @@ from crudadmin.session.backends.memory import MemorySessionStorage
 
 # Import optional backends with fallbacks
 try:
+    from redis.exceptions import WatchError
+
     from crudadmin.session.backends.redis import RedisSessionStorage
 
     REDIS_AVAILABLE = True
@@ -98,6 +100,28 @@ class TestMemorySessionStorage:
         retrieved = await memory_storage.get(session_id, SessionTestData)
         assert retrieved.metadata == {"updated": True}
 
+    @pytest.mark.asyncio
+    async def test_update_fields_keeps_other_fields(self, memory_storage):
+        """Test that update_fields does not write back a stale copy."""
+        session_id = "test-session-id"
+        test_data = SessionTestData(user_id=1, session_id=session_id)
+        await memory_storage.create(test_data, session_id=session_id)
+
+        await memory_storage.update(
+            session_id, test_data.model_copy(update={"is_active": False})
+        )
+        result = await memory_storage.update_fields(
+            session_id, SessionTestData, {"metadata": {"browser": "Chrome"}}
+        )
+
+        retrieved = await memory_storage.get(session_id, SessionTestData)
+        assert result is True
+        assert retrieved.is_active is False
+        assert retrieved.metadata == {"browser": "Chrome"}
+        assert not await memory_storage.update_fields(
+            "missing", SessionTestData, {"metadata": {}}
+        )
+
     @pytest.mark.asyncio
     async def test_delete_session(self, memory_storage):
         """Test deleting a session."""
@@ -143,6 +167,35 @@ class TestMemorySessionStorage:
         result = await memory_storage.get_user_sessions(user_id)
         assert set(result) == set(session_ids)
 
+    @pytest.mark.asyncio
+    async def test_purge_expired(self, memory_storage):
+        """Test that only keys past their TTL are purged."""
+        await memory_storage.create(
+            SessionTestData(user_id=1, session_id="long"), session_id="long"
+        )
+        await memory_storage.create(
+            SessionTestData(user_id=1, session_id="short"),
+            session_id="short",
+            expiration=-1,
+        )
+
+        assert memory_storage.purge_expired() == 1
+        assert await memory_storage.exists("short") is False
+        assert await memory_storage.exists("long") is True
+
+    @pytest.mark.asyncio
+    async def test_purge_expired_skips_extended_keys(self, memory_storage):
+        """Test that superseded heap entries do not purge extended keys."""
+        await memory_storage.create(
+            SessionTestData(user_id=1, session_id="extended"),
+            session_id="extended",
+            expiration=-1,
+        )
+        memory_storage._set_expiry(memory_storage.get_key("extended"), 1800)
+
+        assert memory_storage.purge_expired() == 0
+        assert await memory_storage.exists("extended") is True
+
 
 # Redis Backend Tests
 @pytest.mark.skipif(not REDIS_AVAILABLE, reason="Redis not available")
@@ -244,6 +297,52 @@ class TestRedisSessionStorage:
         mock_pipeline.expire.assert_called()
         mock_pipeline.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_update_fields_retries_on_conflict(
+        self, redis_storage, mock_pipeline
+    ):
+        """Test that update_fields merges into the stored session in a transaction."""
+        session_id = "test-session-id"
+        stored = SessionTestData(user_id=1, session_id=session_id, is_active=False)
+
+        mock_pipeline.__aenter__.return_value = mock_pipeline
+        mock_pipeline.watch = AsyncMock()
+        mock_pipeline.get = AsyncMock(return_value=stored.model_dump_json())
+        mock_pipeline.execute = AsyncMock(side_effect=[WatchError(), [True]])
+
+        result = await redis_storage.update_fields(
+            session_id, SessionTestData, {"metadata": {"browser": "Chrome"}}
+        )
+
+        assert result is True
+        assert mock_pipeline.watch.await_count == 2
+        key, written = mock_pipeline.set.call_args.args
+        assert key == f"test_session:{session_id}"
+        assert mock_pipeline.set.call_args.kwargs == {"keepttl": True}
+        assert json.loads(written)["is_active"] is False
+        assert json.loads(written)["metadata"] == {"browser": "Chrome"}
+
+    @pytest.mark.asyncio
+    async def test_update_fields_gives_up_after_repeated_conflicts(
+        self, redis_storage, mock_pipeline
+    ):
+        """Test that update_fields stops retrying a session that keeps changing."""
+        stored = SessionTestData(user_id=1, session_id="test-session-id")
+
+        mock_pipeline.__aenter__.return_value = mock_pipeline
+        mock_pipeline.watch = AsyncMock()
+        mock_pipeline.get = AsyncMock(return_value=stored.model_dump_json())
+        mock_pipeline.execute = AsyncMock(side_effect=WatchError())
+
+        result = await redis_storage.update_fields(
+            "test-session-id", SessionTestData, {"is_active": False}
+        )
+
+        assert result is False
+        assert mock_pipeline.execute.await_count == (
+            RedisSessionStorage.UPDATE_FIELDS_ATTEMPTS
+        )
+
     @pytest.mark.asyncio
     async def test_delete_session(self, redis_storage, mock_redis, mock_pipeline):
         """Test deleting a session."""
@@ -1,11 +1,13 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
 from crudadmin.session.manager import SessionManager
 from crudadmin.session.schemas import SessionData
 from crudadmin.session.storage import get_session_storage
+from crudadmin.session.user_agents_types import parse
 
 UTC = timezone.utc
 
@@ -292,3 +294,62 @@ async def test_parse_user_agent(session_manager):
     assert isinstance(result.is_mobile, bool)
     assert isinstance(result.is_tablet, bool)
     assert isinstance(result.is_pc, bool)
+
+
+CHROME_UA = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+def test_parse_user_agent_is_cached(session_manager):
+    """Test that repeated User-Agent strings are parsed once."""
+    with patch("crudadmin.session.manager.parse", wraps=parse) as mock_parse:
+        first = session_manager.parse_user_agent(CHROME_UA)
+        second = session_manager.parse_user_agent(CHROME_UA)
+
+    assert mock_parse.call_count == 1
+    assert first == second
+    assert first.browser == "Chrome"
+
+    first.browser = "Mutated"
+    assert session_manager.parse_user_agent(CHROME_UA).browser == "Chrome"
+
+
+def test_user_agent_cache_is_bounded(session_manager):
+    """Test that the User-Agent cache evicts the least recently used entry."""
+    session_manager.user_agent_cache_size = 2
+
+    session_manager.parse_user_agent("agent-a")
+    session_manager.parse_user_agent("agent-b")
+    session_manager.parse_user_agent("agent-c")
+
+    assert list(session_manager._user_agent_cache) == ["agent-b", "agent-c"]
+
+
+@pytest.mark.asyncio
+async def test_deferred_user_agent_parsing(session_manager, mock_request):
+    """Test that deferred parsing patches device info after session creation."""
+    session_manager.defer_user_agent_parsing = True
+    mock_request.headers = {"user-agent": CHROME_UA}
+
+    session_id, _ = await session_manager.create_session(mock_request, user_id=1)
+
+    session_data = await session_manager.storage.get(session_id, SessionData)
+    assert session_data.device_info == {}
+
+    last_activity = datetime.now(UTC) + timedelta(minutes=1)
+    await session_manager.storage.update(
+        session_id, session_data.model_copy(update={"last_activity": last_activity})
+    )
+    await asyncio.gather(*session_manager._background_tasks)
+
+    session_data = await session_manager.storage.get(session_id, SessionData)
+    assert session_data.device_info["browser"] == "Chrome"
+    assert session_data.last_activity == last_activity
+
+    # Once cached, later logins get the device info immediately
+    session_id, _ = await session_manager.create_session(mock_request, user_id=2)
+    session_data = await session_manager.storage.get(session_id, SessionData)
+    assert session_data.device_info["browser"] == "Chrome"
+    assert not session_manager._background_tasks
@@ -264,8 +264,11 @@ class TestSessionManagerRateLimiterIntegration:
         # Call cleanup (this tests the cleanup method exists and runs)
         await session_manager_memory.cleanup_rate_limits()
 
-        # The method should complete without errors
-        # Note: The actual cleanup behavior depends on the storage backend
+        # Active counters are left alone; only expired keys are reclaimed
+        count = await session_manager_memory.rate_limiter.get_count(
+            f"login:ip:{ip_address}"
+        )
+        assert count == 1
 
     @pytest.mark.asyncio
     async def test_rate_limiter_error_handling(self):
@@ -354,6 +357,77 @@ class TestSessionManagerRateLimiterIntegration:
         assert allowed is False
 
 
+class TestSessionManagerLoginPreFilter:
+    """Test the local login pre-filter in front of the rate limiter."""
+
+    @pytest.fixture
+    async def manager_with_prefilter(self):
+        """Create a session manager with a login pre-filter."""
+        from crudadmin.core.rate_limiter import LoginPreFilter
+
+        manager = create_session_manager_with_rate_limiter("memory")
+        manager.login_prefilter = LoginPreFilter(
+            capacity=manager.login_max_attempts,
+            window_seconds=int(manager.login_window.total_seconds()),
+            sync_interval_seconds=0,
+        )
+        yield manager
+        await manager.storage.close()
+        await manager.rate_limiter.close()
+
+    @pytest.mark.asyncio
+    async def test_blocked_ip_skips_shared_storage(self, manager_with_prefilter):
+        """Test that a denied IP is shed without touching the rate limiter."""
+        manager = manager_with_prefilter
+        manager.login_prefilter.sync_interval_seconds = 3600
+        ip_address = "192.168.1.100"
+
+        for _ in range(manager.login_max_attempts + 1):
+            await manager.track_login_attempt(ip_address, "testuser", success=False)
+
+        with patch.object(
+            manager.rate_limiter, "increment", wraps=manager.rate_limiter.increment
+        ) as increment:
+            allowed, remaining = await manager.track_login_attempt(
+                ip_address, "testuser", success=False
+            )
+            assert allowed is False
+            assert remaining == 0
+            increment.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_shed_attempts_synced_to_rate_limiter(self, manager_with_prefilter):
+        """Test that attempts shed locally are added to the distributed counter."""
+        manager = manager_with_prefilter
+        ip_address = "192.168.1.100"
+        max_attempts = manager.login_max_attempts
+
+        for _ in range(max_attempts + 3):
+            await manager.track_login_attempt(ip_address, "testuser", success=False)
+
+        await manager._sync_login_prefilter(900)
+
+        count = await manager.rate_limiter.get_count(f"login:ip:{ip_address}")
+        assert count == max_attempts + 3
+
+    @pytest.mark.asyncio
+    async def test_success_resets_prefilter(self, manager_with_prefilter):
+        """Test that a successful login clears the local bucket."""
+        manager = manager_with_prefilter
+        ip_address = "192.168.1.100"
+
+        for _ in range(manager.login_max_attempts):
+            await manager.track_login_attempt(ip_address, "testuser", success=False)
+
+        await manager.track_login_attempt(ip_address, "testuser", success=True)
+
+        allowed, remaining = await manager.track_login_attempt(
+            ip_address, "testuser", success=False
+        )
+        assert allowed is True
+        assert remaining == manager.login_max_attempts - 1
+
+
 class TestSessionManagerCreationWithRateLimiter:
     """Test session manager creation with rate limiter integration."""
 